@@ -1,28 +1,28 @@
 """Main file of the project."""
 
 # Import used python libraries
+import argparse
 import sys
 
-# Import used classes
-from classes.neural_network import NeuralNetwork
-from classes.user_interface import UserInterface
+# The classes are only imported by the commands that use them, so a headless
+# command never imports tkinter or PIL and no command reads the weights at start
 
 # Size of the neural network
 SIZE_NEURAL_NET: list[tuple[int, int]] = [(81, 784), (10, 81)]
 # Path to the weight matrices
 PATH_TO_WEIGHTS: str = "./weight_matrices/altered_weights.csv"
+# Modules of the user interface
+GUI_MODULES: tuple[str, ...] = ("tkinter", "PIL")
 
-def main() -> int:
-    """Show the user interface o the neural net."""
-    # Set the CSV field size limit
-    NeuralNetwork.set_csv_field_size()
+def show_user_interface(arguments: argparse.Namespace) -> int:
+    """Show the user interface of the neural net."""
+    # Import the user interface (and with it tkinter and PIL) only now
+    from classes.lazy_neural_network import LazyNeuralNetwork
+    from classes.user_interface import UserInterface
 
-    # Create the weights from the CSV file
-    weights: list[list[list[float]]] = NeuralNetwork.create_weights_from_csv(
-        PATH_TO_WEIGHTS)
-
-    # Initialize the neural network
-    neural_net: NeuralNetwork = NeuralNetwork(SIZE_NEURAL_NET, weights)
+    # Initialize the neural network, the weights are read on the first detection
+    neural_net: LazyNeuralNetwork = LazyNeuralNetwork(
+        SIZE_NEURAL_NET, arguments.weights, arguments.backend)
 
     # Initialize the user interface
     user_interface: UserInterface = UserInterface(neural_net)
@@ -33,6 +33,201 @@ def main() -> int:
     # Return exitcode 0 indicating success
     return 0
 
+def convert_weights(arguments: argparse.Namespace) -> int:
+    """Convert the CSV weights into the binary weight file."""
+    import pathlib
+
+    from classes.neural_network import NeuralNetwork
+
+    # Write the binary file next to the CSV file if no output is given
+    path_to_output: str = arguments.output or str(
+        pathlib.Path(arguments.weights).with_suffix(".bin"))
+    NeuralNetwork.convert_weights_to_binary(
+        arguments.weights, path_to_output, arguments.typecode)
+    print("Written", path_to_output)
+
+    return 0
+
+def predict_images(arguments: argparse.Namespace) -> int:
+    """Stream the predictions for the images of a file or directory."""
+    from classes.batch_predictor import BatchPredictor
+    from classes.neural_network import NeuralNetwork
+
+    # Initialize the neural network and the predictor
+    neural_net: NeuralNetwork = NeuralNetwork(
+        SIZE_NEURAL_NET, NeuralNetwork.create_weights(arguments.weights),
+        arguments.backend)
+    predictor: BatchPredictor = BatchPredictor(
+        neural_net, arguments.batch_size, arguments.workers)
+
+    # Predict the images, the report goes to the standard error if the
+    # predictions are written to the standard output
+    report: dict[str, float] = predictor.predict(arguments.source, arguments.output)
+    print("Images:", report["images"], "\tSeconds:", round(report["seconds"], 2),
+          "\tImages/s:", round(report["images_per_second"], 1), file=sys.stderr)
+
+    return 0
+
+def serve_predictions(arguments: argparse.Namespace) -> int:
+    """Serve the predictions over HTTP on localhost."""
+    import asyncio
+
+    from classes.inference_server import InferenceServer
+    from classes.neural_network import NeuralNetwork
+    from classes.prediction_cache import PredictionCache
+
+    # Initialize the neural network (with a cache of the predictions) and the server
+    neural_net: NeuralNetwork = NeuralNetwork(
+        SIZE_NEURAL_NET, NeuralNetwork.create_weights(arguments.weights),
+        arguments.backend, prediction_cache=PredictionCache(
+            arguments.cache_size, arguments.cache_ttl)
+        if arguments.cache_size > 0 else None)
+    server: InferenceServer = InferenceServer(
+        neural_net, arguments.host, arguments.port, arguments.max_batch_size,
+        arguments.max_wait_ms / 1000)
+
+    print("Serving on http://" + arguments.host + ":" + str(arguments.port))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+def start_headless(arguments: argparse.Namespace) -> int:
+    """Detect one blank image without the user interface (startup benchmark)."""
+    import time
+
+    from classes.image import Image
+    from classes.lazy_neural_network import LazyNeuralNetwork
+
+    # Measure the time until the first detection
+    start: float = time.perf_counter()
+    neural_net: LazyNeuralNetwork = LazyNeuralNetwork(
+        SIZE_NEURAL_NET, arguments.weights, arguments.backend)
+    neural_net.detect_one_image(Image([0.0] * SIZE_NEURAL_NET[0][1], 0))
+    elapsed: float = time.perf_counter() - start
+
+    # Report the time and the loaded modules of the user interface
+    print(elapsed, *[module for module in GUI_MODULES if module in sys.modules])
+
+    return 0
+
+def startup_report(arguments: argparse.Namespace) -> int:
+    """Measure the startup of the headless command in fresh processes."""
+    import os
+    import subprocess
+    import time
+
+    # Run the processes from the source directory, the classes are imported from it
+    source_directory: str = os.path.dirname(os.path.abspath(__file__))
+
+    # Initialize the lists of process times, detection times and loaded modules
+    process_times: list[float] = []
+    detection_times: list[float] = []
+    gui_modules: set[str] = set()
+
+    for _ in range(arguments.repetitions):
+        start: float = time.perf_counter()
+        output: str = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--weights",
+             os.path.abspath(arguments.weights)]
+            + (["--backend", arguments.backend] if arguments.backend else [])
+            + ["headless"],
+            cwd=source_directory, capture_output=True, text=True, check=True).stdout
+        process_times.append(time.perf_counter() - start)
+
+        # Read the time of the detection and the loaded modules
+        detection_time, *modules = output.split()
+        detection_times.append(float(detection_time))
+        gui_modules.update(modules)
+
+    # Measure the import of the user interface alone for comparison
+    start = time.perf_counter()
+    gui_import = subprocess.run(
+        [sys.executable, "-c", "import classes.user_interface"],
+        cwd=source_directory, capture_output=True, check=False)
+    gui_import_time: float = time.perf_counter() - start
+
+    print("Headless process (ms):",
+          round(sum(process_times) / len(process_times) * 1000, 1),
+          "\tFirst detection (ms):",
+          round(sum(detection_times) / len(detection_times) * 1000, 1),
+          "\tGUI modules loaded:", ", ".join(sorted(gui_modules)) or "none")
+    if gui_import.returncode == 0:
+        print("User interface import (ms):", round(gui_import_time * 1000, 1))
+    else:
+        print("User interface import (ms): not available (tkinter or PIL missing)")
+
+    # Fail if the headless command imported the user interface
+    return 1 if gui_modules else 0
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command of the command line, by default the user interface."""
+    # Initialize the parser of the command line
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Neural network detecting handwritten digits.")
+    parser.add_argument("--weights", default=PATH_TO_WEIGHTS,
+                        help="CSV or binary weight file")
+    parser.add_argument("--backend", default=None,
+                        help="compute backend ('list', 'array' or 'numpy')")
+    parser.set_defaults(command=show_user_interface)
+    commands = parser.add_subparsers(title="commands")
+
+    # Show the user interface
+    commands.add_parser("gui", help="show the user interface (default)")
+
+    # Convert the CSV weights into the binary weight file
+    convert: argparse.ArgumentParser = commands.add_parser(
+        "convert", help="convert the CSV weights into a binary weight file")
+    convert.add_argument("--output", default=None, help="path to the binary file")
+    convert.add_argument("--typecode", default="d", choices=("d", "f"),
+                         help="'d' for float64, 'f' for float32")
+    convert.set_defaults(command=convert_weights)
+
+    # Predict the images of a file or directory
+    predict: argparse.ArgumentParser = commands.add_parser(
+        "predict", help="stream the predictions for an IDX file, a CSV file or a "
+        "directory of PNG files")
+    predict.add_argument("source", help="IDX file, CSV file or directory of PNGs")
+    predict.add_argument("--output", default=None,
+                         help="CSV file of the predictions (default: standard output)")
+    predict.add_argument("--batch-size", type=int, default=256,
+                         help="number of images per forward pass")
+    predict.add_argument("--workers", type=int, default=None,
+                         help="number of decoding processes (default: one per CPU)")
+    predict.set_defaults(command=predict_images)
+
+    # Serve the predictions over HTTP
+    serve: argparse.ArgumentParser = commands.add_parser(
+        "serve", help="serve the predictions over HTTP on localhost")
+    serve.add_argument("--host", default="127.0.0.1", help="loopback address")
+    serve.add_argument("--port", type=int, default=8000, help="port")
+    serve.add_argument("--max-batch-size", type=int, default=32,
+                       help="largest number of requests per forward pass")
+    serve.add_argument("--max-wait-ms", type=float, default=5.0,
+                       help="longest wait for more requests of a batch")
+    serve.add_argument("--cache-size", type=int, default=0,
+                       help="number of cached predictions (0 turns the cache off)")
+    serve.add_argument("--cache-ttl", type=float, default=None,
+                       help="seconds a cached prediction is valid")
+    serve.set_defaults(command=serve_predictions)
+
+    # Detect one image without the user interface
+    commands.add_parser("headless", help="detect one blank image without the "
+                        "user interface").set_defaults(command=start_headless)
+
+    # Measure the startup of the headless command
+    startup: argparse.ArgumentParser = commands.add_parser(
+        "startup", help="measure the startup of the headless command")
+    startup.add_argument("--repetitions", type=int, default=5,
+                         help="number of started processes")
+    startup.set_defaults(command=startup_report)
+
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    return arguments.command(arguments)
+
 
 if __name__ == "__main__":
     sys.exit(main())
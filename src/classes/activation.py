@@ -0,0 +1,455 @@
+"""File containing the activation functions of the neural network."""
+
+# Import necessary for the create method
+from __future__ import annotations
+
+# Import used Python libraries
+import math
+
+# Import used classes
+from classes.backend import Backend
+
+class Activation:
+    """
+    A class representing an activation function of one layer.
+
+    The kernels themselves are provided by the compute backend, so each activation
+    works on whole batches of values at once.
+
+    Attributes
+    ----------
+    name: str
+        Name under which the activation function can be selected.
+    lookup_table_size: int
+        Number of entries of the lookup table. 0 disables the lookup table.
+    lookup_table_range: tuple[float, float]
+        Smallest and largest input value covered by the lookup table.
+    lookup_table: list[float]
+        Values of the activation function sampled evenly over the range.
+
+    Methods
+    -------
+    create
+        Create the activation function with the given name.
+    set_lookup_table
+        Set the size & range of the lookup table and fill it.
+    get_lookup_table_size
+        Return the number of entries of the lookup table.
+    get_lookup_table_range
+        Return the smallest and largest input value covered by the lookup table.
+    get_lookup_table
+        Return the values of the lookup table.
+    get_key
+        Return a key identifying the transformation done by the activation.
+    scalar
+        Calculate the exact output value for one input value.
+    forward
+        Calculate the output values of a layer from its input values.
+    derivative
+        Calculate the derivative at a layer from its output values.
+
+    """
+
+    name: str = ""
+
+    def __init__(
+            self, lookup_table_size: int = 0,
+            lookup_table_range: tuple[float, float] = (-8.0, 8.0)
+    ) -> None:
+        """
+        Construct one Activation object with the given attributes.
+
+        Parameters
+        ----------
+        lookup_table_size: int
+            Number of entries of the lookup table that approximates the activation
+            function during inference. 0 disables the lookup table.
+        lookup_table_range: tuple[float, float]
+            Smallest and largest input value covered by the lookup table. Values
+            outside the range get the value at the nearest end of the table.
+
+        """
+        self.set_lookup_table(lookup_table_size, lookup_table_range)
+
+    @staticmethod
+    def create(name: str, lookup_table_size: int = 0) -> Activation:
+        """
+        Create the activation function with the given name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the activation function ('sigmoid', 'relu' or 'softmax').
+        lookup_table_size: int
+            Number of entries of the lookup table. 0 disables the lookup table.
+
+        Returns
+        -------
+        activation: Activation
+            The created activation function.
+
+        Raises
+        ------
+        ValueError
+            If the name is unknown.
+
+        """
+        for activation_class in (Sigmoid, ReLU, Softmax):
+            if activation_class.name == name:
+                return activation_class(lookup_table_size)
+
+        raise ValueError("The activation function '" + name + "' is unknown.")
+
+    def set_lookup_table(
+            self, lookup_table_size: int, lookup_table_range: tuple[float, float]
+    ) -> None:
+        """
+        Set the size & range of the lookup table and fill it.
+
+        Parameters
+        ----------
+        lookup_table_size: int
+            Number of entries of the lookup table. 0 disables the lookup table.
+        lookup_table_range: tuple[float, float]
+            Smallest and largest input value covered by the lookup table.
+
+        Raises
+        ------
+        ValueError
+            If the lookup table would have exactly one entry or an empty range.
+
+        """
+        if lookup_table_size == 1 or lookup_table_range[0] >= lookup_table_range[1]:
+            raise ValueError("The lookup table needs at least two entries and a range.")
+
+        self.lookup_table_size: int = lookup_table_size
+        self.lookup_table_range: tuple[float, float] = lookup_table_range
+
+        # Sample the exact function evenly over the range
+        step: float = (lookup_table_range[1] - lookup_table_range[0]) / max(
+            lookup_table_size - 1, 1)
+        self.lookup_table: list[float] = [
+            self.scalar(lookup_table_range[0] + i * step)
+            for i in range(lookup_table_size)]
+
+    def get_lookup_table_size(self) -> int:
+        """
+        Return the number of entries of the lookup table.
+
+        Returns
+        -------
+        lookup_table_size: int
+            Number of entries of the lookup table. 0 if it is disabled.
+
+        """
+        return self.lookup_table_size
+
+    def get_lookup_table_range(self) -> tuple[float, float]:
+        """
+        Return the smallest and largest input value covered by the lookup table.
+
+        Returns
+        -------
+        lookup_table_range: tuple[float, float]
+            Smallest and largest input value covered by the lookup table.
+
+        """
+        return self.lookup_table_range
+
+    def get_lookup_table(self) -> list[float]:
+        """
+        Return the values of the lookup table.
+
+        Returns
+        -------
+        lookup_table: list[float]
+            Values of the activation function sampled evenly over the range.
+
+        """
+        return self.lookup_table
+
+    def get_key(self) -> tuple[str, int, tuple[float, float]]:
+        """
+        Return a key identifying the transformation done by the activation.
+
+        Returns
+        -------
+        tuple[str, int, tuple[float, float]]
+            Name, lookup table size and lookup table range.
+
+        """
+        return (self.name, self.get_lookup_table_size(), self.get_lookup_table_range())
+
+    def scalar(self, x_value: float) -> float:
+        """
+        Calculate the exact output value for one input value.
+
+        Parameters
+        ----------
+        x_value: float
+            Input value of the neuron.
+
+        """
+        raise NotImplementedError
+
+    def forward(self, backend: Backend, matrix, approximate: bool = False):
+        """
+        Calculate the output values of a layer from its input values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        matrix
+            Input values of the layer. One column per image.
+        approximate: bool
+            Whether to use the lookup table (if there is one) instead of the exact
+            kernel. Only meant for inference.
+
+        """
+        raise NotImplementedError
+
+    def derivative(self, backend: Backend, output_values):
+        """
+        Calculate the derivative at a layer from its output values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        output_values
+            Output values of the layer.
+
+        """
+        raise NotImplementedError
+
+
+class Sigmoid(Activation):
+    """A class representing the sigmoid function y = 1 / (1 + e^-x)."""
+
+    name: str = "sigmoid"
+
+    def scalar(self, x_value: float) -> float:
+        """
+        Calculate the exact output value for one input value.
+
+        Parameters
+        ----------
+        x_value: float
+            Input value of the neuron.
+
+        Returns
+        -------
+        float
+            Output value of the neuron. Values are in range of [0; 1].
+
+        """
+        # Use the form that can't overflow for the sign of the value
+        if x_value >= 0:
+            return 1 / (1 + math.exp(-x_value))
+
+        return math.exp(x_value) / (1 + math.exp(x_value))
+
+    def forward(self, backend: Backend, matrix, approximate: bool = False):
+        """
+        Calculate the output values of a layer from its input values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        matrix
+            Input values of the layer. One column per image.
+        approximate: bool
+            Whether to use the lookup table (if there is one).
+
+        Returns
+        -------
+        Output values of the layer.
+
+        """
+        if approximate and self.get_lookup_table_size():
+            return backend.lookup(matrix, self.get_lookup_table(),
+                                  *self.get_lookup_table_range())
+
+        return backend.sigmoid(matrix)
+
+    def derivative(self, backend: Backend, output_values):
+        """
+        Calculate the derivative at a layer from its output values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        output_values
+            Output values of the layer.
+
+        Returns
+        -------
+        Ok * (1 - Ok) for each output value.
+
+        """
+        return backend.sigmoid_derivative(output_values)
+
+
+class ReLU(Activation):
+    """A class representing the rectified linear unit y = max(0, x)."""
+
+    name: str = "relu"
+
+    def scalar(self, x_value: float) -> float:
+        """
+        Calculate the exact output value for one input value.
+
+        Parameters
+        ----------
+        x_value: float
+            Input value of the neuron.
+
+        Returns
+        -------
+        float
+            Output value of the neuron.
+
+        """
+        return max(x_value, 0.0)
+
+    def forward(self, backend: Backend, matrix, approximate: bool = False):
+        """
+        Calculate the output values of a layer from its input values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        matrix
+            Input values of the layer. One column per image.
+        approximate: bool
+            Whether to use the lookup table (if there is one).
+
+        Returns
+        -------
+        Output values of the layer.
+
+        Notes
+        -----
+        The lookup table is supported for consistency, but the exact kernel is a
+        single comparison per value and therefore never slower.
+
+        """
+        if approximate and self.get_lookup_table_size():
+            return backend.lookup(matrix, self.get_lookup_table(),
+                                  *self.get_lookup_table_range())
+
+        return backend.relu(matrix)
+
+    def derivative(self, backend: Backend, output_values):
+        """
+        Calculate the derivative at a layer from its output values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        output_values
+            Output values of the layer.
+
+        Returns
+        -------
+        1.0 for each positive output value, otherwise 0.0.
+
+        """
+        return backend.relu_derivative(output_values)
+
+
+class Softmax(Activation):
+    """
+    A class representing the softmax function y_i = e^x_i / sum_j(e^x_j).
+
+    The softmax function is meant for the output layer together with the
+    cross-entropy loss. The error at the output layer (expected values minus output
+    values) then already is the gradient with respect to the input values, so the
+    derivative is 1 for each value.
+
+    """
+
+    name: str = "softmax"
+
+    def __init__(
+            self, lookup_table_size: int = 0,
+            lookup_table_range: tuple[float, float] = (-16.0, 0.0)
+    ) -> None:
+        """
+        Construct one Softmax object with the given attributes.
+
+        Parameters
+        ----------
+        lookup_table_size: int
+            Number of entries of the lookup table that approximates e^x after the
+            max value of each column was subtracted. 0 disables the lookup table.
+        lookup_table_range: tuple[float, float]
+            Smallest and largest input value of e^x covered by the lookup table.
+
+        """
+        super().__init__(lookup_table_size, lookup_table_range)
+
+    def scalar(self, x_value: float) -> float:
+        """
+        Calculate e^x, the scalar part of the softmax function.
+
+        Parameters
+        ----------
+        x_value: float
+            Input value reduced by the max value of its column.
+
+        Returns
+        -------
+        float
+            e^x for the given value.
+
+        """
+        return math.exp(x_value)
+
+    def forward(self, backend: Backend, matrix, approximate: bool = False):
+        """
+        Calculate the output values of a layer from its input values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        matrix
+            Input values of the layer. One column per image.
+        approximate: bool
+            Whether to look up e^x in the lookup table (if there is one).
+
+        Returns
+        -------
+        Output values of the layer. The values of each column sum up to 1.
+
+        """
+        if approximate and self.get_lookup_table_size():
+            return backend.normalize_columns(backend.lookup(
+                backend.subtract_column_max(matrix), self.get_lookup_table(),
+                *self.get_lookup_table_range()))
+
+        return backend.softmax(matrix)
+
+    def derivative(self, backend: Backend, output_values):
+        """
+        Calculate the derivative at a layer from its output values.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the calculation.
+        output_values
+            Output values of the layer.
+
+        Returns
+        -------
+        A matrix of ones (see the notes of the class).
+
+        """
+        return backend.ones_like(output_values)
@@ -0,0 +1,3538 @@
+"""File containing the compute backends of the neural network."""
+
+# Import necessary for the create method
+from __future__ import annotations
+
+# Import used Python libraries
+import math
+import operator
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+from typing import TYPE_CHECKING
+
+# Import used classes
+from classes.matrix import Matrix, Vector
+from classes.sparse_matrix import SparseMatrix
+
+# Import NumPy if it is installed, otherwise only the pure Python backends are available
+if TYPE_CHECKING:
+    import numpy
+else:
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+# Define Euler's Number as a global constant
+EULERS_NUMBER: float = 2.718281828459045
+
+class Backend(ABC):
+    """
+    An abstract class representing the interface of a compute backend.
+
+    A backend owns the representation of the matrices (weight matrices as well as
+    the values and errors at each layer) and the operations performed on them.
+    Column vectors are matrices with a single column.
+
+    Attributes
+    ----------
+    name: str
+        Name under which the backend can be selected.
+
+    Methods
+    -------
+    create
+        Create the backend with the given name.
+    is_available
+        Return whether the backend can be used in the current environment.
+    from_lists
+        Convert a nested list of floats into the matrix type of the backend.
+    to_lists
+        Convert a matrix of the backend into a nested list of floats.
+    column_vector
+        Create a column vector from a list of floats.
+    column_matrix
+        Create a matrix whose columns are the given lists of floats.
+    one_hot
+        Create a matrix whose columns are one-hot encodings of the given labels.
+    column_count
+        Return the number of columns of a matrix.
+    create_buffer
+        Create a compact buffer holding one row of floats per image.
+    write_rows
+        Write the columns of a matrix into consecutive rows of a buffer.
+    read_columns
+        Create a matrix whose columns are the given rows of a buffer.
+    matrix_multiplication
+        Multiplicate two given matrices.
+    invert
+        Return an inverted matrix.
+    matrix_addition
+        Add the values of two matrices together.
+    matrix_addition_in_place
+        Add the values of the second matrix to the first one in place.
+    transposed_matrix_multiplication
+        Multiplicate the inverted first matrix with the second matrix.
+    create_update_buffer
+        Create the scratch buffer used to update a weight matrix in place.
+    add_matrix_product_in_place
+        Add the product of a matrix and an inverted matrix to a matrix in place.
+    matrix_subtraction
+        Subtract the values of the second matrix from the first one.
+    sigmoid
+        Apply the sigmoid function to each value of a matrix.
+    sigmoid_derivative
+        Calculate the derivative of the sigmoid function from its output values.
+    relu
+        Apply the rectified linear unit to each value of a matrix.
+    relu_derivative
+        Calculate the derivative of the rectified linear unit from its output values.
+    softmax
+        Apply the softmax function to each column of a matrix.
+    ones_like
+        Return a matrix of ones with the dimensions of the given matrix.
+    subtract_column_max
+        Subtract the max value of each column from the values of the column.
+    normalize_columns
+        Divide the values of each column by the sum of the column.
+    lookup
+        Approximate a function by looking up each value of a matrix in a table.
+    error_gradient
+        Calculate Alpha * Ek * f'(Ik) for each value of a matrix.
+    argmax
+        Return the row index of the max value of each column.
+    quantize_rows
+        Quantize each row of a matrix to int8 values with its own scale.
+    from_quantized_lists
+        Convert a nested list of int8 values into the int8 matrix type.
+    quantized_matrix_multiplication
+        Multiplicate a quantized matrix with a matrix of floats.
+    sparse_matrix_multiplication
+        Multiplicate a sparse matrix with a matrix of the backend.
+    zeros_like
+        Return a matrix of zeros with the dimensions of the given matrix.
+    outer_product
+        Multiplicate a matrix with an inverted matrix.
+    linear_combination_in_place
+        Replace the first matrix by a weighted sum of two matrices in place.
+    adam_update_in_place
+        Update the moments of the Adam optimizer and the weights in place.
+    quantize_pixels
+        Quantize the pixels of an image to bytes.
+
+    """
+
+    name: str = ""
+
+    @staticmethod
+    def create(name: str | None = None) -> Backend:
+        """
+        Create the backend with the given name.
+
+        Parameters
+        ----------
+        name: str | None
+            Name of the backend ('numpy', 'array', 'array32' or 'list'). If None, the
+            NumPy backend is used if NumPy is installed, otherwise the array backend
+            is used.
+
+        Returns
+        -------
+        backend: Backend
+            The created backend.
+
+        Raises
+        ------
+        ValueError
+            If the name is unknown or the backend isn't available.
+
+        """
+        # Use the fastest available backend if no name was given
+        if name is None:
+            name = NumpyBackend.name if NumpyBackend.is_available() else "array"
+
+        for backend_class in (NumpyBackend, ArrayBackend, Float32ArrayBackend,
+                              ListBackend):
+            if backend_class.name == name:
+                # Check if the backend can be used
+                if not backend_class.is_available():
+                    raise ValueError("The backend '" + name + "' isn't available.")
+
+                return backend_class()
+
+        raise ValueError("The backend '" + name + "' is unknown.")
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Return whether the backend can be used in the current environment.
+
+        Returns
+        -------
+        bool
+            True if the backend can be used, otherwise False.
+
+        """
+        return True
+
+    @abstractmethod
+    def from_lists(self, matrix, copy: bool = True):
+        """
+        Convert a nested list of floats into the matrix type of the backend.
+
+        Parameters
+        ----------
+        matrix
+            Nested list of floats (or a matrix of the backend).
+        copy: bool
+            Whether a matrix that already is of the matrix type of the backend is
+            copied. Without a copy, in-place changes affect the given matrix.
+
+        """
+
+    @abstractmethod
+    def to_lists(self, matrix) -> list[list[float]]:
+        """
+        Convert a matrix of the backend into a nested list of floats.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of the backend.
+
+        """
+
+    @abstractmethod
+    def column_vector(self, values: list[float]):
+        """
+        Create a column vector from a list of floats.
+
+        Parameters
+        ----------
+        values: list[float]
+            Values of the column vector.
+
+        """
+
+    @abstractmethod
+    def column_matrix(self, columns: Sequence[Sequence[float]]):
+        """
+        Create a matrix whose columns are the given lists of floats.
+
+        Parameters
+        ----------
+        columns: Sequence[Sequence[float]]
+            Values of each column (e.g. lists or rows of a buffer).
+
+        """
+
+    @abstractmethod
+    def one_hot(self, labels: list[int], size: int):
+        """
+        Create a matrix whose columns are one-hot encodings of the given labels.
+
+        Parameters
+        ----------
+        labels: list[int]
+            Row index that is set to 1.0 for each column.
+        size: int
+            Number of rows of the matrix.
+
+        """
+
+    @abstractmethod
+    def column_count(self, matrix) -> int:
+        """
+        Return the number of columns of a matrix.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of the backend.
+
+        """
+
+    @abstractmethod
+    def create_buffer(self, rows: int, width: int):
+        """
+        Create a compact buffer holding one row of floats per image.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the buffer.
+        width: int
+            Number of floats per row.
+
+        """
+
+    @abstractmethod
+    def write_rows(self, buffer, start: int, matrix) -> None:
+        """
+        Write the columns of a matrix into consecutive rows of a buffer.
+
+        Parameters
+        ----------
+        buffer
+            Buffer created by create_buffer.
+        start: int
+            Index of the row the first column is written to.
+        matrix
+            Matrix of the backend whose columns are written.
+
+        """
+
+    @abstractmethod
+    def read_columns(self, buffer, indices, width: int):
+        """
+        Create a matrix whose columns are the given rows of a buffer.
+
+        Parameters
+        ----------
+        buffer
+            Buffer created by create_buffer.
+        indices
+            Indices of the rows that are read.
+        width: int
+            Number of floats per row.
+
+        """
+
+    @abstractmethod
+    def matrix_multiplication(self, matrix_1, matrix_2):
+        """
+        Multiplicate two given matrices.
+
+        Parameters
+        ----------
+        matrix_1
+            First matrix of the equation.
+        matrix_2
+            Second matrix of the equation.
+
+        """
+
+    @abstractmethod
+    def invert(self, matrix):
+        """
+        Return an inverted matrix.
+
+        Parameters
+        ----------
+        matrix
+            The matrix which shall be inverted.
+
+        """
+
+    @abstractmethod
+    def matrix_addition(self, matrix_1, matrix_2):
+        """
+        Add the values of two matrices together.
+
+        Parameters
+        ----------
+        matrix_1
+            First matrix of the equation.
+        matrix_2
+            Second matrix of the equation.
+
+        """
+
+    @abstractmethod
+    def matrix_addition_in_place(self, matrix_1, matrix_2) -> None:
+        """
+        Add the values of the second matrix to the first one in place.
+
+        Parameters
+        ----------
+        matrix_1
+            Matrix that is changed.
+        matrix_2
+            Matrix whose values are added.
+
+        """
+
+    @abstractmethod
+    def transposed_matrix_multiplication(self, matrix_1, matrix_2):
+        """
+        Multiplicate the inverted first matrix with the second matrix.
+
+        Parameters
+        ----------
+        matrix_1
+            First matrix of the equation, which is used inverted.
+        matrix_2
+            Second matrix of the equation.
+
+        """
+
+    @abstractmethod
+    def create_update_buffer(self, matrix):
+        """
+        Create the scratch buffer used to update a weight matrix in place.
+
+        Parameters
+        ----------
+        matrix
+            The weight matrix.
+
+        """
+
+    @abstractmethod
+    def add_matrix_product_in_place(self, matrix, matrix_1, matrix_2, buffer) -> None:
+        """
+        Add the product of a matrix and an inverted matrix to a matrix in place.
+
+        Calculates matrix += matrix_1 * matrix_2^T.
+
+        Parameters
+        ----------
+        matrix
+            Matrix that is changed.
+        matrix_1
+            First matrix of the product.
+        matrix_2
+            Second matrix of the product, which is used inverted.
+        buffer
+            Scratch buffer created by create_update_buffer for the matrix.
+
+        """
+
+    @abstractmethod
+    def matrix_subtraction(self, matrix_1, matrix_2):
+        """
+        Subtract the values of the second matrix from the first one.
+
+        Parameters
+        ----------
+        matrix_1
+            Minuend of the equation.
+        matrix_2
+            Subtrahend of the equation.
+
+        """
+
+    @abstractmethod
+    def sigmoid(self, matrix):
+        """
+        Apply the sigmoid function to each value of a matrix.
+
+        Parameters
+        ----------
+        matrix
+            Input values of the neurons.
+
+        """
+
+    @abstractmethod
+    def sigmoid_derivative(self, output_values):
+        """
+        Calculate the derivative of the sigmoid function from its output values.
+
+        Parameters
+        ----------
+        output_values
+            Output values of the sigmoid function.
+
+        """
+
+    @abstractmethod
+    def relu(self, matrix):
+        """
+        Apply the rectified linear unit to each value of a matrix.
+
+        Parameters
+        ----------
+        matrix
+            Input values of the neurons.
+
+        """
+
+    @abstractmethod
+    def relu_derivative(self, output_values):
+        """
+        Calculate the derivative of the rectified linear unit from its output values.
+
+        Parameters
+        ----------
+        output_values
+            Output values of the rectified linear unit.
+
+        """
+
+    @abstractmethod
+    def softmax(self, matrix):
+        """
+        Apply the softmax function to each column of a matrix.
+
+        Parameters
+        ----------
+        matrix
+            Input values of the neurons. One column per image.
+
+        """
+
+    @abstractmethod
+    def ones_like(self, matrix):
+        """
+        Return a matrix of ones with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix
+            Matrix whose dimensions are used.
+
+        """
+
+    @abstractmethod
+    def subtract_column_max(self, matrix):
+        """
+        Subtract the max value of each column from the values of the column.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of the backend.
+
+        """
+
+    @abstractmethod
+    def normalize_columns(self, matrix):
+        """
+        Divide the values of each column by the sum of the column.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of the backend.
+
+        """
+
+    @abstractmethod
+    def lookup(self, matrix, table: list[float], minimum: float, maximum: float):
+        """
+        Approximate a function by looking up each value of a matrix in a table.
+
+        Parameters
+        ----------
+        matrix
+            Input values of the function.
+        table: list[float]
+            Values of the function sampled evenly from minimum to maximum.
+        minimum: float
+            Input value of the first entry of the table.
+        maximum: float
+            Input value of the last entry of the table.
+
+        """
+
+    @abstractmethod
+    def error_gradient(self, errors, derivatives, learning_rate: float):
+        """
+        Calculate Alpha * Ek * f'(Ik) for each value of a matrix.
+
+        Parameters
+        ----------
+        errors
+            Error at the layer.
+        derivatives
+            Derivative of the activation function at the layer.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+
+    @abstractmethod
+    def argmax(self, matrix) -> list[int]:
+        """
+        Return the row index of the max value of each column.
+
+        Parameters
+        ----------
+        matrix
+            Matrix whose columns are searched.
+
+        """
+
+    @abstractmethod
+    def quantize_rows(self, matrix):
+        """
+        Quantize each row of a matrix to int8 values with its own scale.
+
+        Parameters
+        ----------
+        matrix
+            Matrix of the backend.
+
+        """
+
+    @abstractmethod
+    def from_quantized_lists(self, matrix):
+        """
+        Convert a nested list of int8 values into the int8 matrix type.
+
+        Parameters
+        ----------
+        matrix
+            Nested list of integers in range of [-127; 127].
+
+        """
+
+    @abstractmethod
+    def quantized_matrix_multiplication(self, quantized_matrix, scales, matrix):
+        """
+        Multiplicate a quantized matrix with a matrix of floats.
+
+        Parameters
+        ----------
+        quantized_matrix
+            The int8 values of the first matrix of the equation.
+        scales
+            Column vector with the scale of each row of the quantized matrix.
+        matrix
+            Second matrix of the equation.
+
+        """
+
+    @abstractmethod
+    def sparse_matrix_multiplication(self, sparse_matrix: SparseMatrix, matrix):
+        """
+        Multiplicate a sparse matrix with a matrix of the backend.
+
+        Parameters
+        ----------
+        sparse_matrix: SparseMatrix
+            First matrix of the equation in CSR form.
+        matrix
+            Second matrix of the equation.
+
+        """
+
+    @abstractmethod
+    def zeros_like(self, matrix):
+        """
+        Return a matrix of zeros with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix
+            Matrix whose dimensions are used.
+
+        """
+
+    @abstractmethod
+    def outer_product(self, matrix_1, matrix_2, buffer=None):
+        """
+        Multiplicate a matrix with an inverted matrix.
+
+        Calculates matrix_1 * matrix_2^T, i.e. the summed up outer products of the
+        columns of the two matrices.
+
+        Parameters
+        ----------
+        matrix_1
+            First matrix of the product.
+        matrix_2
+            Second matrix of the product, which is used inverted.
+        buffer
+            Scratch buffer created by create_update_buffer that may receive the
+            product.
+
+        """
+
+    @abstractmethod
+    def linear_combination_in_place(
+            self, matrix_1, factor_1: float, matrix_2, factor_2: float
+    ) -> None:
+        """
+        Replace the first matrix by a weighted sum of two matrices in place.
+
+        Calculates matrix_1 = factor_1 * matrix_1 + factor_2 * matrix_2.
+
+        Parameters
+        ----------
+        matrix_1
+            Matrix that is changed.
+        factor_1: float
+            Factor of the first matrix.
+        matrix_2
+            Matrix that is added.
+        factor_2: float
+            Factor of the second matrix.
+
+        """
+
+    @abstractmethod
+    def adam_update_in_place(
+            self, matrix, first_moment, second_moment, gradient, beta_1: float,
+            beta_2: float, step_size: float, epsilon: float, buffer=None
+    ) -> None:
+        """
+        Update the moments of the Adam optimizer and the weights in place.
+
+        Parameters
+        ----------
+        matrix
+            Weight matrix that is changed.
+        first_moment
+            Moving average of the gradient, changed in place.
+        second_moment
+            Moving average of the squared gradient, changed in place.
+        gradient
+            The gradient of the weight matrix (pointing to smaller errors).
+        beta_1: float
+            Decay of the first moment.
+        beta_2: float
+            Decay of the second moment.
+        step_size: float
+            Learning rate including the bias correction of the moments.
+        epsilon: float
+            Value added to the root of the second moment to avoid a division by
+            zero.
+        buffer
+            Scratch buffer created by create_update_buffer.
+
+        """
+
+    @abstractmethod
+    def quantize_pixels(self, pixels) -> bytes:
+        """
+        Quantize the pixels of an image to bytes.
+
+        Parameters
+        ----------
+        pixels
+            The pixels of the image in range of [0; 1].
+
+        """
+
+class ListBackend(Backend):
+    """
+    A class representing the pure Python backend working on nested lists.
+
+    It is kept as reference implementation, the array backend is faster and needs
+    less memory.
+
+    """
+
+    name: str = "list"
+
+    def from_lists(
+            self, matrix: list[list[float]], copy: bool = True
+    ) -> list[list[float]]:
+        """
+        Convert a nested list of floats into the matrix type of the backend.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Nested list of floats (or a Matrix).
+        copy: bool
+            Whether a nested list is copied. Without a copy, in-place changes
+            affect the given matrix.
+
+        Returns
+        -------
+        matrix: list[list[float]]
+            The given matrix as a nested list of Python floats.
+
+        """
+        # Nested lists are already the matrix type of this backend
+        if isinstance(matrix, list) and not copy:
+            return matrix
+
+        if isinstance(matrix, Matrix):
+            return matrix.to_lists()
+
+        return [[float(value) for value in row] for row in matrix]
+
+    def to_lists(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Convert a matrix of the backend into a nested list of floats.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix of the backend.
+
+        Returns
+        -------
+        matrix: list[list[float]]
+            A copy of the given matrix.
+
+        """
+        return [list(row) for row in matrix]
+
+    def column_vector(self, values: list[float]) -> list[list[float]]:
+        """
+        Create a column vector from a list of floats.
+
+        Parameters
+        ----------
+        values: list[float]
+            Values of the column vector.
+
+        Returns
+        -------
+        column_vector: list[list[float]]
+            List of one-element lists.
+
+        """
+        return [[value] for value in values]
+
+    def column_matrix(self, columns: Sequence[Sequence[float]]) -> list[list[float]]:
+        """
+        Create a matrix whose columns are the given lists of floats.
+
+        Parameters
+        ----------
+        columns: Sequence[Sequence[float]]
+            Values of each column (e.g. lists or rows of a buffer).
+
+        Returns
+        -------
+        matrix: list[list[float]]
+            Matrix with len(columns[0]) rows and len(columns) columns.
+
+        """
+        return [list(row) for row in zip(*columns)]
+
+    def one_hot(self, labels: list[int], size: int) -> list[list[float]]:
+        """
+        Create a matrix whose columns are one-hot encodings of the given labels.
+
+        Parameters
+        ----------
+        labels: list[int]
+            Row index that is set to 1.0 for each column.
+        size: int
+            Number of rows of the matrix.
+
+        Returns
+        -------
+        matrix: list[list[float]]
+            Matrix with size rows and len(labels) columns.
+
+        """
+        return [[1.0 if label == row else 0.0 for label in labels]
+                for row in range(size)]
+
+    def column_count(self, matrix: list[list[float]]) -> int:
+        """
+        Return the number of columns of a matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix of the backend.
+
+        Returns
+        -------
+        int
+            Number of columns of the matrix.
+
+        """
+        return len(matrix[0])
+
+    def create_buffer(self, rows: int, width: int) -> array:
+        """
+        Create a compact buffer holding one row of floats per image.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the buffer.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        array
+            Flat array of doubles (rows * width) stored row after row.
+
+        """
+        return array("d", bytes(8 * rows * width))
+
+    def write_rows(self, buffer: array, start: int, matrix: list[list[float]]) -> None:
+        """
+        Write the columns of a matrix into consecutive rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: array
+            Buffer created by create_buffer.
+        start: int
+            Index of the row the first column is written to.
+        matrix: list[list[float]]
+            Matrix of the backend whose columns are written.
+
+        """
+        width: int = len(matrix)
+
+        for row, column in enumerate(zip(*matrix), start):
+            buffer[row * width:(row + 1) * width] = array("d", column)
+
+    def read_columns(self, buffer: array, indices, width: int) -> list[list[float]]:
+        """
+        Create a matrix whose columns are the given rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: array
+            Buffer created by create_buffer.
+        indices
+            Indices of the rows that are read.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix with width rows and one column per index.
+
+        """
+        return self.column_matrix(
+            [buffer[index * width:(index + 1) * width] for index in indices])
+
+    def matrix_multiplication(
+            self, matrix_1: Sequence[Sequence[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Multiplicate two given matrices.
+
+        Parameters
+        ----------
+        matrix_1: Sequence[Sequence[float]]
+            First matrix of the equation (e.g. the int8 values of a quantized
+            matrix).
+        matrix_2: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        matrix_product: list[list[float]]
+            Product of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if len(matrix_1[0]) != len(matrix_2):
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Initialize the product of the two given matrices
+        matrix_product: list[list[float]] = []
+
+        for row_matrix_1 in range(len(matrix_1)):
+            # Add a new line to the product.
+            matrix_product.append([])
+
+            for column_matrix_2 in range(len(matrix_2[0])):
+                # Multiply row of matrix 1 with column of matrix 2
+                matrix_product[row_matrix_1].append(sum([
+                    matrix_1[row_matrix_1][col_1_row_2]
+                    * matrix_2[col_1_row_2][column_matrix_2]
+                    for col_1_row_2 in range(len(matrix_1[0]))]))
+
+        return matrix_product
+
+    def invert(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Return an inverted matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            The matrix which shall be inverted.
+
+        Returns
+        -------
+        values_inverted: list[list[float]]
+            Matrix with inverted values.
+
+        """
+        values_inverted: list[list[float]] = []
+
+        for col in range(len(matrix[0])):
+            # For each column add a new row
+            values_inverted.append([])
+
+            for row in range(len(matrix)):
+                values_inverted[col].append(matrix[row][col])
+
+        return values_inverted
+
+    def matrix_addition(
+            self, matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Add the values of two matrices together.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            First matrix of the equation.
+        matrix_2: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        matrix_sum: list[list[float]]
+            Sum of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if len(matrix_1) != len(matrix_2) or len(matrix_1[0]) != len(matrix_2[0]):
+            raise ValueError("The two given matrices can't be added together")
+
+        matrix_sum = [
+            [matrix_1[row][col] + matrix_2[row][col]
+             for col in range(len(matrix_1[0]))] for row in range(len(matrix_1))]
+
+        return matrix_sum
+
+    def matrix_addition_in_place(
+            self, matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> None:
+        """
+        Add the values of the second matrix to the first one in place.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            Matrix that is changed.
+        matrix_2: list[list[float]]
+            Matrix whose values are added.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if len(matrix_1) != len(matrix_2) or len(matrix_1[0]) != len(matrix_2[0]):
+            raise ValueError("The two given matrices can't be added together")
+
+        for row_1, row_2 in zip(matrix_1, matrix_2):
+            row_1[:] = [value_1 + value_2 for value_1, value_2 in zip(row_1, row_2)]
+
+    def transposed_matrix_multiplication(
+            self, matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Multiplicate the inverted first matrix with the second matrix.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            First matrix of the equation, which is used inverted.
+        matrix_2: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        matrix_product: list[list[float]]
+            Product of the inverted first matrix and the second matrix.
+
+        Raises
+        ------
+        ValueError
+            If the number of rows of the two matrices isn't equal.
+
+        Notes
+        -----
+        The inverted matrix is never built. Instead, the rows of the first matrix
+        are summed up, weighted by the values of each column of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if len(matrix_1) != len(matrix_2):
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Initialize the columns of the product
+        product_columns: list[list[float]] = []
+
+        for col in range(len(matrix_2[0])):
+            # Sum up the rows of the first matrix weighted by the column
+            product_column: list[float] = [0.0] * len(matrix_1[0])
+            for row_1, row_2 in zip(matrix_1, matrix_2):
+                weight: float = row_2[col]
+                product_column = [
+                    value + value_1 * weight
+                    for value, value_1 in zip(product_column, row_1)]
+
+            product_columns.append(product_column)
+
+        return self.column_matrix(product_columns)
+
+    def create_update_buffer(self, matrix: list[list[float]]) -> None:
+        """
+        Create the scratch buffer used to update a weight matrix in place.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            The weight matrix.
+
+        Returns
+        -------
+        None
+            The list backend updates the rows directly and needs no buffer.
+
+        """
+        return None
+
+    def add_matrix_product_in_place(
+            self, matrix: list[list[float]], matrix_1: list[list[float]],
+            matrix_2: list[list[float]], buffer: None = None
+    ) -> None:
+        """
+        Add the product of a matrix and an inverted matrix to a matrix in place.
+
+        Calculates matrix += matrix_1 * matrix_2^T.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix that is changed.
+        matrix_1: list[list[float]]
+            First matrix of the product.
+        matrix_2: list[list[float]]
+            Second matrix of the product, which is used inverted.
+        buffer: None
+            Unused, the rows are updated directly.
+
+        Raises
+        ------
+        ValueError
+            If the dimensions of the matrices don't match.
+
+        """
+        # Check if the dimensions of the matrices match
+        if (len(matrix) != len(matrix_1) or len(matrix[0]) != len(matrix_2)
+                or len(matrix_1[0]) != len(matrix_2[0])):
+            raise ValueError("The product can't be added to the matrix.")
+
+        # Get the columns of the second matrix (rows of its inverted matrix)
+        columns_2: list[tuple[float, ...]] = list(zip(*matrix_2))
+
+        for row, coefficients in zip(matrix, matrix_1):
+            for coefficient, column_2 in zip(coefficients, columns_2):
+                # Adding a zero change would leave the row unchanged
+                if coefficient:
+                    row[:] = [value + coefficient * value_2
+                              for value, value_2 in zip(row, column_2)]
+
+    def matrix_subtraction(
+            self, matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Subtract the values of the second matrix from the first one.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            Minuend of the equation.
+        matrix_2: list[list[float]]
+            Subtrahend of the equation.
+
+        Returns
+        -------
+        matrix_difference: list[list[float]]
+            Difference of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be subtracted from each other
+        if len(matrix_1) != len(matrix_2) or len(matrix_1[0]) != len(matrix_2[0]):
+            raise ValueError("The two given matrices can't be subtracted")
+
+        matrix_difference = [
+            [matrix_1[row][col] - matrix_2[row][col]
+             for col in range(len(matrix_1[0]))] for row in range(len(matrix_1))]
+
+        return matrix_difference
+
+    def sigmoid(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Apply the sigmoid function to each value of a matrix.
+
+        The function is as follows: y = 1 / (1 + e^-x)
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Input values of the neurons.
+
+        Returns
+        -------
+        output_values: list[list[float]]
+            Output values of the neurons. Values are in range of [0; 1].
+
+        Notes
+        -----
+        For negative values the equivalent form y = e^x / (1 + e^x) is used, so
+        e^-x can't overflow for large negative values.
+
+        """
+        return [[1 / (1 + EULERS_NUMBER ** -value) if value >= 0
+                 else EULERS_NUMBER ** value / (1 + EULERS_NUMBER ** value)
+                 for value in row] for row in matrix]
+
+    def sigmoid_derivative(self, output_values: list[list[float]]) -> list[list[float]]:
+        """
+        Calculate the derivative of the sigmoid function from its output values.
+
+        Parameters
+        ----------
+        output_values: list[list[float]]
+            Output values of the sigmoid function.
+
+        Returns
+        -------
+        derivatives: list[list[float]]
+            Ok * (1 - Ok) for each output value.
+
+        """
+        return [[value * (1 - value) for value in row] for row in output_values]
+
+    def relu(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Apply the rectified linear unit to each value of a matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Input values of the neurons.
+
+        Returns
+        -------
+        output_values: list[list[float]]
+            max(0, x) for each input value.
+
+        """
+        return [[value if value > 0.0 else 0.0 for value in row] for row in matrix]
+
+    def relu_derivative(self, output_values: list[list[float]]) -> list[list[float]]:
+        """
+        Calculate the derivative of the rectified linear unit from its output values.
+
+        Parameters
+        ----------
+        output_values: list[list[float]]
+            Output values of the rectified linear unit.
+
+        Returns
+        -------
+        derivatives: list[list[float]]
+            1.0 for each positive output value, otherwise 0.0.
+
+        """
+        return [[1.0 if value > 0.0 else 0.0 for value in row] for row in output_values]
+
+    def softmax(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Apply the softmax function to each column of a matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Input values of the neurons. One column per image.
+
+        Returns
+        -------
+        output_values: list[list[float]]
+            Output values of the neurons. The values of each column sum up to 1.
+
+        """
+        return self.normalize_columns([
+            [EULERS_NUMBER ** value for value in row]
+            for row in self.subtract_column_max(matrix)])
+
+    def ones_like(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Return a matrix of ones with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix of ones.
+
+        """
+        return [[1.0] * len(row) for row in matrix]
+
+    def subtract_column_max(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Subtract the max value of each column from the values of the column.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix of the backend.
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix whose max value of each column is 0.
+
+        """
+        column_max: list[float] = [max(column) for column in zip(*matrix)]
+
+        return [[value - maximum for value, maximum in zip(row, column_max)]
+                for row in matrix]
+
+    def normalize_columns(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Divide the values of each column by the sum of the column.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix of the backend.
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix whose values of each column sum up to 1.
+
+        """
+        column_sum: list[float] = [sum(column) for column in zip(*matrix)]
+
+        return [[value / total for value, total in zip(row, column_sum)]
+                for row in matrix]
+
+    def lookup(
+            self, matrix: list[list[float]], table: list[float], minimum: float,
+            maximum: float
+    ) -> list[list[float]]:
+        """
+        Approximate a function by looking up each value of a matrix in a table.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Input values of the function.
+        table: list[float]
+            Values of the function sampled evenly from minimum to maximum.
+        minimum: float
+            Input value of the first entry of the table.
+        maximum: float
+            Input value of the last entry of the table.
+
+        Returns
+        -------
+        list[list[float]]
+            The table entry nearest to each value. Values outside of the range of
+            the table get the first or the last entry.
+
+        """
+        # Factor converting a value into an index of the table
+        scale: float = (len(table) - 1) / (maximum - minimum)
+        last_index: int = len(table) - 1
+
+        return [[table[min(max(round((value - minimum) * scale), 0), last_index)]
+                 for value in row] for row in matrix]
+
+    def error_gradient(
+            self, errors: list[list[float]], derivatives: list[list[float]],
+            learning_rate: float
+    ) -> list[list[float]]:
+        """
+        Calculate Alpha * Ek * f'(Ik) for each value of a matrix.
+
+        Parameters
+        ----------
+        errors: list[list[float]]
+            Error at the layer.
+        derivatives: list[list[float]]
+            Derivative of the activation function at the layer.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        Returns
+        -------
+        gradient: list[list[float]]
+            The gradient scaled by the learning rate.
+
+        """
+        return [
+            [learning_rate * (err * der) for err, der in zip(err_row, der_row)]
+            for err_row, der_row in zip(errors, derivatives)]
+
+    def argmax(self, matrix: list[list[float]]) -> list[int]:
+        """
+        Return the row index of the max value of each column.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix whose columns are searched.
+
+        Returns
+        -------
+        indices: list[int]
+            Row index of the max value for each column.
+
+        """
+        indices: list[int] = []
+
+        for col in range(len(matrix[0])):
+            column: list[float] = [row[col] for row in matrix]
+            indices.append(column.index(max(column)))
+
+        return indices
+
+    def quantize_rows(
+            self, matrix: list[list[float]]
+    ) -> tuple[list[list[int]], list[list[float]]]:
+        """
+        Quantize each row of a matrix to int8 values with its own scale.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix of the backend.
+
+        Returns
+        -------
+        quantized_matrix: list[list[int]]
+            Values of the matrix divided by the scale of their row and rounded.
+            They are in range of [-127; 127].
+        scales: list[list[float]]
+            Column vector with the scale of each row (max absolute value / 127).
+            Rows of zeros get the scale 1.0.
+
+        """
+        # The max absolute value of each row is mapped to 127
+        scales: list[float] = [
+            max(abs(value) for value in row) / 127 or 1.0 for row in matrix]
+
+        quantized_matrix: list[list[int]] = [
+            [min(max(round(value / scale), -127), 127) for value in row]
+            for row, scale in zip(matrix, scales)]
+
+        return quantized_matrix, [[scale] for scale in scales]
+
+    def from_quantized_lists(self, matrix: list[list[int]]) -> list[list[int]]:
+        """
+        Convert a nested list of int8 values into the int8 matrix type.
+
+        Parameters
+        ----------
+        matrix: list[list[int]]
+            Nested list of integers in range of [-127; 127].
+
+        Returns
+        -------
+        list[list[int]]
+            A copy of the given matrix.
+
+        """
+        return [[int(value) for value in row] for row in matrix]
+
+    def quantized_matrix_multiplication(
+            self, quantized_matrix: list[list[int]], scales: list[list[float]],
+            matrix: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Multiplicate a quantized matrix with a matrix of floats.
+
+        Parameters
+        ----------
+        quantized_matrix: list[list[int]]
+            The int8 values of the first matrix of the equation.
+        scales: list[list[float]]
+            Column vector with the scale of each row of the quantized matrix.
+        matrix: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        list[list[float]]
+            Product of the two matrices. Each row of the product of the int8 values
+            is multiplied with the scale of its row once.
+
+        """
+        return [[value * scale[0] for value in row] for row, scale in zip(
+            self.matrix_multiplication(quantized_matrix, matrix), scales)]
+
+    def sparse_matrix_multiplication(
+            self, sparse_matrix: SparseMatrix, matrix: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Multiplicate a sparse matrix with a matrix of the backend.
+
+        Parameters
+        ----------
+        sparse_matrix: SparseMatrix
+            First matrix of the equation in CSR form.
+        matrix: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        list[list[float]]
+            Product of the two matrices. Only the stored values are multiplied.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if sparse_matrix.get_columns() != len(matrix):
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Get the arrays of the sparse matrix and the columns of the second matrix
+        values: array = sparse_matrix.get_values()
+        column_indices: array = sparse_matrix.get_column_indices()
+        row_pointers: array = sparse_matrix.get_row_pointers()
+        columns: list[tuple[float, ...]] = list(zip(*matrix))
+
+        return [[sum(value * column[col] for value, col in zip(
+            values[row_pointers[row]:row_pointers[row + 1]],
+            column_indices[row_pointers[row]:row_pointers[row + 1]]))
+            for column in columns] for row in range(sparse_matrix.get_rows())]
+
+    def zeros_like(self, matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Return a matrix of zeros with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix of zeros.
+
+        """
+        return [[0.0] * len(row) for row in matrix]
+
+    def outer_product(
+            self, matrix_1: list[list[float]], matrix_2: list[list[float]],
+            buffer: None = None
+    ) -> list[list[float]]:
+        """
+        Multiplicate a matrix with an inverted matrix.
+
+        Calculates matrix_1 * matrix_2^T, i.e. the summed up outer products of the
+        columns of the two matrices.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            First matrix of the product.
+        matrix_2: list[list[float]]
+            Second matrix of the product, which is used inverted.
+        buffer: None
+            Unused, the product is a new matrix.
+
+        Returns
+        -------
+        list[list[float]]
+            The product.
+
+        """
+        product: list[list[float]] = [[0.0] * len(matrix_2) for _ in matrix_1]
+        self.add_matrix_product_in_place(product, matrix_1, matrix_2)
+
+        return product
+
+    def linear_combination_in_place(
+            self, matrix_1: list[list[float]], factor_1: float,
+            matrix_2: list[list[float]], factor_2: float
+    ) -> None:
+        """
+        Replace the first matrix by a weighted sum of two matrices in place.
+
+        Calculates matrix_1 = factor_1 * matrix_1 + factor_2 * matrix_2.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            Matrix that is changed.
+        factor_1: float
+            Factor of the first matrix.
+        matrix_2: list[list[float]]
+            Matrix that is added.
+        factor_2: float
+            Factor of the second matrix.
+
+        """
+        for row_1, row_2 in zip(matrix_1, matrix_2):
+            row_1[:] = [factor_1 * value_1 + factor_2 * value_2
+                        for value_1, value_2 in zip(row_1, row_2)]
+
+    def adam_update_in_place(
+            self, matrix: list[list[float]], first_moment: list[list[float]],
+            second_moment: list[list[float]], gradient: list[list[float]],
+            beta_1: float, beta_2: float, step_size: float, epsilon: float,
+            buffer: None = None
+    ) -> None:
+        """
+        Update the moments of the Adam optimizer and the weights in place.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Weight matrix that is changed.
+        first_moment: list[list[float]]
+            Moving average of the gradient, changed in place.
+        second_moment: list[list[float]]
+            Moving average of the squared gradient, changed in place.
+        gradient: list[list[float]]
+            The gradient of the weight matrix (pointing to smaller errors).
+        beta_1: float
+            Decay of the first moment.
+        beta_2: float
+            Decay of the second moment.
+        step_size: float
+            Learning rate including the bias correction of the moments.
+        epsilon: float
+            Value added to the root of the second moment to avoid a division by
+            zero.
+        buffer: None
+            Unused, the rows are updated directly.
+
+        """
+        for row, first_row, second_row, gradient_row in zip(
+                matrix, first_moment, second_moment, gradient):
+            first_row[:] = [beta_1 * first + (1 - beta_1) * value
+                            for first, value in zip(first_row, gradient_row)]
+            second_row[:] = [beta_2 * second + (1 - beta_2) * value * value
+                             for second, value in zip(second_row, gradient_row)]
+            row[:] = [weight + step_size * first / (math.sqrt(second) + epsilon)
+                      for weight, first, second in zip(row, first_row, second_row)]
+
+    def quantize_pixels(self, pixels: list[float]) -> bytes:
+        """
+        Quantize the pixels of an image to bytes.
+
+        Parameters
+        ----------
+        pixels: list[float]
+            The pixels of the image in range of [0; 1].
+
+        Returns
+        -------
+        bytes
+            One byte per pixel with the pixel rounded to [0; 255].
+
+        """
+        try:
+            return bytes([int(pixel * 255 + 0.5) for pixel in pixels])
+        except ValueError:
+            # Clamp pixels outside of [0; 1] only if there are any, which is slower
+            return bytes([min(max(int(pixel * 255 + 0.5), 0), 255) for pixel in pixels])
+
+class ArrayBackend(Backend):
+    """
+    A class representing the pure Python backend working on compact arrays.
+
+    All matrices are Matrix objects storing their values row after row in one flat
+    array. The kernels iterate over whole rows with sum(map(operator.mul, ...)), so
+    the loops run in C instead of indexing nested lists value by value. This backend
+    is used as fallback if NumPy isn't installed.
+
+    Attributes
+    ----------
+    typecode: str
+        Typecode of the arrays ('d' for double, 'f' for single precision).
+
+    """
+
+    name: str = "array"
+    typecode: str = "d"
+
+    def new_matrix(self, rows: int, columns: int, values) -> Matrix:
+        """
+        Create a matrix of the backend from values stored row after row.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the matrix.
+        columns: int
+            Number of columns of the matrix.
+        values
+            Iterable of the values stored row after row.
+
+        Returns
+        -------
+        Matrix
+            The created matrix (a Vector if it has a single column).
+
+        """
+        if columns == 1:
+            return Vector(array(self.typecode, values))
+
+        return Matrix(rows, columns, array(self.typecode, values))
+
+    def from_lists(self, matrix, copy: bool = True) -> Matrix:
+        """
+        Convert a nested list of floats into the matrix type of the backend.
+
+        Parameters
+        ----------
+        matrix
+            Nested list of floats (or a Matrix, or an array).
+        copy: bool
+            Whether a Matrix with the typecode of the backend is copied. Without a
+            copy, in-place changes affect the given matrix.
+
+        Returns
+        -------
+        Matrix
+            The given matrix as a Matrix of the backend.
+
+        """
+        if isinstance(matrix, Matrix):
+            # Matrices of the backend are already the matrix type of this backend
+            if matrix.get_typecode() == self.typecode and not copy:
+                return matrix
+
+            return self.new_matrix(
+                matrix.get_rows(), matrix.get_columns(), matrix.get_values())
+
+        return Matrix.from_lists(
+            [[float(value) for value in row] for row in matrix], self.typecode)
+
+    def to_lists(self, matrix: Matrix) -> list[list[float]]:
+        """
+        Convert a matrix of the backend into a nested list of floats.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix of the backend.
+
+        Returns
+        -------
+        list[list[float]]
+            The given matrix as a nested list of Python floats.
+
+        """
+        return matrix.to_lists()
+
+    def column_vector(self, values: Sequence[float]) -> Vector:
+        """
+        Create a column vector from a list of floats.
+
+        Parameters
+        ----------
+        values: Sequence[float]
+            Values of the column vector.
+
+        Returns
+        -------
+        Vector
+            Column vector storing the values contiguously.
+
+        """
+        return Vector(array(self.typecode, values))
+
+    def column_matrix(self, columns: Sequence[Sequence[float]]) -> Matrix:
+        """
+        Create a matrix whose columns are the given lists of floats.
+
+        Parameters
+        ----------
+        columns: Sequence[Sequence[float]]
+            Values of each column (e.g. lists or rows of a buffer).
+
+        Returns
+        -------
+        Matrix
+            Matrix with len(columns[0]) rows and len(columns) columns.
+
+        """
+        # A single column already is stored row after row
+        if len(columns) == 1:
+            return self.column_vector(columns[0])
+
+        return self.new_matrix(len(columns[0]), len(columns),
+                               chain.from_iterable(zip(*columns)))
+
+    def one_hot(self, labels: list[int], size: int) -> Matrix:
+        """
+        Create a matrix whose columns are one-hot encodings of the given labels.
+
+        Parameters
+        ----------
+        labels: list[int]
+            Row index that is set to 1.0 for each column.
+        size: int
+            Number of rows of the matrix.
+
+        Returns
+        -------
+        Matrix
+            Matrix with size rows and len(labels) columns.
+
+        """
+        return self.new_matrix(size, len(labels), [
+            1.0 if label == row else 0.0 for row in range(size) for label in labels])
+
+    def column_count(self, matrix: Matrix) -> int:
+        """
+        Return the number of columns of a matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix of the backend.
+
+        Returns
+        -------
+        int
+            Number of columns of the matrix.
+
+        """
+        return matrix.get_columns()
+
+    def create_buffer(self, rows: int, width: int) -> array:
+        """
+        Create a compact buffer holding one row of floats per image.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the buffer.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        array
+            Flat array (rows * width) stored row after row.
+
+        """
+        return Matrix.zeros(rows, width, self.typecode).get_values()
+
+    def write_rows(self, buffer: array, start: int, matrix: Matrix) -> None:
+        """
+        Write the columns of a matrix into consecutive rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: array
+            Buffer created by create_buffer.
+        start: int
+            Index of the row the first column is written to.
+        matrix: Matrix
+            Matrix of the backend whose columns are written.
+
+        """
+        width: int = matrix.get_rows()
+
+        for row, col in enumerate(range(matrix.get_columns()), start):
+            buffer[row * width:(row + 1) * width] = matrix.get_column(col)
+
+    def read_columns(self, buffer: array, indices, width: int) -> Matrix:
+        """
+        Create a matrix whose columns are the given rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: array
+            Buffer created by create_buffer.
+        indices
+            Indices of the rows that are read.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        Matrix
+            Matrix with width rows and one column per index.
+
+        """
+        return self.column_matrix(
+            [buffer[index * width:(index + 1) * width] for index in indices])
+
+    def matrix_multiplication(self, matrix_1: Matrix, matrix_2: Matrix) -> Matrix:
+        """
+        Multiplicate two given matrices.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            First matrix of the equation.
+        matrix_2: Matrix
+            Second matrix of the equation.
+
+        Returns
+        -------
+        Matrix
+            Product of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if matrix_1.get_columns() != matrix_2.get_rows():
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Get the rows of the first and the columns of the second matrix
+        rows_1: list[memoryview] = [
+            matrix_1.get_row(row) for row in range(matrix_1.get_rows())]
+        columns_2: list[array] = [
+            matrix_2.get_column(col) for col in range(matrix_2.get_columns())]
+
+        # Multiply each row of matrix 1 with each column of matrix 2
+        return self.new_matrix(
+            matrix_1.get_rows(), matrix_2.get_columns(),
+            [sum(map(operator.mul, row_1, column_2))
+             for row_1 in rows_1 for column_2 in columns_2])
+
+    def invert(self, matrix: Matrix) -> Matrix:
+        """
+        Return an inverted matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            The matrix which shall be inverted.
+
+        Returns
+        -------
+        Matrix
+            Matrix with inverted values.
+
+        """
+        # The values of a row or column vector keep their order
+        if matrix.get_rows() == 1 or matrix.get_columns() == 1:
+            return self.new_matrix(
+                matrix.get_columns(), matrix.get_rows(), matrix.get_values())
+
+        return self.new_matrix(
+            matrix.get_columns(), matrix.get_rows(), chain.from_iterable(
+                matrix.get_column(col) for col in range(matrix.get_columns())))
+
+    def matrix_addition(self, matrix_1: Matrix, matrix_2: Matrix) -> Matrix:
+        """
+        Add the values of two matrices together.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            First matrix of the equation.
+        matrix_2: Matrix
+            Second matrix of the equation.
+
+        Returns
+        -------
+        Matrix
+            Sum of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if (matrix_1.get_rows() != matrix_2.get_rows()
+                or matrix_1.get_columns() != matrix_2.get_columns()):
+            raise ValueError("The two given matrices can't be added together")
+
+        return self.new_matrix(
+            matrix_1.get_rows(), matrix_1.get_columns(),
+            map(operator.add, matrix_1.get_values(), matrix_2.get_values()))
+
+    def matrix_addition_in_place(self, matrix_1: Matrix, matrix_2: Matrix) -> None:
+        """
+        Add the values of the second matrix to the first one in place.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            Matrix that is changed.
+        matrix_2: Matrix
+            Matrix whose values are added.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if (matrix_1.get_rows() != matrix_2.get_rows()
+                or matrix_1.get_columns() != matrix_2.get_columns()):
+            raise ValueError("The two given matrices can't be added together")
+
+        matrix_1.get_values()[:] = array(self.typecode, map(
+            operator.add, matrix_1.get_values(), matrix_2.get_values()))
+
+    def transposed_matrix_multiplication(
+            self, matrix_1: Matrix, matrix_2: Matrix
+    ) -> Matrix:
+        """
+        Multiplicate the inverted first matrix with the second matrix.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            First matrix of the equation, which is used inverted.
+        matrix_2: Matrix
+            Second matrix of the equation.
+
+        Returns
+        -------
+        Matrix
+            Product of the inverted first matrix and the second matrix.
+
+        Raises
+        ------
+        ValueError
+            If the number of rows of the two matrices isn't equal.
+
+        Notes
+        -----
+        The columns of the first matrix are the rows of its inverted matrix, so
+        they are multiplied with the columns of the second matrix directly.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if matrix_1.get_rows() != matrix_2.get_rows():
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Get the columns of both matrices
+        columns_1: list[array] = [
+            matrix_1.get_column(col) for col in range(matrix_1.get_columns())]
+        columns_2: list[array] = [
+            matrix_2.get_column(col) for col in range(matrix_2.get_columns())]
+
+        return self.new_matrix(
+            matrix_1.get_columns(), matrix_2.get_columns(),
+            [sum(map(operator.mul, column_1, column_2))
+             for column_1 in columns_1 for column_2 in columns_2])
+
+    def create_update_buffer(self, matrix: Matrix) -> None:
+        """
+        Create the scratch buffer used to update a weight matrix in place.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            The weight matrix.
+
+        Returns
+        -------
+        None
+            The array backend updates the rows directly and needs no buffer.
+
+        """
+        return None
+
+    def add_matrix_product_in_place(
+            self, matrix: Matrix, matrix_1: Matrix, matrix_2: Matrix,
+            buffer: None = None
+    ) -> None:
+        """
+        Add the product of a matrix and an inverted matrix to a matrix in place.
+
+        Calculates matrix += matrix_1 * matrix_2^T.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix that is changed.
+        matrix_1: Matrix
+            First matrix of the product.
+        matrix_2: Matrix
+            Second matrix of the product, which is used inverted.
+        buffer: None
+            Unused, the rows are updated directly.
+
+        Raises
+        ------
+        ValueError
+            If the dimensions of the matrices don't match.
+
+        """
+        # Check if the dimensions of the matrices match
+        if (matrix.get_rows() != matrix_1.get_rows()
+                or matrix.get_columns() != matrix_2.get_rows()
+                or matrix_1.get_columns() != matrix_2.get_columns()):
+            raise ValueError("The product can't be added to the matrix.")
+
+        # Get the values and the columns of the second matrix
+        values: array = matrix.get_values()
+        width: int = matrix.get_columns()
+        columns_2: list[array] = [
+            matrix_2.get_column(col) for col in range(matrix_2.get_columns())]
+
+        for row in range(matrix.get_rows()):
+            for coefficient, column_2 in zip(matrix_1.get_row(row), columns_2):
+                # Adding a zero change would leave the row unchanged
+                if coefficient:
+                    values[row * width:(row + 1) * width] = array(self.typecode, [
+                        value + coefficient * value_2 for value, value_2
+                        in zip(values[row * width:(row + 1) * width], column_2)])
+
+    def matrix_subtraction(self, matrix_1: Matrix, matrix_2: Matrix) -> Matrix:
+        """
+        Subtract the values of the second matrix from the first one.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            Minuend of the equation.
+        matrix_2: Matrix
+            Subtrahend of the equation.
+
+        Returns
+        -------
+        Matrix
+            Difference of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be subtracted from each other
+        if (matrix_1.get_rows() != matrix_2.get_rows()
+                or matrix_1.get_columns() != matrix_2.get_columns()):
+            raise ValueError("The two given matrices can't be subtracted")
+
+        return self.new_matrix(
+            matrix_1.get_rows(), matrix_1.get_columns(),
+            map(operator.sub, matrix_1.get_values(), matrix_2.get_values()))
+
+    def sigmoid(self, matrix: Matrix) -> Matrix:
+        """
+        Apply the sigmoid function to each value of a matrix.
+
+        The function is as follows: y = 1 / (1 + e^-x)
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Input values of the neurons.
+
+        Returns
+        -------
+        Matrix
+            Output values of the neurons. Values are in range of [0; 1].
+
+        Notes
+        -----
+        For negative values the equivalent form y = e^x / (1 + e^x) is used, so
+        e^-x can't overflow for large negative values.
+
+        """
+        return self.new_matrix(
+            matrix.get_rows(), matrix.get_columns(),
+            [1 / (1 + math.exp(-value)) if value >= 0
+             else math.exp(value) / (1 + math.exp(value))
+             for value in matrix.get_values()])
+
+    def sigmoid_derivative(self, output_values: Matrix) -> Matrix:
+        """
+        Calculate the derivative of the sigmoid function from its output values.
+
+        Parameters
+        ----------
+        output_values: Matrix
+            Output values of the sigmoid function.
+
+        Returns
+        -------
+        Matrix
+            Ok * (1 - Ok) for each output value.
+
+        """
+        return self.new_matrix(
+            output_values.get_rows(), output_values.get_columns(),
+            [value * (1 - value) for value in output_values.get_values()])
+
+    def relu(self, matrix: Matrix) -> Matrix:
+        """
+        Apply the rectified linear unit to each value of a matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Input values of the neurons.
+
+        Returns
+        -------
+        Matrix
+            max(0, x) for each input value.
+
+        """
+        return self.new_matrix(
+            matrix.get_rows(), matrix.get_columns(),
+            [value if value > 0.0 else 0.0 for value in matrix.get_values()])
+
+    def relu_derivative(self, output_values: Matrix) -> Matrix:
+        """
+        Calculate the derivative of the rectified linear unit from its output values.
+
+        Parameters
+        ----------
+        output_values: Matrix
+            Output values of the rectified linear unit.
+
+        Returns
+        -------
+        Matrix
+            1.0 for each positive output value, otherwise 0.0.
+
+        """
+        return self.new_matrix(
+            output_values.get_rows(), output_values.get_columns(),
+            [1.0 if value > 0.0 else 0.0 for value in output_values.get_values()])
+
+    def softmax(self, matrix: Matrix) -> Matrix:
+        """
+        Apply the softmax function to each column of a matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Input values of the neurons. One column per image.
+
+        Returns
+        -------
+        Matrix
+            Output values of the neurons. The values of each column sum up to 1.
+
+        """
+        shifted_matrix: Matrix = self.subtract_column_max(matrix)
+
+        return self.normalize_columns(self.new_matrix(
+            shifted_matrix.get_rows(), shifted_matrix.get_columns(),
+            map(math.exp, shifted_matrix.get_values())))
+
+    def ones_like(self, matrix: Matrix) -> Matrix:
+        """
+        Return a matrix of ones with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        Matrix
+            Matrix of ones.
+
+        """
+        return self.new_matrix(matrix.get_rows(), matrix.get_columns(),
+                               [1.0] * len(matrix.get_values()))
+
+    def subtract_column_max(self, matrix: Matrix) -> Matrix:
+        """
+        Subtract the max value of each column from the values of the column.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix of the backend.
+
+        Returns
+        -------
+        Matrix
+            Matrix whose max value of each column is 0.
+
+        """
+        column_max: list[float] = [
+            max(matrix.get_column(col)) for col in range(matrix.get_columns())]
+
+        return self.new_matrix(
+            matrix.get_rows(), matrix.get_columns(),
+            map(operator.sub, matrix.get_values(), column_max * matrix.get_rows()))
+
+    def normalize_columns(self, matrix: Matrix) -> Matrix:
+        """
+        Divide the values of each column by the sum of the column.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix of the backend.
+
+        Returns
+        -------
+        Matrix
+            Matrix whose values of each column sum up to 1.
+
+        """
+        column_sum: list[float] = [
+            sum(matrix.get_column(col)) for col in range(matrix.get_columns())]
+
+        return self.new_matrix(
+            matrix.get_rows(), matrix.get_columns(), map(
+                operator.truediv, matrix.get_values(), column_sum * matrix.get_rows()))
+
+    def lookup(
+            self, matrix: Matrix, table: list[float], minimum: float,
+            maximum: float
+    ) -> Matrix:
+        """
+        Approximate a function by looking up each value of a matrix in a table.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Input values of the function.
+        table: list[float]
+            Values of the function sampled evenly from minimum to maximum.
+        minimum: float
+            Input value of the first entry of the table.
+        maximum: float
+            Input value of the last entry of the table.
+
+        Returns
+        -------
+        Matrix
+            The table entry nearest to each value. Values outside of the range of
+            the table get the first or the last entry.
+
+        """
+        # Factor converting a value into an index of the table
+        scale: float = (len(table) - 1) / (maximum - minimum)
+        last_index: int = len(table) - 1
+
+        return self.new_matrix(
+            matrix.get_rows(), matrix.get_columns(),
+            [table[min(max(round((value - minimum) * scale), 0), last_index)]
+             for value in matrix.get_values()])
+
+    def error_gradient(
+            self, errors: Matrix, derivatives: Matrix, learning_rate: float
+    ) -> Matrix:
+        """
+        Calculate Alpha * Ek * f'(Ik) for each value of a matrix.
+
+        Parameters
+        ----------
+        errors: Matrix
+            Error at the layer.
+        derivatives: Matrix
+            Derivative of the activation function at the layer.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        Returns
+        -------
+        Matrix
+            The gradient scaled by the learning rate.
+
+        """
+        return self.new_matrix(
+            errors.get_rows(), errors.get_columns(),
+            [learning_rate * (err * der) for err, der
+             in zip(errors.get_values(), derivatives.get_values())])
+
+    def argmax(self, matrix: Matrix) -> list[int]:
+        """
+        Return the row index of the max value of each column.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix whose columns are searched.
+
+        Returns
+        -------
+        indices: list[int]
+            Row index of the max value for each column.
+
+        """
+        indices: list[int] = []
+
+        for col in range(matrix.get_columns()):
+            column: array = matrix.get_column(col)
+            indices.append(column.index(max(column)))
+
+        return indices
+
+    def quantize_rows(self, matrix: Matrix) -> tuple[Matrix, Vector]:
+        """
+        Quantize each row of a matrix to int8 values with its own scale.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix of the backend.
+
+        Returns
+        -------
+        quantized_matrix: Matrix
+            Values of the matrix divided by the scale of their row and rounded,
+            stored in a signed char array. They are in range of [-127; 127].
+        scales: Vector
+            Column vector with the scale of each row (max absolute value / 127).
+            Rows of zeros get the scale 1.0.
+
+        """
+        # The max absolute value of each row is mapped to 127
+        scales: list[float] = [
+            max(map(abs, matrix.get_row(row))) / 127 or 1.0
+            for row in range(matrix.get_rows())]
+
+        quantized_matrix: Matrix = Matrix(
+            matrix.get_rows(), matrix.get_columns(), array("b", [
+                min(max(round(value / scale), -127), 127)
+                for row, scale in enumerate(scales)
+                for value in matrix.get_row(row)]))
+
+        return quantized_matrix, self.column_vector(scales)
+
+    def from_quantized_lists(self, matrix: list[list[int]]) -> Matrix:
+        """
+        Convert a nested list of int8 values into the int8 matrix type.
+
+        Parameters
+        ----------
+        matrix: list[list[int]]
+            Nested list of integers in range of [-127; 127].
+
+        Returns
+        -------
+        Matrix
+            Matrix storing the values in a signed char array.
+
+        """
+        return Matrix.from_lists(matrix, "b")
+
+    def quantized_matrix_multiplication(
+            self, quantized_matrix: Matrix, scales: Vector, matrix: Matrix
+    ) -> Matrix:
+        """
+        Multiplicate a quantized matrix with a matrix of floats.
+
+        Parameters
+        ----------
+        quantized_matrix: Matrix
+            The int8 values of the first matrix of the equation.
+        scales: Vector
+            Column vector with the scale of each row of the quantized matrix.
+        matrix: Matrix
+            Second matrix of the equation.
+
+        Returns
+        -------
+        Matrix
+            Product of the two matrices. Each row of the product of the int8 values
+            is multiplied with the scale of its row once.
+
+        """
+        product: Matrix = self.matrix_multiplication(quantized_matrix, matrix)
+
+        return self.new_matrix(
+            product.get_rows(), product.get_columns(), map(
+                operator.mul, product.get_values(), chain.from_iterable(
+                    [scale] * product.get_columns()
+                    for scale in scales.get_values())))
+
+    def sparse_matrix_multiplication(
+            self, sparse_matrix: SparseMatrix, matrix: Matrix
+    ) -> Matrix:
+        """
+        Multiplicate a sparse matrix with a matrix of the backend.
+
+        Parameters
+        ----------
+        sparse_matrix: SparseMatrix
+            First matrix of the equation in CSR form.
+        matrix: Matrix
+            Second matrix of the equation.
+
+        Returns
+        -------
+        Matrix
+            Product of the two matrices. Only the stored values are multiplied.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if sparse_matrix.get_columns() != matrix.get_rows():
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # Get the arrays of the sparse matrix and the columns of the second matrix
+        values: array = sparse_matrix.get_values()
+        column_indices: array = sparse_matrix.get_column_indices()
+        row_pointers: array = sparse_matrix.get_row_pointers()
+        columns: list[array] = [
+            matrix.get_column(col) for col in range(matrix.get_columns())]
+
+        # Multiply the stored values of each row with the matching values of each
+        # column
+        return self.new_matrix(
+            sparse_matrix.get_rows(), matrix.get_columns(),
+            [sum(map(operator.mul,
+                     values[row_pointers[row]:row_pointers[row + 1]],
+                     map(column.__getitem__,
+                         column_indices[row_pointers[row]:row_pointers[row + 1]])))
+             for row in range(sparse_matrix.get_rows()) for column in columns])
+
+    def zeros_like(self, matrix: Matrix) -> Matrix:
+        """
+        Return a matrix of zeros with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        Matrix
+            Matrix of zeros.
+
+        """
+        return Matrix.zeros(matrix.get_rows(), matrix.get_columns(), self.typecode)
+
+    def outer_product(
+            self, matrix_1: Matrix, matrix_2: Matrix, buffer: None = None
+    ) -> Matrix:
+        """
+        Multiplicate a matrix with an inverted matrix.
+
+        Calculates matrix_1 * matrix_2^T, i.e. the summed up outer products of the
+        columns of the two matrices.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            First matrix of the product.
+        matrix_2: Matrix
+            Second matrix of the product, which is used inverted.
+        buffer: None
+            Unused, the product is a new matrix.
+
+        Returns
+        -------
+        Matrix
+            The product.
+
+        """
+        product: Matrix = Matrix.zeros(
+            matrix_1.get_rows(), matrix_2.get_rows(), self.typecode)
+        self.add_matrix_product_in_place(product, matrix_1, matrix_2)
+
+        return product
+
+    def linear_combination_in_place(
+            self, matrix_1: Matrix, factor_1: float, matrix_2: Matrix,
+            factor_2: float
+    ) -> None:
+        """
+        Replace the first matrix by a weighted sum of two matrices in place.
+
+        Calculates matrix_1 = factor_1 * matrix_1 + factor_2 * matrix_2.
+
+        Parameters
+        ----------
+        matrix_1: Matrix
+            Matrix that is changed.
+        factor_1: float
+            Factor of the first matrix.
+        matrix_2: Matrix
+            Matrix that is added.
+        factor_2: float
+            Factor of the second matrix.
+
+        """
+        matrix_1.get_values()[:] = array(self.typecode, [
+            factor_1 * value_1 + factor_2 * value_2 for value_1, value_2
+            in zip(matrix_1.get_values(), matrix_2.get_values())])
+
+    def adam_update_in_place(
+            self, matrix: Matrix, first_moment: Matrix, second_moment: Matrix,
+            gradient: Matrix, beta_1: float, beta_2: float, step_size: float,
+            epsilon: float, buffer: None = None
+    ) -> None:
+        """
+        Update the moments of the Adam optimizer and the weights in place.
+
+        Parameters
+        ----------
+        matrix: Matrix
+            Weight matrix that is changed.
+        first_moment: Matrix
+            Moving average of the gradient, changed in place.
+        second_moment: Matrix
+            Moving average of the squared gradient, changed in place.
+        gradient: Matrix
+            The gradient of the weight matrix (pointing to smaller errors).
+        beta_1: float
+            Decay of the first moment.
+        beta_2: float
+            Decay of the second moment.
+        step_size: float
+            Learning rate including the bias correction of the moments.
+        epsilon: float
+            Value added to the root of the second moment to avoid a division by
+            zero.
+        buffer: None
+            Unused, the values are updated directly.
+
+        """
+        self.linear_combination_in_place(first_moment, beta_1, gradient, 1 - beta_1)
+        second_moment.get_values()[:] = array(self.typecode, [
+            beta_2 * second + (1 - beta_2) * value * value for second, value
+            in zip(second_moment.get_values(), gradient.get_values())])
+        matrix.get_values()[:] = array(self.typecode, [
+            weight + step_size * first / (math.sqrt(second) + epsilon)
+            for weight, first, second in zip(
+                matrix.get_values(), first_moment.get_values(),
+                second_moment.get_values())])
+
+    def quantize_pixels(self, pixels: list[float]) -> bytes:
+        """
+        Quantize the pixels of an image to bytes.
+
+        Parameters
+        ----------
+        pixels: list[float]
+            The pixels of the image in range of [0; 1].
+
+        Returns
+        -------
+        bytes
+            One byte per pixel with the pixel rounded to [0; 255].
+
+        """
+        return ListBackend().quantize_pixels(pixels)
+
+class Float32ArrayBackend(ArrayBackend):
+    """
+    A class representing the array backend storing single precision floats.
+
+    It halves the memory of the weight matrices and the cached input values. The
+    calculations themselves are still done with Python floats.
+
+    """
+
+    name: str = "array32"
+    typecode: str = "f"
+
+
+class NumpyBackend(Backend):
+    """
+    A class representing the backend working on contiguous NumPy arrays.
+
+    All matrices are C-contiguous float64 arrays, so the results stay comparable
+    with those of the list backend.
+
+    """
+
+    name: str = "numpy"
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Return whether the backend can be used in the current environment.
+
+        Returns
+        -------
+        bool
+            True if NumPy is installed, otherwise False.
+
+        """
+        return numpy is not None
+
+    def from_lists(self, matrix, copy: bool = True):
+        """
+        Convert a nested list of floats into the matrix type of the backend.
+
+        Parameters
+        ----------
+        matrix
+            Nested list of floats (or an array, or a Matrix).
+        copy: bool
+            Whether a C-contiguous float64 array is copied. Without a copy, in-place
+            changes affect the given array (e.g. a view on shared memory).
+
+        Returns
+        -------
+        numpy.ndarray
+            C-contiguous float64 array.
+
+        """
+        # View the values of a Matrix without converting them into lists
+        if isinstance(matrix, Matrix):
+            matrix = numpy.frombuffer(
+                matrix.get_values(), dtype=matrix.get_typecode()).reshape(
+                    matrix.get_rows(), matrix.get_columns())
+
+        if copy:
+            return numpy.array(matrix, dtype=numpy.float64, order="C")
+
+        return numpy.ascontiguousarray(matrix, dtype=numpy.float64)
+
+    def to_lists(self, matrix) -> list[list[float]]:
+        """
+        Convert a matrix of the backend into a nested list of floats.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix of the backend.
+
+        Returns
+        -------
+        list[list[float]]
+            The given matrix as a nested list of Python floats.
+
+        """
+        return matrix.tolist()
+
+    def column_vector(self, values: list[float]):
+        """
+        Create a column vector from a list of floats.
+
+        Parameters
+        ----------
+        values: list[float]
+            Values of the column vector.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (len(values), 1).
+
+        """
+        return numpy.asarray(values, dtype=numpy.float64).reshape(-1, 1)
+
+    def column_matrix(self, columns: Sequence[Sequence[float]]):
+        """
+        Create a matrix whose columns are the given lists of floats.
+
+        Parameters
+        ----------
+        columns: Sequence[Sequence[float]]
+            Values of each column (e.g. lists or rows of a buffer).
+
+        Returns
+        -------
+        numpy.ndarray
+            C-contiguous array of shape (len(columns[0]), len(columns)).
+
+        """
+        return numpy.ascontiguousarray(
+            numpy.asarray(columns, dtype=numpy.float64).T)
+
+    def one_hot(self, labels: list[int], size: int):
+        """
+        Create a matrix whose columns are one-hot encodings of the given labels.
+
+        Parameters
+        ----------
+        labels: list[int]
+            Row index that is set to 1.0 for each column.
+        size: int
+            Number of rows of the matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (size, len(labels)).
+
+        """
+        matrix = numpy.zeros((size, len(labels)), dtype=numpy.float64)
+        matrix[labels, numpy.arange(len(labels))] = 1.0
+
+        return matrix
+
+    def column_count(self, matrix) -> int:
+        """
+        Return the number of columns of a matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix of the backend.
+
+        Returns
+        -------
+        int
+            Number of columns of the matrix.
+
+        """
+        return matrix.shape[1]
+
+    def create_buffer(self, rows: int, width: int):
+        """
+        Create a compact buffer holding one row of floats per image.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the buffer.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (rows, width) of single precision floats, which needs
+            half the memory of doubles (e.g. 188 MB for 60000 MNIST images).
+            read_columns converts the read rows back into doubles.
+
+        """
+        return numpy.empty((rows, width), dtype=numpy.float32)
+
+    def write_rows(self, buffer, start: int, matrix) -> None:
+        """
+        Write the columns of a matrix into consecutive rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: numpy.ndarray
+            Buffer created by create_buffer.
+        start: int
+            Index of the row the first column is written to.
+        matrix: numpy.ndarray
+            Matrix of the backend whose columns are written.
+
+        """
+        buffer[start:start + matrix.shape[1]] = matrix.T
+
+    def read_columns(self, buffer, indices, width: int):
+        """
+        Create a matrix whose columns are the given rows of a buffer.
+
+        Parameters
+        ----------
+        buffer: numpy.ndarray
+            Buffer created by create_buffer.
+        indices
+            Indices of the rows that are read. A range is read as a slice without
+            copying the rows first.
+        width: int
+            Number of floats per row.
+
+        Returns
+        -------
+        numpy.ndarray
+            C-contiguous array of doubles of shape (width, len(indices)).
+
+        """
+        if isinstance(indices, range) and indices.step == 1:
+            return numpy.ascontiguousarray(
+                buffer[indices.start:indices.stop].T, dtype=numpy.float64)
+
+        return numpy.ascontiguousarray(
+            buffer[numpy.asarray(indices)].T, dtype=numpy.float64)
+
+    def matrix_multiplication(self, matrix_1, matrix_2):
+        """
+        Multiplicate two given matrices.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            First matrix of the equation.
+        matrix_2: numpy.ndarray
+            Second matrix of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if matrix_1.shape[1] != matrix_2.shape[0]:
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        return matrix_1 @ matrix_2
+
+    def invert(self, matrix):
+        """
+        Return an inverted matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            The matrix which shall be inverted.
+
+        Returns
+        -------
+        numpy.ndarray
+            Transposed view of the matrix (no values are copied).
+
+        """
+        return matrix.T
+
+    def matrix_addition(self, matrix_1, matrix_2):
+        """
+        Add the values of two matrices together.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            First matrix of the equation.
+        matrix_2: numpy.ndarray
+            Second matrix of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Sum of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if matrix_1.shape != matrix_2.shape:
+            raise ValueError("The two given matrices can't be added together")
+
+        return matrix_1 + matrix_2
+
+    def matrix_addition_in_place(self, matrix_1, matrix_2) -> None:
+        """
+        Add the values of the second matrix to the first one in place.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            Matrix that is changed.
+        matrix_2: numpy.ndarray
+            Matrix whose values are added.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be added together
+        if matrix_1.shape != matrix_2.shape:
+            raise ValueError("The two given matrices can't be added together")
+
+        numpy.add(matrix_1, matrix_2, out=matrix_1)
+
+    def transposed_matrix_multiplication(self, matrix_1, matrix_2):
+        """
+        Multiplicate the inverted first matrix with the second matrix.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            First matrix of the equation, which is used inverted.
+        matrix_2: numpy.ndarray
+            Second matrix of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product of the inverted first matrix and the second matrix.
+
+        Raises
+        ------
+        ValueError
+            If the number of rows of the two matrices isn't equal.
+
+        Notes
+        -----
+        The inverted matrix is a view on the same values, so nothing is copied.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if matrix_1.shape[0] != matrix_2.shape[0]:
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        return matrix_1.T @ matrix_2
+
+    def create_update_buffer(self, matrix):
+        """
+        Create the scratch buffer used to update a weight matrix in place.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            The weight matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            Uninitialized array with the dimensions of the weight matrix.
+
+        """
+        return numpy.empty_like(matrix)
+
+    def add_matrix_product_in_place(self, matrix, matrix_1, matrix_2, buffer) -> None:
+        """
+        Add the product of a matrix and an inverted matrix to a matrix in place.
+
+        Calculates matrix += matrix_1 * matrix_2^T.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix that is changed.
+        matrix_1: numpy.ndarray
+            First matrix of the product.
+        matrix_2: numpy.ndarray
+            Second matrix of the product, which is used inverted.
+        buffer: numpy.ndarray
+            Scratch buffer created by create_update_buffer for the matrix. The
+            product is written into it, so no new array is allocated.
+
+        """
+        numpy.matmul(matrix_1, matrix_2.T, out=buffer)
+        numpy.add(matrix, buffer, out=matrix)
+
+    def matrix_subtraction(self, matrix_1, matrix_2):
+        """
+        Subtract the values of the second matrix from the first one.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            Minuend of the equation.
+        matrix_2: numpy.ndarray
+            Subtrahend of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Difference of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the two matrices don't have the same dimensions.
+
+        """
+        # Check if the two matrices can be subtracted from each other
+        if matrix_1.shape != matrix_2.shape:
+            raise ValueError("The two given matrices can't be subtracted")
+
+        return matrix_1 - matrix_2
+
+    def sigmoid(self, matrix):
+        """
+        Apply the sigmoid function to each value of a matrix.
+
+        The function is as follows: y = 1 / (1 + e^-x)
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Input values of the neurons.
+
+        Returns
+        -------
+        numpy.ndarray
+            Output values of the neurons. Values are in range of [0; 1].
+
+        Notes
+        -----
+        Only e^-|x| is calculated, which can't overflow. For negative values the
+        equivalent form y = e^x / (1 + e^x) is used.
+
+        """
+        exponential = numpy.exp(-numpy.abs(matrix))
+
+        return numpy.where(matrix >= 0, 1 / (1 + exponential),
+                           exponential / (1 + exponential))
+
+    def sigmoid_derivative(self, output_values):
+        """
+        Calculate the derivative of the sigmoid function from its output values.
+
+        Parameters
+        ----------
+        output_values: numpy.ndarray
+            Output values of the sigmoid function.
+
+        Returns
+        -------
+        numpy.ndarray
+            Ok * (1 - Ok) for each output value.
+
+        """
+        return output_values * (1 - output_values)
+
+    def relu(self, matrix):
+        """
+        Apply the rectified linear unit to each value of a matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Input values of the neurons.
+
+        Returns
+        -------
+        numpy.ndarray
+            max(0, x) for each input value.
+
+        """
+        return numpy.maximum(matrix, 0.0)
+
+    def relu_derivative(self, output_values):
+        """
+        Calculate the derivative of the rectified linear unit from its output values.
+
+        Parameters
+        ----------
+        output_values: numpy.ndarray
+            Output values of the rectified linear unit.
+
+        Returns
+        -------
+        numpy.ndarray
+            1.0 for each positive output value, otherwise 0.0.
+
+        """
+        return (output_values > 0.0).astype(numpy.float64)
+
+    def softmax(self, matrix):
+        """
+        Apply the softmax function to each column of a matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Input values of the neurons. One column per image.
+
+        Returns
+        -------
+        numpy.ndarray
+            Output values of the neurons. The values of each column sum up to 1.
+
+        """
+        return self.normalize_columns(
+            numpy.exp(self.subtract_column_max(matrix)))
+
+    def ones_like(self, matrix):
+        """
+        Return a matrix of ones with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix of ones.
+
+        """
+        return numpy.ones_like(matrix)
+
+    def subtract_column_max(self, matrix):
+        """
+        Subtract the max value of each column from the values of the column.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix of the backend.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix whose max value of each column is 0.
+
+        """
+        return matrix - matrix.max(axis=0, keepdims=True)
+
+    def normalize_columns(self, matrix):
+        """
+        Divide the values of each column by the sum of the column.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix of the backend.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix whose values of each column sum up to 1.
+
+        """
+        return matrix / matrix.sum(axis=0, keepdims=True)
+
+    def lookup(self, matrix, table: list[float], minimum: float, maximum: float):
+        """
+        Approximate a function by looking up each value of a matrix in a table.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Input values of the function.
+        table: list[float]
+            Values of the function sampled evenly from minimum to maximum.
+        minimum: float
+            Input value of the first entry of the table.
+        maximum: float
+            Input value of the last entry of the table.
+
+        Returns
+        -------
+        numpy.ndarray
+            The table entry nearest to each value. Values outside of the range of
+            the table get the first or the last entry.
+
+        """
+        # Convert the values into indices of the table
+        indices = numpy.rint(
+            (matrix - minimum) * ((len(table) - 1) / (maximum - minimum)))
+        numpy.clip(indices, 0, len(table) - 1, out=indices)
+
+        return numpy.asarray(table, dtype=numpy.float64)[indices.astype(numpy.intp)]
+
+    def error_gradient(self, errors, derivatives, learning_rate: float):
+        """
+        Calculate Alpha * Ek * f'(Ik) for each value of a matrix.
+
+        Parameters
+        ----------
+        errors: numpy.ndarray
+            Error at the layer.
+        derivatives: numpy.ndarray
+            Derivative of the activation function at the layer.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        Returns
+        -------
+        numpy.ndarray
+            The gradient scaled by the learning rate.
+
+        """
+        return learning_rate * (errors * derivatives)
+
+    def argmax(self, matrix) -> list[int]:
+        """
+        Return the row index of the max value of each column.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix whose columns are searched.
+
+        Returns
+        -------
+        indices: list[int]
+            Row index of the max value for each column.
+
+        """
+        return numpy.argmax(matrix, axis=0).tolist()
+
+    def quantize_rows(self, matrix):
+        """
+        Quantize each row of a matrix to int8 values with its own scale.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix of the backend.
+
+        Returns
+        -------
+        quantized_matrix: numpy.ndarray
+            Values of the matrix divided by the scale of their row and rounded,
+            as int8 array. They are in range of [-127; 127].
+        scales: numpy.ndarray
+            Column vector with the scale of each row (max absolute value / 127).
+            Rows of zeros get the scale 1.0.
+
+        """
+        # The max absolute value of each row is mapped to 127
+        scales = numpy.abs(matrix).max(axis=1, keepdims=True) / 127
+        scales[scales == 0.0] = 1.0
+
+        quantized_matrix = numpy.clip(
+            numpy.rint(matrix / scales), -127, 127).astype(numpy.int8)
+
+        return quantized_matrix, scales
+
+    def from_quantized_lists(self, matrix: list[list[int]]):
+        """
+        Convert a nested list of int8 values into the int8 matrix type.
+
+        Parameters
+        ----------
+        matrix: list[list[int]]
+            Nested list of integers in range of [-127; 127].
+
+        Returns
+        -------
+        numpy.ndarray
+            C-contiguous int8 array.
+
+        """
+        return numpy.array(matrix, dtype=numpy.int8, order="C")
+
+    def quantized_matrix_multiplication(self, quantized_matrix, scales, matrix):
+        """
+        Multiplicate a quantized matrix with a matrix of floats.
+
+        Parameters
+        ----------
+        quantized_matrix: numpy.ndarray
+            The int8 values of the first matrix of the equation.
+        scales: numpy.ndarray
+            Column vector with the scale of each row of the quantized matrix.
+        matrix: numpy.ndarray
+            Second matrix of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product of the two matrices. Each row of the product of the int8 values
+            is multiplied with the scale of its row once.
+
+        """
+        product = quantized_matrix @ matrix
+        product *= scales
+
+        return product
+
+    def sparse_matrix_multiplication(self, sparse_matrix: SparseMatrix, matrix):
+        """
+        Multiplicate a sparse matrix with a matrix of the backend.
+
+        Parameters
+        ----------
+        sparse_matrix: SparseMatrix
+            First matrix of the equation in CSR form.
+        matrix: numpy.ndarray
+            Second matrix of the equation.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product of the two matrices. Only the stored values are multiplied.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        Notes
+        -----
+        The arrays of the sparse matrix are used as NumPy arrays without copying
+        them. Each row multiplies its stored values with only the matching rows of
+        the second matrix, so the temporary arrays stay as small as one row.
+
+        """
+        # Check if the two given matrices can be multiplicated
+        if sparse_matrix.get_columns() != matrix.shape[0]:
+            raise ValueError("The two given matrices can't be multiplicated.")
+
+        # View the arrays of the sparse matrix as NumPy arrays
+        values = numpy.frombuffer(sparse_matrix.get_values(), dtype=numpy.float64)
+        column_indices = numpy.frombuffer(
+            sparse_matrix.get_column_indices(), dtype=numpy.intc)
+        row_pointers: array = sparse_matrix.get_row_pointers()
+
+        # Initialize the product
+        product = numpy.empty(
+            (sparse_matrix.get_rows(), matrix.shape[1]), dtype=numpy.float64)
+
+        for row in range(sparse_matrix.get_rows()):
+            start, end = row_pointers[row], row_pointers[row + 1]
+            product[row] = values[start:end] @ matrix[column_indices[start:end]]
+
+        return product
+
+    def zeros_like(self, matrix):
+        """
+        Return a matrix of zeros with the dimensions of the given matrix.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Matrix whose dimensions are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix of zeros.
+
+        """
+        return numpy.zeros_like(matrix, dtype=numpy.float64)
+
+    def outer_product(self, matrix_1, matrix_2, buffer=None):
+        """
+        Multiplicate a matrix with an inverted matrix.
+
+        Calculates matrix_1 * matrix_2^T, i.e. the summed up outer products of the
+        columns of the two matrices.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            First matrix of the product.
+        matrix_2: numpy.ndarray
+            Second matrix of the product, which is used inverted.
+        buffer: numpy.ndarray | None
+            Scratch buffer created by create_update_buffer. If given, the product
+            is written into it instead of a new array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The product.
+
+        """
+        return numpy.matmul(matrix_1, matrix_2.T, out=buffer)
+
+    def linear_combination_in_place(
+            self, matrix_1, factor_1: float, matrix_2, factor_2: float
+    ) -> None:
+        """
+        Replace the first matrix by a weighted sum of two matrices in place.
+
+        Calculates matrix_1 = factor_1 * matrix_1 + factor_2 * matrix_2.
+
+        Parameters
+        ----------
+        matrix_1: numpy.ndarray
+            Matrix that is changed.
+        factor_1: float
+            Factor of the first matrix.
+        matrix_2: numpy.ndarray
+            Matrix that is added.
+        factor_2: float
+            Factor of the second matrix.
+
+        """
+        # Without anything to add, the first matrix is only scaled
+        if factor_2 == 0.0:
+            matrix_1 *= factor_1
+            return
+
+        # Without a factor on the second matrix, it is added directly
+        if factor_2 == 1.0:
+            matrix_1 *= factor_1
+            matrix_1 += matrix_2
+            return
+
+        # Factor out factor_2, so no temporary array for factor_2 * matrix_2 is needed
+        matrix_1 *= factor_1 / factor_2
+        matrix_1 += matrix_2
+        matrix_1 *= factor_2
+
+    def adam_update_in_place(
+            self, matrix, first_moment, second_moment, gradient, beta_1: float,
+            beta_2: float, step_size: float, epsilon: float, buffer=None
+    ) -> None:
+        """
+        Update the moments of the Adam optimizer and the weights in place.
+
+        Parameters
+        ----------
+        matrix: numpy.ndarray
+            Weight matrix that is changed.
+        first_moment: numpy.ndarray
+            Moving average of the gradient, changed in place.
+        second_moment: numpy.ndarray
+            Moving average of the squared gradient, changed in place.
+        gradient: numpy.ndarray
+            The gradient of the weight matrix (pointing to smaller errors).
+        beta_1: float
+            Decay of the first moment.
+        beta_2: float
+            Decay of the second moment.
+        step_size: float
+            Learning rate including the bias correction of the moments.
+        epsilon: float
+            Value added to the root of the second moment to avoid a division by
+            zero.
+        buffer: numpy.ndarray
+            Scratch buffer with the dimensions of the weight matrix. All
+            intermediate results are written into it, so nothing is allocated.
+
+        """
+        # m = beta_1 * m + (1 - beta_1) * g
+        first_moment *= beta_1
+        numpy.multiply(gradient, 1 - beta_1, out=buffer)
+        first_moment += buffer
+
+        # v = beta_2 * v + (1 - beta_2) * g^2
+        second_moment *= beta_2
+        numpy.multiply(gradient, gradient, out=buffer)
+        buffer *= 1 - beta_2
+        second_moment += buffer
+
+        # w = w + step_size * m / (sqrt(v) + epsilon)
+        numpy.sqrt(second_moment, out=buffer)
+        buffer += epsilon
+        numpy.divide(first_moment, buffer, out=buffer)
+        buffer *= step_size
+        matrix += buffer
+
+    def quantize_pixels(self, pixels) -> bytes:
+        """
+        Quantize the pixels of an image to bytes.
+
+        Parameters
+        ----------
+        pixels: list[float] | numpy.ndarray
+            The pixels of the image in range of [0; 1].
+
+        Returns
+        -------
+        bytes
+            One byte per pixel with the pixel rounded to [0; 255].
+
+        """
+        quantized = numpy.asarray(pixels, dtype=numpy.float64) * 255
+        numpy.rint(quantized, out=quantized)
+        numpy.clip(quantized, 0, 255, out=quantized)
+
+        return quantized.astype(numpy.uint8).tobytes()
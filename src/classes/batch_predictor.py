@@ -0,0 +1,596 @@
+"""File containing the BatchPredictor class."""
+
+# Import used Python libraries
+import collections
+import contextlib
+import csv
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+# Import used classes
+from classes.idx_file import IdxFile
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+
+class BatchPredictor:
+    """
+    A class streaming the predictions of the neural network for a set of images.
+
+    The images are read in chunks, which are decoded by a pool of worker processes
+    while the main process runs the already decoded chunks through the neural
+    network. Only a few chunks are in flight at any time, so the memory doesn't
+    grow with the number of images. The predictions are written in the order of
+    the images as soon as their chunk is finished.
+
+    The images are read from an IDX file (with the labels of the paired labels
+    file, if there is one), a CSV file in the format of
+    Image.save_image_bytes_and_labels or a directory of PNG files (which requires
+    Pillow).
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that predicts the numbers.
+    batch_size: int
+        Number of images that are run through the neural network at once.
+    workers: int
+        Number of worker processes decoding the images.
+
+    Methods
+    -------
+    set_neural_net
+        Set the neural network that predicts the numbers.
+    set_batch_size
+        Set the number of images that are run through the neural network at once.
+    set_workers
+        Set the number of worker processes decoding the images.
+    get_neural_net
+        Return the neural network that predicts the numbers.
+    get_batch_size
+        Return the number of images that are run through the neural network at once.
+    get_workers
+        Return the number of worker processes decoding the images.
+    read_chunks
+        Read the undecoded chunks of images of a file or directory.
+    find_labels_file
+        Return the path to the IDX file of the labels paired with an IDX file.
+    read_idx_chunks
+        Read the chunks of images of an IDX file.
+    read_csv_chunks
+        Read the chunks of rows of a CSV file.
+    read_png_chunks
+        Read the chunks of file names of a directory of PNG files.
+    decode_idx_chunk
+        Decode a chunk of images of an IDX file.
+    decode_csv_chunk
+        Decode a chunk of rows of a CSV file.
+    decode_png_chunk
+        Decode a chunk of PNG files.
+    decode_task
+        Decode one chunk inside a worker process.
+    decode_chunks
+        Decode the chunks, in parallel if there is more than one worker.
+    predict
+        Predict the numbers of all images and write them into a CSV file.
+
+    """
+
+    def __init__(
+            self, neural_net: NeuralNetwork, batch_size: int = 256,
+            workers: int | None = None
+    ) -> None:
+        """
+        Construct one BatchPredictor object with the given attributes.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+        batch_size: int
+            Number of images that are run through the neural network at once.
+        workers: int | None
+            Number of worker processes decoding the images. If None, one per CPU.
+
+        """
+        self.set_neural_net(neural_net)
+        self.set_batch_size(batch_size)
+        self.set_workers(workers if workers is not None else os.cpu_count() or 1)
+
+    def set_neural_net(self, neural_net: NeuralNetwork) -> None:
+        """
+        Set the neural network that predicts the numbers.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+
+        """
+        self.neural_net: NeuralNetwork = neural_net
+
+    def set_batch_size(self, batch_size: int) -> None:
+        """
+        Set the number of images that are run through the neural network at once.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of images per batch.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is smaller than 1.
+
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size has to be at least 1.")
+
+        self.batch_size: int = batch_size
+
+    def set_workers(self, workers: int) -> None:
+        """
+        Set the number of worker processes decoding the images.
+
+        Parameters
+        ----------
+        workers: int
+            Number of worker processes. If 1, the images are decoded in the main
+            process.
+
+        Raises
+        ------
+        ValueError
+            If the number of workers is smaller than 1.
+
+        """
+        if workers < 1:
+            raise ValueError("The number of workers has to be at least 1.")
+
+        self.workers: int = workers
+
+    def get_neural_net(self) -> NeuralNetwork:
+        """
+        Return the neural network that predicts the numbers.
+
+        Returns
+        -------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+
+        """
+        return self.neural_net
+
+    def get_batch_size(self) -> int:
+        """
+        Return the number of images that are run through the neural network at once.
+
+        Returns
+        -------
+        batch_size: int
+            Number of images per batch.
+
+        """
+        return self.batch_size
+
+    def get_workers(self) -> int:
+        """
+        Return the number of worker processes decoding the images.
+
+        Returns
+        -------
+        workers: int
+            Number of worker processes.
+
+        """
+        return self.workers
+
+    @staticmethod
+    def read_chunks(path: str, chunk_size: int) -> Iterator[tuple[Callable, tuple]]:
+        """
+        Read the undecoded chunks of images of a file or directory.
+
+        Parameters
+        ----------
+        path: str
+            Path to an IDX file, a CSV file or a directory of PNG files.
+        chunk_size: int
+            Number of images per chunk.
+
+        Returns
+        -------
+        Iterator[tuple[Callable, tuple]]
+            The decoding function and its arguments for each chunk.
+
+        """
+        if os.path.isdir(path):
+            return BatchPredictor.read_png_chunks(path, chunk_size)
+        if pathlib.Path(path).suffix.lower() == ".csv":
+            return BatchPredictor.read_csv_chunks(path, chunk_size)
+
+        return BatchPredictor.read_idx_chunks(path, chunk_size)
+
+    @staticmethod
+    def find_labels_file(path_to_idx_file: str) -> str | None:
+        """
+        Return the path to the IDX file of the labels paired with an IDX file.
+
+        Parameters
+        ----------
+        path_to_idx_file: str
+            Path to an IDX file of images.
+
+        Returns
+        -------
+        str | None
+            The path with 'images' replaced by 'labels' and 'idx3' by 'idx1' in the
+            file name (e.g. 't10k-labels.idx1-ubyte' for 't10k-images.idx3-ubyte'),
+            if that file exists. Otherwise None.
+
+        """
+        path: pathlib.Path = pathlib.Path(path_to_idx_file)
+        labels_path: pathlib.Path = path.with_name(
+            path.name.replace("images", "labels").replace("idx3", "idx1"))
+
+        if labels_path == path or not labels_path.is_file():
+            return None
+
+        return str(labels_path)
+
+    @staticmethod
+    def read_idx_chunks(
+        path_to_idx_file: str, chunk_size: int
+    ) -> Iterator[tuple[Callable, tuple]]:
+        """
+        Read the chunks of images of an IDX file.
+
+        Parameters
+        ----------
+        path_to_idx_file: str
+            Path to an IDX file of unsigned bytes with three dimensions (images,
+            rows, columns).
+        chunk_size: int
+            Number of images per chunk.
+
+        Yields
+        ------
+        tuple[Callable, tuple]
+            decode_idx_chunk and the path, the path to the paired labels file (or
+            None), the index of the first image and the index after the last image of
+            the chunk. The workers map the files themselves, so the pixels aren't
+            copied between the processes.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't an IDX file of images or the paired labels file
+            doesn't hold one label per image.
+
+        """
+        with IdxFile(path_to_idx_file) as idx_file:
+            if idx_file.get_typecode() != "B" or len(idx_file.get_shape()) < 2:
+                raise ValueError("The file isn't an IDX file of images.")
+            count: int = idx_file.get_count()
+
+        # Check the paired labels file, if there is one
+        path_to_labels: str | None = BatchPredictor.find_labels_file(
+            path_to_idx_file)
+        if path_to_labels is not None:
+            with IdxFile(path_to_labels) as labels_file:
+                if labels_file.get_shape() != (count,):
+                    raise ValueError("The file '" + path_to_labels
+                                     + "' doesn't hold one label per image.")
+
+        for start in range(0, count, chunk_size):
+            yield BatchPredictor.decode_idx_chunk, (
+                path_to_idx_file, path_to_labels, start,
+                min(start + chunk_size, count))
+
+    @staticmethod
+    def read_csv_chunks(
+        path_to_csv_file: str, chunk_size: int
+    ) -> Iterator[tuple[Callable, tuple]]:
+        """
+        Read the chunks of rows of a CSV file.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to a CSV file with the columns 'label' and 'pixels'.
+        chunk_size: int
+            Number of images per chunk.
+
+        Yields
+        ------
+        tuple[Callable, tuple]
+            decode_csv_chunk and the index of the first image, the header and the
+            lines of the chunk.
+
+        """
+        with open(path_to_csv_file, 'r', encoding='utf-8') as csv_file:
+            # Read the header, the lines are only split by the workers
+            header: str = csv_file.readline()
+
+            # Initialize the lines of the chunk
+            lines: list[str] = []
+            start: int = 0
+
+            for line in csv_file:
+                # Skip empty lines
+                if not line.strip():
+                    continue
+
+                lines.append(line)
+                if len(lines) == chunk_size:
+                    yield BatchPredictor.decode_csv_chunk, (start, header, lines)
+                    start += len(lines)
+                    lines = []
+
+            if lines:
+                yield BatchPredictor.decode_csv_chunk, (start, header, lines)
+
+    @staticmethod
+    def read_png_chunks(
+        path_to_directory: str, chunk_size: int
+    ) -> Iterator[tuple[Callable, tuple]]:
+        """
+        Read the chunks of file names of a directory of PNG files.
+
+        Parameters
+        ----------
+        path_to_directory: str
+            Path to the directory. The PNG files are read in the order of their names.
+        chunk_size: int
+            Number of images per chunk.
+
+        Yields
+        ------
+        tuple[Callable, tuple]
+            decode_png_chunk and the paths to the PNG files of the chunk.
+
+        """
+        paths: list[str] = sorted(
+            str(path) for path in pathlib.Path(path_to_directory).iterdir()
+            if path.suffix.lower() == ".png")
+
+        for start in range(0, len(paths), chunk_size):
+            yield BatchPredictor.decode_png_chunk, (paths[start:start + chunk_size],)
+
+    @staticmethod
+    def decode_idx_chunk(
+        path_to_idx_file: str, path_to_labels: str | None, start: int, stop: int
+    ) -> tuple[list[str], list[Image]]:
+        """
+        Decode a chunk of images of an IDX file.
+
+        Parameters
+        ----------
+        path_to_idx_file: str
+            Path to the IDX file.
+        path_to_labels: str | None
+            Path to the IDX file of the labels. If None, the labels are unknown.
+        start: int
+            Index of the first image of the chunk.
+        stop: int
+            Index after the last image of the chunk.
+
+        Returns
+        -------
+        tuple[list[str], list[Image]]
+            The index of each image and the images with pixels in range of [0; 1].
+            The actual numbers are None if there is no labels file.
+
+        """
+        # Read the labels of the chunk, if they are known
+        labels: list[int | None] = [None] * (stop - start)
+        if path_to_labels is not None:
+            with IdxFile(path_to_labels) as labels_file:
+                labels = labels_file.read(start, stop).tolist()
+
+        with IdxFile(path_to_idx_file) as idx_file:
+            return ([str(index) for index in range(start, stop)],
+                    [Image(pixels, label) for pixels, label in zip(
+                        idx_file.get_batch(start, stop), labels)])
+
+    @staticmethod
+    def decode_csv_chunk(
+        start: int, header: str, lines: list[str]
+    ) -> tuple[list[str], list[Image]]:
+        """
+        Decode a chunk of rows of a CSV file.
+
+        Parameters
+        ----------
+        start: int
+            Index of the first image of the chunk.
+        header: str
+            The header line of the CSV file.
+        lines: list[str]
+            The lines of the chunk.
+
+        Returns
+        -------
+        tuple[list[str], list[Image]]
+            The index of each image and the images.
+
+        """
+        # Initialize the return values
+        names: list[str] = []
+        images: list[Image] = []
+
+        for count, row in enumerate(csv.DictReader([header] + lines)):
+            # Read the pixels the same way as Image.create_images_from_csv
+            names.append(str(start + count))
+            images.append(Image(
+                [float(pixel) for pixel in row['pixels'][1:][:-1].split(', ')],
+                int(row['label'])))
+
+        return names, images
+
+    @staticmethod
+    def decode_png_chunk(paths: list[str]) -> tuple[list[str], list[Image]]:
+        """
+        Decode a chunk of PNG files.
+
+        Parameters
+        ----------
+        paths: list[str]
+            Paths to the PNG files of the chunk.
+
+        Returns
+        -------
+        tuple[list[str], list[Image]]
+            The file name of each image and the images. Each PNG file is converted to
+            grayscale and resized to 28x28 like the drawing of the user interface
+            (white number on black background).
+
+        Raises
+        ------
+        ImportError
+            If Pillow isn't installed.
+
+        """
+        # Pillow is only needed for PNG files
+        try:
+            from PIL import Image as PILImage
+        except ImportError as error:
+            raise ImportError("Reading PNG files requires Pillow.") from error
+
+        # Initialize the return values
+        names: list[str] = []
+        images: list[Image] = []
+
+        for path in paths:
+            with PILImage.open(path) as png_image:
+                # Convert the image into 28x28 gray values
+                gray_image = png_image.convert("L").resize((28, 28))
+
+            names.append(os.path.basename(path))
+            images.append(Image(
+                [pixel / 255 for pixel in gray_image.tobytes()], None))
+
+        return names, images
+
+    @staticmethod
+    def decode_task(task: tuple[Callable, tuple]) -> tuple[list[str], list[Image]]:
+        """
+        Decode one chunk inside a worker process.
+
+        Parameters
+        ----------
+        task: tuple[Callable, tuple]
+            The decoding function and its arguments.
+
+        Returns
+        -------
+        tuple[list[str], list[Image]]
+            The names and images of the chunk.
+
+        """
+        decode, arguments = task
+
+        return decode(*arguments)
+
+    def decode_chunks(
+            self, chunks: Iterator[tuple[Callable, tuple]]
+    ) -> Iterator[tuple[list[str], list[Image]]]:
+        """
+        Decode the chunks, in parallel if there is more than one worker.
+
+        Parameters
+        ----------
+        chunks: Iterator[tuple[Callable, tuple]]
+            The undecoded chunks.
+
+        Yields
+        ------
+        tuple[list[str], list[Image]]
+            The names and images of each chunk, in the order of the chunks.
+
+        """
+        if self.get_workers() == 1:
+            for chunk in chunks:
+                yield BatchPredictor.decode_task(chunk)
+            return
+
+        with multiprocessing.Pool(self.get_workers()) as pool:
+            # Keep two chunks per worker in flight, so reading never runs ahead
+            pending: collections.deque = collections.deque()
+
+            for chunk in chunks:
+                pending.append(pool.apply_async(BatchPredictor.decode_task, (chunk,)))
+                if len(pending) >= 2 * self.get_workers():
+                    yield pending.popleft().get()
+
+            while pending:
+                yield pending.popleft().get()
+
+    def predict(self, path: str, path_to_output: str | None = None) -> dict[str, float]:
+        """
+        Predict the numbers of all images and write them into a CSV file.
+
+        Parameters
+        ----------
+        path: str
+            Path to an IDX file, a CSV file or a directory of PNG files.
+        path_to_output: str | None
+            Path to the CSV file of the predictions. If None, they are written to
+            the standard output.
+
+        Returns
+        -------
+        dict[str, float]
+            The number of images, the elapsed seconds and the images per second.
+
+        Notes
+        -----
+        Each row of the output holds the index (or file name) of the image, its
+        actual number (empty if unknown), the predicted number and the output value
+        of each neuron of the output layer.
+
+        """
+        # Get the neural network
+        neural_net: NeuralNetwork = self.get_neural_net()
+
+        start: float = time.perf_counter()
+        count: int = 0
+
+        # The standard output isn't closed after the predictions
+        with (open(path_to_output, 'w', encoding='utf-8', newline='')
+              if path_to_output is not None
+              else contextlib.nullcontext(sys.stdout)) as output_file:
+            # Initialize the writer of the CSV file, whose type isn't public
+            csv_writer: Any = csv.writer(output_file)
+
+            # Write the header
+            csv_writer.writerow(
+                ["image", "label", "prediction"]
+                + ["probability_" + str(number)
+                   for number in range(neural_net.get_dimensions()[-1][0])])
+
+            for names, images in self.decode_chunks(BatchPredictor.read_chunks(
+                    path, self.get_batch_size())):
+                # Run the chunk through the neural network at once
+                labels, probabilities = neural_net.predict_batch(images)
+
+                csv_writer.writerows(
+                    [name, "" if image.get_actual_number() is None
+                     else image.get_actual_number(), label]
+                    + [round(value, 6) for value in values]
+                    for name, image, label, values in zip(
+                        names, images, labels, probabilities))
+
+                # Print a message after one thousand images
+                if (count + len(images)) // 1000 > count // 1000:
+                    print("Elapsed", count + len(images), "images.", file=sys.stderr)
+                count += len(images)
+
+        elapsed: float = time.perf_counter() - start
+
+        return {"images": count, "seconds": elapsed,
+                "images_per_second": count / elapsed if elapsed > 0 else 0.0}
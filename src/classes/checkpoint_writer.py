@@ -0,0 +1,459 @@
+"""File containing the CheckpointWriter class."""
+
+# Import used Python libraries
+import csv
+import os
+import pathlib
+import queue
+import tempfile
+import threading
+import time
+import zlib
+
+# Import used types
+from collections.abc import Callable
+from csv import DictReader
+import _csv
+
+# Import used classes
+from classes.backend import Backend
+from classes.optimizer import Optimizer
+
+class CheckpointWriter:
+    """
+    A class writing checkpoints of a training in a background thread.
+
+    The training only hands over a snapshot (copies of the weight matrices and of
+    the state of the optimizer, together with the position in the training data)
+    and continues. The thread converts the snapshot and writes it. If the thread is
+    still busy when the next snapshot arrives, the older waiting snapshot is
+    replaced, so the training never waits for the disk.
+
+    Every file is written into a temporary file in the same directory first and
+    then renamed over the old file, so a crash never leaves a partly written file.
+    The files can't be replaced at once, so the position is written last and
+    records the checksums of the weights and of the state of the optimizer. A
+    crash between the files is detected when the training is resumed.
+
+    Attributes
+    ----------
+    path_to_csv_file: str
+        Path to the CSV file of the weight matrices.
+    write_weights: Callable[[str, list[list[list[float]]]], None]
+        Function writing weight matrices into a CSV file.
+    checkpoint_images: int | None
+        Number of trained images after which a checkpoint is due.
+    checkpoint_seconds: float | None
+        Number of seconds after which a checkpoint is due.
+    images_since_checkpoint: int
+        Number of images trained since the last checkpoint.
+    last_checkpoint: float
+        Time of the last checkpoint (time.perf_counter).
+    snapshots: queue.Queue
+        The snapshot waiting to be written (at most one).
+    thread: threading.Thread
+        The background thread writing the snapshots.
+    written: int
+        Number of checkpoints written so far.
+    error: OSError | csv.Error | None
+        The error raised while writing the last checkpoint, if there was one.
+
+    Methods
+    -------
+    get_path_to_csv_file
+        Return the path to the CSV file of the weight matrices.
+    get_written
+        Return the number of checkpoints written so far.
+    get_position_path
+        Return the path of the position file belonging to a weights file.
+    count_images
+        Count trained images and return whether a checkpoint is due.
+    submit
+        Hand a snapshot over to the background thread.
+    close
+        Write the waiting snapshot and stop the background thread.
+    run
+        Write the snapshots until the writer is closed (background thread).
+    write_checkpoint
+        Write the files of one snapshot.
+    replace_atomically
+        Write a file through a temporary file that is renamed over it.
+    get_checksum
+        Return the CRC-32 checksum of a file.
+    is_complete
+        Check whether the files of a checkpoint belong to its position.
+    write_position
+        Write the position in the training data into a CSV file.
+    read_position
+        Read the position in the training data from a CSV file.
+
+    """
+
+    def __init__(
+            self, path_to_csv_file: str,
+            write_weights: Callable[[str, list[list[list[float]]]], None],
+            checkpoint_images: int | None = None,
+            checkpoint_seconds: float | None = None
+    ) -> None:
+        """
+        Construct one CheckpointWriter object and start its background thread.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file of the weight matrices. The state of the optimizer
+            and the position are written next to it.
+        write_weights: Callable[[str, list[list[list[float]]]], None]
+            Function writing weight matrices into a CSV file.
+        checkpoint_images: int | None
+            Number of trained images after which a checkpoint is due.
+        checkpoint_seconds: float | None
+            Number of seconds after which a checkpoint is due.
+
+        """
+        self.path_to_csv_file: str = path_to_csv_file
+        self.write_weights: Callable[[str, list[list[list[float]]]], None] = (
+            write_weights)
+        self.checkpoint_images: int | None = checkpoint_images
+        self.checkpoint_seconds: float | None = checkpoint_seconds
+        self.images_since_checkpoint: int = 0
+        self.last_checkpoint: float = time.perf_counter()
+        self.snapshots: queue.Queue = queue.Queue(maxsize=1)
+        self.written: int = 0
+        self.error: OSError | csv.Error | None = None
+
+        # Start the background thread
+        self.thread: threading.Thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def get_path_to_csv_file(self) -> str:
+        """
+        Return the path to the CSV file of the weight matrices.
+
+        Returns
+        -------
+        path_to_csv_file: str
+            Path to the CSV file of the weight matrices.
+
+        """
+        return self.path_to_csv_file
+
+    def get_written(self) -> int:
+        """
+        Return the number of checkpoints written so far.
+
+        Returns
+        -------
+        written: int
+            Number of checkpoints written so far.
+
+        """
+        return self.written
+
+    @staticmethod
+    def get_position_path(path_to_weights: str) -> str:
+        """
+        Return the path of the position file belonging to a weights file.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices.
+
+        Returns
+        -------
+        str
+            The path with '_position' appended to the file name, e.g.
+            'altered_weights_position.csv'.
+
+        """
+        path: pathlib.Path = pathlib.Path(path_to_weights)
+
+        return str(path.with_name(path.stem + "_position" + path.suffix))
+
+    def count_images(self, images: int) -> bool:
+        """
+        Count trained images and return whether a checkpoint is due.
+
+        Parameters
+        ----------
+        images: int
+            Number of images trained since the last call.
+
+        Returns
+        -------
+        bool
+            True if the given number of images or seconds passed since the last
+            checkpoint. The counters then start again.
+
+        """
+        self.images_since_checkpoint += images
+
+        if not ((self.checkpoint_images is not None
+                 and self.images_since_checkpoint >= self.checkpoint_images)
+                or (self.checkpoint_seconds is not None
+                    and time.perf_counter() - self.last_checkpoint
+                    >= self.checkpoint_seconds)):
+            return False
+
+        self.images_since_checkpoint = 0
+        self.last_checkpoint = time.perf_counter()
+
+        return True
+
+    def submit(
+            self, backend: Backend, weight_matrices: list, optimizer: Optimizer,
+            position: dict[str, int | str]
+    ) -> None:
+        """
+        Hand a snapshot over to the background thread.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            Copies of the weight matrices, which aren't changed anymore.
+        optimizer: Optimizer
+            Optimizer holding copies of the state buffers.
+        position: dict[str, int | str]
+            The position from which the training continues.
+
+        Raises
+        ------
+        OSError | csv.Error
+            The error raised while writing an earlier checkpoint.
+
+        """
+        # Report errors of the background thread to the training
+        if self.error is not None:
+            raise self.error
+
+        snapshot: tuple = (backend, weight_matrices, optimizer, position)
+
+        # Replace a snapshot that is still waiting instead of waiting for the disk
+        try:
+            self.snapshots.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self.snapshots.get_nowait()
+            except queue.Empty:
+                pass
+            self.snapshots.put(snapshot)
+
+    def close(self) -> None:
+        """
+        Write the waiting snapshot and stop the background thread.
+
+        Raises
+        ------
+        OSError | csv.Error
+            The error raised while writing a checkpoint.
+
+        """
+        # Signal the end after the waiting snapshot, unless the thread stopped
+        # because of an unexpected error and doesn't take it anymore
+        while self.thread.is_alive():
+            try:
+                self.snapshots.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self.thread.join()
+
+        if self.error is not None:
+            raise self.error
+
+    def run(self) -> None:
+        """Write the snapshots until the writer is closed (background thread)."""
+        while True:
+            snapshot: tuple | None = self.snapshots.get()
+
+            # The writer was closed
+            if snapshot is None:
+                return
+
+            try:
+                self.write_checkpoint(*snapshot)
+                self.written += 1
+            except (OSError, csv.Error) as error:
+                self.error = error
+
+    def write_checkpoint(
+            self, backend: Backend, weight_matrices: list, optimizer: Optimizer,
+            position: dict[str, int | str]
+    ) -> None:
+        """
+        Write the files of one snapshot.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            Copies of the weight matrices.
+        optimizer: Optimizer
+            Optimizer holding copies of the state buffers.
+        position: dict[str, int | str]
+            The position from which the training continues.
+
+        """
+        # Get the path to the weights
+        path_to_csv_file: str = self.get_path_to_csv_file()
+
+        # Write the weights
+        weight_matrices_as_lists: list[list[list[float]]] = [
+            backend.to_lists(weight_matrix) for weight_matrix in weight_matrices]
+        CheckpointWriter.replace_atomically(path_to_csv_file, lambda path: (
+            self.write_weights(path, weight_matrices_as_lists)))
+
+        # Write the state of the optimizer (-1 marks a checkpoint without state)
+        optimizer_checksum: int = -1
+        if optimizer.get_state():
+            path_to_state: str = Optimizer.get_state_path(path_to_csv_file)
+            CheckpointWriter.replace_atomically(
+                path_to_state, lambda path: optimizer.write_state(backend, path))
+            optimizer_checksum = CheckpointWriter.get_checksum(path_to_state)
+
+        # Write the position last, together with the checksums of the files it
+        # belongs to
+        checked_position: dict[str, int | str] = {
+            **position,
+            "weights_checksum": CheckpointWriter.get_checksum(path_to_csv_file),
+            "optimizer_checksum": optimizer_checksum}
+        CheckpointWriter.replace_atomically(
+            CheckpointWriter.get_position_path(path_to_csv_file),
+            lambda path: CheckpointWriter.write_position(path, checked_position))
+
+    @staticmethod
+    def replace_atomically(path: str, write_file: Callable[[str], None]) -> None:
+        """
+        Write a file through a temporary file that is renamed over it.
+
+        Parameters
+        ----------
+        path: str
+            Path to the file that is replaced.
+        write_file: Callable[[str], None]
+            Function writing the file at the given path.
+
+        """
+        # Create the temporary file in the same directory, renaming is only atomic
+        # within one file system
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+        os.close(file_descriptor)
+
+        try:
+            write_file(temporary_path)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    @staticmethod
+    def get_checksum(path: str) -> int:
+        """
+        Return the CRC-32 checksum of a file.
+
+        Parameters
+        ----------
+        path: str
+            Path to the file.
+
+        Returns
+        -------
+        crc: int
+            The checksum of the content of the file.
+
+        """
+        crc: int = 0
+
+        with open(path, 'rb') as checked_file:
+            while chunk := checked_file.read(1 << 20):
+                crc = zlib.crc32(chunk, crc)
+
+        return crc
+
+    @staticmethod
+    def is_complete(path_to_weights: str, position: dict[str, int | str]) -> bool:
+        """
+        Check whether the files of a checkpoint belong to its position.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices.
+        position: dict[str, int | str]
+            The position read from the position file.
+
+        Returns
+        -------
+        bool
+            True if the checksums of the weights and of the state of the optimizer
+            (if the checkpoint has one) match the checksums of the position. False
+            if a file was replaced after the position was written, e.g. because the
+            training crashed while writing the next checkpoint.
+
+        """
+        if "weights_checksum" not in position or "optimizer_checksum" not in position:
+            return False
+
+        path_to_state: str = Optimizer.get_state_path(path_to_weights)
+
+        try:
+            return (CheckpointWriter.get_checksum(path_to_weights)
+                    == position["weights_checksum"]
+                    and (position["optimizer_checksum"] == -1
+                         or CheckpointWriter.get_checksum(path_to_state)
+                         == position["optimizer_checksum"]))
+        except OSError:
+            return False
+
+    @staticmethod
+    def write_position(path_to_output: str, position: dict[str, int | str]) -> None:
+        """
+        Write the position in the training data into a CSV file.
+
+        Parameters
+        ----------
+        path_to_output: str
+            Path to the CSV file in which the position needs to be written.
+        position: dict[str, int | str]
+            The epoch and the index within its order from which the training
+            continues, the seed, the sampling and the checksums of the files.
+
+        """
+        with open(path_to_output, 'w', encoding='utf-8', newline='') as csv_file:
+            # Initialize the writer of the CSV file
+            csv_writer: _csv._writer = csv.writer(csv_file)
+
+            # Write the header and the position
+            csv_writer.writerow(list(position))
+            csv_writer.writerow(list(position.values()))
+
+    @staticmethod
+    def read_position(path_to_csv_file: str) -> dict[str, int | str]:
+        """
+        Read the position in the training data from a CSV file.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file that is read.
+
+        Returns
+        -------
+        dict[str, int | str]
+            The position with all numbers converted to int.
+
+        """
+        with open(path_to_csv_file, 'r', encoding='utf-8') as csv_file:
+            # Initialize the reader of the CSV file
+            csv_reader: DictReader = csv.DictReader(csv_file)
+
+            # Read the position
+            position: dict[str, str] = next(csv_reader)
+
+        return {key: int(value) if value.lstrip("-").isdigit() else value
+                for key, value in position.items()}
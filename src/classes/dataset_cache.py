@@ -0,0 +1,312 @@
+"""File containing the DatasetCache class."""
+
+# Import used Python libraries
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+# Import used classes
+from classes.checkpoint_writer import CheckpointWriter
+from classes.image_dataset import ImageDataset
+
+class DatasetCache:
+    """
+    A class caching the images of IDX files in one binary file.
+
+    The cache is written once from the IDX files of the images and labels and
+    read on later runs instead of the IDX (or CSV) files. It starts with a header
+    of 20 bytes: the magic bytes b'NNDS', the version (uint16), the typecode of
+    the pixels (b'B'), a zero byte, the number of images (uint32), the number of
+    pixels per image (uint32) and the CRC-32 checksum of everything after the
+    header (uint32). The header is followed by the size (uint64), the
+    modification time in nanoseconds (int64) and the CRC-32 checksum (uint32) of
+    both IDX files, the labels (one signed byte each), zero bytes up to the next
+    multiple of 8 and the pixels (one byte each). All numbers are little-endian.
+
+    The cache belongs to the IDX files as long as their sizes match and either
+    their modification times or their checksums match. Otherwise (or if the cache
+    is missing or damaged) it is written again from the IDX files.
+
+    Methods
+    -------
+    get_source_info
+        Return the size, modification time and checksum of an IDX file.
+    write
+        Write a dataset into a cache file.
+    read
+        Read the dataset of a cache file.
+    read_sources
+        Read the information about the IDX files stored in a cache file.
+    is_valid
+        Check whether a cache file belongs to the given IDX files.
+    load
+        Return the dataset of IDX files, through the cache file if it is valid.
+
+    """
+
+    magic: bytes = b"NNDS"
+    version: int = 1
+    header: struct.Struct = struct.Struct("<4sHcBIII")
+    source: struct.Struct = struct.Struct("<QqI4x")
+
+    @staticmethod
+    def get_source_info(path: str, checksum: bool = True) -> tuple[int, int, int]:
+        """
+        Return the size, modification time and checksum of an IDX file.
+
+        Parameters
+        ----------
+        path: str
+            Path to the IDX file.
+        checksum: bool
+            Whether the checksum is calculated (which reads the file).
+
+        Returns
+        -------
+        tuple[int, int, int]
+            The size in bytes, the modification time in nanoseconds and the CRC-32
+            checksum (0 if it isn't calculated).
+
+        """
+        status: os.stat_result = os.stat(path)
+        crc: int = 0
+
+        if checksum:
+            with open(path, 'rb') as source_file:
+                while chunk := source_file.read(1 << 20):
+                    crc = zlib.crc32(chunk, crc)
+
+        return status.st_size, status.st_mtime_ns, crc
+
+    @staticmethod
+    def write(
+        path_to_cache: str, dataset: ImageDataset,
+        sources: list[tuple[int, int, int]]
+    ) -> None:
+        """
+        Write a dataset into a cache file.
+
+        Parameters
+        ----------
+        path_to_cache: str
+            Path to the cache file. It is replaced atomically.
+        dataset: ImageDataset
+            The dataset with the pixels stored as bytes.
+        sources: list[tuple[int, int, int]]
+            Size, modification time and checksum of the IDX files of the images and
+            of the labels.
+
+        Raises
+        ------
+        ValueError
+            If the pixels of the dataset aren't stored as bytes.
+
+        """
+        if dataset.get_typecode() != "B":
+            raise ValueError("Only datasets of bytes can be cached.")
+
+        # Get the images of the dataset (a slice may share larger arrays)
+        start: int = dataset.start
+        width: int = dataset.get_width()
+        labels: bytes = dataset.labels[start:start + len(dataset)].tobytes()
+
+        # Create the information about the sources and the labels, padded to a
+        # multiple of 8 bytes
+        body: bytearray = bytearray()
+        for size, modification_time, crc in sources:
+            body += DatasetCache.source.pack(size, modification_time, crc)
+        body += labels
+        body += bytes(-(DatasetCache.header.size + len(body)) % 8)
+
+        # Append the pixels
+        body += memoryview(dataset.pixels)[
+            start * width:(start + len(dataset)) * width]
+
+        def write_file(path: str) -> None:
+            with open(path, 'wb') as cache_file:
+                cache_file.write(DatasetCache.header.pack(
+                    DatasetCache.magic, DatasetCache.version, b"B", 0, len(dataset),
+                    width, zlib.crc32(body)))
+                cache_file.write(body)
+
+        # Create the directory of the cache if necessary
+        os.makedirs(os.path.dirname(os.path.abspath(path_to_cache)), exist_ok=True)
+        CheckpointWriter.replace_atomically(path_to_cache, write_file)
+
+    @staticmethod
+    def read_sources(path_to_cache: str) -> list[tuple[int, int, int]]:
+        """
+        Read the information about the IDX files stored in a cache file.
+
+        Parameters
+        ----------
+        path_to_cache: str
+            Path to the cache file.
+
+        Returns
+        -------
+        list[tuple[int, int, int]]
+            Size, modification time and checksum of the IDX files of the images and
+            of the labels.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a cache file of the current version.
+
+        """
+        with open(path_to_cache, 'rb') as cache_file:
+            data: bytes = cache_file.read(
+                DatasetCache.header.size + 2 * DatasetCache.source.size)
+
+        if len(data) < DatasetCache.header.size + 2 * DatasetCache.source.size or (
+                DatasetCache.header.unpack_from(data)[:2]
+                != (DatasetCache.magic, DatasetCache.version)):
+            raise ValueError("The file isn't a dataset cache of version "
+                             + str(DatasetCache.version) + ".")
+
+        return [DatasetCache.source.unpack_from(
+            data, DatasetCache.header.size + i * DatasetCache.source.size)
+            for i in range(2)]
+
+    @staticmethod
+    def read(path_to_cache: str, verify: bool = True) -> ImageDataset:
+        """
+        Read the dataset of a cache file.
+
+        Parameters
+        ----------
+        path_to_cache: str
+            Path to the cache file.
+        verify: bool
+            Whether the checksum of the cache file is verified.
+
+        Returns
+        -------
+        ImageDataset
+            The dataset with the pixels stored as bytes.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a cache file of the current version, is truncated or
+            its checksum doesn't match.
+
+        """
+        with open(path_to_cache, 'rb') as cache_file, mmap.mmap(
+                cache_file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            # Read the header
+            if len(mapping) < DatasetCache.header.size + 2 * DatasetCache.source.size:
+                raise ValueError("The file is too short to be a dataset cache.")
+            magic, version, typecode, _, count, width, checksum = (
+                DatasetCache.header.unpack_from(mapping))
+            if (magic != DatasetCache.magic or version != DatasetCache.version
+                    or typecode != b"B"):
+                raise ValueError("The file isn't a dataset cache of version "
+                                 + str(DatasetCache.version) + ".")
+
+            # Get the offsets of the labels and pixels
+            offset: int = DatasetCache.header.size + 2 * DatasetCache.source.size
+            pixel_offset: int = offset + count + -(offset + count) % 8
+
+            # Check that the data is complete and unchanged
+            if pixel_offset + count * width != len(mapping):
+                raise ValueError("The size of the file doesn't match its header.")
+            with memoryview(mapping) as view:
+                if verify and zlib.crc32(
+                        view[DatasetCache.header.size:]) != checksum:
+                    raise ValueError("The checksum of the file doesn't match.")
+
+                # Copy the labels and the pixels at once
+                labels: array = array("b")
+                labels.frombytes(view[offset:offset + count])
+                pixels: array = array("B")
+                pixels.frombytes(view[pixel_offset:])
+
+        return ImageDataset(pixels, labels, width)
+
+    @staticmethod
+    def is_valid(
+        path_to_cache: str, path_to_images: str, path_to_labels: str
+    ) -> bool:
+        """
+        Check whether a cache file belongs to the given IDX files.
+
+        Parameters
+        ----------
+        path_to_cache: str
+            Path to the cache file.
+        path_to_images: str
+            Path to the IDX file of the images.
+        path_to_labels: str
+            Path to the IDX file of the labels.
+
+        Returns
+        -------
+        bool
+            True if the cache file exists and the size of each IDX file matches and
+            either its modification time or (calculated only then) its checksum.
+
+        """
+        try:
+            cached_sources: list[tuple[int, int, int]] = DatasetCache.read_sources(
+                path_to_cache)
+        except (OSError, ValueError):
+            return False
+
+        for path, (size, modification_time, crc) in zip(
+                (path_to_images, path_to_labels), cached_sources):
+            current_size, current_modification_time, _ = (
+                DatasetCache.get_source_info(path, False))
+            if current_size != size:
+                return False
+
+            # A changed modification time only invalidates a changed file
+            if current_modification_time != modification_time and (
+                    DatasetCache.get_source_info(path)[2] != crc):
+                return False
+
+        return True
+
+    @staticmethod
+    def load(
+        path_to_images: str, path_to_labels: str, path_to_cache: str
+    ) -> ImageDataset:
+        """
+        Return the dataset of IDX files, through the cache file if it is valid.
+
+        Parameters
+        ----------
+        path_to_images: str
+            Path to the IDX file of the images.
+        path_to_labels: str
+            Path to the IDX file of the labels.
+        path_to_cache: str
+            Path to the cache file, which is (re)written if it isn't valid.
+
+        Returns
+        -------
+        ImageDataset
+            The dataset with the pixels stored as bytes.
+
+        """
+        if DatasetCache.is_valid(path_to_cache, path_to_images, path_to_labels):
+            try:
+                return DatasetCache.read(path_to_cache)
+            except ValueError:
+                # Fall back to the IDX files if the cache is damaged
+                pass
+
+        # Read the information about the sources before reading them, so a file
+        # changed in the meantime invalidates the cache at the next run
+        sources: list[tuple[int, int, int]] = [
+            DatasetCache.get_source_info(path)
+            for path in (path_to_images, path_to_labels)]
+
+        # Regenerate the cache from the IDX files
+        dataset: ImageDataset = ImageDataset.from_idx(path_to_images, path_to_labels)
+        DatasetCache.write(path_to_cache, dataset, sources)
+
+        return dataset
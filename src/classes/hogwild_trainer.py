@@ -0,0 +1,280 @@
+"""File containing the HogwildTrainer class."""
+
+# Import used Python libraries
+import time
+
+# Import used types
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+# Import used classes
+from classes.activation import Activation
+from classes.image import Image
+from classes.multiprocess_trainer import MultiprocessTrainer
+from classes.neural_network import NeuralNetwork
+
+# Import NumPy if it is installed, it is needed to view the shared memory
+if TYPE_CHECKING:
+    import numpy
+else:
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+class HogwildTrainer(MultiprocessTrainer):
+    """
+    A class training a neural network asynchronously on shared weight matrices.
+
+    The weight matrices are copied into shared memory. Each worker process streams
+    its own slice of the training data and adjusts the shared weight matrices after
+    every image in place and without any locks (Hogwild-style). Concurrent updates
+    may overwrite each other occasionally, which is tolerated in exchange for never
+    having to synchronize the workers.
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that is trained. It has to use the NumPy backend and
+        plain SGD, since the workers don't share any state of an optimizer.
+    workers: int
+        Number of worker processes.
+
+    Methods
+    -------
+    set_neural_net
+        Set the neural network that is trained.
+    run_worker
+        Train the shared weight matrices with one slice of the training data.
+    train_shared
+        Train the neural network asynchronously and return the images per second.
+    train
+        Run one asynchronous training iteration and write the weights.
+    comparison_report
+        Compare speed & accuracy of the asynchronous and the serial training.
+
+    """
+
+    def set_neural_net(self, neural_net: NeuralNetwork) -> None:
+        """
+        Set the neural network that is trained.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+
+        Raises
+        ------
+        ValueError
+            If the neural network doesn't use the NumPy backend or another
+            optimizer than SGD.
+
+        """
+        if neural_net.get_backend().name != "numpy":
+            raise ValueError("Hogwild training requires the NumPy backend.")
+        # The workers train with SGD, the state of other optimizers isn't shared
+        if neural_net.get_optimizer().name != "sgd":
+            raise ValueError("Hogwild training requires the SGD optimizer.")
+
+        super().set_neural_net(neural_net)
+
+    @staticmethod
+    def run_worker(
+        shared_memory_names: list[str], dimensions: list[tuple[int, int]],
+        activations: list[Activation], training_data: list[Image],
+        learning_rate: float
+    ) -> None:
+        """
+        Train the shared weight matrices with one slice of the training data.
+
+        Parameters
+        ----------
+        shared_memory_names: list[str]
+            Names of the shared memory blocks holding the weight matrices.
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        activations: list[Activation]
+            The activation function of each layer.
+        training_data: list[Image]
+            The slice of the training data of this worker.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Attach to the shared memory blocks
+        shared_blocks: list[SharedMemory] = [
+            SharedMemory(name=name) for name in shared_memory_names]
+
+        # The weight matrices of the worker are views on the shared memory
+        worker_net: NeuralNetwork = NeuralNetwork(
+            dimensions, [], "numpy", activations)
+        shared_matrices: list = [
+            numpy.ndarray(dimension, dtype=numpy.float64, buffer=block.buf)
+            for dimension, block in zip(dimensions, shared_blocks)]
+        worker_net.set_weight_matrices(shared_matrices, False)
+
+        # The weights are updated in place, so each step changes the shared memory
+        for single_image in training_data:
+            worker_net.train_batch([single_image], learning_rate)
+
+        # Release the views before detaching from the shared memory
+        worker_net.set_weight_matrices([])
+        del shared_matrices
+        for block in shared_blocks:
+            block.close()
+
+    def train_shared(self, training_data: list[Image], learning_rate: float) -> float:
+        """
+        Train the neural network asynchronously and return the images per second.
+
+        Parameters
+        ----------
+        training_data: list[Image]
+            The images that are used for training.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        Returns
+        -------
+        images_per_second: float
+            Number of trained images per second of all workers together.
+
+        """
+        # Get the neural network and its weight matrices (NumPy arrays)
+        neural_net: NeuralNetwork = self.get_neural_net()
+        weight_matrices: list = neural_net.get_weight_matrices()
+        dimensions: list[tuple[int, int]] = [
+            weight_matrix.shape for weight_matrix in weight_matrices]
+
+        # Initialize the shared memory blocks
+        shared_blocks: list[SharedMemory] = []
+
+        try:
+            # Copy each weight matrix into its own shared memory block
+            for weight_matrix in weight_matrices:
+                shared_blocks.append(
+                    SharedMemory(create=True, size=weight_matrix.nbytes))
+                numpy.ndarray(weight_matrix.shape, dtype=numpy.float64,
+                              buffer=shared_blocks[-1].buf)[:] = weight_matrix
+
+            # Give each worker its own contiguous slice of the training data
+            workers: int = self.get_workers()
+            arguments: list[tuple] = [
+                ([block.name for block in shared_blocks], dimensions,
+                 neural_net.get_activations(),
+                 training_data[worker * len(training_data) // workers:
+                               (worker + 1) * len(training_data) // workers],
+                 learning_rate)
+                for worker in range(workers)]
+
+            # Run all workers and wait for them to finish, the error of a failed
+            # worker is raised here
+            with self.create_pool() as pool:
+                start_time: float = time.perf_counter()
+                pool.starmap(HogwildTrainer.run_worker, arguments, chunksize=1)
+                elapsed_time: float = time.perf_counter() - start_time
+
+            # Copy the trained weight matrices out of the shared memory
+            trained_matrices: list = [
+                numpy.ndarray(dimension, dtype=numpy.float64, buffer=block.buf).copy()
+                for dimension, block in zip(dimensions, shared_blocks)]
+            neural_net.set_weight_matrices(trained_matrices)
+        finally:
+            # Free the shared memory blocks
+            for block in shared_blocks:
+                block.close()
+                block.unlink()
+
+        return len(training_data) / elapsed_time
+
+    def train(
+            self, training_data: list[Image], learning_rate: float,
+            path_to_csv_file: str
+    ) -> None:
+        """
+        Run one asynchronous training iteration and write the weights.
+
+        Parameters
+        ----------
+        training_data: list[Image]
+            The (60.000) images that are used for training.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        path_to_csv_file: str
+            Path to the CSV file in which the adjusted weight matrices shall be
+            written to.
+
+        """
+        # Train the shared weight matrices
+        images_per_second: float = self.train_shared(training_data, learning_rate)
+        print("Trained", round(images_per_second, 1), "images per second.")
+
+        # Write the adjusted weights into the csv file
+        NeuralNetwork.write_weights(
+            path_to_csv_file, self.get_neural_net().get_weight_matrices_as_lists())
+
+    @staticmethod
+    def comparison_report(
+        neural_net: NeuralNetwork, training_data: list[Image],
+        testing_data: list[Image], learning_rate: float, workers: int
+    ) -> dict[str, float]:
+        """
+        Compare speed & accuracy of the asynchronous and the serial training.
+
+        Both trainings start from the current weight matrices of the given neural
+        network, which aren't changed.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+        training_data: list[Image]
+            The images that are used for training.
+        testing_data: list[Image]
+            The images that are used to measure the accuracy.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        workers: int
+            Number of worker processes of the asynchronous training.
+
+        Returns
+        -------
+        report: dict[str, float]
+            Images per second and accuracy of the serial and the asynchronous
+            training.
+
+        """
+        # Get the initial weight matrices to start each training from them
+        weight_matrices: list[list[list[float]]] = (
+            neural_net.get_weight_matrices_as_lists())
+
+        # Measure the serial training with one update per image
+        serial_net: NeuralNetwork = NeuralNetwork(
+            neural_net.get_dimensions(), weight_matrices, "numpy",
+            neural_net.get_activations())
+        start_time: float = time.perf_counter()
+        for single_image in training_data:
+            serial_net.train_batch([single_image], learning_rate)
+        serial_rate: float = len(training_data) / (time.perf_counter() - start_time)
+
+        # Measure the asynchronous training
+        hogwild_net: NeuralNetwork = NeuralNetwork(
+            neural_net.get_dimensions(), weight_matrices, "numpy",
+            neural_net.get_activations())
+        hogwild_rate: float = HogwildTrainer(hogwild_net, workers).train_shared(
+            training_data, learning_rate)
+
+        report: dict[str, float] = {
+            "serial_images_per_second": serial_rate,
+            "serial_accuracy": serial_net.test(testing_data) / len(testing_data),
+            "hogwild_images_per_second": hogwild_rate,
+            "hogwild_accuracy": hogwild_net.test(testing_data) / len(testing_data)}
+
+        # Print the report
+        print("Serial:\t\tImages/s:", round(report["serial_images_per_second"], 1),
+              "\tAccuracy:", round(report["serial_accuracy"], 4))
+        print("Hogwild:\tImages/s:", round(report["hogwild_images_per_second"], 1),
+              "\tAccuracy:", round(report["hogwild_accuracy"], 4))
+
+        return report
@@ -0,0 +1,295 @@
+"""File containing the IdxFile class."""
+
+# Import necessary for the type hint of the __enter__ return value
+from __future__ import annotations
+
+# Import used Python libraries
+import mmap
+import struct
+import sys
+from array import array
+
+# Import used types
+from typing import Literal
+
+# Typecode and size in bytes of each data type of the IDX format
+DATA_TYPES: dict[int, tuple[str, int]] = {
+    0x08: ("B", 1), 0x09: ("b", 1), 0x0B: ("h", 2), 0x0C: ("i", 4),
+    0x0D: ("f", 4), 0x0E: ("d", 8)}
+
+class IdxFile:
+    """
+    A class reading an IDX file (e.g. the MNIST images & labels) through mmap.
+
+    The header is parsed instead of skipped: two zero bytes, the data type, the
+    number of dimensions and the size of each dimension (big-endian uint32). The
+    data after the header is mapped into memory, so opening a file doesn't read it.
+    Items (images or labels) of byte data are returned as memoryviews of the
+    mapping without copying them. Other data types are copied (and converted to
+    the byte order of the machine) when they're read.
+
+    The pixels are only converted into floats in range of [0; 1] when a batch is
+    materialized with get_batch.
+
+    Attributes
+    ----------
+    path: str
+        Path to the IDX file.
+    typecode: str
+        Typecode of the data ('B' for unsigned bytes).
+    shape: tuple[int, ...]
+        Size of each dimension, the first one is the number of items.
+    offset: int
+        Offset of the data in the file.
+    mapping: mmap.mmap | None
+        The memory mapping of the file, None once it is closed.
+
+    Methods
+    -------
+    get_path
+        Return the path to the IDX file.
+    get_typecode
+        Return the typecode of the data.
+    get_shape
+        Return the size of each dimension.
+    get_count
+        Return the number of items.
+    get_item_size
+        Return the number of values per item.
+    view
+        Return the values of some items without copying them.
+    read
+        Return a copy of the values of some items in the byte order of the machine.
+    get_batch
+        Return the values of some items as lists of floats divided by a divisor.
+    close
+        Close the memory mapping.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open an IDX file and parse its header.
+
+        Parameters
+        ----------
+        path: str
+            Path to the IDX file.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't an IDX file or is shorter than its header states.
+
+        """
+        self.path: str = path
+        self.mapping: mmap.mmap | None = None
+
+        with open(path, 'rb') as idx_file:
+            # Read the magic number (two zero bytes, the data type and the rank)
+            magic: bytes = idx_file.read(4)
+            if len(magic) < 4 or magic[:2] != b"\0\0" or magic[2] not in DATA_TYPES:
+                raise ValueError("The file '" + path + "' isn't an IDX file.")
+            self.typecode, item_bytes = DATA_TYPES[magic[2]]
+
+            # Read the size of each dimension
+            dimensions: bytes = idx_file.read(4 * magic[3])
+            if len(dimensions) < 4 * magic[3]:
+                raise ValueError("The header of '" + path + "' is truncated.")
+            self.shape: tuple[int, ...] = struct.unpack(
+                ">" + "I" * magic[3], dimensions)
+            self.offset: int = 4 + 4 * magic[3]
+
+            # Check that the data is complete
+            size: int = self.get_count() * self.get_item_size() * item_bytes
+            idx_file.seek(0, 2)
+            if idx_file.tell() < self.offset + size:
+                raise ValueError("The data of '" + path + "' is truncated.")
+
+            # Map the file, an empty one can't be mapped
+            if size > 0:
+                self.mapping = mmap.mmap(
+                    idx_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get_path(self) -> str:
+        """
+        Return the path to the IDX file.
+
+        Returns
+        -------
+        path: str
+            Path to the IDX file.
+
+        """
+        return self.path
+
+    def get_typecode(self) -> str:
+        """
+        Return the typecode of the data.
+
+        Returns
+        -------
+        typecode: str
+            'B', 'b', 'h', 'i', 'f' or 'd'.
+
+        """
+        return self.typecode
+
+    def get_shape(self) -> tuple[int, ...]:
+        """
+        Return the size of each dimension.
+
+        Returns
+        -------
+        shape: tuple[int, ...]
+            Size of each dimension, e.g. (60000, 28, 28) for the training images.
+
+        """
+        return self.shape
+
+    def get_count(self) -> int:
+        """
+        Return the number of items.
+
+        Returns
+        -------
+        int
+            Size of the first dimension (0 for a file without dimensions).
+
+        """
+        return self.shape[0] if self.shape else 0
+
+    def get_item_size(self) -> int:
+        """
+        Return the number of values per item.
+
+        Returns
+        -------
+        int
+            Product of the sizes of all but the first dimension, e.g. 784 for images
+            and 1 for labels.
+
+        """
+        item_size: int = 1
+        for size in self.shape[1:]:
+            item_size *= size
+
+        return item_size
+
+    def view(self, start: int = 0, stop: int | None = None) -> memoryview:
+        """
+        Return the values of some items without copying them.
+
+        Parameters
+        ----------
+        start: int
+            Index of the first item.
+        stop: int | None
+            Index after the last item. If None, all items up to the end.
+
+        Returns
+        -------
+        memoryview
+            Flat view ('B' or 'b') of the values of the items on the mapping. It has
+            to be released before the file is closed.
+
+        Raises
+        ------
+        ValueError
+            If the data isn't of a byte type, which needs converting.
+
+        """
+        if self.get_typecode() not in ("B", "b"):
+            raise ValueError("Only byte data can be viewed without copying.")
+        typecode: Literal["B", "b"] = "B" if self.get_typecode() == "B" else "b"
+
+        # Get the range of the items
+        stop = self.get_count() if stop is None else min(stop, self.get_count())
+        if self.mapping is None or start >= stop:
+            return memoryview(b"").cast(typecode)
+
+        return memoryview(self.mapping)[
+            self.offset + start * self.get_item_size():
+            self.offset + stop * self.get_item_size()].cast(typecode)
+
+    def read(self, start: int = 0, stop: int | None = None) -> array:
+        """
+        Return a copy of the values of some items in the byte order of the machine.
+
+        Parameters
+        ----------
+        start: int
+            Index of the first item.
+        stop: int | None
+            Index after the last item. If None, all items up to the end.
+
+        Returns
+        -------
+        array
+            The values of the items, with the typecode of the file.
+
+        """
+        # Initialize the return value
+        values: array = array(self.get_typecode())
+
+        # Get the range of the items
+        stop = self.get_count() if stop is None else min(stop, self.get_count())
+        if self.mapping is None or start >= stop:
+            return values
+
+        # Copy the values and convert them from big-endian
+        item_bytes: int = values.itemsize * self.get_item_size()
+        with memoryview(self.mapping) as mapping:
+            values.frombytes(mapping[self.offset + start * item_bytes:
+                                     self.offset + stop * item_bytes])
+        if values.itemsize > 1 and sys.byteorder == "little":
+            values.byteswap()
+
+        return values
+
+    def get_batch(
+            self, start: int, stop: int, divisor: float = 255
+    ) -> list[list[float]]:
+        """
+        Return the values of some items as lists of floats divided by a divisor.
+
+        Parameters
+        ----------
+        start: int
+            Index of the first item.
+        stop: int
+            Index after the last item.
+        divisor: float
+            Number each value is divided by, 255 converts bytes into [0; 1].
+
+        Returns
+        -------
+        list[list[float]]
+            One list of divided values per item.
+
+        """
+        # Get the values of the items without copying byte data
+        values = (self.view(start, stop) if self.get_typecode() in ("B", "b")
+                  else self.read(start, stop))
+        item_size: int = self.get_item_size()
+
+        try:
+            return [[value / divisor for value in values[offset:offset + item_size]]
+                    for offset in range(0, len(values), item_size)]
+        finally:
+            if isinstance(values, memoryview):
+                values.release()
+
+    def close(self) -> None:
+        """Close the memory mapping."""
+        if self.mapping is not None:
+            self.mapping.close()
+            self.mapping = None
+
+    def __enter__(self) -> IdxFile:
+        """Return the opened IDX file."""
+        return self
+
+    def __exit__(self, *_) -> None:
+        """Close the memory mapping."""
+        self.close()
@@ -5,17 +5,31 @@ from __future__ import annotations
 
 import csv
 import _csv
+from collections.abc import Iterator
+from itertools import islice
+
+# Import used classes
+from classes.idx_file import IdxFile
 
 class Image:
     """
     A class representing one image.
 
+    An image either holds its own pixels or is a view of one image of an
+    ImageDataset, which stores the pixels of all its images in one compact array.
+    The attributes are stored in slots instead of an instance dictionary, so many
+    images need little memory.
+
     Attributes
     ----------
     pixels: list[float]
-        The 28x28 (784) pixels of one image.
-    actual_number: int
-        The actual number that is drawn on the image.
+        The 28x28 (784) pixels of one image, empty for a view of a dataset.
+    actual_number: int | None
+        The actual number that is drawn on the image, None if it is unknown.
+    dataset: ImageDataset | None
+        The dataset the image is a view of.
+    index: int
+        Index of the image within the dataset.
 
     Methods
     -------
@@ -23,6 +37,8 @@ class Image:
         Return the pixels of the image.
     get_actual_number
         Return the actual number of the image.
+    from_dataset
+        Create a view of one image of a dataset.
     read_image_pixels_from_idx
         Read the image bytes from an IDX file.
     read_image_labels_from_idx
@@ -31,10 +47,16 @@ class Image:
         Read the image bytes and labels from an IDX file & save them in a CSV file.
     initialize_training_and_testing_data
         Read both training & testing images from IDX and save them in CSV files.
+    iterate_images_from_csv
+        Read a CSV file and yield the images while reading.
+    iterate_image_batches_from_csv
+        Read a CSV file and yield batches of images while reading.
 
     """
 
-    def __init__(self, pixels: list[float], actual_number: int) -> None:
+    __slots__ = ("pixels", "actual_number", "dataset", "index")
+
+    def __init__(self, pixels: list[float], actual_number: int | None) -> None:
         """
         Construct one Image object with the given attributes.
 
@@ -42,12 +64,39 @@ class Image:
         ----------
         pixels: list[float]
             The 28x28 (784) pixels of one image.
-        actual_number: int
-            The actual number that is drawn on the image.
+        actual_number: int | None
+            The actual number that is drawn on the image, None if it is unknown.
 
         """
         self.pixels = pixels
         self.actual_number = actual_number
+        self.dataset = None
+        self.index = 0
+
+    @staticmethod
+    def from_dataset(dataset, index: int) -> Image:
+        """
+        Create a view of one image of a dataset.
+
+        Parameters
+        ----------
+        dataset: ImageDataset
+            The dataset storing the pixels and the label.
+        index: int
+            Index of the image within the dataset.
+
+        Returns
+        -------
+        Image
+            The image, which doesn't copy the pixels.
+
+        """
+        # The pixels and the label of a view are read from the dataset
+        image: Image = Image([], None)
+        image.dataset = dataset
+        image.index = index
+
+        return image
 
     def get_pixels(self) -> list[float]:
         """
@@ -56,23 +105,34 @@ class Image:
         Returns
         -------
         self.pixels
-            The 28x28 (784) pixels of one image.
+            The 28x28 (784) pixels of one image. For a view of a dataset they are
+            converted from the dataset on each call.
 
         """
+        if self.dataset is not None:
+            return self.dataset.get_pixels(self.index)
+
         return self.pixels
 
-    def get_actual_number(self) -> int:
+    def get_actual_number(self) -> int | None:
         """
         Return the actual number of the image.
 
         Returns
         -------
         self.actual_number
-            The actual number that is drawn on the image.
+            The actual number that is drawn on the image, None if it is unknown.
 
         """
+        if self.dataset is not None:
+            return self.dataset.get_label(self.index)
+
         return self.actual_number
 
+    def __reduce__(self) -> tuple:
+        """Pickle a view of a dataset as image with its own pixels."""
+        return Image, (self.get_pixels(), self.get_actual_number())
+
     @staticmethod
     def read_image_pixels_from_idx(file: str) -> list[list[float]]:
         """
@@ -95,33 +155,13 @@ class Image:
         the neural network are values in range of [0; 1], the byte values are
         converted to be floats in that range. To do so they are divided by 255.
 
-        """
-        # Open the file
-        with open(file, 'rb') as idx_file:
-            # Ignore the first 16 bytes since the image bytes only start at offset 16
-            images = list(idx_file.read()[16:])
-
-            # Close the file
-            idx_file.close()
-
-        # Initialize the return value
-        all_image_pixels: list[list[float]] = []
-
-        # Count indicating the current image number
-        current_image_number: int = -1
-
-        for i, image_byte in enumerate(images):
-            # Append a new list after every 784 bytes
-            if i % 784 == 0:
-                all_image_pixels.append([])
-
-                # Increment the current image number
-                current_image_number += 1
-
-            # Append the converted byte
-            all_image_pixels[current_image_number].append(image_byte / 255)
+        The header of the file is parsed by IdxFile, so the number and size of the
+        images are taken from the file. To read the images without converting all
+        of them at once, use IdxFile directly.
 
-        return all_image_pixels
+        """
+        with IdxFile(file) as idx_file:
+            return idx_file.get_batch(0, idx_file.get_count())
 
     @staticmethod
     def read_image_labels_from_idx(file: str) -> list[int]:
@@ -140,15 +180,8 @@ class Image:
             representing the number that the 784 pixels represent.
 
         """
-        # Open the file
-        with open(file, 'rb') as idx_file:
-            # Ignore the first 8 bytes since the image labels only start at offset 8
-            all_image_labels = list(idx_file.read()[8:])
-
-            # Close the file
-            idx_file.close()
-
-        return all_image_labels
+        with IdxFile(file) as idx_file:
+            return idx_file.read().tolist()
 
     @staticmethod
     def save_image_bytes_and_labels(
@@ -167,27 +200,26 @@ class Image:
             Path to the output file.
 
         """
-        # Get the image labels and pixels
+        # Get the image labels
         all_image_labels = Image.read_image_labels_from_idx(file_labels)
-        all_image_pixels = Image.read_image_pixels_from_idx(file_images)
 
         # Define the table header
         header = ['label', 'pixels']
 
-        with open(path_to_output, 'w', encoding='utf-8') as csv_file:
+        with IdxFile(file_images) as idx_file, open(
+                path_to_output, 'w', encoding='utf-8') as csv_file:
             # Initialize the writer of the CSV file
             csv_writer: _csv._writer = csv.writer(csv_file)
 
             # Write the header
             csv_writer.writerow(header)
 
-            # Iterate over all images
-            for pixels, label in zip(all_image_pixels, all_image_labels):
-                # Add the image label to the image pixels
-                csv_writer.writerow([label, pixels])
-
-            # Close the file
-            csv_file.close()
+            # Convert the pixels of one thousand images at a time
+            for start in range(0, len(all_image_labels), 1000):
+                csv_writer.writerows(
+                    [label, pixels] for pixels, label in zip(
+                        idx_file.get_batch(start, start + 1000),
+                        all_image_labels[start:start + 1000]))
 
     @staticmethod
     def create_images_from_csv(path_to_csv_file: str) -> list[Image]:
@@ -217,31 +249,66 @@ class Image:
         Python Enhancement Proposals [PEP 563]).
 
         """
-        # Initialize the return value
-        image_list: list[Image] = []
+        return list(Image.iterate_images_from_csv(path_to_csv_file))
+
+    @staticmethod
+    def iterate_images_from_csv(path_to_csv_file: str) -> Iterator[Image]:
+        """
+        Read a CSV file and yield the images while reading.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file that is read.
 
+        Yields
+        ------
+        Image
+            Each image as soon as its row is read.
+
+        Notes
+        -----
+        Only the current row is held in memory, so the images can be processed
+        while the file is still read. The pixels are converted like in
+        create_images_from_csv.
+
+        """
         # Open the file
         with open(path_to_csv_file, 'r', encoding='utf-8') as csv_file:
             csv_reader: csv.DictReader = csv.DictReader(csv_file)
 
             # Read each row
             for row in csv_reader:
-                # Read the label and convert it into an integer
-                label = int(row['label'])
+                # Read the label and the pixels and create an image object
+                yield Image(
+                    [float(pixel) for pixel in row['pixels'][1:][:-1].split(', ')],
+                    int(row['label']))
 
-                # Read the pixels and convert it into a list of float
-                pixels = [
-                    float(pixel) for pixel in
-                    row['pixels'][1:][:-1].split(', ')]
+    @staticmethod
+    def iterate_image_batches_from_csv(
+        path_to_csv_file: str, batch_size: int
+    ) -> Iterator[list[Image]]:
+        """
+        Read a CSV file and yield batches of images while reading.
 
-                # Create an image object and add it to the return value
-                image_list.append(Image(pixels, label))
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file that is read.
+        batch_size: int
+            Number of images per batch.
+
+        Yields
+        ------
+        list[Image]
+            Each batch of images as soon as it is full (the last batch may be
+            smaller).
 
-            # Close the file
-            csv_file.close()
+        """
+        images: Iterator[Image] = Image.iterate_images_from_csv(path_to_csv_file)
 
-        # Return the list of all images created
-        return image_list
+        while batch := list(islice(images, batch_size)):
+            yield batch
 
     @staticmethod
     def initialize_training_and_testing_data(
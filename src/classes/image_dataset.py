@@ -0,0 +1,375 @@
+"""File containing the ImageDataset class."""
+
+# Import necessary for the type hints of the ImageDataset return values
+from __future__ import annotations
+
+# Import used Python libraries
+from array import array
+
+# Import used types
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+# Import used classes
+from classes.idx_file import IdxFile
+from classes.image import Image
+
+class ImageDataset(Sequence):
+    """
+    A class storing the pixels and labels of many images in two compact arrays.
+
+    The pixels of all images are stored row after row in one contiguous array,
+    either as bytes ('B', one byte per pixel, the resolution of the MNIST images)
+    or as floats ('f', four bytes per pixel). The labels are stored in a second
+    array, -1 stands for an unknown label. Indexing the dataset returns an Image
+    that is only a view of one row, its pixels are converted into floats when
+    get_pixels is called.
+
+    Slices with a step of 1 share the arrays of the dataset, so slicing and
+    batching don't copy any pixels.
+
+    Attributes
+    ----------
+    pixels: array
+        The pixels of all images of the underlying arrays.
+    labels: array
+        The labels ('b' array) of all images of the underlying arrays.
+    width: int
+        Number of pixels of each image.
+    start: int
+        Index of the first image of the dataset within the arrays.
+    size: int
+        Number of images of the dataset.
+
+    Methods
+    -------
+    get_typecode
+        Return the typecode of the pixels.
+    get_width
+        Return the number of pixels of each image.
+    get_pixels
+        Return the pixels of one image in range of [0; 1].
+    get_label
+        Return the label of one image.
+    get_batch
+        Return the pixels of some images in range of [0; 1].
+    batches
+        Yield the dataset in slices of the given size.
+    from_images
+        Create a dataset from images.
+    from_idx
+        Create a dataset from an IDX file of images and one of labels.
+    from_csv
+        Create a dataset from a CSV file of images.
+
+    """
+
+    def __init__(
+            self, pixels: array, labels: array, width: int = 784, start: int = 0,
+            size: int | None = None
+    ) -> None:
+        """
+        Construct one ImageDataset object on the given arrays.
+
+        Parameters
+        ----------
+        pixels: array
+            The pixels of all images, row after row ('B' array with values in range
+            of [0; 255] or 'f' array with values in range of [0; 1]).
+        labels: array
+            The label of each image ('b' array, -1 if unknown).
+        width: int
+            Number of pixels of each image.
+        start: int
+            Index of the first image of the dataset within the arrays.
+        size: int | None
+            Number of images of the dataset. If None, all images after start.
+
+        Raises
+        ------
+        ValueError
+            If the typecode isn't 'B' or 'f' or the arrays don't fit together.
+
+        """
+        if pixels.typecode not in ("B", "f"):
+            raise ValueError("The pixels have to be stored as 'B' or 'f' array.")
+        if len(pixels) != len(labels) * width:
+            raise ValueError("The number of pixels doesn't match the labels.")
+
+        self.pixels: array = pixels
+        self.labels: array = labels
+        self.width: int = width
+        self.start: int = start
+        # Not named count, which would hide the count method of Sequence
+        self.size: int = len(labels) - start if size is None else size
+
+    def get_typecode(self) -> str:
+        """
+        Return the typecode of the pixels.
+
+        Returns
+        -------
+        str
+            'B' for bytes, 'f' for floats.
+
+        """
+        return self.pixels.typecode
+
+    def get_width(self) -> int:
+        """
+        Return the number of pixels of each image.
+
+        Returns
+        -------
+        width: int
+            Number of pixels of each image.
+
+        """
+        return self.width
+
+    def __len__(self) -> int:
+        """Return the number of images of the dataset."""
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> Image:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ImageDataset:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Image | ImageDataset:
+        """
+        Return a view of one image or a dataset of some images.
+
+        Parameters
+        ----------
+        index: int | slice
+            Index of the image or slice of the images.
+
+        Returns
+        -------
+        Image | ImageDataset
+            An Image viewing the row of the image, or a dataset of the images of
+            the slice (sharing the arrays if the step is 1).
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range.
+
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+
+            # Share the arrays for a contiguous slice
+            if step == 1:
+                return ImageDataset(self.pixels, self.labels, self.width,
+                                    self.start + start, max(stop - start, 0))
+
+            return ImageDataset.from_images(
+                [self[i] for i in range(start, stop, step)], self.get_typecode())
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("The index of the image is out of range.")
+
+        return Image.from_dataset(self, index)
+
+    def __iter__(self) -> Iterator[Image]:
+        """Yield a view of each image."""
+        for index in range(self.size):
+            yield Image.from_dataset(self, index)
+
+    def __reduce__(self) -> tuple:
+        """Pickle only the images of the dataset, not the whole arrays."""
+        start: int = self.start
+
+        return (ImageDataset, (
+            self.pixels[start * self.width:(start + self.size) * self.width],
+            self.labels[start:start + self.size], self.width))
+
+    def get_pixels(self, index: int) -> list[float]:
+        """
+        Return the pixels of one image in range of [0; 1].
+
+        Parameters
+        ----------
+        index: int
+            Index of the image within the dataset.
+
+        Returns
+        -------
+        list[float]
+            The pixels of the image. Bytes are divided by 255, so they're equal to
+            the pixels of Image.read_image_pixels_from_idx.
+
+        """
+        offset: int = (self.start + index) * self.width
+        pixels: array = self.pixels[offset:offset + self.width]
+
+        if self.get_typecode() == "B":
+            return [pixel / 255 for pixel in pixels]
+
+        return pixels.tolist()
+
+    def get_label(self, index: int) -> int | None:
+        """
+        Return the label of one image.
+
+        Parameters
+        ----------
+        index: int
+            Index of the image within the dataset.
+
+        Returns
+        -------
+        int | None
+            The actual number of the image, None if it is unknown.
+
+        """
+        label: int = self.labels[self.start + index]
+
+        return label if label >= 0 else None
+
+    def get_batch(self, start: int, stop: int) -> list[list[float]]:
+        """
+        Return the pixels of some images in range of [0; 1].
+
+        Parameters
+        ----------
+        start: int
+            Index of the first image.
+        stop: int
+            Index after the last image.
+
+        Returns
+        -------
+        list[list[float]]
+            The pixels of each image.
+
+        """
+        return [self.get_pixels(index)
+                for index in range(max(start, 0), min(stop, self.size))]
+
+    def batches(self, batch_size: int) -> Iterator[ImageDataset]:
+        """
+        Yield the dataset in slices of the given size.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of images per slice (the last slice may be smaller).
+
+        Yields
+        ------
+        ImageDataset
+            The next slice, sharing the arrays of the dataset.
+
+        """
+        for start in range(0, self.size, batch_size):
+            yield self[start:start + batch_size]
+
+    @staticmethod
+    def from_images(images: Iterable[Image], typecode: str = "B") -> ImageDataset:
+        """
+        Create a dataset from images.
+
+        Parameters
+        ----------
+        images: Iterable[Image]
+            The images, with pixels in range of [0; 1].
+        typecode: str
+            'B' to store the pixels as bytes (rounded to multiples of 1/255), 'f' to
+            store them as floats.
+
+        Returns
+        -------
+        ImageDataset
+            The dataset of the images.
+
+        Raises
+        ------
+        ValueError
+            If the typecode isn't 'B' or 'f'.
+
+        """
+        if typecode not in ("B", "f"):
+            raise ValueError("The typecode has to be 'B' or 'f'.")
+
+        # Initialize the arrays
+        pixels: array = array(typecode)
+        labels: array = array("b")
+        width: int = 0
+
+        for image in images:
+            if typecode == "B":
+                pixels.frombytes(bytes(
+                    [int(pixel * 255 + 0.5) for pixel in image.get_pixels()]))
+            else:
+                pixels.extend(image.get_pixels())
+            labels.append(image.get_actual_number()
+                          if image.get_actual_number() is not None else -1)
+            width = len(image.get_pixels())
+
+        return ImageDataset(pixels, labels, width)
+
+    @staticmethod
+    def from_idx(path_to_images: str, path_to_labels: str) -> ImageDataset:
+        """
+        Create a dataset from an IDX file of images and one of labels.
+
+        Parameters
+        ----------
+        path_to_images: str
+            Path to the IDX file of the images (unsigned bytes).
+        path_to_labels: str
+            Path to the IDX file of the labels.
+
+        Returns
+        -------
+        ImageDataset
+            The dataset with the pixels stored as bytes, read without converting
+            them.
+
+        Raises
+        ------
+        ValueError
+            If the files aren't IDX files of bytes or their numbers don't match.
+
+        """
+        with IdxFile(path_to_images) as image_file, IdxFile(
+                path_to_labels) as label_file:
+            if image_file.get_typecode() != "B" or label_file.get_typecode() != "B":
+                raise ValueError("The IDX files have to contain unsigned bytes.")
+            if image_file.get_count() != label_file.get_count():
+                raise ValueError("The number of images and labels doesn't match.")
+
+            # Copy the bytes at once
+            pixels: array = image_file.read()
+            labels: array = array("b", label_file.read())
+
+            return ImageDataset(pixels, labels, image_file.get_item_size())
+
+    @staticmethod
+    def from_csv(path_to_csv_file: str, typecode: str = "B") -> ImageDataset:
+        """
+        Create a dataset from a CSV file of images.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file (see Image.save_image_bytes_and_labels).
+        typecode: str
+            'B' to store the pixels as bytes, 'f' to store them as floats.
+
+        Returns
+        -------
+        ImageDataset
+            The dataset of the images. Only one image is held as floats at a time.
+
+        """
+        return ImageDataset.from_images(
+            Image.iterate_images_from_csv(path_to_csv_file), typecode)
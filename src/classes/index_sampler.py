@@ -0,0 +1,287 @@
+"""File containing the IndexSampler class."""
+
+# Import used Python libraries
+import random
+from array import array
+
+# Import used types
+from collections.abc import Sequence
+
+# Import used classes
+from classes.image import Image
+
+class IndexSampler:
+    """
+    A class creating the order in which the images are visited in each epoch.
+
+    The order is a compact array of indices into the training data (4 bytes per
+    image), so the images themselves are never copied or reordered. The order of
+    each epoch only depends on the seed and the number of the epoch.
+
+    Attributes
+    ----------
+    sampling: str
+        How the images are sampled:
+        'sequential' visits the images in the order of the training data.
+        'shuffle' visits the images in a random permutation.
+        'stratified' visits the images in a random order in which each class is
+        spread evenly, so every batch has about the class shares of the data.
+        'balanced' draws the same number of images of each class (small classes
+        are repeated, large classes are cut) and spreads them evenly.
+    seed: int
+        Seed of the random orders.
+
+    Methods
+    -------
+    set_sampling
+        Set how the images are sampled.
+    set_seed
+        Set the seed of the random orders.
+    get_sampling
+        Return how the images are sampled.
+    get_seed
+        Return the seed of the random orders.
+    get_random
+        Return the random number generator of one epoch.
+    get_class_indices
+        Return the indices of the images of each class.
+    interleave
+        Spread the indices of each class evenly over one order.
+    epoch_indices
+        Return the indices of the images in the order of one epoch.
+    repeat
+        Repeat or cut the shuffled indices of one class to the given count.
+
+    """
+
+    samplings: tuple[str, ...] = ("sequential", "shuffle", "stratified", "balanced")
+
+    def __init__(self, sampling: str = "shuffle", seed: int | None = None) -> None:
+        """
+        Construct one IndexSampler object with the given attributes.
+
+        Parameters
+        ----------
+        sampling: str
+            How the images are sampled ('sequential', 'shuffle', 'stratified' or
+            'balanced').
+        seed: int | None
+            Seed of the random orders. If None, every sampler creates different
+            orders.
+
+        """
+        self.set_sampling(sampling)
+        self.set_seed(seed if seed is not None else random.SystemRandom().randrange(
+            2 ** 32))
+
+    def set_sampling(self, sampling: str) -> None:
+        """
+        Set how the images are sampled.
+
+        Parameters
+        ----------
+        sampling: str
+            'sequential', 'shuffle', 'stratified' or 'balanced'.
+
+        Raises
+        ------
+        ValueError
+            If the sampling is unknown.
+
+        """
+        if sampling not in IndexSampler.samplings:
+            raise ValueError("The sampling '" + sampling + "' is unknown.")
+
+        self.sampling: str = sampling
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Set the seed of the random orders.
+
+        Parameters
+        ----------
+        seed: int
+            Seed of the random orders.
+
+        """
+        self.seed: int = seed
+
+    def get_sampling(self) -> str:
+        """
+        Return how the images are sampled.
+
+        Returns
+        -------
+        sampling: str
+            'sequential', 'shuffle', 'stratified' or 'balanced'.
+
+        """
+        return self.sampling
+
+    def get_seed(self) -> int:
+        """
+        Return the seed of the random orders.
+
+        Returns
+        -------
+        seed: int
+            Seed of the random orders.
+
+        """
+        return self.seed
+
+    def get_random(self, epoch: int) -> random.Random:
+        """
+        Return the random number generator of one epoch.
+
+        Parameters
+        ----------
+        epoch: int
+            Number of the epoch, starting at 0.
+
+        Returns
+        -------
+        random.Random
+            Generator seeded with the seed and the epoch, so each epoch can be
+            recreated on its own.
+
+        """
+        return random.Random(str(self.get_seed()) + ":" + str(epoch))
+
+    @staticmethod
+    def get_class_indices(images: Sequence[Image]) -> dict[int | None, array]:
+        """
+        Return the indices of the images of each class.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The training data.
+
+        Returns
+        -------
+        dict[int | None, array]
+            The indices ('i' array) of the images of each actual number (None for
+            images without one).
+
+        """
+        # Initialize the return value
+        class_indices: dict[int | None, array] = {}
+
+        for index, image in enumerate(images):
+            class_indices.setdefault(image.get_actual_number(), array("i")).append(
+                index)
+
+        return class_indices
+
+    @staticmethod
+    def interleave(
+        class_indices: list[array], generator: random.Random
+    ) -> array:
+        """
+        Spread the indices of each class evenly over one order.
+
+        The k-th of n indices of a class gets the position (k + u) / n with a
+        random u in [0; 1), and the indices are ordered by their position.
+
+        Parameters
+        ----------
+        class_indices: list[array]
+            The already shuffled indices of each class.
+        generator: random.Random
+            Random number generator of the epoch.
+
+        Returns
+        -------
+        array
+            All indices ('i' array) ordered by their position.
+
+        """
+        # Calculate the position of every index
+        positions: array = array("d")
+        indices: array = array("i")
+        for indices_of_class in class_indices:
+            count: int = len(indices_of_class)
+            positions.extend([(k + generator.random()) / count for k in range(count)])
+            indices.extend(indices_of_class)
+
+        return array("i", [indices[i] for i in sorted(
+            range(len(indices)), key=positions.__getitem__)])
+
+    def epoch_indices(self, images: Sequence[Image], epoch: int) -> range | array:
+        """
+        Return the indices of the images in the order of one epoch.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The training data.
+        epoch: int
+            Number of the epoch, starting at 0.
+
+        Returns
+        -------
+        range | array
+            A range for the sequential sampling, otherwise an 'i' array with one
+            index per image of the epoch.
+
+        """
+        if self.get_sampling() == "sequential":
+            return range(len(images))
+
+        # Get the random number generator of the epoch
+        generator: random.Random = self.get_random(epoch)
+
+        if self.get_sampling() == "shuffle":
+            # Shuffle the indices in place within the compact array
+            indices: array = array("i", range(len(images)))
+            generator.shuffle(indices)
+
+            return indices
+
+        # Shuffle the indices of each class
+        class_indices: list[array] = list(
+            IndexSampler.get_class_indices(images).values())
+        for indices_of_class in class_indices:
+            generator.shuffle(indices_of_class)
+
+        if self.get_sampling() == "balanced":
+            # Draw the same number of images of each class, the first classes
+            # get one more image if the images can't be split evenly
+            per_class, remainder = divmod(len(images), len(class_indices))
+            class_indices = [
+                IndexSampler.repeat(indices_of_class,
+                                    per_class + (number < remainder), generator)
+                for number, indices_of_class in enumerate(class_indices)]
+
+        return IndexSampler.interleave(class_indices, generator)
+
+    @staticmethod
+    def repeat(indices: array, count: int, generator: random.Random) -> array:
+        """
+        Repeat or cut the shuffled indices of one class to the given count.
+
+        Parameters
+        ----------
+        indices: array
+            The shuffled indices of the class.
+        count: int
+            Number of indices that are returned.
+        generator: random.Random
+            Random number generator of the epoch, used to reshuffle each repetition.
+
+        Returns
+        -------
+        array
+            The indices ('i' array). Each index occurs at most once more than any
+            other index of the class.
+
+        """
+        # Initialize the return value
+        repeated: array = indices[:count]
+
+        while len(repeated) < count:
+            generator.shuffle(indices)
+            repeated.extend(indices[:count - len(repeated)])
+
+        return repeated
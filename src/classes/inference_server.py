@@ -0,0 +1,677 @@
+"""File containing the InferenceServer class."""
+
+# Import used Python libraries
+import asyncio
+import concurrent.futures
+import io
+import ipaddress
+import json
+import time
+
+# Import used classes
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+
+# Reason phrases of the sent HTTP status codes
+STATUS_PHRASES: dict[int, str] = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error"}
+# Largest accepted request body in bytes
+MAX_BODY_SIZE: int = 1 << 20
+
+class InferenceServer:
+    """
+    A class serving the predictions of the neural network over HTTP on localhost.
+
+    Requests aren't run through the neural network one by one. They are queued and
+    a single task collects them into a micro-batch until either the maximum batch
+    size is reached or the oldest request has waited for the maximum wait time.
+    The whole micro-batch is then run through the neural network in one forward
+    pass (in a separate thread, so the server keeps accepting requests) and each
+    request gets its own row of the result.
+
+    Endpoints:
+    'POST /predict' takes either a JSON object {"pixels": [784 floats in [0; 1]]}
+    or the bytes of a PNG file (Content-Type 'image/png', requires Pillow) and
+    returns {"prediction": int, "probabilities": [floats]}.
+    'GET /stats' returns the counters of the server as JSON.
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that predicts the numbers.
+    host: str
+        The loopback address the server listens on.
+    port: int
+        The port the server listens on (0 chooses a free port).
+    max_batch_size: int
+        Largest number of requests that are run through the neural network at once.
+    max_wait: float
+        Longest time in seconds the first request of a micro-batch waits for more.
+    queue: asyncio.Queue
+        The requests waiting for a micro-batch.
+    batcher: asyncio.Task | None
+        The task collecting the micro-batches.
+    executor: concurrent.futures.ThreadPoolExecutor
+        The thread running the forward passes.
+    counters: dict[str, float]
+        Number of requests, errors and batches, sum of the latencies and the start
+        time.
+    latencies: list[float]
+        The latencies in seconds of the recent requests (at most 10000).
+
+    Methods
+    -------
+    set_neural_net
+        Set the neural network that predicts the numbers.
+    set_address
+        Set the loopback address and the port the server listens on.
+    set_batching
+        Set the maximum batch size and the maximum wait time.
+    get_neural_net
+        Return the neural network that predicts the numbers.
+    get_address
+        Return the loopback address and the port the server listens on.
+    get_batching
+        Return the maximum batch size and the maximum wait time.
+    get_stats
+        Return the latency & throughput counters of the server.
+    decode_request
+        Decode the body of a prediction request into an image.
+    predict
+        Queue an image and wait for the result of its micro-batch.
+    run_batches
+        Collect the queued requests into micro-batches and run them (task).
+    run_batch
+        Run one micro-batch through the neural network.
+    handle_connection
+        Answer the HTTP requests of one connection.
+    handle_request
+        Answer one HTTP request.
+    read_request_line
+        Read the method, target and version of one HTTP request.
+    read_headers
+        Read the headers of one HTTP request.
+    read_body
+        Read the body of one HTTP request after validating its length.
+    answer_prediction
+        Answer one prediction request and count its latency.
+    send_response
+        Send one HTTP response with a JSON body.
+    start
+        Start listening and batching.
+    serve_forever
+        Start the server and serve until it is cancelled.
+
+    """
+
+    def __init__(
+            self, neural_net: NeuralNetwork, host: str = "127.0.0.1", port: int = 8000,
+            max_batch_size: int = 32, max_wait: float = 0.005
+    ) -> None:
+        """
+        Construct one InferenceServer object with the given attributes.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+        host: str
+            The loopback address the server listens on.
+        port: int
+            The port the server listens on (0 chooses a free port).
+        max_batch_size: int
+            Largest number of requests that are run through the neural network at
+            once.
+        max_wait: float
+            Longest time in seconds the first request of a micro-batch waits for
+            more requests.
+
+        """
+        self.set_neural_net(neural_net)
+        self.set_address(host, port)
+        self.set_batching(max_batch_size, max_wait)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batcher: asyncio.Task | None = None
+        self.executor: concurrent.futures.ThreadPoolExecutor = (
+            concurrent.futures.ThreadPoolExecutor(max_workers=1))
+        self.counters: dict[str, float] = {
+            "requests": 0, "errors": 0, "batches": 0, "latency_sum": 0.0,
+            "start": time.perf_counter()}
+        self.latencies: list[float] = []
+
+    def set_neural_net(self, neural_net: NeuralNetwork) -> None:
+        """
+        Set the neural network that predicts the numbers.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+
+        """
+        self.neural_net: NeuralNetwork = neural_net
+
+    def set_address(self, host: str, port: int) -> None:
+        """
+        Set the loopback address and the port the server listens on.
+
+        Parameters
+        ----------
+        host: str
+            'localhost' or a loopback address such as '127.0.0.1' or '::1'.
+        port: int
+            The port, 0 chooses a free port.
+
+        Raises
+        ------
+        ValueError
+            If the host isn't a loopback address or the port is out of range.
+
+        """
+        if host != "localhost" and not ipaddress.ip_address(host).is_loopback:
+            raise ValueError("The server only listens on loopback addresses.")
+        if not 0 <= port <= 65535:
+            raise ValueError("The port has to be in range of [0; 65535].")
+
+        self.host: str = host
+        self.port: int = port
+
+    def set_batching(self, max_batch_size: int, max_wait: float) -> None:
+        """
+        Set the maximum batch size and the maximum wait time.
+
+        Parameters
+        ----------
+        max_batch_size: int
+            Largest number of requests per micro-batch.
+        max_wait: float
+            Longest wait in seconds for more requests.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is smaller than 1 or the wait time is negative.
+
+        """
+        if max_batch_size < 1:
+            raise ValueError("The maximum batch size has to be at least 1.")
+        if max_wait < 0:
+            raise ValueError("The maximum wait time can't be negative.")
+
+        self.max_batch_size: int = max_batch_size
+        self.max_wait: float = max_wait
+
+    def get_neural_net(self) -> NeuralNetwork:
+        """
+        Return the neural network that predicts the numbers.
+
+        Returns
+        -------
+        neural_net: NeuralNetwork
+            The neural network that predicts the numbers.
+
+        """
+        return self.neural_net
+
+    def get_address(self) -> tuple[str, int]:
+        """
+        Return the loopback address and the port the server listens on.
+
+        Returns
+        -------
+        tuple[str, int]
+            The host and the port.
+
+        """
+        return self.host, self.port
+
+    def get_batching(self) -> tuple[int, float]:
+        """
+        Return the maximum batch size and the maximum wait time.
+
+        Returns
+        -------
+        tuple[int, float]
+            The maximum batch size and the maximum wait time in seconds.
+
+        """
+        return self.max_batch_size, self.max_wait
+
+    def get_stats(self) -> dict[str, float | dict[str, float]]:
+        """
+        Return the latency & throughput counters of the server.
+
+        Returns
+        -------
+        dict[str, float | dict[str, float]]
+            The number of answered predictions, errors and batches, the mean batch
+            size, the mean, median, 95th percentile and maximum latency in
+            milliseconds (of the recent requests) and the predictions per second
+            since the start. If the neural network has a prediction cache, its
+            statistics are added under 'cache'.
+
+        """
+        # Get the counters
+        counters: dict[str, float] = self.counters
+        requests: float = counters["requests"]
+        latencies: list[float] = sorted(self.latencies)
+
+        stats: dict[str, float | dict[str, float]] = {
+            "requests": requests, "errors": counters["errors"],
+            "batches": counters["batches"],
+            "mean_batch_size": requests / counters["batches"]
+            if counters["batches"] else 0.0,
+            "mean_latency_ms": counters["latency_sum"] / requests * 1000
+            if requests else 0.0,
+            "p50_latency_ms": latencies[len(latencies) // 2] * 1000
+            if latencies else 0.0,
+            "p95_latency_ms": latencies[int(len(latencies) * 0.95)] * 1000
+            if latencies else 0.0,
+            "max_latency_ms": latencies[-1] * 1000 if latencies else 0.0,
+            "requests_per_second": requests / (
+                time.perf_counter() - counters["start"])}
+
+        # Add the statistics of the prediction cache
+        prediction_cache = self.get_neural_net().get_prediction_cache()
+        if prediction_cache is not None:
+            stats["cache"] = prediction_cache.get_stats()
+
+        return stats
+
+    def decode_request(self, content_type: str, body: bytes) -> Image:
+        """
+        Decode the body of a prediction request into an image.
+
+        Parameters
+        ----------
+        content_type: str
+            The Content-Type header of the request.
+        body: bytes
+            The body of the request.
+
+        Returns
+        -------
+        Image
+            The image with pixels in range of [0; 1]. The actual number is None.
+
+        Raises
+        ------
+        ValueError
+            If the body isn't a valid JSON object or PNG file of the right size.
+
+        """
+        # Get the number of pixels of the input layer
+        pixel_count: int = self.get_neural_net().get_dimensions()[0][1]
+
+        if content_type.startswith("image/png"):
+            # Pillow is only needed for PNG files
+            try:
+                from PIL import Image as PILImage
+            except ImportError as error:
+                raise ValueError("Reading PNG files requires Pillow.") from error
+
+            # Pillow raises an OSError for data that isn't an image
+            try:
+                with PILImage.open(io.BytesIO(body)) as png_image:
+                    pixels: list[float] = [
+                        pixel / 255 for pixel in
+                        png_image.convert("L").resize((28, 28)).tobytes()]
+            except OSError as error:
+                raise ValueError("The body isn't a valid PNG file.") from error
+        else:
+            try:
+                pixels = [float(pixel) for pixel in json.loads(body)["pixels"]]
+            except (TypeError, KeyError, json.JSONDecodeError) as error:
+                raise ValueError(
+                    "The body has to be a JSON object with a list 'pixels'.") from error
+
+        if len(pixels) != pixel_count:
+            raise ValueError("The image has to have " + str(pixel_count) + " pixels.")
+
+        return Image(pixels, None)
+
+    async def predict(self, image: Image) -> tuple[int, list[float]]:
+        """
+        Queue an image and wait for the result of its micro-batch.
+
+        Parameters
+        ----------
+        image: Image
+            The image whose number is predicted.
+
+        Returns
+        -------
+        tuple[int, list[float]]
+            The predicted number and the output values of the output layer.
+
+        """
+        result: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self.queue.put((image, result))
+
+        return await result
+
+    async def run_batches(self) -> None:
+        """Collect the queued requests into micro-batches and run them (task)."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            # Wait for the first request of the micro-batch
+            batch: list[tuple[Image, asyncio.Future]] = [await self.queue.get()]
+            deadline: float = loop.time() + self.max_wait
+
+            # Add requests until the batch is full or the first one waited too long
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self.queue.get(), deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+
+            await self.run_batch(batch)
+
+    async def run_batch(self, batch: list[tuple[Image, asyncio.Future]]) -> None:
+        """
+        Run one micro-batch through the neural network.
+
+        Parameters
+        ----------
+        batch: list[tuple[Image, asyncio.Future]]
+            The image and the future of the result of each request.
+
+        """
+        try:
+            # Run the forward pass in the thread, the server keeps accepting requests
+            labels, probabilities = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.get_neural_net().predict_batch,
+                [image for image, _ in batch])
+        except (ValueError, ArithmeticError) as error:
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(error)
+            return
+        except BaseException:
+            # Don't let any request wait forever for an unexpected error
+            for _, result in batch:
+                result.cancel()
+            raise
+
+        self.counters["batches"] += 1
+        for (_, result), label, values in zip(batch, labels, probabilities):
+            # The client might have closed the connection in the meantime
+            if not result.done():
+                result.set_result((int(label), [float(value) for value in values]))
+
+    async def handle_connection(
+            self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the HTTP requests of one connection.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream the requests are read from.
+        writer: asyncio.StreamWriter
+            The stream the responses are written to.
+
+        """
+        try:
+            # Answer requests until the client closes the connection
+            while await self.handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(
+            self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """
+        Answer one HTTP request.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream the request is read from.
+        writer: asyncio.StreamWriter
+            The stream the response is written to.
+
+        Returns
+        -------
+        bool
+            Whether the connection is kept alive.
+
+        """
+        # Read the request line, the headers and the body
+        request_line: tuple[str, str, str] | None = await self.read_request_line(
+            reader, writer)
+        if request_line is None:
+            return False
+        method, target, version = request_line
+        headers: dict[str, str] = await self.read_headers(reader)
+        keep_alive: bool = (headers.get("connection", "").lower() != "close"
+                            and version == "HTTP/1.1")
+        body: bytes | None = await self.read_body(reader, writer, headers)
+        if body is None:
+            return False
+
+        if target == "/stats":
+            if method != "GET":
+                await self.send_response(writer, 405, {"error": "Use GET."}, keep_alive)
+            else:
+                await self.send_response(writer, 200, self.get_stats(), keep_alive)
+        elif target != "/predict":
+            await self.send_response(
+                writer, 404, {"error": "Unknown path."}, keep_alive)
+        elif method != "POST":
+            await self.send_response(writer, 405, {"error": "Use POST."}, keep_alive)
+        else:
+            await self.answer_prediction(writer, headers, body, keep_alive)
+
+        return keep_alive
+
+    @staticmethod
+    async def read_request_line(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> tuple[str, str, str] | None:
+        """
+        Read the method, target and version of one HTTP request.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream the request is read from.
+        writer: asyncio.StreamWriter
+            The stream an error response is written to.
+
+        Returns
+        -------
+        tuple[str, str, str] | None
+            The method, the target and the HTTP version. None if the client closed
+            the connection or the request line is invalid (which is answered).
+
+        """
+        request_line: bytes = await reader.readline()
+        if not request_line.strip():
+            return None
+
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            await InferenceServer.send_response(
+                writer, 400, {"error": "Invalid request line."})
+            return None
+
+        return method, target, version
+
+    @staticmethod
+    async def read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+        """
+        Read the headers of one HTTP request.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream the request is read from.
+
+        Returns
+        -------
+        dict[str, str]
+            The value of each header by its lowercase name.
+
+        """
+        headers: dict[str, str] = {}
+
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return headers
+
+    @staticmethod
+    async def read_body(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+        headers: dict[str, str]
+    ) -> bytes | None:
+        """
+        Read the body of one HTTP request after validating its length.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream the request is read from.
+        writer: asyncio.StreamWriter
+            The stream an error response is written to.
+        headers: dict[str, str]
+            The headers of the request.
+
+        Returns
+        -------
+        bytes | None
+            The body of the request. None if the Content-Length is invalid or
+            larger than MAX_BODY_SIZE (which is answered).
+
+        """
+        length: str = headers.get("content-length", "0")
+
+        if not length.isdigit():
+            await InferenceServer.send_response(
+                writer, 400, {"error": "Invalid Content-Length."})
+            return None
+        if int(length) > MAX_BODY_SIZE:
+            await InferenceServer.send_response(
+                writer, 413, {"error": "The body is too large."})
+            return None
+
+        return await reader.readexactly(int(length))
+
+    async def answer_prediction(
+            self, writer: asyncio.StreamWriter, headers: dict[str, str], body: bytes,
+            keep_alive: bool
+    ) -> None:
+        """
+        Answer one prediction request and count its latency.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            The stream the response is written to.
+        headers: dict[str, str]
+            The headers of the request.
+        body: bytes
+            The body of the request.
+        keep_alive: bool
+            Whether the connection is kept alive.
+
+        """
+        start: float = time.perf_counter()
+
+        # An invalid body is an error of the client
+        try:
+            image: Image = self.decode_request(headers.get("content-type", ""), body)
+        except ValueError as error:
+            self.counters["errors"] += 1
+            await self.send_response(writer, 400, {"error": str(error)}, keep_alive)
+            return
+
+        # A failed forward pass is an error of the server
+        try:
+            label, probabilities = await self.predict(image)
+        except (ValueError, ArithmeticError) as error:
+            self.counters["errors"] += 1
+            await self.send_response(writer, 500, {"error": str(error)}, keep_alive)
+            return
+
+        # Count the answered request and its latency
+        latency: float = time.perf_counter() - start
+        self.counters["requests"] += 1
+        self.counters["latency_sum"] += latency
+        self.latencies.append(latency)
+        if len(self.latencies) > 10000:
+            del self.latencies[:5000]
+
+        await self.send_response(
+            writer, 200, {"prediction": label, "probabilities": probabilities},
+            keep_alive)
+
+    @staticmethod
+    async def send_response(
+        writer: asyncio.StreamWriter, status: int, content: dict,
+        keep_alive: bool = False
+    ) -> None:
+        """
+        Send one HTTP response with a JSON body.
+
+        Parameters
+        ----------
+        writer: asyncio.StreamWriter
+            The stream the response is written to.
+        status: int
+            The HTTP status code.
+        content: dict
+            The content that is sent as JSON.
+        keep_alive: bool
+            Whether the connection is kept alive.
+
+        """
+        body: bytes = json.dumps(content).encode()
+        writer.write(
+            ("HTTP/1.1 " + str(status) + " " + STATUS_PHRASES[status] + "\r\n"
+             + "Content-Type: application/json\r\n"
+             + "Content-Length: " + str(len(body)) + "\r\n"
+             + "Connection: " + ("keep-alive" if keep_alive else "close") + "\r\n\r\n"
+             ).encode("latin-1") + body)
+        await writer.drain()
+
+    async def start(self) -> asyncio.Server:
+        """
+        Start listening and batching.
+
+        Returns
+        -------
+        asyncio.Server
+            The listening server. If the port was 0, the chosen port is set.
+
+        """
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.create_task(self.run_batches())
+        server: asyncio.Server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self.counters["start"] = time.perf_counter()
+
+        return server
+
+    async def serve_forever(self) -> None:
+        """Start the server and serve until it is cancelled."""
+        server: asyncio.Server = await self.start()
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self.batcher is not None:
+                self.batcher.cancel()
+            self.executor.shutdown(wait=False)
@@ -0,0 +1,175 @@
+"""File containing the InputLayerCache class."""
+
+# Import used types
+from collections.abc import Sequence
+
+# Import used classes
+from classes.activation import Activation
+from classes.backend import Backend
+from classes.image import Image
+
+# Number of images that are transformed at once while filling the cache
+CHUNK_SIZE: int = 1000
+# Number of datasets whose caches a neural network keeps (e.g. the training and
+# the testing data), each cache holds a float buffer of the whole dataset
+MAX_CACHED_DATASETS: int = 2
+
+class InputLayerCache:
+    """
+    A class caching the output values of the input layer for a dataset.
+
+    The input layer only applies the activation function to the pixels, so its
+    output values never change for the same image. They are calculated once per
+    dataset and stored in one compact buffer (one row per image), which is then
+    reused by every epoch of the training and by the testing.
+
+    Attributes
+    ----------
+    images: Sequence[Image]
+        The dataset whose input values are cached.
+    transform_key: tuple
+        Key identifying the backend and the transformation of the input layer.
+    backend: Backend
+        The compute backend the buffer belongs to.
+    size: int
+        Number of images of the dataset when the cache was filled.
+    width: int
+        Number of pixels of each image.
+    buffer
+        Output values of the input layer, one row per image.
+
+    Methods
+    -------
+    get_images
+        Return the dataset whose input values are cached.
+    get_transform_key
+        Return the key identifying the transformation of the input layer.
+    create_transform_key
+        Create the key identifying a transformation of the input layer.
+    is_valid_for
+        Check whether the cache belongs to the given dataset & transformation.
+    get_input_values
+        Return the cached output values of the input layer for some images.
+
+    """
+
+    def __init__(
+            self, images: Sequence[Image], backend: Backend, activation: Activation,
+            approximate: bool
+    ) -> None:
+        """
+        Construct one InputLayerCache object and fill its buffer.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The dataset whose input values are cached.
+        backend: Backend
+            The compute backend used for the transformation and the buffer.
+        activation: Activation
+            The activation function of the input layer.
+        approximate: bool
+            Whether the lookup table of the activation function is used.
+
+        """
+        self.images: Sequence[Image] = images
+        self.backend: Backend = backend
+        self.transform_key: tuple = InputLayerCache.create_transform_key(
+            backend, activation, approximate)
+        self.size: int = len(images)
+        self.width: int = len(images[0].get_pixels()) if images else 0
+        self.buffer = backend.create_buffer(len(images), self.width)
+
+        # Transform the pixels chunk by chunk to keep the temporary matrices small
+        for start in range(0, len(images), CHUNK_SIZE):
+            backend.write_rows(self.buffer, start, activation.forward(
+                backend, backend.column_matrix([
+                    image.get_pixels() for image in images[start:start + CHUNK_SIZE]]),
+                approximate))
+
+    def get_images(self) -> Sequence[Image]:
+        """
+        Return the dataset whose input values are cached.
+
+        Returns
+        -------
+        images: Sequence[Image]
+            The dataset whose input values are cached.
+
+        """
+        return self.images
+
+    def get_transform_key(self) -> tuple:
+        """
+        Return the key identifying the transformation of the input layer.
+
+        Returns
+        -------
+        transform_key: tuple
+            Key identifying the backend and the transformation of the input layer.
+
+        """
+        return self.transform_key
+
+    @staticmethod
+    def create_transform_key(
+        backend: Backend, activation: Activation, approximate: bool
+    ) -> tuple:
+        """
+        Create the key identifying a transformation of the input layer.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend.
+        activation: Activation
+            The activation function of the input layer.
+        approximate: bool
+            Whether the lookup table of the activation function is used.
+
+        Returns
+        -------
+        tuple
+            Name of the backend, key of the activation function and whether it is
+            approximated.
+
+        """
+        return (backend.name, activation.get_key(), approximate)
+
+    def is_valid_for(self, images: Sequence[Image], transform_key: tuple) -> bool:
+        """
+        Check whether the cache belongs to the given dataset & transformation.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The dataset.
+        transform_key: tuple
+            Key identifying the current transformation of the input layer.
+
+        Returns
+        -------
+        bool
+            True if the cache was filled from the same (unchanged in length) list
+            of images with the same transformation, otherwise False.
+
+        """
+        return (self.get_images() is images and len(images) == self.size
+                and self.get_transform_key() == transform_key)
+
+    def get_input_values(self, indices) -> list[list[float]]:
+        """
+        Return the cached output values of the input layer for some images.
+
+        Parameters
+        ----------
+        indices
+            Indices of the images within the dataset (e.g. a range).
+
+        Returns
+        -------
+        list[list[float]]
+            Matrix of the backend with one column per image.
+
+        """
+        return self.backend.read_columns(self.buffer, indices, self.width)
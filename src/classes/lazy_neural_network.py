@@ -0,0 +1,228 @@
+"""File containing the LazyNeuralNetwork class."""
+
+# Import used types
+from collections.abc import Iterable, Sequence
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+
+class LazyNeuralNetwork:
+    """
+    A class standing in for a neural network whose weights are read on first use.
+
+    Reading the weights (especially from CSV) takes much longer than starting the
+    program, so the weight file is only read when the neural network is used for
+    the first time. The methods of NeuralNetworkInterface are defined here, every
+    other attribute that isn't defined here is looked up on the loaded neural
+    network, so the object can be used wherever a NeuralNetwork is expected.
+
+    Attributes
+    ----------
+    dimensions: list[tuple[int, int]]
+        The dimensions of the neural network.
+    path_to_weights: str
+        Path to the CSV or binary weight file.
+    backend_name: str | None
+        Name of the compute backend.
+    neural_net: NeuralNetwork | None
+        The loaded neural network. None until it is used for the first time.
+
+    Methods
+    -------
+    get_dimensions
+        Return the dimensions of the neural network.
+    get_path_to_weights
+        Return the path to the weight file.
+    is_loaded
+        Return whether the weights have been read.
+    get_neural_net
+        Return the neural network, reading the weights on the first call.
+    get_backend
+        Return the compute backend of the loaded neural network.
+    detect_one_image
+        Run one image through the loaded neural network.
+    train
+        Train the loaded neural network and write the adjusted weights.
+    test
+        Test the accuracy of the loaded neural network.
+
+    """
+
+    def __init__(
+            self, dimensions: list[tuple[int, int]], path_to_weights: str,
+            backend: str | None = None
+    ) -> None:
+        """
+        Construct one LazyNeuralNetwork object without reading the weights.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        path_to_weights: str
+            Path to the CSV or binary weight file (see NeuralNetwork.create_weights).
+        backend: str | None
+            Name of the compute backend, see NeuralNetwork.
+
+        """
+        self.dimensions: list[tuple[int, int]] = dimensions
+        self.path_to_weights: str = path_to_weights
+        self.backend_name: str | None = backend
+        self.neural_net: NeuralNetwork | None = None
+
+    def get_dimensions(self) -> list[tuple[int, int]]:
+        """
+        Return the dimensions of the neural network.
+
+        Returns
+        -------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+
+        """
+        return self.dimensions
+
+    def get_path_to_weights(self) -> str:
+        """
+        Return the path to the weight file.
+
+        Returns
+        -------
+        path_to_weights: str
+            Path to the CSV or binary weight file.
+
+        """
+        return self.path_to_weights
+
+    def is_loaded(self) -> bool:
+        """
+        Return whether the weights have been read.
+
+        Returns
+        -------
+        bool
+            True once the neural network has been used.
+
+        """
+        return self.neural_net is not None
+
+    def get_neural_net(self) -> NeuralNetwork:
+        """
+        Return the neural network, reading the weights on the first call.
+
+        Returns
+        -------
+        neural_net: NeuralNetwork
+            The neural network with the weights of the weight file.
+
+        """
+        if self.neural_net is None:
+            self.neural_net = NeuralNetwork(
+                self.dimensions, NeuralNetwork.create_weights(self.path_to_weights),
+                self.backend_name)
+
+        return self.neural_net
+
+    def get_backend(self) -> Backend:
+        """
+        Return the compute backend of the loaded neural network.
+
+        Returns
+        -------
+        backend: Backend
+            The compute backend of the neural network.
+
+        """
+        return self.get_neural_net().get_backend()
+
+    def detect_one_image(self, image: Image) -> list[list[float]]:
+        """
+        Run one image through the loaded neural network.
+
+        Parameters
+        ----------
+        image: Image
+            The image that is run through the neural network.
+
+        Returns
+        -------
+        values_at_each_layer: list[list[float]]
+            Output values at each layer.
+
+        """
+        return self.get_neural_net().detect_one_image(image)
+
+    def train(
+            self, training_data: Sequence[Image], learning_rate: float,
+            path_to_csv_file: str, **options
+    ) -> None:
+        """
+        Train the loaded neural network and write the adjusted weights.
+
+        Parameters
+        ----------
+        training_data: Sequence[Image]
+            The images that are used for training.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        path_to_csv_file: str
+            Path to the CSV file in which the adjusted weight matrices are written.
+        options
+            Further arguments of NeuralNetwork.train.
+
+        """
+        self.get_neural_net().train(
+            training_data, learning_rate, path_to_csv_file, **options)
+
+    def test(
+            self, testing_data: Iterable[Image] | Iterable[Sequence[Image]],
+            block_size: int = 1000, workers: int = 1
+    ) -> int:
+        """
+        Test the accuracy of the loaded neural network.
+
+        Parameters
+        ----------
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+            The images (or blocks of images) that are used for testing.
+        block_size: int
+            Number of images that are run through the neural network at once.
+        workers: int
+            Number of worker processes.
+
+        Returns
+        -------
+        correct_images: int
+            Number of correctly guessed images.
+
+        """
+        return self.get_neural_net().test(testing_data, block_size, workers)
+
+    def __getattr__(self, name: str):
+        """
+        Look up an attribute on the loaded neural network.
+
+        Parameters
+        ----------
+        name: str
+            Name of the attribute (e.g. 'detect_images').
+
+        Returns
+        -------
+        The attribute of the neural network.
+
+        Raises
+        ------
+        AttributeError
+            If the attribute is a special one or the object isn't initialized yet
+            (e.g. while it is unpickled), which would look it up endlessly.
+
+        """
+        # Only the instance dictionary is used, any other lookup of a missing
+        # attribute would call this method again
+        if name.startswith("__") or "neural_net" not in self.__dict__:
+            raise AttributeError(name)
+
+        return getattr(self.get_neural_net(), name)
@@ -0,0 +1,415 @@
+"""File containing the learning rate schedules used during training."""
+
+# Import necessary for the create method
+from __future__ import annotations
+
+# Import used Python libraries
+import math
+
+class LearningRateSchedule:
+    """
+    A class representing the change of the learning rate over the training.
+
+    The learning rate is a function of the number of epochs done so far, which
+    includes the fraction of the current epoch. During the warmup it rises linearly
+    from zero to the decayed learning rate.
+
+    Attributes
+    ----------
+    name: str
+        Name under which the schedule can be selected.
+    learning_rate: float
+        Learning rate at the start of the training (after the warmup).
+    warmup_epochs: float
+        Number of epochs during which the learning rate rises linearly.
+
+    Methods
+    -------
+    create
+        Create the schedule with the given name.
+    set_learning_rate
+        Set the learning rate at the start of the training.
+    set_warmup_epochs
+        Set the number of epochs during which the learning rate rises linearly.
+    get_learning_rate
+        Return the learning rate at the start of the training.
+    get_warmup_epochs
+        Return the number of epochs during which the learning rate rises linearly.
+    decay
+        Return the factor by which the learning rate has decayed.
+    learning_rate_at
+        Return the learning rate after the given number of epochs.
+
+    """
+
+    name: str = ""
+
+    def __init__(self, learning_rate: float, warmup_epochs: float = 0.0) -> None:
+        """
+        Construct one LearningRateSchedule object with the given attributes.
+
+        Parameters
+        ----------
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+        warmup_epochs: float
+            Number of epochs during which the learning rate rises linearly from
+            zero. 0 disables the warmup.
+
+        """
+        self.set_learning_rate(learning_rate)
+        self.set_warmup_epochs(warmup_epochs)
+
+    @staticmethod
+    def create(
+        name: str, learning_rate: float, epochs: int, warmup_epochs: float = 0.0
+    ) -> LearningRateSchedule:
+        """
+        Create the schedule with the given name and its default parameters.
+
+        Parameters
+        ----------
+        name: str
+            Name of the schedule ('constant', 'step' or 'cosine').
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+        epochs: int
+            Number of epochs of the training. The step schedule halves the learning
+            rate every quarter of them, the cosine schedule decays it to zero at
+            their end.
+        warmup_epochs: float
+            Number of epochs during which the learning rate rises linearly.
+
+        Returns
+        -------
+        schedule: LearningRateSchedule
+            The created schedule.
+
+        Raises
+        ------
+        ValueError
+            If the name is unknown.
+
+        """
+        if name == ConstantSchedule.name:
+            return ConstantSchedule(learning_rate, warmup_epochs)
+        if name == StepSchedule.name:
+            return StepSchedule(learning_rate, max(epochs / 4, 1.0), 0.5,
+                                warmup_epochs)
+        if name == CosineSchedule.name:
+            return CosineSchedule(learning_rate, epochs, 0.0, warmup_epochs)
+
+        raise ValueError("The learning rate schedule '" + name + "' is unknown.")
+
+    def set_learning_rate(self, learning_rate: float) -> None:
+        """
+        Set the learning rate at the start of the training.
+
+        Parameters
+        ----------
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+
+        Raises
+        ------
+        ValueError
+            If the learning rate isn't positive.
+
+        """
+        if learning_rate <= 0:
+            raise ValueError("The learning rate has to be positive.")
+
+        self.learning_rate: float = learning_rate
+
+    def set_warmup_epochs(self, warmup_epochs: float) -> None:
+        """
+        Set the number of epochs during which the learning rate rises linearly.
+
+        Parameters
+        ----------
+        warmup_epochs: float
+            Number of epochs of the warmup. 0 disables the warmup.
+
+        Raises
+        ------
+        ValueError
+            If the number of epochs is negative.
+
+        """
+        if warmup_epochs < 0:
+            raise ValueError("The warmup can't be negative.")
+
+        self.warmup_epochs: float = warmup_epochs
+
+    def get_learning_rate(self) -> float:
+        """
+        Return the learning rate at the start of the training.
+
+        Returns
+        -------
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+
+        """
+        return self.learning_rate
+
+    def get_warmup_epochs(self) -> float:
+        """
+        Return the number of epochs during which the learning rate rises linearly.
+
+        Returns
+        -------
+        warmup_epochs: float
+            Number of epochs of the warmup.
+
+        """
+        return self.warmup_epochs
+
+    def decay(self, epoch: float) -> float:
+        """
+        Return the factor by which the learning rate has decayed.
+
+        Parameters
+        ----------
+        epoch: float
+            Number of epochs done so far.
+
+        """
+        raise NotImplementedError
+
+    def learning_rate_at(self, epoch: float) -> float:
+        """
+        Return the learning rate after the given number of epochs.
+
+        Parameters
+        ----------
+        epoch: float
+            Number of epochs done so far, including the fraction of the current
+            epoch.
+
+        Returns
+        -------
+        float
+            The learning rate of the next batch.
+
+        """
+        # Get the decayed learning rate
+        learning_rate: float = self.get_learning_rate() * self.decay(epoch)
+
+        # Rise linearly during the warmup
+        if epoch < self.get_warmup_epochs():
+            learning_rate *= epoch / self.get_warmup_epochs()
+
+        return learning_rate
+
+
+class ConstantSchedule(LearningRateSchedule):
+    """A class representing a learning rate that doesn't decay."""
+
+    name: str = "constant"
+
+    def decay(self, epoch: float) -> float:
+        """
+        Return the factor by which the learning rate has decayed.
+
+        Parameters
+        ----------
+        epoch: float
+            Number of epochs done so far.
+
+        Returns
+        -------
+        float
+            Always 1.
+
+        """
+        return 1.0
+
+
+class StepSchedule(LearningRateSchedule):
+    """
+    A class representing a learning rate that decays in steps.
+
+    The learning rate is multiplied by the factor after every step_epochs epochs.
+
+    Attributes
+    ----------
+    step_epochs: float
+        Number of epochs between two decays.
+    factor: float
+        Factor by which the learning rate decays at each step.
+
+    """
+
+    name: str = "step"
+
+    def __init__(
+            self, learning_rate: float, step_epochs: float, factor: float,
+            warmup_epochs: float = 0.0
+    ) -> None:
+        """
+        Construct one StepSchedule object with the given attributes.
+
+        Parameters
+        ----------
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+        step_epochs: float
+            Number of epochs between two decays.
+        factor: float
+            Factor by which the learning rate decays at each step.
+        warmup_epochs: float
+            Number of epochs during which the learning rate rises linearly.
+
+        Raises
+        ------
+        ValueError
+            If the step isn't positive or the factor isn't in range of (0; 1].
+
+        """
+        super().__init__(learning_rate, warmup_epochs)
+
+        if step_epochs <= 0 or not 0 < factor <= 1:
+            raise ValueError("The step has to be positive and the factor in (0; 1].")
+
+        self.step_epochs: float = step_epochs
+        self.factor: float = factor
+
+    def get_step_epochs(self) -> float:
+        """
+        Return the number of epochs between two decays.
+
+        Returns
+        -------
+        step_epochs: float
+            Number of epochs between two decays.
+
+        """
+        return self.step_epochs
+
+    def get_factor(self) -> float:
+        """
+        Return the factor by which the learning rate decays at each step.
+
+        Returns
+        -------
+        factor: float
+            Factor by which the learning rate decays at each step.
+
+        """
+        return self.factor
+
+    def decay(self, epoch: float) -> float:
+        """
+        Return the factor by which the learning rate has decayed.
+
+        Parameters
+        ----------
+        epoch: float
+            Number of epochs done so far.
+
+        Returns
+        -------
+        float
+            factor ^ (number of completed steps).
+
+        """
+        return self.get_factor() ** math.floor(epoch / self.get_step_epochs())
+
+
+class CosineSchedule(LearningRateSchedule):
+    """
+    A class representing a learning rate that decays along a cosine.
+
+    The learning rate falls from its start value to the minimum along half a cosine
+    period spanning all epochs of the training.
+
+    Attributes
+    ----------
+    epochs: float
+        Number of epochs until the minimum is reached.
+    minimum: float
+        Share of the learning rate left at the end of the training.
+
+    """
+
+    name: str = "cosine"
+
+    def __init__(
+            self, learning_rate: float, epochs: float, minimum: float = 0.0,
+            warmup_epochs: float = 0.0
+    ) -> None:
+        """
+        Construct one CosineSchedule object with the given attributes.
+
+        Parameters
+        ----------
+        learning_rate: float
+            Learning rate at the start of the training (after the warmup).
+        epochs: float
+            Number of epochs until the minimum is reached.
+        minimum: float
+            Share of the learning rate left at the end of the training.
+        warmup_epochs: float
+            Number of epochs during which the learning rate rises linearly.
+
+        Raises
+        ------
+        ValueError
+            If the number of epochs isn't positive or the minimum isn't in range
+            of [0; 1].
+
+        """
+        super().__init__(learning_rate, warmup_epochs)
+
+        if epochs <= 0 or not 0 <= minimum <= 1:
+            raise ValueError("The epochs have to be positive and the minimum in "
+                             "[0; 1].")
+
+        self.epochs: float = epochs
+        self.minimum: float = minimum
+
+    def get_epochs(self) -> float:
+        """
+        Return the number of epochs until the minimum is reached.
+
+        Returns
+        -------
+        epochs: float
+            Number of epochs until the minimum is reached.
+
+        """
+        return self.epochs
+
+    def get_minimum(self) -> float:
+        """
+        Return the share of the learning rate left at the end of the training.
+
+        Returns
+        -------
+        minimum: float
+            Share of the learning rate left at the end of the training.
+
+        """
+        return self.minimum
+
+    def decay(self, epoch: float) -> float:
+        """
+        Return the factor by which the learning rate has decayed.
+
+        Parameters
+        ----------
+        epoch: float
+            Number of epochs done so far.
+
+        Returns
+        -------
+        float
+            minimum + (1 - minimum) * (1 + cos(pi * epoch / epochs)) / 2, staying at
+            the minimum after the last epoch.
+
+        """
+        progress: float = min(epoch / self.get_epochs(), 1.0)
+
+        return self.get_minimum() + (1 - self.get_minimum()) * (
+            1 + math.cos(math.pi * progress)) / 2
@@ -0,0 +1,251 @@
+"""File containing the Matrix and Vector classes."""
+
+# Import necessary for the from_lists method
+from __future__ import annotations
+
+# Import used Python libraries
+from array import array
+from itertools import chain
+
+# Import used types
+from collections.abc import Sequence
+
+class Matrix:
+    """
+    A class representing a compact matrix of floats.
+
+    The values are stored row after row in one flat array, so a matrix needs 8 (or
+    4 for single precision) bytes per value instead of one Python float object and
+    one list entry per value.
+
+    Attributes
+    ----------
+    rows: int
+        Number of rows of the matrix.
+    columns: int
+        Number of columns of the matrix.
+    values: array
+        The values of the matrix stored row after row.
+
+    Methods
+    -------
+    zeros
+        Create a matrix filled with zeros.
+    from_lists
+        Create a matrix from a nested list of floats.
+    get_rows
+        Return the number of rows of the matrix.
+    get_columns
+        Return the number of columns of the matrix.
+    get_values
+        Return the values of the matrix stored row after row.
+    get_typecode
+        Return the typecode of the array storing the values.
+    get_row
+        Return a view on the values of one row.
+    get_column
+        Return a copy of the values of one column.
+    to_lists
+        Convert the matrix into a nested list of floats.
+
+    """
+
+    __slots__ = ("rows", "columns", "values")
+
+    def __init__(self, rows: int, columns: int, values: array) -> None:
+        """
+        Construct one Matrix object with the given attributes.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the matrix.
+        columns: int
+            Number of columns of the matrix.
+        values: array
+            The values of the matrix stored row after row ('d' or 'f' array).
+
+        Raises
+        ------
+        ValueError
+            If the number of values doesn't match the dimensions.
+
+        """
+        if len(values) != rows * columns:
+            raise ValueError("The number of values doesn't match the dimensions.")
+
+        self.rows: int = rows
+        self.columns: int = columns
+        self.values: array = values
+
+    @staticmethod
+    def zeros(rows: int, columns: int, typecode: str = "d") -> Matrix:
+        """
+        Create a matrix filled with zeros.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the matrix.
+        columns: int
+            Number of columns of the matrix.
+        typecode: str
+            'd' for double or 'f' for single precision.
+
+        Returns
+        -------
+        Matrix
+            The created matrix.
+
+        """
+        return Matrix(rows, columns, array(typecode, bytes(
+            array(typecode).itemsize * rows * columns)))
+
+    @staticmethod
+    def from_lists(
+        matrix: Sequence[Sequence[float]], typecode: str = "d"
+    ) -> Matrix:
+        """
+        Create a matrix from a nested list of floats.
+
+        Parameters
+        ----------
+        matrix: Sequence[Sequence[float]]
+            Nested list of floats (or anything iterable row by row).
+        typecode: str
+            'd' for double or 'f' for single precision ('b' for the int8 values of
+            a quantized matrix).
+
+        Returns
+        -------
+        Matrix
+            The created matrix.
+
+        """
+        rows: list = list(matrix)
+
+        return Matrix(len(rows), len(rows[0]) if rows else 0,
+                      array(typecode, chain.from_iterable(rows)))
+
+    def get_rows(self) -> int:
+        """
+        Return the number of rows of the matrix.
+
+        Returns
+        -------
+        rows: int
+            Number of rows of the matrix.
+
+        """
+        return self.rows
+
+    def get_columns(self) -> int:
+        """
+        Return the number of columns of the matrix.
+
+        Returns
+        -------
+        columns: int
+            Number of columns of the matrix.
+
+        """
+        return self.columns
+
+    def get_values(self) -> array:
+        """
+        Return the values of the matrix stored row after row.
+
+        Returns
+        -------
+        values: array
+            The values of the matrix stored row after row.
+
+        """
+        return self.values
+
+    def get_typecode(self) -> str:
+        """
+        Return the typecode of the array storing the values.
+
+        Returns
+        -------
+        str
+            'd' for double or 'f' for single precision.
+
+        """
+        return self.values.typecode
+
+    def get_row(self, row: int) -> memoryview:
+        """
+        Return a view on the values of one row.
+
+        Parameters
+        ----------
+        row: int
+            Index of the row.
+
+        Returns
+        -------
+        memoryview
+            The values of the row without copying them.
+
+        """
+        return memoryview(self.values)[row * self.columns:(row + 1) * self.columns]
+
+    def get_column(self, column: int) -> array:
+        """
+        Return a copy of the values of one column.
+
+        Parameters
+        ----------
+        column: int
+            Index of the column.
+
+        Returns
+        -------
+        array
+            The values of the column. For a matrix with a single column this is
+            the array of values itself.
+
+        """
+        # A column vector already stores its only column contiguously
+        if self.columns == 1:
+            return self.values
+
+        return self.values[column::self.columns]
+
+    def to_lists(self) -> list[list[float]]:
+        """
+        Convert the matrix into a nested list of floats.
+
+        Returns
+        -------
+        list[list[float]]
+            The values of the matrix, one list per row.
+
+        """
+        return [self.values[row * self.columns:(row + 1) * self.columns].tolist()
+                for row in range(self.rows)]
+
+
+class Vector(Matrix):
+    """
+    A class representing a column vector, i.e. a matrix with a single column.
+
+    Its values are stored contiguously, so no one-element list per value is needed.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values: array) -> None:
+        """
+        Construct one Vector object with the given values.
+
+        Parameters
+        ----------
+        values: array
+            The values of the column vector ('d' or 'f' array).
+
+        """
+        super().__init__(len(values), 1, values)
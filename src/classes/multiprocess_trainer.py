@@ -0,0 +1,135 @@
+"""File containing the MultiprocessTrainer class."""
+
+# Import used Python libraries
+import multiprocessing
+
+# Import used types
+from collections.abc import Callable
+from multiprocessing.pool import Pool
+
+# Import used classes
+from classes.neural_network import NeuralNetwork
+
+class MultiprocessTrainer:
+    """
+    A class representing the training of a neural network on worker processes.
+
+    It holds the neural network and the number of worker processes and starts the
+    pool of worker processes. The subclasses decide how the work is distributed.
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that is trained.
+    workers: int
+        Number of worker processes.
+
+    Methods
+    -------
+    set_neural_net
+        Set the neural network that is trained.
+    set_workers
+        Set the number of worker processes.
+    get_neural_net
+        Return the neural network that is trained.
+    get_workers
+        Return the number of worker processes.
+    create_pool
+        Start the pool of worker processes.
+
+    """
+
+    def __init__(self, neural_net: NeuralNetwork, workers: int) -> None:
+        """
+        Construct one MultiprocessTrainer object with the given attributes.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+        workers: int
+            Number of worker processes.
+
+        """
+        self.set_neural_net(neural_net)
+        self.set_workers(workers)
+
+    def set_neural_net(self, neural_net: NeuralNetwork) -> None:
+        """
+        Set the neural network that is trained.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+
+        """
+        self.neural_net: NeuralNetwork = neural_net
+
+    def set_workers(self, workers: int) -> None:
+        """
+        Set the number of worker processes.
+
+        Parameters
+        ----------
+        workers: int
+            Number of worker processes.
+
+        Raises
+        ------
+        ValueError
+            If the number of workers is smaller than 1.
+
+        """
+        if workers < 1:
+            raise ValueError("The number of workers has to be at least 1.")
+
+        self.workers: int = workers
+
+    def get_neural_net(self) -> NeuralNetwork:
+        """
+        Return the neural network that is trained.
+
+        Returns
+        -------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+
+        """
+        return self.neural_net
+
+    def get_workers(self) -> int:
+        """
+        Return the number of worker processes.
+
+        Returns
+        -------
+        workers: int
+            Number of worker processes.
+
+        """
+        return self.workers
+
+    def create_pool(
+            self, initializer: Callable[..., None] | None = None,
+            initargs: tuple = ()
+    ) -> Pool:
+        """
+        Start the pool of worker processes.
+
+        Parameters
+        ----------
+        initializer: Callable[..., None] | None
+            Function that is called once in each worker process when it starts.
+        initargs: tuple
+            The arguments of the initializer.
+
+        Returns
+        -------
+        Pool
+            The pool with one process per worker. It has to be closed (e.g. by
+            using it as a context manager).
+
+        """
+        return multiprocessing.Pool(
+            self.get_workers(), initializer=initializer, initargs=initargs)
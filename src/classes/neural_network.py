@@ -1,5 +1,8 @@
 """File containing the NeuralNetwork class."""
 
+# Import necessary for the type hint of TEST_WORKER_NETS
+from __future__ import annotations
+
 # Import used Python libraries
 import pathlib
 import random
@@ -7,16 +10,34 @@ import sys
 import csv
 import ast
 import os
+import multiprocessing
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict, deque
+from itertools import chain, islice
 
 # Import used types
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TypeGuard
 from csv import DictReader
 import _csv
 
 # Import used classes
+from classes.activation import Activation, Sigmoid
+from classes.backend import Backend, ListBackend, EULERS_NUMBER
+from classes.checkpoint_writer import CheckpointWriter
 from classes.image import Image
+from classes.index_sampler import IndexSampler
+from classes.input_layer_cache import InputLayerCache, MAX_CACHED_DATASETS
+from classes.matrix import Matrix
+from classes.optimizer import Optimizer, SGD
+from classes.prediction_cache import PredictionCache
+from classes.sparse_matrix import SparseMatrix
+from classes.weight_file import WeightFile
 
-# Define Euler's Number as a global constant
-EULERS_NUMBER: float = 2.718281828459045
+# The neural network of the current test worker process, set by the pool initializer
+TEST_WORKER_NETS: dict[str, NeuralNetwork] = {}
 
 class NeuralNetwork:
     """
@@ -28,6 +49,29 @@ class NeuralNetwork:
         The dimensions of the neural network.
     weight_matrices: list[list[list[float]]]
             The weight matrices of the neural network.
+    backend: Backend
+        The compute backend performing the matrix operations.
+    activations: list[Activation]
+        The activation function of each layer, starting with the input layer.
+    approximate_inference: bool
+        Whether the lookup tables of the activation functions are used for inference.
+    derivative_cache: tuple[list[list[float]], list[list[float]]] | None
+        The values at each layer of the last forward pass of a training step
+        together with the derivatives at each layer calculated during that pass.
+    input_layer_caches: OrderedDict[int, InputLayerCache]
+        The cached output values of the input layer of the most recently used
+        datasets (by id), least recently used first.
+    update_buffers: list
+        One scratch buffer per weight matrix used to update it in place.
+    sparse_first_layer: SparseMatrix | None
+        The pruned first weight matrix in CSR form used for inference.
+    optimizer: Optimizer
+        The optimizer adjusting the weight matrices during training.
+    weight_version: int
+        Number identifying the current weights, increased by every change of the
+        weights or of how the outputs are calculated.
+    prediction_cache: PredictionCache | None
+        The cache of the results of detect_one_image and predict_batch, if any.
 
     Methods
     -------
@@ -35,14 +79,70 @@ class NeuralNetwork:
         Set the dimensions of the neural network.
     set_weight_matrices
         Set the weight matrices of the neural network.
+    set_update_buffers
+        Create the scratch buffers used to update the weight matrices in place.
+    set_sparse_first_layer
+        Set the pruned first weight matrix used for inference.
+    set_optimizer
+        Set the optimizer adjusting the weight matrices during training.
+    set_prediction_cache
+        Set the cache of the results of detect_one_image and predict_batch.
+    increment_weight_version
+        Mark the cached results of the current weights as outdated.
+    set_backend
+        Set the compute backend of the neural network.
+    set_activations
+        Set the activation function of each layer.
+    set_approximate_inference
+        Set whether the lookup tables of the activation functions are used.
+    set_derivative_cache
+        Cache the derivatives calculated during a forward pass.
     get_dimensions
         Return the dimensions of the neural network.
     get_weight_matrices
         Return the weight matrices of the neural network.
+    get_weight_matrices_as_lists
+        Return the weight matrices of the neural network as nested lists.
+    get_update_buffers
+        Return the scratch buffers used to update the weight matrices in place.
+    get_sparse_first_layer
+        Return the pruned first weight matrix used for inference.
+    get_optimizer
+        Return the optimizer adjusting the weight matrices during training.
+    get_prediction_cache
+        Return the cache of the results of detect_one_image and predict_batch.
+    get_weight_version
+        Return the number identifying the current weights.
+    get_backend
+        Return the compute backend of the neural network.
+    get_activations
+        Return the activation function of each layer.
+    get_approximate_inference
+        Return whether the lookup tables of the activation functions are used.
+    get_derivatives_at_each_layer
+        Return the derivatives belonging to the given values at each layer.
+    get_input_layer_cache
+        Return the cached output values of the input layer for a dataset.
+    clear_input_layer_caches
+        Remove the cached output values of the input layer of all datasets.
     write_weights
         Write weight matrices into a CSV file.
+    write_optimizer_state
+        Write the state of the optimizer next to the weight matrices.
+    read_optimizer_state
+        Read the state of the optimizer written next to the weight matrices.
     create_weights_from_csv
         Read a CSV file and create a weight matrix per line that is read.
+    write_weights_binary
+        Write weight matrices into a binary weight file.
+    create_weights_from_binary
+        Read the weight matrices of a binary weight file.
+    convert_weights_to_binary
+        Convert a CSV file of weight matrices into a binary weight file.
+    load_time_report
+        Measure the load time of the CSV and the binary weight file.
+    create_weights
+        Read the weight matrices of a CSV or binary weight file.
     sigmoid_function
         Calculate the output value of a neuron by using the sigmoid function.
     matrix_multiplication
@@ -53,18 +153,64 @@ class NeuralNetwork:
         Add the values of two matrices together.
     detect_one_image
         Run one image through the neural network and return the values at each layer.
+    detect_images
+        Run a batch of images through the neural network at once.
+    transform_input_layer
+        Calculate the output values of the input layer for a batch of images.
+    forward_pass
+        Run the output values of the input layer through the other layers.
     calculate_output_error
         Calculate the error at the output layer.
+    calculate_batch_output_error
+        Calculate the error at the output layer for a batch of images.
     calc_errors_at_each_layer
         Calculate the error at each layer of the neural network.
+    calc_batch_errors_at_each_layer
+        Calculate the error at each layer of the neural network for a batch of images.
+    calc_weight_changes
+        Calculate the changes to the weight matrices without applying them.
+    apply_weight_changes
+        Add the given changes to the weight matrices.
+    apply_gradients
+        Adjust the weight matrices with given gradients using the optimizer.
     adjust_weight_matrices
-        Adjust the weight matrices of the neural network and save them in a CSV file.
+        Adjust the weight matrices of the neural network.
     guessed_image_is_correct
         Check whether the neural network correctly guessed the image.
+    train_batch
+        Run one batch of images through the neural network and adjust the weights.
+    submit_checkpoint
+        Hand a snapshot of the training over to a checkpoint writer.
+    resume_training
+        Restore the weights, the optimizer state and the position of a training.
+    get_training_start
+        Return the sampler and the position from which the training starts.
     train
-        Run one training iteration.
+        Run one or more training iterations.
+    predict_batch
+        Run a block of images through the neural network and return the predictions.
+    predict_input_values
+        Return the predictions for already calculated output values of the input layer.
+    count_correct_images
+        Return the number of correctly guessed images of a block.
+    initialize_test_worker
+        Create the neural network of a test worker process.
+    test_shard
+        Test one shard of images inside a test worker process.
     test
         Test the accuracy of the neural network.
+    is_image_sequence
+        Check whether the testing data is a sequence of single images.
+    split_into_blocks
+        Split a stream of images into blocks while it is read.
+    test_stream
+        Test the accuracy on a stream of images in one pass.
+    latency_report
+        Measure latency & memory of detect_one_image for several backends.
+    prune_first_layer
+        Prune the first weight matrix and use it in CSR form for inference.
+    pruning_report
+        Measure sparsity, speedup & accuracy of several prunings.
     set_csv_field_size
         Set the CSV field size.
     xavier_initialization
@@ -73,7 +219,11 @@ class NeuralNetwork:
     """
 
     def __init__(self, dimensions: list[tuple[int, int]],
-                 weight_matrices: list[list[list[float]]]) -> None:
+                 weight_matrices: list[list[list[float]]] | list[Matrix],
+                 backend: str | None = None,
+                 activations: list[Activation] | None = None,
+                 optimizer: Optimizer | None = None,
+                 prediction_cache: PredictionCache | None = None) -> None:
         """
         Construct one NeuralNetwork object with the given attributes.
 
@@ -84,14 +234,38 @@ class NeuralNetwork:
             of one layer to another. The first value represents the size of the input
             layer of those two, while the second value represents the output layer of
             those two.
-        weight_matrices: list[list[list[float]]]
+        weight_matrices: list[list[list[float]]] | list[Matrix]
             The weight matrices of the neural network. Each weight matrix is a list
-            of lists of floats that is used to calculate the input values of a layer
-            with the output values of the prior layer.
+            of lists of floats (or a Matrix read from a binary weight file) that is
+            used to calculate the input values of a layer with the output values of
+            the prior layer.
+        backend: str | None
+            Name of the compute backend ('numpy', 'array', 'array32' or 'list'). If
+            None, NumPy is used if it is installed, otherwise the pure Python array
+            backend is used.
+        activations: list[Activation] | None
+            The activation function of each layer, starting with the input layer
+            (one more than the number of weight matrices). If None, the sigmoid
+            function is used for every layer.
+        optimizer: Optimizer | None
+            The optimizer adjusting the weight matrices during training. If None,
+            plain stochastic gradient descent is used.
+        prediction_cache: PredictionCache | None
+            The cache of the results of detect_one_image and predict_batch. If None,
+            every image is run through the neural network.
 
         """
+        self.weight_version: int = 0
+        self.set_prediction_cache(prediction_cache)
         self.set_dimensions(dimensions)
+        self.set_backend(Backend.create(backend))
         self.set_weight_matrices(weight_matrices)
+        self.set_activations(activations if activations is not None else [
+            Sigmoid() for _ in range(len(dimensions) + 1)])
+        self.set_approximate_inference(False)
+        self.set_derivative_cache(None)
+        self.clear_input_layer_caches()
+        self.set_optimizer(optimizer if optimizer is not None else SGD())
 
     def set_dimensions(self, dimensions: list[tuple[int, int]]) -> None:
         """
@@ -105,17 +279,114 @@ class NeuralNetwork:
         """
         self.dimensions: list[tuple[int, int]] = dimensions
 
-    def set_weight_matrices(self, weight_matrices: list[list[list[float]]]) -> None:
+    def set_weight_matrices(
+            self, weight_matrices: list[list[list[float]]] | list[Matrix],
+            copy: bool = True
+    ) -> None:
         """
         Set the weight matrices of the neural network.
 
         Parameters
         ----------
-        weight_matrices: list[list[list[float]]]
-            The weight matrices of the neural network.
+        weight_matrices: list[list[list[float]]] | list[Matrix]
+            The weight matrices of the neural network. They are converted into the
+            matrix type of the compute backend.
+        copy: bool
+            Whether the given weight matrices are copied. The weight matrices are
+            updated in place during training, so without a copy the training
+            changes the given matrices (e.g. views on shared memory).
+
+        """
+        self.weight_matrices: list[list[list[float]]] = [
+            self.get_backend().from_lists(weight_matrix, copy)
+            for weight_matrix in weight_matrices]
+
+        # The scratch buffers have to match the new weight matrices
+        self.set_update_buffers()
+
+        # A pruned first weight matrix belongs to the old weight matrices
+        self.set_sparse_first_layer(None)
+
+        # The cached results belong to the old weight matrices
+        self.increment_weight_version()
+
+    def set_update_buffers(self) -> None:
+        """Create the scratch buffers used to update the weight matrices in place."""
+        self.update_buffers: list = [
+            self.get_backend().create_update_buffer(weight_matrix)
+            for weight_matrix in self.get_weight_matrices()]
+
+    def set_backend(self, backend: Backend) -> None:
+        """
+        Set the compute backend of the neural network.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the matrix operations.
+
+        Notes
+        -----
+        Changing the backend of a neural network with weight matrices requires
+        setting the weight matrices again to convert them.
+
+        """
+        self.backend: Backend = backend
+
+    def set_activations(self, activations: list[Activation]) -> None:
+        """
+        Set the activation function of each layer.
+
+        Parameters
+        ----------
+        activations: list[Activation]
+            The activation function of each layer, starting with the input layer.
+
+        Raises
+        ------
+        ValueError
+            If the number of activation functions doesn't match the number of layers.
+
+        """
+        if len(activations) != len(self.get_dimensions()) + 1:
+            raise ValueError("One activation function per layer is needed.")
+
+        self.activations: list[Activation] = activations
+
+        # The cached results were calculated with the old activation functions
+        self.increment_weight_version()
+
+    def set_approximate_inference(self, approximate_inference: bool) -> None:
+        """
+        Set whether the lookup tables of the activation functions are used.
+
+        Parameters
+        ----------
+        approximate_inference: bool
+            Whether the lookup tables of the activation functions are used for
+            inference. Training steps always use the exact kernels.
+
+        """
+        self.approximate_inference: bool = approximate_inference
+
+        # The cached results were calculated with the old kernels
+        self.increment_weight_version()
+
+    def set_derivative_cache(
+            self, derivative_cache: tuple[list[list[float]], list[list[float]]] | None
+    ) -> None:
+        """
+        Cache the derivatives calculated during a forward pass.
+
+        Parameters
+        ----------
+        derivative_cache: tuple[list[list[float]], list[list[float]]] | None
+            The values at each layer of a forward pass and the derivatives at each
+            layer calculated during that pass. None clears the cache.
 
         """
-        self.weight_matrices: list[list[list[float]]] = weight_matrices
+        self.derivative_cache: tuple[
+            list[list[float]], list[list[float]]] | None = derivative_cache
 
     def get_dimensions(self) -> list[tuple[int, int]]:
         """
@@ -141,6 +412,241 @@ class NeuralNetwork:
         """
         return self.weight_matrices
 
+    def set_sparse_first_layer(self, sparse_first_layer: SparseMatrix | None) -> None:
+        """
+        Set the pruned first weight matrix used for inference.
+
+        Parameters
+        ----------
+        sparse_first_layer: SparseMatrix | None
+            The pruned first weight matrix in CSR form. None uses the dense weight
+            matrix.
+
+        """
+        self.sparse_first_layer: SparseMatrix | None = sparse_first_layer
+
+    def set_optimizer(self, optimizer: Optimizer) -> None:
+        """
+        Set the optimizer adjusting the weight matrices during training.
+
+        Parameters
+        ----------
+        optimizer: Optimizer
+            The optimizer. Its state buffers are allocated for the weight matrices
+            at the first update.
+
+        """
+        self.optimizer: Optimizer = optimizer
+
+    def get_optimizer(self) -> Optimizer:
+        """
+        Return the optimizer adjusting the weight matrices during training.
+
+        Returns
+        -------
+        optimizer: Optimizer
+            The optimizer adjusting the weight matrices during training.
+
+        """
+        return self.optimizer
+
+    def set_prediction_cache(self, prediction_cache: PredictionCache | None) -> None:
+        """
+        Set the cache of the results of detect_one_image and predict_batch.
+
+        Parameters
+        ----------
+        prediction_cache: PredictionCache | None
+            The cache, which must only be used by this neural network. None turns
+            the caching off.
+
+        """
+        self.prediction_cache: PredictionCache | None = prediction_cache
+
+    def get_prediction_cache(self) -> PredictionCache | None:
+        """
+        Return the cache of the results of detect_one_image and predict_batch.
+
+        Returns
+        -------
+        prediction_cache: PredictionCache | None
+            The cache, None if the caching is turned off.
+
+        """
+        return self.prediction_cache
+
+    def increment_weight_version(self) -> None:
+        """Mark the cached results of the current weights as outdated."""
+        self.weight_version += 1
+
+    def get_weight_version(self) -> int:
+        """
+        Return the number identifying the current weights.
+
+        Returns
+        -------
+        weight_version: int
+            Number that is increased by every change of the weights.
+
+        """
+        return self.weight_version
+
+    def get_sparse_first_layer(self) -> SparseMatrix | None:
+        """
+        Return the pruned first weight matrix used for inference.
+
+        Returns
+        -------
+        sparse_first_layer: SparseMatrix | None
+            The pruned first weight matrix in CSR form, None if there is none.
+
+        """
+        return self.sparse_first_layer
+
+    def get_update_buffers(self) -> list:
+        """
+        Return the scratch buffers used to update the weight matrices in place.
+
+        Returns
+        -------
+        update_buffers: list
+            One scratch buffer per weight matrix.
+
+        """
+        return self.update_buffers
+
+    def get_weight_matrices_as_lists(self) -> list[list[list[float]]]:
+        """
+        Return the weight matrices of the neural network as nested lists.
+
+        Returns
+        -------
+        weight_matrices: list[list[list[float]]]
+            The weight matrices of the neural network as nested lists of floats.
+
+        """
+        return [self.get_backend().to_lists(weight_matrix)
+                for weight_matrix in self.get_weight_matrices()]
+
+    def get_backend(self) -> Backend:
+        """
+        Return the compute backend of the neural network.
+
+        Returns
+        -------
+        backend: Backend
+            The compute backend performing the matrix operations.
+
+        """
+        return self.backend
+
+    def get_activations(self) -> list[Activation]:
+        """
+        Return the activation function of each layer.
+
+        Returns
+        -------
+        activations: list[Activation]
+            The activation function of each layer, starting with the input layer.
+
+        """
+        return self.activations
+
+    def get_approximate_inference(self) -> bool:
+        """
+        Return whether the lookup tables of the activation functions are used.
+
+        Returns
+        -------
+        approximate_inference: bool
+            Whether the lookup tables of the activation functions are used for
+            inference.
+
+        """
+        return self.approximate_inference
+
+    def get_derivatives_at_each_layer(
+            self, values_at_each_layer: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Return the derivatives belonging to the given values at each layer.
+
+        Parameters
+        ----------
+        values_at_each_layer: list[list[float]]
+            Output values of each layer.
+
+        Returns
+        -------
+        derivatives_at_each_layer: list[list[float]]
+            Derivative of the activation function at each layer after the input
+            layer. The derivatives at index i belong to the values at index i + 1.
+            They are taken from the cache if the values come from the last forward
+            pass of a training step, otherwise they are calculated.
+
+        """
+        # Reuse the derivatives calculated during the forward pass
+        derivative_cache = self.derivative_cache
+        if derivative_cache is not None and derivative_cache[0] is values_at_each_layer:
+            return derivative_cache[1]
+
+        return [activation.derivative(self.get_backend(), values)
+                for activation, values in zip(self.get_activations()[1:],
+                                              values_at_each_layer[1:])]
+
+    def get_input_layer_cache(
+            self, images: Sequence[Image], approximate: bool
+    ) -> InputLayerCache:
+        """
+        Return the cached output values of the input layer for a dataset.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The dataset.
+        approximate: bool
+            Whether the lookup table of the activation function is used.
+
+        Returns
+        -------
+        input_layer_cache: InputLayerCache
+            The cache of the dataset. It is created if the dataset wasn't cached yet
+            or if the transformation of the input layer (backend or activation
+            function) changed since it was cached.
+
+        Notes
+        -----
+        Only the caches of the MAX_CACHED_DATASETS most recently used datasets are
+        kept. A cache holds a reference to its dataset, so the id of a cached
+        dataset can't be reused by another one.
+
+        """
+        # Key identifying the current transformation of the input layer
+        transform_key: tuple = InputLayerCache.create_transform_key(
+            self.get_backend(), self.get_activations()[0], approximate)
+
+        # Reuse the existing cache of the dataset if it is still valid
+        input_layer_cache: InputLayerCache | None = self.input_layer_caches.get(
+            id(images))
+        if input_layer_cache is None or not input_layer_cache.is_valid_for(
+                images, transform_key):
+            # Release the old cache of the dataset before filling the new one
+            self.input_layer_caches.pop(id(images), None)
+            input_layer_cache = InputLayerCache(
+                images, self.get_backend(), self.get_activations()[0], approximate)
+            self.input_layer_caches[id(images)] = input_layer_cache
+
+        # Mark the cache as most recently used and evict the least recently used
+        self.input_layer_caches.move_to_end(id(images))
+        while len(self.input_layer_caches) > MAX_CACHED_DATASETS:
+            self.input_layer_caches.popitem(last=False)
+
+        return input_layer_cache
+
+    def clear_input_layer_caches(self) -> None:
+        """Remove the cached output values of the input layer of all datasets."""
+        self.input_layer_caches: OrderedDict[int, InputLayerCache] = OrderedDict()
+
     @staticmethod
     def write_weights(
         path_to_output: str, weight_matrices: list[list[list[float]]]
@@ -173,13 +679,61 @@ class NeuralNetwork:
             # Write the header
             csv_writer.writerow(header)
 
-            # Write each weight matrix
+            # Write each weight matrix, formatted row by row (the same text as
+            # str(weight_matrix)), so a background thread writing the file lets
+            # other threads run between the rows
             for weight_matrix in weight_matrices:
-                csv_writer.writerow([weight_matrix])
+                csv_writer.writerow(
+                    ["[" + ", ".join([str(row) for row in weight_matrix]) + "]"])
 
             # Close the file
             csv_file.close()
 
+    def write_optimizer_state(self, path_to_weights: str) -> None:
+        """
+        Write the state of the optimizer next to the weight matrices.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices. The state is written into
+            the file returned by Optimizer.get_state_path. Nothing is written for an
+            optimizer without state.
+
+        """
+        if self.get_optimizer().get_state():
+            self.get_optimizer().write_state(
+                self.get_backend(), Optimizer.get_state_path(path_to_weights))
+
+    def read_optimizer_state(self, path_to_weights: str) -> bool:
+        """
+        Read the state of the optimizer written next to the weight matrices.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices.
+
+        Returns
+        -------
+        bool
+            True if a state file existed and was read, otherwise False (the
+            optimizer then starts without state).
+
+        """
+        # Get the path of the state file
+        path_to_state: str = Optimizer.get_state_path(path_to_weights)
+
+        if not pathlib.Path(path_to_state).is_file():
+            return False
+
+        # Set the CSV field size limit, a state buffer is one large field
+        NeuralNetwork.set_csv_field_size()
+
+        self.get_optimizer().read_state(self.get_backend(), path_to_state)
+
+        return True
+
     @staticmethod
     def create_weights_from_csv(path_to_csv_file: str) -> list[list[list[float]]]:
         """
@@ -215,142 +769,303 @@ class NeuralNetwork:
         return weight_matrix_list
 
     @staticmethod
-    def sigmoid_function(x_value: float) -> float:
+    def write_weights_binary(
+        path_to_output: str, weight_matrices: list[list[list[float]]],
+        typecode: str = "d", source: tuple[int, int] = (0, 0)
+    ) -> None:
         """
-        Calculate the output value of a neuron by using the sigmoid function.
-
-        The function is as follows: y = 1 / (1 + e^-x)
+        Write weight matrices into a binary weight file.
 
         Parameters
         ----------
-        x_value: float
-            Input value of the neuron.
-
-        Returns
-        -------
-        y_value: float
-            Output value of the neuron. Values are in range of [0; 1].
+        path_to_output: str
+            Path to the binary file in which the weight matrices need to be written.
+        weight_matrices: list[list[list[float]]]
+            Altered/New weights that need to be saved (nested lists or Matrix
+            objects).
+        typecode: str
+            'd' to store the values as float64, 'f' to store them as float32.
+        source: tuple[int, int]
+            Size and modification time of the CSV file the weights were read from
+            (see WeightFile.get_source_info), (0, 0) without one.
 
         """
-        y_value: float = 1 / (1 + EULERS_NUMBER ** -x_value)
-
-        return y_value
+        WeightFile.write(path_to_output, weight_matrices, typecode, source)
 
     @staticmethod
-    def matrix_multiplication(
-        matrix_1: list[list[float]], matrix_2: list[list[float]]
-    ) -> list[list[float]]:
+    def create_weights_from_binary(
+        path_to_binary_file: str, verify: bool = True
+    ) -> list[Matrix]:
         """
-        Multiplicate two given matrices.
+        Read the weight matrices of a binary weight file.
 
         Parameters
         ----------
-        matrix_1: list[list[float]]
-            First matrix of the equation.
-        matrix_2: list[list[float]]
-            Second matrix of the equation.
+        path_to_binary_file: str
+            Path to the binary file that is read.
+        verify: bool
+            Whether the checksum of the file is verified.
 
         Returns
         -------
-        matrix_product: list[list[float]]
-            Product of the two given matrices.
+        list[Matrix]
+            One Matrix per weight matrix. They can be passed to the constructor or
+            to set_weight_matrices like nested lists.
 
-        Raises
-        ------
-        ValueError
-            If the number of columns of the first matrix is not equal to the number of
-            rows of the second matrix.
+        """
+        return WeightFile.read(path_to_binary_file, verify)
 
+    @staticmethod
+    def convert_weights_to_binary(
+        path_to_csv_file: str, path_to_output: str, typecode: str = "d"
+    ) -> None:
         """
-        # Check if the two given matrices can be multiplicated
-        if len(matrix_1[0]) != len(matrix_2):
-            raise ValueError("The two given matrices can't be multiplicated.")
+        Convert a CSV file of weight matrices into a binary weight file.
 
-        # Initialize the product of the two given matrices
-        matrix_product: list[list[float]] = []
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file that is read (e.g. weight_matrices.csv).
+        path_to_output: str
+            Path to the binary file that is written.
+        typecode: str
+            'd' to store the values as float64, 'f' to store them as float32.
 
-        for row_matrix_1 in range(len(matrix_1)):
-            # Add a new line to the product.
-            matrix_product.append([])
+        """
+        # Set the CSV field size limit
+        NeuralNetwork.set_csv_field_size()
 
-            for column_matrix_2 in range(len(matrix_2[0])):
-                # Multiply row of matrix 1 with column of matrix 2
-                matrix_product[row_matrix_1].append(sum([
-                    matrix_1[row_matrix_1][col_1_row_2]
-                    * matrix_2[col_1_row_2][column_matrix_2]
-                    for col_1_row_2 in range(len(matrix_1[0]))]))
+        # Get the information about the CSV file before reading it, so a file
+        # changed in the meantime makes the binary file outdated
+        source: tuple[int, int] = WeightFile.get_source_info(path_to_csv_file)
 
-        return matrix_product
+        NeuralNetwork.write_weights_binary(
+            path_to_output, NeuralNetwork.create_weights_from_csv(path_to_csv_file),
+            typecode, source)
 
     @staticmethod
-    def invert(matrix: list[list[float]]) -> list[list[float]]:
+    def load_time_report(
+        dimensions: list[tuple[int, int]], path_to_csv_file: str,
+        path_to_binary_file: str, backends: list[str], repetitions: int = 5
+    ) -> list[dict[str, float | str]]:
         """
-        Return an inverted matrix.
+        Measure the load time of the CSV and the binary weight file.
+
+        Each measurement reads the file and creates a neural network with the
+        weight matrices, so the conversion into the matrix type of the backend is
+        included.
 
         Parameters
         ----------
-        matrix: list[list[float]]
-            The matrix which shall be inverted.
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        path_to_csv_file: str
+            Path to the CSV file of the weight matrices.
+        path_to_binary_file: str
+            Path to the binary file of the same weight matrices.
+        backends: list[str]
+            Names of the compute backends that are measured.
+        repetitions: int
+            Number of loads per file and backend. The fastest load is reported.
 
         Returns
         -------
-        Matrix(values_inverted): Matrix
-            Matrix with inverted values.
+        list[dict[str, float | str]]
+            Per backend its name, the file sizes in KB and the load times in ms.
 
         """
-        values_inverted: list[list[float]] = []
-
-        for col in range(len(matrix[0])):
-            # For each column add a new row
-            values_inverted.append([])
+        # Set the CSV field size limit
+        NeuralNetwork.set_csv_field_size()
 
-            for row in range(len(matrix)):
-                values_inverted[col].append(matrix[row][col])
-
-        return values_inverted
+        # Initialize the return value
+        report: list[dict[str, float | str]] = []
+
+        for backend in backends:
+            load_times: list[float] = []
+            for create_weights in (NeuralNetwork.create_weights_from_csv,
+                                   NeuralNetwork.create_weights_from_binary):
+                fastest: float = float("inf")
+                for _ in range(repetitions):
+                    start: float = time.perf_counter()
+                    NeuralNetwork(dimensions, create_weights(
+                        path_to_csv_file if create_weights is
+                        NeuralNetwork.create_weights_from_csv
+                        else path_to_binary_file), backend)
+                    fastest = min(fastest, time.perf_counter() - start)
+                load_times.append(fastest * 1000)
+
+            measurement: dict[str, float] = {
+                "csv_kb": os.path.getsize(path_to_csv_file) / 1024,
+                "binary_kb": os.path.getsize(path_to_binary_file) / 1024,
+                "csv_ms": load_times[0], "binary_ms": load_times[1]}
+
+            # Print the measurement
+            print("Backend:", backend,
+                  "\tCSV (KB):", round(measurement["csv_kb"], 1),
+                  "\tBinary (KB):", round(measurement["binary_kb"], 1),
+                  "\tCSV load (ms):", round(measurement["csv_ms"], 2),
+                  "\tBinary load (ms):", round(measurement["binary_ms"], 2))
+
+            report.append({"backend": backend, **measurement})
+
+        return report
 
     @staticmethod
-    def matrix_addition(
-        matrix_1: list[list[float]], matrix_2: list[list[float]]
-    ) -> list[list[float]]:
+    def create_weights(path_to_weights: str) -> list:
         """
-        Add the values of two matrices together.
+        Read the weight matrices of a CSV or binary weight file.
 
         Parameters
         ----------
-        matrix_1: list[list[float]]
-            First matrix of the equation.
-        matrix_2: list[list[float]]
-            Second matrix of the equation.
+        path_to_weights: str
+            Path to the weight file. Files ending with '.bin' are read as binary
+            weight files, all other files as CSV files.
 
         Returns
         -------
-        matrix_sum: list[list[float]]
-            Sum of the two given matrices.
+        list
+            The weight matrices (nested lists or Matrix objects).
 
-        Raises
-        ------
-        ValueError
-            If the number of columns of the first matrix is not equal to the number of
-            rows of the second matrix.
+        Notes
+        -----
+        If a CSV file is given and a binary weight file with the same name (but
+        ending with '.bin') exists that was converted from the CSV file as it is
+        now (same size and modification time), the binary file is read instead. A
+        training writing the CSV file makes the binary file outdated, so it is
+        ignored until it is converted again.
 
         """
-        # Check if the two matrices can be added together
-        if len(matrix_1) != len(matrix_2) or len(matrix_1[0]) != len(matrix_2[0]):
-            raise ValueError("The two given matrices can't be added together")
+        # Get the path of the binary weight file
+        path: pathlib.Path = pathlib.Path(path_to_weights)
+        binary_path: pathlib.Path = path.with_suffix(".bin")
 
-        matrix_sum = [
-            [matrix_1[row][col] + matrix_2[row][col]
-             for col in range(len(matrix_1[0]))] for row in range(len(matrix_1))]
+        if path.suffix == ".bin":
+            return NeuralNetwork.create_weights_from_binary(str(binary_path))
 
-        return matrix_sum
+        # Read the binary file only if it belongs to the current CSV file
+        try:
+            if binary_path.is_file() and WeightFile.read_source(
+                    str(binary_path)) == WeightFile.get_source_info(path_to_weights):
+                return NeuralNetwork.create_weights_from_binary(str(binary_path))
+        except (OSError, ValueError):
+            # Fall back to the CSV file if the binary file is outdated or damaged
+            pass
 
-    def detect_one_image(self, image: Image) -> list[list[float]]:
-        """
-        Run one image through the neural network and return the values at each layer.
+        # Set the CSV field size limit
+        NeuralNetwork.set_csv_field_size()
 
-        Parameters
-        ----------
+        return NeuralNetwork.create_weights_from_csv(path_to_weights)
+
+    @staticmethod
+    def sigmoid_function(x_value: float) -> float:
+        """
+        Calculate the output value of a neuron by using the sigmoid function.
+
+        The function is as follows: y = 1 / (1 + e^-x)
+
+        Parameters
+        ----------
+        x_value: float
+            Input value of the neuron.
+
+        Returns
+        -------
+        y_value: float
+            Output value of the neuron. Values are in range of [0; 1].
+
+        Notes
+        -----
+        For negative values the equivalent form y = e^x / (1 + e^x) is used, so
+        e^-x can't overflow for large negative values.
+
+        """
+        if x_value < 0:
+            return EULERS_NUMBER ** x_value / (1 + EULERS_NUMBER ** x_value)
+
+        y_value: float = 1 / (1 + EULERS_NUMBER ** -x_value)
+
+        return y_value
+
+    @staticmethod
+    def matrix_multiplication(
+        matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Multiplicate two given matrices.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            First matrix of the equation.
+        matrix_2: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        matrix_product: list[list[float]]
+            Product of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        return ListBackend().matrix_multiplication(matrix_1, matrix_2)
+
+    @staticmethod
+    def invert(matrix: list[list[float]]) -> list[list[float]]:
+        """
+        Return an inverted matrix.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            The matrix which shall be inverted.
+
+        Returns
+        -------
+        Matrix(values_inverted): Matrix
+            Matrix with inverted values.
+
+        """
+        return ListBackend().invert(matrix)
+
+    @staticmethod
+    def matrix_addition(
+        matrix_1: list[list[float]], matrix_2: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Add the values of two matrices together.
+
+        Parameters
+        ----------
+        matrix_1: list[list[float]]
+            First matrix of the equation.
+        matrix_2: list[list[float]]
+            Second matrix of the equation.
+
+        Returns
+        -------
+        matrix_sum: list[list[float]]
+            Sum of the two given matrices.
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of the first matrix is not equal to the number of
+            rows of the second matrix.
+
+        """
+        return ListBackend().matrix_addition(matrix_1, matrix_2)
+
+    def detect_one_image(self, image: Image) -> list[list[float]]:
+        """
+        Run one image through the neural network and return the values at each layer.
+
+        Parameters
+        ----------
         image: Image
             The image that is being run through the neural network.
 
@@ -362,24 +1077,147 @@ class NeuralNetwork:
             the output layer. The values in between are the values at the respective
             hidden layers.
 
+        Notes
+        -----
+        If the neural network has a prediction cache, the values of an image with
+        the same (quantized) pixels and the same weights are returned from the
+        cache. They mustn't be changed.
+
+        """
+        # Get the prediction cache
+        prediction_cache: PredictionCache | None = self.get_prediction_cache()
+
+        if prediction_cache is None:
+            return self.detect_images([image])
+
+        # Return the cached values if the image was already detected
+        key: tuple = PredictionCache.create_key(
+            self.get_backend(), image.get_pixels(), self.get_weight_version(),
+            "detect")
+        values_at_each_layer: list[list[float]] | None = prediction_cache.get(key)
+        if values_at_each_layer is None:
+            values_at_each_layer = self.detect_images([image])
+            prediction_cache.put(key, values_at_each_layer)
+
+        return values_at_each_layer
+
+    def detect_images(
+            self, images: Sequence[Image], keep_derivatives: bool = False
+    ) -> list[list[float]]:
         """
-        # Apply the sigmoid function to the values at the input layer
-        values: list[float] = [[NeuralNetwork.sigmoid_function(val)]
-                               for val in image.get_pixels()]
-        values_at_each_layer: list[list[float]] = [values]
+        Run a batch of images through the neural network at once.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images that are being run through the neural network.
+        keep_derivatives: bool
+            Whether the derivatives of the activation functions are calculated
+            during the forward pass and cached for the following weight adjustment.
+            The exact kernels are always used in that case.
+
+        Returns
+        -------
+        values_at_each_layer: list[float]
+            Output values at each layer. Each column of the values belongs to the
+            image with the same index. The values at index 0 are the output values
+            of the input layer. The values at the last index are the output values of
+            the output layer.
+
+        """
+        # Only approximate the activation functions for inference
+        approximate: bool = self.get_approximate_inference() and not keep_derivatives
+
+        return self.forward_pass(
+            self.transform_input_layer(images, approximate), keep_derivatives)
+
+    def transform_input_layer(
+            self, images: Sequence[Image], approximate: bool
+    ) -> list[list[float]]:
+        """
+        Calculate the output values of the input layer for a batch of images.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images that are being run through the neural network.
+        approximate: bool
+            Whether the lookup table of the activation function is used.
+
+        Returns
+        -------
+        list[list[float]]
+            Output values of the input layer. One column per image.
+
+        """
+        return self.get_activations()[0].forward(
+            self.get_backend(),
+            self.get_backend().column_matrix([image.get_pixels() for image in images]),
+            approximate)
+
+    def forward_pass(
+            self, input_values: list[list[float]], keep_derivatives: bool = False
+    ) -> list[list[float]]:
+        """
+        Run the output values of the input layer through the other layers.
+
+        Parameters
+        ----------
+        input_values: list[list[float]]
+            Output values of the input layer. One column per image.
+        keep_derivatives: bool
+            Whether the derivatives of the activation functions are calculated
+            and cached for the following weight adjustment. The exact kernels are
+            always used in that case.
+
+        Returns
+        -------
+        values_at_each_layer: list[float]
+            Output values at each layer, starting with the given input values.
+
+        """
+        # Get the compute backend and the activation functions
+        backend: Backend = self.get_backend()
+        activations: list[Activation] = self.get_activations()
+
+        # Only approximate the activation functions for inference
+        approximate: bool = self.get_approximate_inference() and not keep_derivatives
+
+        # Only use the pruned first weight matrix for inference
+        sparse_first_layer: SparseMatrix | None = (
+            None if keep_derivatives else self.get_sparse_first_layer())
+
+        values: list[list[float]] = input_values
+        values_at_each_layer: list = [values]
+        derivatives_at_each_layer: list[list[float]] = []
 
         # Go through each layer transition
-        for weight_matrix in self.get_weight_matrices():
+        for weight_matrix, activation in zip(self.get_weight_matrices(),
+                                             activations[1:]):
             # Calculate the input values for the next layer
-            input_values: list[float] = NeuralNetwork.matrix_multiplication(
-                weight_matrix, values)
+            if sparse_first_layer is not None and len(values_at_each_layer) == 1:
+                layer_input_values: list[list[float]] = (
+                    backend.sparse_matrix_multiplication(sparse_first_layer, values))
+            else:
+                layer_input_values = backend.matrix_multiplication(
+                    weight_matrix, values)
 
-            # Apply the sigmoid function to get the output values of this layer
-            values = [[NeuralNetwork.sigmoid_function(val[0])] for val in input_values]
+            # Apply the activation function to get the output values of this layer
+            values = activation.forward(backend, layer_input_values, approximate)
 
             # Save the output values of the current layer
             values_at_each_layer.append(values)
 
+            # Calculate the derivative while the output values are at hand
+            if keep_derivatives:
+                derivatives_at_each_layer.append(
+                    activation.derivative(backend, values))
+
+        # Cache the derivatives for the following weight adjustment
+        if keep_derivatives:
+            self.set_derivative_cache(
+                (values_at_each_layer, derivatives_at_each_layer))
+
         return values_at_each_layer
 
     def calculate_output_error(
@@ -401,13 +1239,46 @@ class NeuralNetwork:
             Error at the output layer.
 
         """
+        return self.calculate_batch_output_error([current_image], values)
+
+    def calculate_batch_output_error(
+            self, current_images: list[Image], values: list[float]
+    ) -> list[float]:
+        """
+        Calculate the error at the output layer for a batch of images.
+
+        Parameters
+        ----------
+        current_images: list[Image]
+            Images that are currently being run through the neural network.
+        values: list[float]
+            Output values of the output layer. One column per image.
+
+        Returns
+        -------
+        output_error: list[float]
+            Error at the output layer. One column per image.
+
+        Raises
+        ------
+        ValueError
+            If the actual number of an image is unknown.
+
+        """
+        # Get the actual numbers, which have to be known for training
+        labels: list[int] = []
+        for image in current_images:
+            label: int | None = image.get_actual_number()
+            if label is None:
+                raise ValueError("The actual number of a training image is unknown.")
+            labels.append(label)
+
         # Calculate the expected values
-        expected_values: list[float] = [0.0 for _ in range(10)]
-        expected_values[current_image.get_actual_number()] = 1.0
+        expected_values: list[float] = self.get_backend().one_hot(labels, 10)
 
         # Calculate the error
-        output_error: list[float] = [
-            [expected_values[i] - values[i][0]] for i in range(10)]
+        output_error: list[float] = self.get_backend().matrix_subtraction(
+            expected_values, values)
 
         return output_error
 
@@ -429,58 +1300,192 @@ class NeuralNetwork:
         errors_at_each_layer: list[list[float]]
             Calculated error at each layer.
 
+        """
+        return self.calc_batch_errors_at_each_layer(
+            [current_image], values_at_each_layer)
+
+    def calc_batch_errors_at_each_layer(
+            self, current_images: list[Image],
+            values_at_each_layer: list[list[float]]
+    ) -> list[list[float]]:
+        """
+        Calculate the error at each layer of the neural network for a batch of images.
+
+        Parameters
+        ----------
+        current_images: list[Image]
+            Images that are currently being run through the neural network.
+        values_ate_each_layer: list[list[float]]
+            Output values of each layer. One column per image.
+
+        Returns
+        -------
+        errors_at_each_layer: list[list[float]]
+            Calculated error at each layer after the input layer (index i belongs
+            to the output values of weight matrix i). One column per image.
+
+        Notes
+        -----
+        The error at the input layer isn't needed to adjust any weight matrix, so
+        it isn't calculated. The weight matrices are never inverted explicitly,
+        the backend multiplicates them inverted directly.
+
         """
         # Calculate the error at the output layer
-        error_at_current_layer: list[float] = self.calculate_output_error(
-            current_image, values_at_each_layer[len(values_at_each_layer) - 1])
+        error_at_current_layer: list[float] = self.calculate_batch_output_error(
+            current_images, values_at_each_layer[len(values_at_each_layer) - 1])
         errors_at_each_layer: list[list[float]] = [error_at_current_layer]
 
-        # Calculate the errors for the other layers
-        for weight_matrix in reversed(self.get_weight_matrices()):
-            error_at_current_layer = NeuralNetwork.matrix_multiplication(
-                NeuralNetwork.invert(weight_matrix), error_at_current_layer)
+        # Calculate the errors for the hidden layers
+        for weight_matrix in reversed(self.get_weight_matrices()[1:]):
+            error_at_current_layer = (
+                self.get_backend().transposed_matrix_multiplication(
+                    weight_matrix, error_at_current_layer))
             errors_at_each_layer.insert(0, error_at_current_layer)
 
         return errors_at_each_layer
 
-    def adjust_weight_matrices(
+    def calc_weight_changes(
             self, values_at_each_layer: list[list[float]],
             errors_at_each_layer: list[list[float]], learning_rate: float
-    ) -> None:
+    ) -> list[list[list[float]]]:
         """
-        Adjust the weight matrices of the neural network and save them in a CSV file.
+        Calculate the changes to the weight matrices without applying them.
 
         Parameters
         ----------
         values_at_each_layer: list[list[float]]
-            Output values of each layer.
+            Output values of each layer. One column per image.
         errors_at_each_layer: list[list[float]]
-            Calculated error at each layer.
+            Calculated error at each layer after the input layer. One column per
+            image.
         learning_rate: float
             Factor that controls the change of the weights.
 
+        Returns
+        -------
+        changes_to_weight_matrices: list[list[list[float]]]
+            One change per weight matrix. The changes of all images (columns) are
+            summed up.
+
         """
+        # Get the compute backend
+        backend: Backend = self.get_backend()
+
+        # Get the derivatives of the activation functions
+        derivatives_at_each_layer: list[list[float]] = (
+            self.get_derivatives_at_each_layer(values_at_each_layer))
+
         # Initialize the changes
-        changed_weight_matrices: list[list[list[float]]] = []
+        changes_to_weight_matrices: list[list[list[float]]] = []
 
         # Go through each layer
         for i in range(len(self.get_weight_matrices())):
-            # Calculate Alpha * Ek * Ok * (1 - Ok)
-            change_to_weight_matrix: list[list[float]] = [
-                [learning_rate * (err[0] * val[0] * (1 - val[0]))]
-                for err, val in zip(errors_at_each_layer[i + 1],
-                                    values_at_each_layer[i + 1])]
+            # Calculate Alpha * Ek * f'(Ik), for the sigmoid function f'(Ik) is
+            # Ok * (1 - Ok)
+            change_to_weight_matrix: list[list[float]] = backend.error_gradient(
+                errors_at_each_layer[i], derivatives_at_each_layer[i],
+                learning_rate)
+
+            # Calculate Alpha * Ek * f'(Ik) * Oj^T
+            changes_to_weight_matrices.append(backend.matrix_multiplication(
+                change_to_weight_matrix, backend.invert(values_at_each_layer[i])))
+
+        return changes_to_weight_matrices
+
+    def apply_weight_changes(
+            self, changes_to_weight_matrices: list[list[list[float]]]
+    ) -> None:
+        """
+        Add the given changes to the weight matrices.
+
+        Parameters
+        ----------
+        changes_to_weight_matrices: list[list[list[float]]]
+            One change per weight matrix.
+
+        """
+        # Add the changes to the weight matrices in place
+        for weight_matrix, change in zip(self.get_weight_matrices(),
+                                         changes_to_weight_matrices):
+            self.get_backend().matrix_addition_in_place(weight_matrix, change)
+
+        # The pruned weights changed, so the sparse first weight matrix is outdated
+        self.set_sparse_first_layer(None)
+
+        # The cached results belong to the old weights
+        self.increment_weight_version()
+
+    def apply_gradients(
+            self, gradients: list[list[list[float]]], learning_rate: float
+    ) -> None:
+        """
+        Adjust the weight matrices with given gradients using the optimizer.
+
+        Parameters
+        ----------
+        gradients: list[list[list[float]]]
+            Ek * f'(Ik) * Oj^T of each weight matrix averaged over the images of
+            the batch (see calc_weight_changes). They may be overwritten.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Let the optimizer adjust the weight matrices in place
+        self.get_optimizer().apply_gradients(
+            self.get_backend(), self.get_weight_matrices(), gradients, learning_rate)
+
+        # The pruned weights changed, so the sparse first weight matrix is outdated
+        self.set_sparse_first_layer(None)
+
+        # The cached results belong to the old weights
+        self.increment_weight_version()
+
+    def adjust_weight_matrices(
+            self, values_at_each_layer: list[list[float]],
+            errors_at_each_layer: list[list[float]], learning_rate: float
+    ) -> None:
+        """
+        Adjust the weight matrices of the neural network.
+
+        Parameters
+        ----------
+        values_at_each_layer: list[list[float]]
+            Output values of each layer. One column per image.
+        errors_at_each_layer: list[list[float]]
+            Calculated error at each layer after the input layer. One column per
+            image.
+        learning_rate: float
+            Factor that controls the change of the weights.
 
-            # Calculate Alpha * Ek * Ok * (1 - Ok) * Oj^T
-            change_to_weight_matrix = NeuralNetwork.matrix_multiplication(
-                change_to_weight_matrix, NeuralNetwork.invert(values_at_each_layer[i]))
+        Notes
+        -----
+        If the values contain more than one column (a batch of images), the
+        changes of all images are summed up by the matrix multiplication and then
+        averaged over the batch size. For a single image this is exactly the
+        per-image update.
 
-            # Calculate the new values for the weight matrix
-            changed_weight_matrices.append(NeuralNetwork.matrix_addition(
-                self.get_weight_matrices()[i], change_to_weight_matrix))
+        The update rule is the one of the optimizer. The weight matrices and the
+        state buffers of the optimizer are updated in place, using the scratch
+        buffer of each weight matrix, so no change matrices and no new weight
+        matrices are allocated.
 
-        # Apply the changes
-        self.set_weight_matrices(changed_weight_matrices)
+        """
+        # Get the derivatives of the activation functions
+        derivatives_at_each_layer: list[list[float]] = (
+            self.get_derivatives_at_each_layer(values_at_each_layer))
+
+        # Let the optimizer adjust the weight matrices in place
+        self.get_optimizer().update(
+            self.get_backend(), self.get_weight_matrices(), self.get_update_buffers(),
+            values_at_each_layer, errors_at_each_layer, derivatives_at_each_layer,
+            learning_rate)
+
+        # The pruned weights changed, so the sparse first weight matrix is outdated
+        self.set_sparse_first_layer(None)
+
+        # The cached results belong to the old weights
+        self.increment_weight_version()
 
     def guessed_image_is_correct(
             self, current_image: Image, values_at_output_layer: list[float]
@@ -502,81 +1507,857 @@ class NeuralNetwork:
             layer is equal to the actual number, otherwise False.
 
         """
-        return (values_at_output_layer.index(max(values_at_output_layer)) ==
+        return (self.get_backend().argmax(values_at_output_layer)[0] ==
                 current_image.get_actual_number())
 
+    def train_batch(
+            self, batch: list[Image], learning_rate: float,
+            input_values: list[list[float]] | None = None
+    ) -> None:
+        """
+        Run one batch of images through the neural network and adjust the weights.
+
+        Parameters
+        ----------
+        batch: list[Image]
+            The images of the batch.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        input_values: list[list[float]] | None
+            Already calculated output values of the input layer for the batch. If
+            None, they are calculated from the pixels.
+
+        """
+        # Calculate the output values of the input layer if they aren't given
+        if input_values is None:
+            input_values = self.transform_input_layer(batch, False)
+
+        # Calculate the output values & the derivatives at each layer
+        values_at_each_layer: list[list[float]] = self.forward_pass(
+            input_values, True)
+
+        # Calculate the error at each layer
+        errors_at_each_layer: list[list[float]] = (
+            self.calc_batch_errors_at_each_layer(batch, values_at_each_layer))
+
+        # Apply the changes to the weight matrices
+        self.adjust_weight_matrices(values_at_each_layer,
+                                    errors_at_each_layer, learning_rate)
+
+        # Release the cached derivatives
+        self.set_derivative_cache(None)
+
+    def submit_checkpoint(
+            self, checkpoint_writer: CheckpointWriter, sampler: IndexSampler,
+            epoch: int, index: int
+    ) -> None:
+        """
+        Hand a snapshot of the training over to a checkpoint writer.
+
+        Parameters
+        ----------
+        checkpoint_writer: CheckpointWriter
+            The checkpoint writer.
+        sampler: IndexSampler
+            The sampler of the order of the images.
+        epoch: int
+            The epoch from which the training continues.
+        index: int
+            The index within the order of the epoch from which the training
+            continues.
+
+        """
+        # Get the compute backend
+        backend: Backend = self.get_backend()
+
+        # Copy the weight matrices & the state of the optimizer
+        checkpoint_writer.submit(
+            backend, [backend.from_lists(weight_matrix)
+                      for weight_matrix in self.get_weight_matrices()],
+            self.get_optimizer().snapshot(backend),
+            {"epoch": epoch, "index": index, "seed": sampler.get_seed(),
+             "sampling": sampler.get_sampling()})
+
+    def resume_training(self, path_to_weights: str) -> dict[str, int | str] | None:
+        """
+        Restore the weights, the optimizer state and the position of a training.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices the checkpoints were
+            written to.
+
+        Returns
+        -------
+        dict[str, int | str] | None
+            The position from which the training continues (epoch, index within
+            the order of the epoch, seed, sampling and the checksums of the files).
+            None if there is no checkpoint, then nothing is restored.
+
+        Raises
+        ------
+        ValueError
+            If the weights or the state of the optimizer don't belong to the
+            position, because the training stopped while writing a checkpoint.
+
+        """
+        # Get the path of the position file
+        path_to_position: str = CheckpointWriter.get_position_path(path_to_weights)
+
+        if not pathlib.Path(path_to_position).is_file():
+            return None
+
+        # Check that the weights and the state of the optimizer belong to the position
+        position: dict[str, int | str] = CheckpointWriter.read_position(
+            path_to_position)
+        if not CheckpointWriter.is_complete(path_to_weights, position):
+            raise ValueError("The checkpoint of '" + path_to_weights
+                             + "' is incomplete, it can't be resumed.")
+
+        # Set the CSV field size limit, a weight matrix is one large field
+        NeuralNetwork.set_csv_field_size()
+
+        # Restore the weights and the state of the optimizer
+        self.set_weight_matrices(NeuralNetwork.create_weights_from_csv(
+            path_to_weights), False)
+        if position["optimizer_checksum"] != -1:
+            self.read_optimizer_state(path_to_weights)
+
+        return position
+
+    def get_training_start(
+            self, sampler: IndexSampler, path_to_csv_file: str, resume: bool
+    ) -> tuple[IndexSampler, int, int]:
+        """
+        Return the sampler and the position from which the training starts.
+
+        Parameters
+        ----------
+        sampler: IndexSampler
+            The sampler of the order of the images of a new training.
+        path_to_csv_file: str
+            Path to the CSV file of the weight matrices the checkpoints are written
+            to.
+        resume: bool
+            Whether to continue the training from the last checkpoint.
+
+        Returns
+        -------
+        tuple[IndexSampler, int, int]
+            The sampler, the epoch and the index within the order of the epoch.
+            If a checkpoint is resumed, its weights and optimizer state are
+            restored and its sampler and position are returned, otherwise the
+            given sampler and the beginning of the training.
+
+        """
+        # Continue from the position of the last checkpoint
+        position: dict[str, int | str] | None = (
+            self.resume_training(path_to_csv_file) if resume else None)
+        if position is None:
+            return sampler, 0, 0
+
+        seed: int | str = position["seed"]
+
+        return (IndexSampler(str(position["sampling"]),
+                             seed if isinstance(seed, int) else None),
+                int(position["epoch"]), int(position["index"]))
+
     def train(
-            self, training_data: list[Image], learning_rate: float,
-            path_to_csv_file: str
+            self, training_data: Sequence[Image], learning_rate: float,
+            path_to_csv_file: str, batch_size: int = 1, epochs: int = 1,
+            seed: int | None = None, sampling: str | None = None,
+            checkpoint_images: int | None = None,
+            checkpoint_seconds: float | None = None, resume: bool = False
     ) -> None:
         """
-        Run one training iteration.
+        Run one or more training iterations.
 
         Parameters
         ----------
-        training_data: list[Image]
+        training_data: Sequence[Image]
             The (60.000) images that are used for training.
         learning_rate: float
             Factor that controls the change of the weights.
         path_to_csv_file: str
             Path to the CSV file in which the adjusted weight matrices shall be
             written to.
+        batch_size: int
+            Number of images that are run through the neural network at once. The
+            weight matrices are adjusted once per batch with the averaged changes.
+            A batch size of 1 adjusts the weight matrices after every image.
+        epochs: int
+            Number of passes over the training data.
+        seed: int | None
+            Seed of the order in which the images are visited.
+        sampling: str | None
+            How the images of each epoch are sampled ('sequential', 'shuffle',
+            'stratified' or 'balanced', see IndexSampler). If None, the images are
+            visited in the order of the training data without a seed and shuffled
+            with a seed.
+        checkpoint_images: int | None
+            Number of trained images after which a checkpoint is taken.
+        checkpoint_seconds: float | None
+            Number of seconds after which a checkpoint is taken.
+        resume: bool
+            Whether to continue the training from the last checkpoint written to
+            path_to_csv_file. The seed and the sampling of the checkpoint are used.
+            Without a checkpoint, the training starts from the beginning.
 
-        """
-        for count, single_image in enumerate(training_data):
-            # Print a message after one thousand images
-            if count % 1000 == 0 and count != 0:
-                print("Elapsed", count, "images.")
+        Raises
+        ------
+        ValueError
+            If the batch size or the number of epochs is smaller than 1.
 
-            # Calculate the output values at each layer
-            values_at_each_layer: list[list[float]] = self.detect_one_image(
-                single_image)
+        Notes
+        -----
+        Each epoch only creates an array of indices. The training data is neither
+        copied nor reordered, the batches are read from it by index.
 
-            # Calculate the error at each layer
-            errors_at_each_layer: list[list[float]] = self.calc_errors_at_each_layer(
-                single_image, values_at_each_layer)
+        A checkpoint consists of the weights, the state of the optimizer and the
+        position in the training data. It is written by a background thread into
+        path_to_csv_file and the files next to it, see CheckpointWriter. The
+        training only copies the weight matrices and the state buffers.
 
-            # Apply the changes to the weight matrices
-            self.adjust_weight_matrices(values_at_each_layer,
-                                        errors_at_each_layer, learning_rate)
+        """
+        # Check if the batch size and the number of epochs are valid
+        if batch_size < 1:
+            raise ValueError("The batch size has to be at least 1.")
+        if epochs < 1:
+            raise ValueError("The number of epochs has to be at least 1.")
+
+        # Get the sampler of the order of the images and the position from which
+        # the training starts
+        sampler, start_epoch, start_index = self.get_training_start(
+            IndexSampler(sampling or ("sequential" if seed is None else "shuffle"),
+                         seed), path_to_csv_file, resume)
+
+        # Start the background thread writing the checkpoints
+        checkpoint_writer: CheckpointWriter | None = None
+        if checkpoint_images is not None or checkpoint_seconds is not None:
+            checkpoint_writer = CheckpointWriter(
+                path_to_csv_file, NeuralNetwork.write_weights, checkpoint_images,
+                checkpoint_seconds)
+
+        # Get the cached output values of the input layer
+        input_layer_cache: InputLayerCache = self.get_input_layer_cache(
+            training_data, False)
+
+        for epoch in range(start_epoch, epochs):
+            # Get the order of the images of the epoch
+            indices: range | array = sampler.epoch_indices(training_data, epoch)
+
+            for count in range(start_index if epoch == start_epoch else 0,
+                               len(indices), batch_size):
+                # Print a message after one thousand images
+                if count // 1000 > (count - batch_size) // 1000 and count != 0:
+                    print("Elapsed", count, "images.")
+
+                # Train the neural network with the images of the current batch
+                batch_indices: range | array = indices[count:count + batch_size]
+                self.train_batch(
+                    [training_data[index] for index in batch_indices], learning_rate,
+                    input_layer_cache.get_input_values(batch_indices))
+
+                # Take a checkpoint after the given number of images or seconds
+                if checkpoint_writer is not None and checkpoint_writer.count_images(
+                        len(batch_indices)):
+                    self.submit_checkpoint(checkpoint_writer, sampler, epoch,
+                                           count + len(batch_indices))
+
+        if checkpoint_writer is not None:
+            # Write the final checkpoint and wait for the background thread
+            self.submit_checkpoint(checkpoint_writer, sampler, epochs, 0)
+            checkpoint_writer.close()
+            return
 
         # Write the adjusted weights into the csv file
-        NeuralNetwork.write_weights(path_to_csv_file, self.get_weight_matrices())
+        NeuralNetwork.write_weights(path_to_csv_file,
+                                    self.get_weight_matrices_as_lists())
+
+        # Write the state of the optimizer next to the weights to resume training
+        self.write_optimizer_state(path_to_csv_file)
+
+    def predict_batch(
+            self, images: Sequence[Image]
+    ) -> tuple[list[int], list[list[float]]]:
+        """
+        Run a block of images through the neural network and return the predictions.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images that are being run through the neural network.
 
-    def test(self, testing_data: list[Image]) -> int:
+        Returns
+        -------
+        labels: list[int]
+            The guessed number for each image.
+        probabilities: list[list[float]]
+            The output values of the output layer for each image. Values are in range
+            of [0; 1].
+
+        Notes
+        -----
+        If the neural network has a prediction cache, only the images that aren't
+        cached are run through the neural network (still at once).
+
+        """
+        # Get the prediction cache
+        prediction_cache: PredictionCache | None = self.get_prediction_cache()
+
+        if prediction_cache is None:
+            return self.predict_input_values(self.transform_input_layer(
+                images, self.get_approximate_inference()))
+
+        # Look up the result of each image
+        keys: list[tuple] = [
+            PredictionCache.create_key(
+                self.get_backend(), image.get_pixels(), self.get_weight_version(),
+                "predict")
+            for image in images]
+        cached_results: list[tuple[int, list[float]] | None] = [
+            prediction_cache.get(key) for key in keys]
+
+        # Run the images that aren't cached through the neural network at once
+        missing: list[int] = [
+            index for index, result in enumerate(cached_results) if result is None]
+        if missing:
+            labels, probabilities = self.predict_input_values(
+                self.transform_input_layer([images[index] for index in missing],
+                                           self.get_approximate_inference()))
+            for index, label, values in zip(missing, labels, probabilities):
+                cached_results[index] = (label, values)
+                prediction_cache.put(keys[index], (label, values))
+
+        # Every image has a result now
+        results: list[tuple[int, list[float]]] = [
+            result for result in cached_results if result is not None]
+
+        return ([label for label, _ in results],
+                [values for _, values in results])
+
+    def predict_input_values(
+            self, input_values: list[list[float]]
+    ) -> tuple[list[int], list[list[float]]]:
+        """
+        Return the predictions for already calculated output values of the input layer.
+
+        Parameters
+        ----------
+        input_values: list[list[float]]
+            Output values of the input layer. One column per image.
+
+        Returns
+        -------
+        labels: list[int]
+            The guessed number for each image.
+        probabilities: list[list[float]]
+            The output values of the output layer for each image.
+
+        """
+        # Calculate the output values at the output layer for all images at once
+        values_at_output_layer: list[float] = self.forward_pass(input_values)[-1]
+
+        # Get the index of the max value of each column
+        labels: list[int] = self.get_backend().argmax(values_at_output_layer)
+
+        # Convert the columns of the output values into one list per image
+        probabilities: list[list[float]] = self.get_backend().to_lists(
+            self.get_backend().invert(values_at_output_layer))
+
+        return labels, probabilities
+
+    def count_correct_images(
+            self, images: Sequence[Image], input_values: list[list[float]] | None = None
+    ) -> int:
+        """
+        Return the number of correctly guessed images of a block.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images of the block.
+        input_values: list[list[float]] | None
+            Already calculated output values of the input layer for the images. If
+            None, they are calculated from the pixels.
+
+        Returns
+        -------
+        int
+            Number of correctly guessed images.
+
+        """
+        # Guess the numbers of all images of the block
+        if input_values is None:
+            labels: list[int] = self.predict_batch(images)[0]
+        else:
+            labels = self.predict_input_values(input_values)[0]
+
+        # Count the correctly guessed images
+        return sum(label == single_image.get_actual_number()
+                   for label, single_image in zip(labels, images))
+
+    @staticmethod
+    def initialize_test_worker(
+        dimensions: list[tuple[int, int]], weight_matrices: list[list[list[float]]],
+        backend: str, activations: list[Activation], approximate_inference: bool
+    ) -> None:
+        """
+        Create the neural network of a test worker process.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        weight_matrices: list[list[list[float]]]
+            The weight matrices of the neural network. They are loaded once per
+            worker process.
+        backend: str
+            Name of the compute backend.
+        activations: list[Activation]
+            The activation function of each layer.
+        approximate_inference: bool
+            Whether the lookup tables of the activation functions are used.
+
+        """
+        test_worker_net: NeuralNetwork = NeuralNetwork(
+            dimensions, weight_matrices, backend, activations)
+        test_worker_net.set_approximate_inference(approximate_inference)
+        TEST_WORKER_NETS["worker"] = test_worker_net
+
+    @staticmethod
+    def test_shard(images: Sequence[Image]) -> tuple[int, int]:
+        """
+        Test one shard of images inside a test worker process.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images of the shard.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of correctly guessed images and number of images of the shard.
+
+        """
+        return TEST_WORKER_NETS["worker"].count_correct_images(images), len(images)
+
+    def test(
+            self, testing_data: Iterable[Image] | Iterable[Sequence[Image]],
+            block_size: int = 1000, workers: int = 1
+    ) -> int:
         """
         Test the accuracy of the neural network.
 
         Parameters
         ----------
-        testing_data: list[Image]
-            The (10.000) images that are used for testing.
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+            The (10.000) images that are used for testing. If they aren't a sequence
+            of images (e.g. Image.iterate_images_from_csv or blocks of images), they
+            are tested in one pass while they are read, see test_stream.
+        block_size: int
+            Number of images that are run through the neural network at once.
+        workers: int
+            Number of worker processes. If more than one, the blocks are split
+            across a process pool and the counts of the workers are merged.
 
         Returns
         -------
         correct_images: int
             Number of correctly guessed images.
 
+        Raises
+        ------
+        ValueError
+            If the block size or the number of workers is smaller than 1.
+
         """
+        # Check if the block size and the number of workers are valid
+        if block_size < 1:
+            raise ValueError("The block size has to be at least 1.")
+        if workers < 1:
+            raise ValueError("The number of workers has to be at least 1.")
+
+        # Test a stream of images (or of blocks of images) while it is read
+        if not NeuralNetwork.is_image_sequence(testing_data):
+            return self.test_stream(testing_data, block_size, workers)
+
+        # Split the testing data into blocks
+        blocks: list[Sequence[Image]] = [
+            testing_data[count:count + block_size]
+            for count in range(0, len(testing_data), block_size)]
+
         # Initialize the return value
         correct_images: int = 0
+        count: int = 0
+
+        if workers == 1:
+            # Get the cached output values of the input layer
+            input_layer_cache: InputLayerCache = self.get_input_layer_cache(
+                testing_data, self.get_approximate_inference())
+
+            for block in blocks:
+                # Print a message after one thousand images
+                if count // 1000 > (count - block_size) // 1000 and count != 0:
+                    print("Elapsed", count, "images.")
+
+                correct_images += self.count_correct_images(
+                    block, input_layer_cache.get_input_values(
+                        range(count, count + len(block))))
+                count += len(block)
+
+            return correct_images
+
+        with multiprocessing.Pool(
+            workers, initializer=NeuralNetwork.initialize_test_worker,
+            initargs=(self.get_dimensions(), self.get_weight_matrices_as_lists(),
+                      self.get_backend().name, self.get_activations(),
+                      self.get_approximate_inference())
+        ) as pool:
+            # Merge the counts of the workers as soon as they are finished
+            for correct_images_of_shard, images_of_shard in pool.imap_unordered(
+                    NeuralNetwork.test_shard, blocks):
+                # Print a message after one thousand images
+                if (count + images_of_shard) // 1000 > count // 1000:
+                    print("Elapsed", count + images_of_shard, "images.")
+
+                correct_images += correct_images_of_shard
+                count += images_of_shard
 
-        for count, single_image in enumerate(testing_data):
-            # Print a message after one thousand images
-            if count % 1000 == 0 and count != 0:
-                print("Elapsed", count, "images.")
+        return correct_images
 
-            # Calculate the output values at each layer
-            values_at_each_layer: list[list[float]] = self.detect_one_image(
-                single_image)
+    @staticmethod
+    def is_image_sequence(
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+    ) -> TypeGuard[Sequence[Image]]:
+        """
+        Check whether the testing data is a sequence of single images.
+
+        Parameters
+        ----------
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+            The images or blocks of images that are used for testing.
+
+        Returns
+        -------
+        bool
+            True if the testing data is a sequence, whose (first) elements are
+            images and not blocks of images.
+
+        """
+        return isinstance(testing_data, Sequence) and all(
+            isinstance(image, Image) for image in testing_data[:1])
+
+    @staticmethod
+    def split_into_blocks(
+        images: Iterable[Image], block_size: int
+    ) -> Iterator[list[Image]]:
+        """
+        Split a stream of images into blocks while it is read.
 
-            if self.guessed_image_is_correct(
-                single_image, values_at_each_layer[len(values_at_each_layer) - 1]
-            ):
-                correct_images += 1
+        Parameters
+        ----------
+        images: Iterable[Image]
+            The images.
+        block_size: int
+            Number of images per block.
+
+        Yields
+        ------
+        list[Image]
+            The next block of images (the last block may be smaller).
+
+        """
+        images = iter(images)
+
+        while block := list(islice(images, block_size)):
+            yield block
+
+    def test_stream(
+            self, testing_data: Iterable[Image] | Iterable[Sequence[Image]],
+            block_size: int = 1000, workers: int = 1
+    ) -> int:
+        """
+        Test the accuracy on a stream of images in one pass.
+
+        Parameters
+        ----------
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+            The images, yielded one by one (e.g. Image.iterate_images_from_csv) or
+            already in blocks (e.g. Image.iterate_image_batches_from_csv).
+        block_size: int
+            Number of images that are run through the neural network at once, if the
+            images are yielded one by one.
+        workers: int
+            Number of worker processes. If more than one, two blocks per worker are
+            tested at the same time while the next blocks are read.
+
+        Returns
+        -------
+        correct_images: int
+            Number of correctly guessed images.
+
+        Notes
+        -----
+        Each block is tested as soon as it is read, so the testing overlaps with
+        reading the images and only a few blocks are held in memory at any time.
+        The output values of the input layer aren't cached, since every image is
+        only seen once.
+
+        """
+        # Get the first element to check whether the images are already in blocks
+        elements: Iterator[Image | Sequence[Image]] = iter(testing_data)
+        first: Image | Sequence[Image] | None = next(elements, None)
+        if first is None:
+            return 0
+
+        # The elements are all of one kind, the isinstance checks narrow their type
+        blocks: Iterator[Sequence[Image]]
+        if isinstance(first, Image):
+            blocks = NeuralNetwork.split_into_blocks(
+                (image for image in chain([first], elements)
+                 if isinstance(image, Image)), block_size)
+        else:
+            blocks = (block for block in chain([first], elements)
+                      if not isinstance(block, Image))
+
+        # Initialize the return value
+        correct_images: int = 0
+        count: int = 0
+
+        if workers == 1:
+            for block in blocks:
+                correct_images += self.count_correct_images(block)
+
+                # Print a message after one thousand images
+                if (count + len(block)) // 1000 > count // 1000:
+                    print("Elapsed", count + len(block), "images.")
+                count += len(block)
+
+            return correct_images
+
+        with multiprocessing.Pool(
+            workers, initializer=NeuralNetwork.initialize_test_worker,
+            initargs=(self.get_dimensions(), self.get_weight_matrices_as_lists(),
+                      self.get_backend().name, self.get_activations(),
+                      self.get_approximate_inference())
+        ) as pool:
+            # Keep two blocks per worker in flight, so reading never runs ahead
+            pending: deque = deque()
+
+            # None marks the end of the blocks
+            shard: Sequence[Image] | None
+            for shard in chain(blocks, [None]):
+                if shard is not None:
+                    pending.append(
+                        pool.apply_async(NeuralNetwork.test_shard, (shard,)))
+
+                # Merge the counts of the oldest blocks (of all blocks at the end)
+                while pending and (shard is None or len(pending) >= 2 * workers):
+                    correct_images_of_shard, images_of_shard = (
+                        pending.popleft().get())
+                    if (count + images_of_shard) // 1000 > count // 1000:
+                        print("Elapsed", count + images_of_shard, "images.")
+                    correct_images += correct_images_of_shard
+                    count += images_of_shard
 
         return correct_images
 
+    @staticmethod
+    def latency_report(
+        dimensions: list[tuple[int, int]], weight_matrices: list[list[list[float]]],
+        image: Image, backends: list[str], repetitions: int = 100
+    ) -> list[dict[str, float | str]]:
+        """
+        Measure latency & memory of detect_one_image for several backends.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        weight_matrices: list[list[list[float]]]
+            The weight matrices of the neural network as nested lists.
+        image: Image
+            The image that is detected.
+        backends: list[str]
+            Names of the compute backends that are measured.
+        repetitions: int
+            Number of times the image is detected per backend.
+
+        Returns
+        -------
+        report: list[dict[str, float | str]]
+            One entry per backend with its name, the mean latency of detect_one_image in
+            milliseconds and the memory allocated by the neural network (weight
+            matrices and scratch buffers) in kilobytes.
+
+        """
+        # Initialize the return value
+        report: list[dict[str, float | str]] = []
+
+        for backend in backends:
+            # Measure the memory allocated while creating the neural network. The
+            # values are copied, so no float objects are shared with the given lists
+            tracemalloc.start()
+            neural_net: NeuralNetwork = NeuralNetwork(dimensions, [
+                [[value + 0.0 for value in row] for row in weight_matrix]
+                for weight_matrix in weight_matrices], backend)
+            memory: int = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            # Measure the mean latency of detecting one image
+            start_time: float = time.perf_counter()
+            for _ in range(repetitions):
+                neural_net.detect_one_image(image)
+            latency: float = (time.perf_counter() - start_time) / repetitions
+
+            measurement: dict[str, float] = {
+                "latency_ms": latency * 1000, "memory_kb": memory / 1024}
+
+            # Print the measurement
+            print("Backend:", backend,
+                  "\tLatency (ms):", round(measurement["latency_ms"], 3),
+                  "\tMemory (KB):", round(measurement["memory_kb"], 1))
+
+            report.append({"backend": backend, **measurement})
+
+        return report
+
+    def prune_first_layer(
+            self, threshold: float | None = None, top_k: int | None = None
+    ) -> SparseMatrix:
+        """
+        Prune the first weight matrix and use it in CSR form for inference.
+
+        Parameters
+        ----------
+        threshold: float | None
+            Weights whose absolute value is below the threshold are set to zero.
+        top_k: int | None
+            Number of weights of largest absolute value that are kept per row.
+
+        Returns
+        -------
+        sparse_first_layer: SparseMatrix
+            The pruned first weight matrix in CSR form.
+
+        Notes
+        -----
+        The pruned weights are set to zero in the dense weight matrix as well, so
+        training (and testing with worker processes) sees the same weights. The
+        training updates all weights, so it discards the sparse weight matrix.
+
+        """
+        # Prune the first weight matrix
+        sparse_first_layer: SparseMatrix = SparseMatrix.prune(
+            self.get_backend().to_lists(self.get_weight_matrices()[0]),
+            threshold, top_k)
+
+        # Set the pruned weights to zero in the dense weight matrix
+        self.set_weight_matrices(
+            [sparse_first_layer.to_lists()] + self.get_weight_matrices()[1:])
+
+        # Use the sparse weight matrix for inference
+        self.set_sparse_first_layer(sparse_first_layer)
+
+        return sparse_first_layer
+
+    @staticmethod
+    def pruning_report(
+        neural_net: NeuralNetwork, testing_data: list[Image], image: Image,
+        thresholds: list[float] | None = None, top_ks: list[int] | None = None,
+        repetitions: int = 100
+    ) -> list[dict[str, float | str]]:
+        """
+        Measure sparsity, speedup & accuracy of several prunings.
+
+        Every pruning starts from the current weight matrices of the given neural
+        network, which aren't changed.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The trained neural network.
+        testing_data: list[Image]
+            The images that are used to measure the accuracy and the batched
+            inference.
+        image: Image
+            The image whose detection is timed.
+        thresholds: list[float] | None
+            Thresholds that are measured.
+        top_ks: list[int] | None
+            Numbers of weights kept per row that are measured.
+        repetitions: int
+            Number of times the image is detected per pruning.
+
+        Returns
+        -------
+        report: list[dict[str, float | str]]
+            One entry per pruning with its name, the sparsity of the first weight
+            matrix, the
+            speedup of detect_one_image and of the batched test, the accuracy and
+            the accuracy delta. The first entry is the unpruned neural network.
+
+        """
+        # Get the initial weight matrices to start each pruning from them
+        weight_matrices: list[list[list[float]]] = (
+            neural_net.get_weight_matrices_as_lists())
+
+        # Collect the prunings, None is the unpruned neural network
+        prunings: list[tuple[str, float | None, int | None]] = [("none", None, None)]
+        prunings += [("threshold " + str(threshold), threshold, None)
+                     for threshold in thresholds or []]
+        prunings += [("top_k " + str(top_k), None, top_k) for top_k in top_ks or []]
+
+        # Initialize the return value and the measurements of the unpruned network
+        report: list[dict[str, float | str]] = []
+        unpruned: dict[str, float] | None = None
+
+        for name, threshold, top_k in prunings:
+            pruned_net: NeuralNetwork = NeuralNetwork(
+                neural_net.get_dimensions(), weight_matrices,
+                neural_net.get_backend().name, neural_net.get_activations())
+
+            # Prune the first weight matrix
+            sparsity: float = 0.0
+            if name != "none":
+                sparsity = pruned_net.prune_first_layer(
+                    threshold, top_k).get_sparsity()
+
+            # Measure the mean latency of detecting one image
+            start_time: float = time.perf_counter()
+            for _ in range(repetitions):
+                pruned_net.detect_one_image(image)
+            latency: float = (time.perf_counter() - start_time) / repetitions
+
+            # Measure the accuracy and the duration of the batched inference
+            start_time = time.perf_counter()
+            accuracy: float = pruned_net.test(testing_data) / len(testing_data)
+            test_duration: float = time.perf_counter() - start_time
+
+            measurement: dict[str, float] = {
+                "sparsity": sparsity, "latency_ms": latency * 1000,
+                "test_duration_s": test_duration, "accuracy": accuracy}
+            if unpruned is None:
+                unpruned = measurement
+            measurement["speedup"] = unpruned["latency_ms"] / (latency * 1000)
+            measurement["batch_speedup"] = unpruned["test_duration_s"] / test_duration
+            measurement["accuracy_delta"] = accuracy - unpruned["accuracy"]
+
+            # Print the measurement
+            print("Pruning:", name,
+                  "\tSparsity:", round(measurement["sparsity"], 3),
+                  "\tSpeedup:", round(measurement["speedup"], 2),
+                  "\tBatch speedup:", round(measurement["batch_speedup"], 2),
+                  "\tAccuracy:", round(measurement["accuracy"], 4),
+                  "\tDelta:", round(measurement["accuracy_delta"], 4))
+
+            report.append({"pruning": name, **measurement})
+
+        return report
+
     @staticmethod
     def set_csv_field_size() -> None:
         """
@@ -0,0 +1,92 @@
+"""File containing the NeuralNetworkInterface protocol."""
+
+# Import used types
+from collections.abc import Iterable, Sequence
+from typing import Protocol
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+
+class NeuralNetworkInterface(Protocol):
+    """
+    A protocol of the methods the user interface calls on a neural network.
+
+    NeuralNetwork implements it, and so does LazyNeuralNetwork, which reads the
+    weights on first use.
+
+    Methods
+    -------
+    get_backend
+        Return the compute backend of the neural network.
+    detect_one_image
+        Run one image through the neural network and return the values at each layer.
+    train
+        Train the neural network and write the adjusted weights.
+    test
+        Test the accuracy of the neural network.
+
+    """
+
+    def get_backend(self) -> Backend:
+        """
+        Return the compute backend of the neural network.
+
+        Returns
+        -------
+        backend: Backend
+            The compute backend of the neural network.
+
+        """
+
+    def detect_one_image(self, image: Image) -> list[list[float]]:
+        """
+        Run one image through the neural network and return the values at each layer.
+
+        Parameters
+        ----------
+        image: Image
+            The image that is run through the neural network.
+
+        Returns
+        -------
+        values_at_each_layer: list[list[float]]
+            Output values at each layer.
+
+        """
+
+    def train(
+            self, training_data: Sequence[Image], learning_rate: float,
+            path_to_csv_file: str
+    ) -> None:
+        """
+        Train the neural network and write the adjusted weights.
+
+        Parameters
+        ----------
+        training_data: Sequence[Image]
+            The images that are used for training.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        path_to_csv_file: str
+            Path to the CSV file in which the adjusted weight matrices are written.
+
+        """
+
+    def test(
+            self, testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+    ) -> int:
+        """
+        Test the accuracy of the neural network.
+
+        Parameters
+        ----------
+        testing_data: Iterable[Image] | Iterable[Sequence[Image]]
+            The images (or blocks of images) that are used for testing.
+
+        Returns
+        -------
+        correct_images: int
+            Number of correctly guessed images.
+
+        """
@@ -0,0 +1,922 @@
+"""File containing the optimizers that adjust the weight matrices."""
+
+# Import necessary for the create method
+from __future__ import annotations
+
+# Import used Python libraries
+import ast
+import copy
+import csv
+import math
+import pathlib
+
+# Import used types
+from csv import DictReader
+import _csv
+
+# Import used classes
+from classes.backend import Backend
+
+class Optimizer:
+    """
+    A class representing the update rule of the weight matrices.
+
+    The optimizer keeps its state (e.g. velocities or moments) in buffers with the
+    dimensions of the weight matrices. They are allocated once and then updated in
+    place by the kernels of the compute backend.
+
+    Attributes
+    ----------
+    name: str
+        Name under which the optimizer can be selected.
+    step: int
+        Number of updates done so far.
+    state: list[list]
+        The state buffers of the optimizer. One list per kind of state holding one
+        matrix per weight matrix.
+
+    Methods
+    -------
+    create
+        Create the optimizer with the given name.
+    set_step
+        Set the number of updates done so far.
+    set_state
+        Set the state buffers of the optimizer.
+    get_step
+        Return the number of updates done so far.
+    get_state
+        Return the state buffers of the optimizer.
+    get_state_count
+        Return the number of kinds of state the optimizer keeps.
+    initialize
+        Allocate the state buffers for the given weight matrices.
+    prepare_update
+        Allocate the state buffers if necessary and count the update.
+    update
+        Adjust the weight matrices in place with the errors at each layer.
+    update_layer
+        Adjust one weight matrix in place.
+    apply_gradients
+        Adjust the weight matrices in place with given gradients.
+    apply_gradient
+        Adjust one weight matrix in place with its gradient.
+    snapshot
+        Return a copy of the optimizer with copies of the state buffers.
+    get_state_path
+        Return the path of the state file belonging to a weights file.
+    write_state
+        Write the step and the state buffers into a CSV file.
+    read_state
+        Read the step and the state buffers from a CSV file.
+
+    """
+
+    name: str = ""
+
+    def __init__(self) -> None:
+        """Construct one Optimizer object without any state."""
+        self.set_step(0)
+        self.set_state([])
+
+    @staticmethod
+    def create(name: str) -> Optimizer:
+        """
+        Create the optimizer with the given name and its default parameters.
+
+        Parameters
+        ----------
+        name: str
+            Name of the optimizer ('sgd', 'momentum', 'nesterov' or 'adam').
+
+        Returns
+        -------
+        optimizer: Optimizer
+            The created optimizer.
+
+        Raises
+        ------
+        ValueError
+            If the name is unknown.
+
+        """
+        for optimizer_class in (SGD, Momentum, Nesterov, Adam):
+            if optimizer_class.name == name:
+                return optimizer_class()
+
+        raise ValueError("The optimizer '" + name + "' is unknown.")
+
+    def set_step(self, step: int) -> None:
+        """
+        Set the number of updates done so far.
+
+        Parameters
+        ----------
+        step: int
+            Number of updates done so far.
+
+        """
+        self.step: int = step
+
+    def set_state(self, state: list[list]) -> None:
+        """
+        Set the state buffers of the optimizer.
+
+        Parameters
+        ----------
+        state: list[list]
+            One list per kind of state holding one matrix per weight matrix.
+
+        """
+        self.state: list[list] = state
+
+    def get_step(self) -> int:
+        """
+        Return the number of updates done so far.
+
+        Returns
+        -------
+        step: int
+            Number of updates done so far.
+
+        """
+        return self.step
+
+    def get_state(self) -> list[list]:
+        """
+        Return the state buffers of the optimizer.
+
+        Returns
+        -------
+        state: list[list]
+            One list per kind of state holding one matrix per weight matrix.
+
+        """
+        return self.state
+
+    def get_state_count(self) -> int:
+        """
+        Return the number of kinds of state the optimizer keeps.
+
+        Returns
+        -------
+        int
+            0 for a stateless optimizer.
+
+        """
+        return 0
+
+    def initialize(self, backend: Backend, weight_matrices: list) -> None:
+        """
+        Allocate the state buffers for the given weight matrices.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            The weight matrices that are adjusted by the optimizer.
+
+        """
+        self.set_step(0)
+        self.set_state([[backend.zeros_like(weight_matrix)
+                         for weight_matrix in weight_matrices]
+                        for _ in range(self.get_state_count())])
+
+    def prepare_update(self, backend: Backend, weight_matrices: list) -> None:
+        """
+        Allocate the state buffers if necessary and count the update.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            The weight matrices that are changed.
+
+        """
+        # Allocate the state buffers if they don't belong to the weight matrices
+        if len(self.get_state()) != self.get_state_count() or any(
+                len(buffers) != len(weight_matrices) for buffers in self.get_state()):
+            self.initialize(backend, weight_matrices)
+
+        # Count the update
+        self.set_step(self.get_step() + 1)
+
+    def update(
+            self, backend: Backend, weight_matrices: list, update_buffers: list,
+            values_at_each_layer: list, errors_at_each_layer: list,
+            derivatives_at_each_layer: list, learning_rate: float
+    ) -> None:
+        """
+        Adjust the weight matrices in place with the errors at each layer.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            The weight matrices that are changed.
+        update_buffers: list
+            One scratch buffer per weight matrix created by create_update_buffer.
+        values_at_each_layer: list
+            Output values of each layer. One column per image.
+        errors_at_each_layer: list
+            Calculated error at each layer after the input layer.
+        derivatives_at_each_layer: list
+            Derivatives of the activation functions at each layer.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        self.prepare_update(backend, weight_matrices)
+
+        # Get the number of images whose changes are averaged
+        batch_size: int = backend.column_count(values_at_each_layer[0])
+
+        for i, weight_matrix in enumerate(weight_matrices):
+            self.update_layer(
+                backend, i, weight_matrix, update_buffers[i], values_at_each_layer[i],
+                errors_at_each_layer[i], derivatives_at_each_layer[i], learning_rate,
+                batch_size)
+
+    def update_layer(
+            self, backend: Backend, layer: int, weight_matrix, update_buffer,
+            values, errors, derivatives, learning_rate: float, batch_size: int
+    ) -> None:
+        """
+        Adjust one weight matrix in place.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its state buffers).
+        weight_matrix
+            The weight matrix that is changed.
+        update_buffer
+            Scratch buffer of the weight matrix.
+        values
+            Output values of the layer before the weight matrix.
+        errors
+            Errors at the outputs of the weight matrix.
+        derivatives
+            Derivatives at the outputs of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        batch_size: int
+            Number of images whose changes are averaged.
+
+        """
+        raise NotImplementedError
+
+    def apply_gradients(
+            self, backend: Backend, weight_matrices: list, gradients: list,
+            learning_rate: float
+    ) -> None:
+        """
+        Adjust the weight matrices in place with given gradients.
+
+        This is the update of training that calculates the gradients elsewhere,
+        e.g. in worker processes.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            The weight matrices that are changed.
+        gradients: list
+            Ek * f'(Ik) * Oj^T of each weight matrix averaged over the images of
+            the batch. They may be overwritten.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        self.prepare_update(backend, weight_matrices)
+
+        for i, (weight_matrix, gradient) in enumerate(zip(weight_matrices, gradients)):
+            self.apply_gradient(backend, i, weight_matrix, gradient, learning_rate)
+
+    def apply_gradient(
+            self, backend: Backend, layer: int, weight_matrix, gradient,
+            learning_rate: float
+    ) -> None:
+        """
+        Adjust one weight matrix in place with its gradient.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its state buffers).
+        weight_matrix
+            The weight matrix that is changed.
+        gradient
+            The averaged gradient of the weight matrix. It may be overwritten.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        raise NotImplementedError
+
+    def snapshot(self, backend: Backend) -> Optimizer:
+        """
+        Return a copy of the optimizer with copies of the state buffers.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the state buffers.
+
+        Returns
+        -------
+        Optimizer
+            The copy, which isn't changed by further updates of this optimizer.
+
+        """
+        # Copy the optimizer and replace its state by copies of the buffers
+        optimizer: Optimizer = copy.copy(self)
+        optimizer.set_state([[backend.from_lists(buffer) for buffer in buffers]
+                             for buffers in self.get_state()])
+
+        return optimizer
+
+    @staticmethod
+    def get_state_path(path_to_weights: str) -> str:
+        """
+        Return the path of the state file belonging to a weights file.
+
+        Parameters
+        ----------
+        path_to_weights: str
+            Path to the CSV file of the weight matrices.
+
+        Returns
+        -------
+        str
+            The path with '_optimizer' appended to the file name, e.g.
+            'altered_weights_optimizer.csv'.
+
+        """
+        path: pathlib.Path = pathlib.Path(path_to_weights)
+
+        return str(path.with_name(path.stem + "_optimizer" + path.suffix))
+
+    def write_state(self, backend: Backend, path_to_output: str) -> None:
+        """
+        Write the step and the state buffers into a CSV file.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the state buffers.
+        path_to_output: str
+            Path to the CSV file in which the state needs to be written.
+
+        """
+        with open(path_to_output, 'w', encoding='utf-8', newline='') as csv_file:
+            # Initialize the writer of the CSV file
+            csv_writer: _csv._writer = csv.writer(csv_file)
+
+            # Write the header
+            csv_writer.writerow(["optimizer", "step", "state"])
+
+            # Write one row per kind of state
+            for buffers in self.get_state():
+                csv_writer.writerow([self.name, self.get_step(), [
+                    backend.to_lists(buffer) for buffer in buffers]])
+
+    def read_state(self, backend: Backend, path_to_csv_file: str) -> None:
+        """
+        Read the step and the state buffers from a CSV file.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend the state buffers are converted to.
+        path_to_csv_file: str
+            Path to the CSV file that is read.
+
+        Raises
+        ------
+        ValueError
+            If the file was written by another optimizer.
+
+        Notes
+        -----
+        A state buffer is one large field, so the CSV field size limit has to be
+        raised before (see NeuralNetwork.set_csv_field_size).
+
+        """
+        # Initialize the state
+        state: list[list] = []
+        step: int = 0
+
+        with open(path_to_csv_file, 'r', encoding='utf-8') as csv_file:
+            # Initialize the reader of the CSV file
+            csv_reader: DictReader = csv.DictReader(csv_file)
+
+            # Read each kind of state
+            for row in csv_reader:
+                if row["optimizer"] != self.name:
+                    raise ValueError("The state belongs to the optimizer '"
+                                     + row["optimizer"] + "'.")
+
+                step = int(row["step"])
+                state.append([backend.from_lists(buffer, False)
+                              for buffer in ast.literal_eval(row["state"])])
+
+        if len(state) != self.get_state_count():
+            raise ValueError("The state doesn't match the optimizer.")
+
+        self.set_step(step)
+        self.set_state(state)
+
+
+class SGD(Optimizer):
+    """
+    A class representing stochastic gradient descent.
+
+    The weights are changed by W = W + Alpha * Ek * f'(Ik) * Oj^T.
+
+    """
+
+    name: str = "sgd"
+
+    def update_layer(
+            self, backend: Backend, layer: int, weight_matrix, update_buffer,
+            values, errors, derivatives, learning_rate: float, batch_size: int
+    ) -> None:
+        """
+        Adjust one weight matrix in place.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix.
+        weight_matrix
+            The weight matrix that is changed.
+        update_buffer
+            Scratch buffer of the weight matrix.
+        values
+            Output values of the layer before the weight matrix.
+        errors
+            Errors at the outputs of the weight matrix.
+        derivatives
+            Derivatives at the outputs of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        batch_size: int
+            Number of images whose changes are averaged.
+
+        """
+        # Calculate Alpha * Ek * f'(Ik) averaged over the images of the batch
+        gradient = backend.error_gradient(
+            errors, derivatives, learning_rate / batch_size)
+
+        # Add Alpha * Ek * f'(Ik) * Oj^T to the weight matrix in place
+        backend.add_matrix_product_in_place(
+            weight_matrix, gradient, values, update_buffer)
+
+    def apply_gradient(
+            self, backend: Backend, layer: int, weight_matrix, gradient,
+            learning_rate: float
+    ) -> None:
+        """
+        Adjust one weight matrix in place with its gradient.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix.
+        weight_matrix
+            The weight matrix that is changed.
+        gradient
+            The averaged gradient of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        backend.linear_combination_in_place(weight_matrix, 1.0, gradient, learning_rate)
+
+
+class Momentum(Optimizer):
+    """
+    A class representing gradient descent with momentum.
+
+    The change of each step is added to the decayed change of the prior steps:
+    V = Mu * V + Alpha * Ek * f'(Ik) * Oj^T and W = W + V.
+
+    Attributes
+    ----------
+    momentum: float
+        Factor by which the velocity of the prior steps decays (Mu).
+
+    """
+
+    name: str = "momentum"
+
+    def __init__(self, momentum: float = 0.9) -> None:
+        """
+        Construct one Momentum object with the given attributes.
+
+        Parameters
+        ----------
+        momentum: float
+            Factor by which the velocity of the prior steps decays.
+
+        """
+        super().__init__()
+        self.set_momentum(momentum)
+
+    def set_momentum(self, momentum: float) -> None:
+        """
+        Set the factor by which the velocity of the prior steps decays.
+
+        Parameters
+        ----------
+        momentum: float
+            Factor by which the velocity of the prior steps decays.
+
+        Raises
+        ------
+        ValueError
+            If the momentum isn't in range of [0; 1).
+
+        """
+        if not 0 <= momentum < 1:
+            raise ValueError("The momentum has to be in range of [0; 1).")
+
+        self.momentum: float = momentum
+
+    def get_momentum(self) -> float:
+        """
+        Return the factor by which the velocity of the prior steps decays.
+
+        Returns
+        -------
+        momentum: float
+            Factor by which the velocity of the prior steps decays.
+
+        """
+        return self.momentum
+
+    def get_state_count(self) -> int:
+        """
+        Return the number of kinds of state the optimizer keeps.
+
+        Returns
+        -------
+        int
+            1 for the velocities.
+
+        """
+        return 1
+
+    def update_layer(
+            self, backend: Backend, layer: int, weight_matrix, update_buffer,
+            values, errors, derivatives, learning_rate: float, batch_size: int
+    ) -> None:
+        """
+        Adjust one weight matrix in place.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its velocity).
+        weight_matrix
+            The weight matrix that is changed.
+        update_buffer
+            Scratch buffer of the weight matrix.
+        values
+            Output values of the layer before the weight matrix.
+        errors
+            Errors at the outputs of the weight matrix.
+        derivatives
+            Derivatives at the outputs of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        batch_size: int
+            Number of images whose changes are averaged.
+
+        """
+        # Calculate Alpha * Ek * f'(Ik) * Oj^T averaged over the images of the batch
+        change = backend.outer_product(backend.error_gradient(
+            errors, derivatives, learning_rate / batch_size), values, update_buffer)
+
+        # The learning rate is part of the change already
+        self.apply_gradient(backend, layer, weight_matrix, change, 1.0)
+
+    def apply_gradient(
+            self, backend: Backend, layer: int, weight_matrix, gradient,
+            learning_rate: float
+    ) -> None:
+        """
+        Update the velocity with the gradient of the current step and apply it.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its velocity).
+        weight_matrix
+            The weight matrix that is changed.
+        gradient
+            The averaged gradient of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Update the velocity V = Mu * V + Alpha * gradient in place
+        velocity = self.get_state()[0][layer]
+        backend.linear_combination_in_place(
+            velocity, self.get_momentum(), gradient, learning_rate)
+
+        backend.matrix_addition_in_place(weight_matrix, velocity)
+
+
+class Nesterov(Momentum):
+    """
+    A class representing gradient descent with Nesterov momentum.
+
+    The weights are moved by the change of the current step and by the velocity
+    looking one step ahead: W = W + change + Mu * V.
+
+    """
+
+    name: str = "nesterov"
+
+    def apply_gradient(
+            self, backend: Backend, layer: int, weight_matrix, gradient,
+            learning_rate: float
+    ) -> None:
+        """
+        Update the velocity and apply the change and the velocity looking ahead.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its velocity).
+        weight_matrix
+            The weight matrix that is changed.
+        gradient
+            The averaged gradient of the weight matrix. It is overwritten.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Update the velocity V = Mu * V + Alpha * gradient in place
+        velocity = self.get_state()[0][layer]
+        backend.linear_combination_in_place(
+            velocity, self.get_momentum(), gradient, learning_rate)
+
+        # Look one step ahead with Alpha * gradient + Mu * V
+        backend.linear_combination_in_place(
+            gradient, learning_rate, velocity, self.get_momentum())
+        backend.matrix_addition_in_place(weight_matrix, gradient)
+
+
+class Adam(Optimizer):
+    """
+    A class representing the Adam optimizer.
+
+    The weights are changed by the moving average of the gradient divided by the
+    root of the moving average of the squared gradient, so each weight gets its own
+    step size.
+
+    Attributes
+    ----------
+    beta_1: float
+        Decay of the moving average of the gradient.
+    beta_2: float
+        Decay of the moving average of the squared gradient.
+    epsilon: float
+        Value added to the root of the second moment to avoid a division by zero.
+    scratch_buffers: list
+        One additional scratch buffer per weight matrix.
+
+    """
+
+    name: str = "adam"
+
+    def __init__(
+            self, beta_1: float = 0.9, beta_2: float = 0.999, epsilon: float = 1e-8
+    ) -> None:
+        """
+        Construct one Adam object with the given attributes.
+
+        Parameters
+        ----------
+        beta_1: float
+            Decay of the moving average of the gradient.
+        beta_2: float
+            Decay of the moving average of the squared gradient.
+        epsilon: float
+            Value added to the root of the second moment to avoid a division by
+            zero.
+
+        """
+        super().__init__()
+        self.set_betas(beta_1, beta_2)
+        self.set_epsilon(epsilon)
+        self.set_scratch_buffers([])
+
+    def set_betas(self, beta_1: float, beta_2: float) -> None:
+        """
+        Set the decays of the moving averages.
+
+        Parameters
+        ----------
+        beta_1: float
+            Decay of the moving average of the gradient.
+        beta_2: float
+            Decay of the moving average of the squared gradient.
+
+        Raises
+        ------
+        ValueError
+            If a decay isn't in range of [0; 1).
+
+        """
+        if not (0 <= beta_1 < 1 and 0 <= beta_2 < 1):
+            raise ValueError("The decays have to be in range of [0; 1).")
+
+        self.beta_1: float = beta_1
+        self.beta_2: float = beta_2
+
+    def set_epsilon(self, epsilon: float) -> None:
+        """
+        Set the value added to the root of the second moment.
+
+        Parameters
+        ----------
+        epsilon: float
+            Value added to the root of the second moment.
+
+        Raises
+        ------
+        ValueError
+            If epsilon isn't positive.
+
+        """
+        if epsilon <= 0:
+            raise ValueError("Epsilon has to be positive.")
+
+        self.epsilon: float = epsilon
+
+    def set_scratch_buffers(self, scratch_buffers: list) -> None:
+        """
+        Set the additional scratch buffers of the weight matrices.
+
+        Parameters
+        ----------
+        scratch_buffers: list
+            One scratch buffer per weight matrix.
+
+        """
+        self.scratch_buffers: list = scratch_buffers
+
+    def get_betas(self) -> tuple[float, float]:
+        """
+        Return the decays of the moving averages.
+
+        Returns
+        -------
+        tuple[float, float]
+            Decay of the moving average of the gradient & of the squared gradient.
+
+        """
+        return self.beta_1, self.beta_2
+
+    def get_epsilon(self) -> float:
+        """
+        Return the value added to the root of the second moment.
+
+        Returns
+        -------
+        epsilon: float
+            Value added to the root of the second moment.
+
+        """
+        return self.epsilon
+
+    def get_scratch_buffers(self) -> list:
+        """
+        Return the additional scratch buffers of the weight matrices.
+
+        Returns
+        -------
+        scratch_buffers: list
+            One scratch buffer per weight matrix.
+
+        """
+        return self.scratch_buffers
+
+    def get_state_count(self) -> int:
+        """
+        Return the number of kinds of state the optimizer keeps.
+
+        Returns
+        -------
+        int
+            2 for the first and the second moments.
+
+        """
+        return 2
+
+    def prepare_update(self, backend: Backend, weight_matrices: list) -> None:
+        """
+        Allocate the state & scratch buffers if necessary and count the update.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        weight_matrices: list
+            The weight matrices that are changed.
+
+        """
+        # The scratch buffers have to match the weight matrices
+        if len(self.get_scratch_buffers()) != len(weight_matrices):
+            self.set_scratch_buffers([backend.create_update_buffer(weight_matrix)
+                                      for weight_matrix in weight_matrices])
+
+        super().prepare_update(backend, weight_matrices)
+
+    def update_layer(
+            self, backend: Backend, layer: int, weight_matrix, update_buffer,
+            values, errors, derivatives, learning_rate: float, batch_size: int
+    ) -> None:
+        """
+        Adjust one weight matrix in place.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its moments).
+        weight_matrix
+            The weight matrix that is changed.
+        update_buffer
+            Scratch buffer of the weight matrix.
+        values
+            Output values of the layer before the weight matrix.
+        errors
+            Errors at the outputs of the weight matrix.
+        derivatives
+            Derivatives at the outputs of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        batch_size: int
+            Number of images whose changes are averaged.
+
+        """
+        # Calculate Ek * f'(Ik) * Oj^T averaged over the images of the batch
+        gradient = backend.outer_product(backend.error_gradient(
+            errors, derivatives, 1 / batch_size), values, update_buffer)
+
+        self.apply_gradient(backend, layer, weight_matrix, gradient, learning_rate)
+
+    def apply_gradient(
+            self, backend: Backend, layer: int, weight_matrix, gradient,
+            learning_rate: float
+    ) -> None:
+        """
+        Adjust one weight matrix in place with its gradient.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend of the weight matrices.
+        layer: int
+            Index of the weight matrix (and of its moments).
+        weight_matrix
+            The weight matrix that is changed.
+        gradient
+            The averaged gradient of the weight matrix.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Correct the bias of the moments towards zero in the step size
+        beta_1, beta_2 = self.get_betas()
+        step_size: float = (learning_rate * math.sqrt(1 - beta_2 ** self.get_step())
+                            / (1 - beta_1 ** self.get_step()))
+
+        backend.adam_update_in_place(
+            weight_matrix, self.get_state()[0][layer], self.get_state()[1][layer],
+            gradient, beta_1, beta_2, step_size, self.get_epsilon(),
+            self.get_scratch_buffers()[layer])
@@ -0,0 +1,319 @@
+"""File containing the ParallelTrainer class."""
+
+# Import used Python libraries
+import time
+
+# Import used types
+from multiprocessing.pool import Pool
+
+# Import used classes
+from classes.activation import Activation
+from classes.image import Image
+from classes.multiprocess_trainer import MultiprocessTrainer
+from classes.neural_network import NeuralNetwork
+
+# The neural network of the current worker process, set by the pool initializer
+WORKER_NETS: dict[str, NeuralNetwork] = {}
+
+class ParallelTrainer(MultiprocessTrainer):
+    """
+    A class training a neural network data-parallel on multiple processes.
+
+    Each batch of images is split into one shard per worker process. Every worker
+    calculates the gradients for its shard with the current weight matrices. The
+    parent process sums up the gradients of all shards, lets the optimizer of the
+    neural network apply them and sends the updated weight matrices to the workers
+    together with the next batch.
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that is trained.
+    workers: int
+        Number of worker processes.
+
+    Methods
+    -------
+    split_into_shards
+        Split a batch of images into one shard per worker.
+    initialize_worker
+        Create the neural network of a worker process.
+    calc_shard_gradients
+        Calculate the gradients for one shard inside a worker process.
+    train_batch
+        Train the neural network with one batch of images using the worker pool.
+    train
+        Run one data-parallel training iteration.
+    scaling_report
+        Measure the scaling efficiency against the single-process training.
+
+    """
+
+    @staticmethod
+    def split_into_shards(batch: list[Image], shards: int) -> list[list[Image]]:
+        """
+        Split a batch of images into one shard per worker.
+
+        Parameters
+        ----------
+        batch: list[Image]
+            The images of the batch.
+        shards: int
+            Number of shards.
+
+        Returns
+        -------
+        list[list[Image]]
+            Contiguous shards whose sizes differ by at most one. Empty shards are
+            left out.
+
+        """
+        # Size of each shard and number of shards that get one additional image
+        shard_size, remainder = divmod(len(batch), shards)
+
+        # Initialize the return value
+        all_shards: list[list[Image]] = []
+        start: int = 0
+
+        for shard in range(shards):
+            end: int = start + shard_size + (1 if shard < remainder else 0)
+
+            # Leave out empty shards
+            if end > start:
+                all_shards.append(batch[start:end])
+
+            start = end
+
+        return all_shards
+
+    @staticmethod
+    def initialize_worker(
+        dimensions: list[tuple[int, int]], backend: str,
+        activations: list[Activation]
+    ) -> None:
+        """
+        Create the neural network of a worker process.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        backend: str
+            Name of the compute backend.
+        activations: list[Activation]
+            The activation function of each layer.
+
+        """
+        WORKER_NETS["worker"] = NeuralNetwork(dimensions, [], backend, activations)
+
+    @staticmethod
+    def calc_shard_gradients(
+        weight_matrices: list[list[list[float]]], shard: list[Image],
+        batch_size: int
+    ) -> list[list[list[float]]]:
+        """
+        Calculate the gradients for one shard inside a worker process.
+
+        Parameters
+        ----------
+        weight_matrices: list[list[list[float]]]
+            The current weight matrices broadcasted by the parent process.
+        shard: list[Image]
+            The images of the shard.
+        batch_size: int
+            Number of images of the whole batch, the gradients are averaged over.
+
+        Returns
+        -------
+        list[list[list[float]]]
+            The gradients of the images of the shard, each divided by the batch
+            size.
+
+        """
+        # Get the neural network of the worker process
+        worker_net: NeuralNetwork = WORKER_NETS["worker"]
+
+        # Use the broadcasted weight matrices, they are a fresh copy already
+        worker_net.set_weight_matrices(weight_matrices, False)
+
+        # Calculate the output values and the error at each layer
+        values_at_each_layer: list[list[float]] = worker_net.detect_images(
+            shard, True)
+        errors_at_each_layer: list[list[float]] = (
+            worker_net.calc_batch_errors_at_each_layer(shard, values_at_each_layer))
+
+        return worker_net.calc_weight_changes(
+            values_at_each_layer, errors_at_each_layer, 1 / batch_size)
+
+    def train_batch(
+            self, pool: Pool, batch: list[Image], learning_rate: float
+    ) -> None:
+        """
+        Train the neural network with one batch of images using the worker pool.
+
+        Parameters
+        ----------
+        pool: Pool
+            The pool of worker processes.
+        batch: list[Image]
+            The images of the batch.
+        learning_rate: float
+            Factor that controls the change of the weights.
+
+        """
+        # Get the neural network and its current weight matrices
+        neural_net: NeuralNetwork = self.get_neural_net()
+        weight_matrices: list[list[list[float]]] = neural_net.get_weight_matrices()
+
+        # Calculate the gradients of each shard in the worker processes
+        gradients_of_each_shard: list[list[list[list[float]]]] = pool.starmap(
+            ParallelTrainer.calc_shard_gradients,
+            [(weight_matrices, shard, len(batch)) for shard in
+             ParallelTrainer.split_into_shards(batch, self.get_workers())])
+
+        # Sum up the gradients of all shards, which averages them over the batch
+        gradients: list[list[list[float]]] = gradients_of_each_shard[0]
+        for shard_gradients in gradients_of_each_shard[1:]:
+            gradients = [
+                neural_net.get_backend().matrix_addition(summed_gradient, gradient)
+                for summed_gradient, gradient in zip(gradients, shard_gradients)]
+
+        # Let the optimizer of the neural network apply the averaged gradients
+        neural_net.apply_gradients(gradients, learning_rate)
+
+    def train(
+            self, training_data: list[Image], learning_rate: float,
+            path_to_csv_file: str, batch_size: int
+    ) -> None:
+        """
+        Run one data-parallel training iteration.
+
+        Parameters
+        ----------
+        training_data: list[Image]
+            The (60.000) images that are used for training.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        path_to_csv_file: str
+            Path to the CSV file in which the adjusted weight matrices shall be
+            written to.
+        batch_size: int
+            Number of images per batch. Each batch is split across the workers, so
+            it should be a multiple of the number of workers.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is smaller than 1.
+
+        """
+        # Check if the batch size is valid
+        if batch_size < 1:
+            raise ValueError("The batch size has to be at least 1.")
+
+        # Get the neural network
+        neural_net: NeuralNetwork = self.get_neural_net()
+
+        with self.create_pool(
+            ParallelTrainer.initialize_worker,
+            (neural_net.get_dimensions(), neural_net.get_backend().name,
+             neural_net.get_activations())
+        ) as pool:
+            for count in range(0, len(training_data), batch_size):
+                # Print a message after one thousand images
+                if count // 1000 > (count - batch_size) // 1000 and count != 0:
+                    print("Elapsed", count, "images.")
+
+                # Train the neural network with the images of the current batch
+                self.train_batch(
+                    pool, training_data[count:count + batch_size], learning_rate)
+
+        # Write the adjusted weights into the csv file
+        NeuralNetwork.write_weights(path_to_csv_file,
+                                    neural_net.get_weight_matrices_as_lists())
+
+        # Write the state of the optimizer next to the weights to resume training
+        neural_net.write_optimizer_state(path_to_csv_file)
+
+    @staticmethod
+    def scaling_report(
+        neural_net: NeuralNetwork, training_data: list[Image], learning_rate: float,
+        batch_size: int, worker_counts: list[int]
+    ) -> list[dict[str, float]]:
+        """
+        Measure the scaling efficiency against the single-process training.
+
+        Every measurement starts from the current weight matrices of the given
+        neural network, which aren't changed.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+        training_data: list[Image]
+            The images that are used for the measurement.
+        learning_rate: float
+            Factor that controls the change of the weights.
+        batch_size: int
+            Number of images per batch.
+        worker_counts: list[int]
+            Numbers of worker processes that are measured.
+
+        Returns
+        -------
+        report: list[dict[str, float]]
+            One entry per measurement with the number of workers, the images per
+            second, the speedup and the efficiency (speedup / workers). The first
+            entry is the single-process training with NeuralNetwork.train_batch.
+
+        """
+        # Get the initial weight matrices to start each measurement from them
+        weight_matrices: list[list[list[float]]] = (
+            neural_net.get_weight_matrices_as_lists())
+
+        # Measure the single-process training
+        serial_net: NeuralNetwork = NeuralNetwork(
+            neural_net.get_dimensions(), weight_matrices,
+            neural_net.get_backend().name, neural_net.get_activations())
+        start_time: float = time.perf_counter()
+        for count in range(0, len(training_data), batch_size):
+            serial_net.train_batch(
+                training_data[count:count + batch_size], learning_rate)
+        serial_rate: float = len(training_data) / (time.perf_counter() - start_time)
+
+        # Initialize the return value
+        report: list[dict[str, float]] = [{
+            "workers": 0, "images_per_second": serial_rate,
+            "speedup": 1.0, "efficiency": 1.0}]
+
+        # Measure the data-parallel training
+        for workers in worker_counts:
+            trainer: ParallelTrainer = ParallelTrainer(NeuralNetwork(
+                neural_net.get_dimensions(), weight_matrices,
+                neural_net.get_backend().name, neural_net.get_activations()),
+                workers)
+
+            with trainer.create_pool(
+                ParallelTrainer.initialize_worker,
+                (neural_net.get_dimensions(), neural_net.get_backend().name,
+                 neural_net.get_activations())
+            ) as pool:
+                start_time = time.perf_counter()
+                for count in range(0, len(training_data), batch_size):
+                    trainer.train_batch(
+                        pool, training_data[count:count + batch_size], learning_rate)
+                rate: float = len(training_data) / (time.perf_counter() - start_time)
+
+            report.append({
+                "workers": workers, "images_per_second": rate,
+                "speedup": rate / serial_rate,
+                "efficiency": rate / serial_rate / workers})
+
+        # Print the report
+        for entry in report:
+            print("Workers:", entry["workers"] or "single process",
+                  "\tImages/s:", round(entry["images_per_second"], 1),
+                  "\tSpeedup:", round(entry["speedup"], 2),
+                  "\tEfficiency:", round(entry["efficiency"], 2))
+
+        return report
@@ -0,0 +1,247 @@
+"""File containing the PredictionCache class."""
+
+# Import used Python libraries
+import hashlib
+import time
+from collections import OrderedDict
+
+# Import used classes
+from classes.backend import Backend
+
+class PredictionCache:
+    """
+    A class memoizing results of the neural network for identical images.
+
+    The key of a result is a hash of the pixels quantized to bytes together with
+    the weight version of the neural network (which changes with every change of
+    the weights) and the kind of the result. Results of older weights are
+    therefore never returned and are evicted like any other unused entry.
+
+    The cache holds at most 'capacity' results and evicts the least recently used
+    one first. Results older than the time to live are discarded when they're
+    looked up.
+
+    Attributes
+    ----------
+    capacity: int
+        Largest number of cached results.
+    time_to_live: float | None
+        Number of seconds a result is valid. None keeps results until evicted.
+    entries: OrderedDict
+        The cached results with the time they were added, least recently used first.
+    stats: dict[str, int]
+        Number of hits, misses, evictions and expirations.
+
+    Methods
+    -------
+    set_capacity
+        Set the largest number of cached results.
+    set_time_to_live
+        Set the number of seconds a result is valid.
+    get_capacity
+        Return the largest number of cached results.
+    get_time_to_live
+        Return the number of seconds a result is valid.
+    get_stats
+        Return the hit & miss statistics of the cache.
+    create_key
+        Create the key of the result of one image.
+    get
+        Return the cached result of a key.
+    put
+        Add a result to the cache.
+    clear
+        Remove all results and reset the statistics.
+
+    """
+
+    def __init__(
+            self, capacity: int = 10000, time_to_live: float | None = None
+    ) -> None:
+        """
+        Construct one empty PredictionCache object.
+
+        Parameters
+        ----------
+        capacity: int
+            Largest number of cached results.
+        time_to_live: float | None
+            Number of seconds a result is valid. None keeps results until evicted.
+
+        """
+        self.set_capacity(capacity)
+        self.set_time_to_live(time_to_live)
+        self.clear()
+
+    def set_capacity(self, capacity: int) -> None:
+        """
+        Set the largest number of cached results.
+
+        Parameters
+        ----------
+        capacity: int
+            Largest number of cached results.
+
+        Raises
+        ------
+        ValueError
+            If the capacity is smaller than 1.
+
+        """
+        if capacity < 1:
+            raise ValueError("The capacity has to be at least 1.")
+
+        self.capacity: int = capacity
+
+    def set_time_to_live(self, time_to_live: float | None) -> None:
+        """
+        Set the number of seconds a result is valid.
+
+        Parameters
+        ----------
+        time_to_live: float | None
+            Number of seconds a result is valid. None keeps results until evicted.
+
+        Raises
+        ------
+        ValueError
+            If the time to live isn't positive.
+
+        """
+        if time_to_live is not None and time_to_live <= 0:
+            raise ValueError("The time to live has to be positive.")
+
+        self.time_to_live: float | None = time_to_live
+
+    def get_capacity(self) -> int:
+        """
+        Return the largest number of cached results.
+
+        Returns
+        -------
+        capacity: int
+            Largest number of cached results.
+
+        """
+        return self.capacity
+
+    def get_time_to_live(self) -> float | None:
+        """
+        Return the number of seconds a result is valid.
+
+        Returns
+        -------
+        time_to_live: float | None
+            Number of seconds a result is valid, None if results don't expire.
+
+        """
+        return self.time_to_live
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Return the hit & miss statistics of the cache.
+
+        Returns
+        -------
+        dict[str, float]
+            The number of hits, misses, evictions (because the cache was full) and
+            expirations, the share of hits among all lookups, the number of cached
+            results and the capacity.
+
+        """
+        lookups: int = self.stats["hits"] + self.stats["misses"]
+
+        return {**self.stats,
+                "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+                "size": len(self.entries), "capacity": self.get_capacity()}
+
+    @staticmethod
+    def create_key(
+        backend: Backend, pixels: list[float], weight_version: int, kind: str
+    ) -> tuple:
+        """
+        Create the key of the result of one image.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend quantizing the pixels.
+        pixels: list[float]
+            The pixels of the image in range of [0; 1].
+        weight_version: int
+            The weight version of the neural network.
+        kind: str
+            The kind of the result (e.g. 'detect' or 'predict').
+
+        Returns
+        -------
+        tuple
+            The 16 byte hash of the pixels quantized to [0; 255], the weight version
+            and the kind.
+
+        """
+        # Quantize the pixels to bytes, which is the resolution of the images
+        quantized: bytes = backend.quantize_pixels(pixels)
+
+        return (hashlib.blake2b(quantized, digest_size=16).digest(), weight_version,
+                kind)
+
+    def get(self, key: tuple):
+        """
+        Return the cached result of a key.
+
+        Parameters
+        ----------
+        key: tuple
+            The key created by create_key.
+
+        Returns
+        -------
+        The cached result, None if there is no valid result.
+
+        """
+        entry: tuple | None = self.entries.get(key)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        # Discard the result if it expired
+        if (self.get_time_to_live() is not None
+                and time.monotonic() - entry[0] > self.get_time_to_live()):
+            del self.entries[key]
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+        # Mark the result as most recently used
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+
+        return entry[1]
+
+    def put(self, key: tuple, result) -> None:
+        """
+        Add a result to the cache.
+
+        Parameters
+        ----------
+        key: tuple
+            The key created by create_key.
+        result
+            The result, which mustn't be changed afterwards.
+
+        """
+        self.entries[key] = (time.monotonic(), result)
+        self.entries.move_to_end(key)
+
+        # Evict the least recently used results
+        while len(self.entries) > self.get_capacity():
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove all results and reset the statistics."""
+        self.entries: OrderedDict = OrderedDict()
+        self.stats: dict[str, int] = {
+            "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
@@ -0,0 +1,568 @@
+"""File containing the QuantizedNeuralNetwork class."""
+
+# Import necessary for the quantize method
+from __future__ import annotations
+
+# Import used Python libraries
+import time
+import tracemalloc
+import csv
+import ast
+
+# Import used types
+from collections.abc import Sequence
+from csv import DictReader
+from typing import Any
+
+# Import used classes
+from classes.activation import Activation, Sigmoid
+from classes.backend import Backend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+
+class QuantizedNeuralNetwork:
+    """
+    A class representing a neural network with int8 weights for inference.
+
+    Each row of a weight matrix is stored as int8 values together with one scale
+    (max absolute value of the row / 127). A row is multiplied with the int8 values
+    first and with its scale afterwards, so the weight matrices need about an
+    eighth of the memory of the float64 weights. The quantized network can only be
+    used for inference.
+
+    Attributes
+    ----------
+    dimensions: list[tuple[int, int]]
+        The dimensions of the neural network.
+    backend: Backend
+        The compute backend performing the matrix operations.
+    activations: list[Activation]
+        The activation function of each layer, starting with the input layer.
+    quantized_weight_matrices: list
+        The int8 values of each weight matrix.
+    scales: list
+        Column vector with the scale of each row of each weight matrix.
+
+    Methods
+    -------
+    set_dimensions
+        Set the dimensions of the neural network.
+    set_backend
+        Set the compute backend of the neural network.
+    set_activations
+        Set the activation function of each layer.
+    set_quantized_weight_matrices
+        Set the int8 values and the scales of the weight matrices.
+    get_dimensions
+        Return the dimensions of the neural network.
+    get_backend
+        Return the compute backend of the neural network.
+    get_activations
+        Return the activation function of each layer.
+    get_quantized_weight_matrices
+        Return the int8 values of the weight matrices.
+    get_scales
+        Return the scales of the rows of the weight matrices.
+    quantize
+        Quantize the weight matrices of a trained neural network.
+    write_weights
+        Write the int8 values and the scales into a CSV file.
+    create_from_csv
+        Read a CSV file written by write_weights and create the quantized network.
+    detect_one_image
+        Run one image through the neural network and return the values at each layer.
+    detect_images
+        Run a batch of images through the neural network at once.
+    forward_pass
+        Run the output values of the input layer through the other layers.
+    count_correct_images
+        Return the number of correctly guessed images of a block.
+    test
+        Test the accuracy of the neural network.
+    comparison_report
+        Compare accuracy, latency & memory of the float and the quantized network.
+
+    """
+
+    def __init__(self, dimensions: list[tuple[int, int]],
+                 quantized_weight_matrices: list[list[list[int]]],
+                 scales: list[list[float]], backend: str | None = None,
+                 activations: list[Activation] | None = None) -> None:
+        """
+        Construct one QuantizedNeuralNetwork object with the given attributes.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        quantized_weight_matrices: list[list[list[int]]]
+            The int8 values of each weight matrix as nested lists.
+        scales: list[list[float]]
+            The scale of each row of each weight matrix.
+        backend: str | None
+            Name of the compute backend. If None, NumPy is used if it is installed,
+            otherwise the pure Python array backend is used.
+        activations: list[Activation] | None
+            The activation function of each layer, starting with the input layer.
+            If None, the sigmoid function is used for every layer.
+
+        """
+        self.set_dimensions(dimensions)
+        self.set_backend(Backend.create(backend))
+        self.set_activations(activations if activations is not None else [
+            Sigmoid() for _ in range(len(dimensions) + 1)])
+        self.set_quantized_weight_matrices(quantized_weight_matrices, scales)
+
+    def set_dimensions(self, dimensions: list[tuple[int, int]]) -> None:
+        """
+        Set the dimensions of the neural network.
+
+        Parameters
+        ----------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+
+        """
+        self.dimensions: list[tuple[int, int]] = dimensions
+
+    def set_backend(self, backend: Backend) -> None:
+        """
+        Set the compute backend of the neural network.
+
+        Parameters
+        ----------
+        backend: Backend
+            The compute backend performing the matrix operations.
+
+        """
+        self.backend: Backend = backend
+
+    def set_activations(self, activations: list[Activation]) -> None:
+        """
+        Set the activation function of each layer.
+
+        Parameters
+        ----------
+        activations: list[Activation]
+            The activation function of each layer, starting with the input layer.
+
+        Raises
+        ------
+        ValueError
+            If the number of activation functions doesn't match the number of layers.
+
+        """
+        if len(activations) != len(self.get_dimensions()) + 1:
+            raise ValueError("One activation function per layer is needed.")
+
+        self.activations: list[Activation] = activations
+
+    def set_quantized_weight_matrices(
+            self, quantized_weight_matrices: list[list[list[int]]],
+            scales: list[list[float]]
+    ) -> None:
+        """
+        Set the int8 values and the scales of the weight matrices.
+
+        Parameters
+        ----------
+        quantized_weight_matrices: list[list[list[int]]]
+            The int8 values of each weight matrix as nested lists.
+        scales: list[list[float]]
+            The scale of each row of each weight matrix.
+
+        Raises
+        ------
+        ValueError
+            If the number of scales doesn't match the rows of the weight matrices.
+
+        """
+        if [len(matrix) for matrix in quantized_weight_matrices] != [
+                len(matrix_scales) for matrix_scales in scales]:
+            raise ValueError("One scale per row of each weight matrix is needed.")
+
+        self.quantized_weight_matrices: list = [
+            self.get_backend().from_quantized_lists(matrix)
+            for matrix in quantized_weight_matrices]
+        self.scales: list = [self.get_backend().column_vector(matrix_scales)
+                             for matrix_scales in scales]
+
+    def get_dimensions(self) -> list[tuple[int, int]]:
+        """
+        Return the dimensions of the neural network.
+
+        Returns
+        -------
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+
+        """
+        return self.dimensions
+
+    def get_backend(self) -> Backend:
+        """
+        Return the compute backend of the neural network.
+
+        Returns
+        -------
+        backend: Backend
+            The compute backend performing the matrix operations.
+
+        """
+        return self.backend
+
+    def get_activations(self) -> list[Activation]:
+        """
+        Return the activation function of each layer.
+
+        Returns
+        -------
+        activations: list[Activation]
+            The activation function of each layer, starting with the input layer.
+
+        """
+        return self.activations
+
+    def get_quantized_weight_matrices(self) -> list:
+        """
+        Return the int8 values of the weight matrices.
+
+        Returns
+        -------
+        quantized_weight_matrices: list
+            The int8 values of each weight matrix.
+
+        """
+        return self.quantized_weight_matrices
+
+    def get_scales(self) -> list:
+        """
+        Return the scales of the rows of the weight matrices.
+
+        Returns
+        -------
+        scales: list
+            Column vector with the scale of each row of each weight matrix.
+
+        """
+        return self.scales
+
+    @staticmethod
+    def quantize(neural_net: NeuralNetwork) -> QuantizedNeuralNetwork:
+        """
+        Quantize the weight matrices of a trained neural network.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The trained neural network. It isn't changed.
+
+        Returns
+        -------
+        QuantizedNeuralNetwork
+            Network with the same backend and activation functions whose weight
+            matrices are quantized per row.
+
+        """
+        # Get the compute backend of the neural network
+        backend: Backend = neural_net.get_backend()
+
+        # Initialize the quantized values and scales of all weight matrices
+        quantized_weight_matrices: list[list[list[int]]] = []
+        scales: list[list[float]] = []
+
+        for weight_matrix in neural_net.get_weight_matrices():
+            quantized_matrix, matrix_scales = backend.quantize_rows(weight_matrix)
+            quantized_weight_matrices.append(
+                [[int(value) for value in row]
+                 for row in backend.to_lists(quantized_matrix)])
+            scales.append([row[0] for row in backend.to_lists(matrix_scales)])
+
+        return QuantizedNeuralNetwork(
+            neural_net.get_dimensions(), quantized_weight_matrices, scales,
+            backend.name, neural_net.get_activations())
+
+    def write_weights(self, path_to_output: str) -> None:
+        """
+        Write the int8 values and the scales into a CSV file.
+
+        Parameters
+        ----------
+        path_to_output: str
+            Path to the CSV file in which the quantized weight matrices are written.
+            It is meant to be stored next to the CSV files of the float weights.
+
+        """
+        # Define the table header
+        header: list[str] = ["weights", "scales"]
+
+        with open(path_to_output, 'w', encoding='utf-8') as csv_file:
+            # Initialize the writer of the CSV file, whose type isn't public
+            csv_writer: Any = csv.writer(csv_file)
+
+            # Write the header
+            csv_writer.writerow(header)
+
+            # Write the int8 values and the scales of each weight matrix
+            for quantized_matrix, matrix_scales in zip(
+                    self.get_quantized_weight_matrices(), self.get_scales()):
+                csv_writer.writerow([
+                    self.get_backend().to_lists(quantized_matrix),
+                    [row[0] for row in self.get_backend().to_lists(matrix_scales)]])
+
+    @staticmethod
+    def create_from_csv(
+        path_to_csv_file: str, dimensions: list[tuple[int, int]],
+        backend: str | None = None, activations: list[Activation] | None = None
+    ) -> QuantizedNeuralNetwork:
+        """
+        Read a CSV file written by write_weights and create the quantized network.
+
+        Parameters
+        ----------
+        path_to_csv_file: str
+            Path to the CSV file that is read.
+        dimensions: list[tuple[int, int]]
+            The dimensions of the neural network.
+        backend: str | None
+            Name of the compute backend.
+        activations: list[Activation] | None
+            The activation function of each layer. If None, the sigmoid function is
+            used for every layer.
+
+        Returns
+        -------
+        QuantizedNeuralNetwork
+            The quantized neural network.
+
+        """
+        # Initialize the quantized values and scales of all weight matrices
+        quantized_weight_matrices: list[list[list[int]]] = []
+        scales: list[list[float]] = []
+
+        with open(path_to_csv_file, 'r', encoding='utf-8') as csv_file:
+            # Initialize the reader of the CSV file
+            csv_reader: DictReader = csv.DictReader(csv_file)
+
+            # Read the int8 values and the scales of each weight matrix
+            for row in csv_reader:
+                quantized_weight_matrices.append(ast.literal_eval(row["weights"]))
+                scales.append(ast.literal_eval(row["scales"]))
+
+        return QuantizedNeuralNetwork(
+            dimensions, quantized_weight_matrices, scales, backend, activations)
+
+    def detect_one_image(self, image: Image) -> list[list[float]]:
+        """
+        Run one image through the neural network and return the values at each layer.
+
+        Parameters
+        ----------
+        image: Image
+            The image that is run through the neural network.
+
+        Returns
+        -------
+        values_at_each_layer: list[list[float]]
+            Output values at each layer. Each is a column vector of the backend.
+
+        """
+        return self.detect_images([image])
+
+    def detect_images(self, images: Sequence[Image]) -> list[list[float]]:
+        """
+        Run a batch of images through the neural network at once.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images that are run through the neural network.
+
+        Returns
+        -------
+        values_at_each_layer: list[list[float]]
+            Output values at each layer. One column per image.
+
+        """
+        # Calculate the output values of the input layer
+        input_values: list[list[float]] = self.get_activations()[0].forward(
+            self.get_backend(), self.get_backend().column_matrix(
+                [image.get_pixels() for image in images]))
+
+        return self.forward_pass(input_values)
+
+    def forward_pass(self, input_values: list[list[float]]) -> list[list[float]]:
+        """
+        Run the output values of the input layer through the other layers.
+
+        Parameters
+        ----------
+        input_values: list[list[float]]
+            Output values of the input layer. One column per image.
+
+        Returns
+        -------
+        values_at_each_layer: list[list[float]]
+            Output values at each layer, starting with the given input values.
+
+        """
+        # Get the compute backend
+        backend: Backend = self.get_backend()
+
+        values: list[list[float]] = input_values
+        values_at_each_layer: list = [values]
+
+        # Go through each layer transition
+        for quantized_matrix, matrix_scales, activation in zip(
+                self.get_quantized_weight_matrices(), self.get_scales(),
+                self.get_activations()[1:]):
+            # Calculate the input values for the next layer with the int8 weights
+            layer_input_values: list[list[float]] = (
+                backend.quantized_matrix_multiplication(
+                    quantized_matrix, matrix_scales, values))
+
+            # Apply the activation function to get the output values of this layer
+            values = activation.forward(backend, layer_input_values)
+
+            # Save the output values of the current layer
+            values_at_each_layer.append(values)
+
+        return values_at_each_layer
+
+    def count_correct_images(self, images: Sequence[Image]) -> int:
+        """
+        Return the number of correctly guessed images of a block.
+
+        Parameters
+        ----------
+        images: Sequence[Image]
+            The images of the block.
+
+        Returns
+        -------
+        int
+            Number of correctly guessed images.
+
+        """
+        # Guess the numbers of all images of the block
+        labels: list[int] = self.get_backend().argmax(self.detect_images(images)[-1])
+
+        # Count the correctly guessed images
+        return sum(label == single_image.get_actual_number()
+                   for label, single_image in zip(labels, images))
+
+    def test(self, testing_data: list[Image], block_size: int = 1000) -> int:
+        """
+        Test the accuracy of the neural network.
+
+        Parameters
+        ----------
+        testing_data: list[Image]
+            The (10.000) images that are used for testing.
+        block_size: int
+            Number of images that are run through the neural network at once.
+
+        Returns
+        -------
+        correct_images: int
+            Number of correctly guessed images.
+
+        Raises
+        ------
+        ValueError
+            If the block size is smaller than 1.
+
+        """
+        # Check if the block size is valid
+        if block_size < 1:
+            raise ValueError("The block size has to be at least 1.")
+
+        # Initialize the return value
+        correct_images: int = 0
+
+        for count in range(0, len(testing_data), block_size):
+            # Print a message after one thousand images
+            if count // 1000 > (count - block_size) // 1000 and count != 0:
+                print("Elapsed", count, "images.")
+
+            correct_images += self.count_correct_images(
+                testing_data[count:count + block_size])
+
+        return correct_images
+
+    @staticmethod
+    def comparison_report(
+        neural_net: NeuralNetwork, testing_data: list[Image], image: Image,
+        repetitions: int = 100
+    ) -> dict[str, float]:
+        """
+        Compare accuracy, latency & memory of the float and the quantized network.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The trained neural network that is quantized. It isn't changed.
+        testing_data: list[Image]
+            The images that are used to measure the accuracy.
+        image: Image
+            The image whose detection is timed.
+        repetitions: int
+            Number of times the image is detected per network.
+
+        Returns
+        -------
+        report: dict[str, float]
+            Accuracy, mean latency of detect_one_image in milliseconds and memory of
+            the weight matrices (with the scales) in kilobytes of both networks,
+            plus the accuracy delta (quantized - float).
+
+        """
+        # Get the compute backend of the neural network
+        backend: Backend = neural_net.get_backend()
+
+        # Measure the memory allocated for a copy of the float weight matrices. The
+        # values are copied, so no float objects are shared with the network
+        tracemalloc.start()
+        float_weight_matrices: list = [backend.from_lists(
+            [[value + 0.0 for value in row] for row in weight_matrix])
+            for weight_matrix in neural_net.get_weight_matrices_as_lists()]
+        float_memory: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del float_weight_matrices
+
+        # Measure the memory allocated for the quantized weight matrices
+        tracemalloc.start()
+        quantized_net: QuantizedNeuralNetwork = QuantizedNeuralNetwork.quantize(
+            neural_net)
+        quantized_memory: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        # Measure the mean latency of detecting one image
+        latencies: list[float] = []
+        for net in (neural_net, quantized_net):
+            start_time: float = time.perf_counter()
+            for _ in range(repetitions):
+                net.detect_one_image(image)
+            latencies.append((time.perf_counter() - start_time) / repetitions)
+
+        report: dict[str, float] = {
+            "float_accuracy": neural_net.test(testing_data) / len(testing_data),
+            "quantized_accuracy": (
+                quantized_net.test(testing_data) / len(testing_data)),
+            "float_latency_ms": latencies[0] * 1000,
+            "quantized_latency_ms": latencies[1] * 1000,
+            "float_memory_kb": float_memory / 1024,
+            "quantized_memory_kb": quantized_memory / 1024}
+        report["accuracy_delta"] = (
+            report["quantized_accuracy"] - report["float_accuracy"])
+
+        # Print the report
+        print("Float:\t\tAccuracy:", round(report["float_accuracy"], 4),
+              "\tLatency (ms):", round(report["float_latency_ms"], 3),
+              "\tMemory (KB):", round(report["float_memory_kb"], 1))
+        print("Quantized:\tAccuracy:", round(report["quantized_accuracy"], 4),
+              "\tLatency (ms):", round(report["quantized_latency_ms"], 3),
+              "\tMemory (KB):", round(report["quantized_memory_kb"], 1))
+        print("Accuracy delta:", round(report["accuracy_delta"], 4))
+
+        return report
@@ -0,0 +1,247 @@
+"""File containing the SparseMatrix class."""
+
+# Import necessary for the prune method
+from __future__ import annotations
+
+# Import used Python libraries
+import heapq
+from array import array
+
+class SparseMatrix:
+    """
+    A class representing a matrix in compressed sparse row (CSR) form.
+
+    Only the nonzero values are stored row after row together with their column
+    index. The values of row i are values[row_pointers[i]:row_pointers[i + 1]].
+
+    Attributes
+    ----------
+    rows: int
+        Number of rows of the matrix.
+    columns: int
+        Number of columns of the matrix.
+    values: array
+        The nonzero values stored row after row.
+    column_indices: array
+        The column index of each nonzero value.
+    row_pointers: array
+        Index of the first nonzero value of each row, followed by the number of
+        nonzero values.
+
+    Methods
+    -------
+    prune
+        Create a sparse matrix that only keeps the weights of largest magnitude.
+    get_rows
+        Return the number of rows of the matrix.
+    get_columns
+        Return the number of columns of the matrix.
+    get_values
+        Return the nonzero values stored row after row.
+    get_column_indices
+        Return the column index of each nonzero value.
+    get_row_pointers
+        Return the index of the first nonzero value of each row.
+    get_sparsity
+        Return the share of values that are zero.
+    to_lists
+        Convert the matrix into a nested list of floats.
+
+    """
+
+    __slots__ = ("rows", "columns", "values", "column_indices", "row_pointers")
+
+    def __init__(
+            self, rows: int, columns: int, values: array, column_indices: array,
+            row_pointers: array
+    ) -> None:
+        """
+        Construct one SparseMatrix object with the given attributes.
+
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the matrix.
+        columns: int
+            Number of columns of the matrix.
+        values: array
+            The nonzero values stored row after row ('d' array).
+        column_indices: array
+            The column index of each nonzero value ('i' array).
+        row_pointers: array
+            Index of the first nonzero value of each row, followed by the number of
+            nonzero values ('i' array).
+
+        Raises
+        ------
+        ValueError
+            If the arrays don't match each other or the dimensions.
+
+        """
+        if (len(values) != len(column_indices) or len(row_pointers) != rows + 1
+                or row_pointers[-1] != len(values)):
+            raise ValueError("The arrays don't describe a sparse matrix.")
+
+        self.rows: int = rows
+        self.columns: int = columns
+        self.values: array = values
+        self.column_indices: array = column_indices
+        self.row_pointers: array = row_pointers
+
+    @staticmethod
+    def prune(
+        matrix: list[list[float]], threshold: float | None = None,
+        top_k: int | None = None
+    ) -> SparseMatrix:
+        """
+        Create a sparse matrix that only keeps the weights of largest magnitude.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            The dense matrix as nested list of floats.
+        threshold: float | None
+            Weights whose absolute value is below the threshold are removed.
+        top_k: int | None
+            Number of weights of largest absolute value that are kept per row.
+
+        Returns
+        -------
+        SparseMatrix
+            The pruned matrix. Weights that are exactly zero are never stored.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one of threshold and top_k is given, or top_k is negative.
+
+        """
+        # Check if exactly one pruning criterion is given
+        if (threshold is None) == (top_k is None):
+            raise ValueError("Either a threshold or top_k has to be given.")
+        if top_k is not None and top_k < 0:
+            raise ValueError("top_k can't be negative.")
+
+        # Number of weights kept per row if the rows are pruned by top_k
+        kept_per_row: int = top_k if top_k is not None else 0
+
+        # Initialize the arrays of the sparse matrix
+        values: array = array("d")
+        column_indices: array = array("i")
+        row_pointers: array = array("i", [0])
+
+        for row in matrix:
+            # Get the columns of the weights that are kept
+            if threshold is not None:
+                kept_columns: list[int] = [
+                    col for col, value in enumerate(row) if abs(value) >= threshold]
+            else:
+                magnitudes: list[float] = [abs(value) for value in row]
+                kept_columns = sorted(heapq.nlargest(
+                    kept_per_row, range(len(row)), key=magnitudes.__getitem__))
+
+            for col in kept_columns:
+                # Zeros don't need to be stored
+                if row[col] != 0.0:
+                    values.append(row[col])
+                    column_indices.append(col)
+
+            row_pointers.append(len(values))
+
+        return SparseMatrix(len(matrix), len(matrix[0]) if matrix else 0, values,
+                            column_indices, row_pointers)
+
+    def get_rows(self) -> int:
+        """
+        Return the number of rows of the matrix.
+
+        Returns
+        -------
+        rows: int
+            Number of rows of the matrix.
+
+        """
+        return self.rows
+
+    def get_columns(self) -> int:
+        """
+        Return the number of columns of the matrix.
+
+        Returns
+        -------
+        columns: int
+            Number of columns of the matrix.
+
+        """
+        return self.columns
+
+    def get_values(self) -> array:
+        """
+        Return the nonzero values stored row after row.
+
+        Returns
+        -------
+        values: array
+            The nonzero values stored row after row.
+
+        """
+        return self.values
+
+    def get_column_indices(self) -> array:
+        """
+        Return the column index of each nonzero value.
+
+        Returns
+        -------
+        column_indices: array
+            The column index of each nonzero value.
+
+        """
+        return self.column_indices
+
+    def get_row_pointers(self) -> array:
+        """
+        Return the index of the first nonzero value of each row.
+
+        Returns
+        -------
+        row_pointers: array
+            Index of the first nonzero value of each row, followed by the number of
+            nonzero values.
+
+        """
+        return self.row_pointers
+
+    def get_sparsity(self) -> float:
+        """
+        Return the share of values that are zero.
+
+        Returns
+        -------
+        float
+            Number of values that aren't stored divided by rows * columns.
+
+        """
+        return 1 - len(self.get_values()) / (self.get_rows() * self.get_columns())
+
+    def to_lists(self) -> list[list[float]]:
+        """
+        Convert the matrix into a nested list of floats.
+
+        Returns
+        -------
+        list[list[float]]
+            The dense matrix with zeros for the values that aren't stored.
+
+        """
+        # Initialize the dense matrix
+        matrix: list[list[float]] = [
+            [0.0] * self.get_columns() for _ in range(self.get_rows())]
+
+        for row in range(self.get_rows()):
+            for index in range(self.get_row_pointers()[row],
+                               self.get_row_pointers()[row + 1]):
+                matrix[row][self.get_column_indices()[index]] = (
+                    self.get_values()[index])
+
+        return matrix
@@ -0,0 +1,780 @@
+"""File containing the TrainingController class."""
+
+# Import used Python libraries
+import time
+from array import array
+
+# Import used classes
+from classes.image import Image
+from classes.index_sampler import IndexSampler
+from classes.input_layer_cache import InputLayerCache
+from classes.learning_rate_schedule import LearningRateSchedule
+from classes.neural_network import NeuralNetwork
+from classes.optimizer import Optimizer
+
+class TrainingController:
+    """
+    A class running a training of several epochs within a budget.
+
+    The learning rate of each batch is taken from a schedule. A share of the
+    training data is held out and the accuracy on it is measured at intervals. The
+    training stops after the given number of epochs, when the accuracy hasn't
+    improved for a number of evaluations, or when the wall-clock time or the number
+    of trained images exceeds its budget. The weight matrices with the best
+    validation accuracy are kept.
+
+    Attributes
+    ----------
+    neural_net: NeuralNetwork
+        The neural network that is trained.
+    schedule: LearningRateSchedule
+        The schedule of the learning rate.
+    epochs: int
+        Maximum number of passes over the training data.
+    batch_size: int
+        Number of images that are run through the neural network at once.
+    sampler: IndexSampler
+        The sampler of the order in which the images are visited in each epoch.
+    validation_share: float
+        Share of the training data that is held out for the evaluations.
+    evaluation_interval: int | None
+        Number of trained images between two evaluations. If None, the neural
+        network is only evaluated at the end of each epoch.
+    patience: int | None
+        Number of evaluations without improvement after which the training stops.
+        If None, the training never stops early.
+    min_improvement: float
+        Increase of the validation accuracy that counts as an improvement.
+    time_budget: float | None
+        Number of seconds after which the training stops.
+    sample_budget: int | None
+        Number of trained images after which the training stops.
+    history: list[dict[str, float]]
+        One entry per evaluation of the last training.
+    stop_reason: str
+        Why the last training stopped ('epochs', 'plateau', 'time' or 'samples').
+
+    Methods
+    -------
+    set_neural_net
+        Set the neural network that is trained.
+    set_schedule
+        Set the schedule of the learning rate.
+    set_epochs
+        Set the maximum number of passes over the training data.
+    set_batch_size
+        Set the number of images that are run through the neural network at once.
+    set_sampler
+        Set the sampler of the order in which the images are visited.
+    set_validation_share
+        Set the share of the training data that is held out.
+    set_evaluation_interval
+        Set the number of trained images between two evaluations.
+    set_early_stopping
+        Set the patience and the minimal improvement of the early stopping.
+    set_budgets
+        Set the wall-clock and the sample budget of the training.
+    set_history
+        Set the evaluations of the last training.
+    set_stop_reason
+        Set why the last training stopped.
+    get_neural_net
+        Return the neural network that is trained.
+    get_schedule
+        Return the schedule of the learning rate.
+    get_epochs
+        Return the maximum number of passes over the training data.
+    get_batch_size
+        Return the number of images that are run through the neural network at once.
+    get_sampler
+        Return the sampler of the order in which the images are visited.
+    get_validation_share
+        Return the share of the training data that is held out.
+    get_evaluation_interval
+        Return the number of trained images between two evaluations.
+    get_patience
+        Return the number of evaluations without improvement before stopping.
+    get_min_improvement
+        Return the increase of the validation accuracy that counts as improvement.
+    get_time_budget
+        Return the number of seconds after which the training stops.
+    get_sample_budget
+        Return the number of trained images after which the training stops.
+    get_history
+        Return the evaluations of the last training.
+    get_stop_reason
+        Return why the last training stopped.
+    split_validation_data
+        Split the training data into the images that are trained and held out.
+    evaluate
+        Measure the validation accuracy and record it in the history.
+    check_budgets
+        Return whether the time or the sample budget is used up.
+    keep_best
+        Keep copies of the weight matrices and the optimizer if they improved.
+    train
+        Run the training and keep the weight matrices with the best accuracy.
+
+    """
+
+    def __init__(
+            self, neural_net: NeuralNetwork, schedule: LearningRateSchedule,
+            epochs: int, batch_size: int = 1, validation_share: float = 0.1,
+            evaluation_interval: int | None = None, patience: int | None = 3,
+            min_improvement: float = 0.0, time_budget: float | None = None,
+            sample_budget: int | None = None, sampler: IndexSampler | None = None
+    ) -> None:
+        """
+        Construct one TrainingController object with the given attributes.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+        schedule: LearningRateSchedule
+            The schedule of the learning rate.
+        epochs: int
+            Maximum number of passes over the training data.
+        batch_size: int
+            Number of images that are run through the neural network at once.
+        validation_share: float
+            Share of the training data that is held out for the evaluations. The
+            last images of the training data are held out.
+        evaluation_interval: int | None
+            Number of trained images between two evaluations. If None, the neural
+            network is only evaluated at the end of each epoch.
+        patience: int | None
+            Number of evaluations without improvement after which the training
+            stops. If None, the training never stops early.
+        min_improvement: float
+            Increase of the validation accuracy that counts as an improvement.
+        time_budget: float | None
+            Number of seconds after which the training stops. If None, the time
+            isn't limited.
+        sample_budget: int | None
+            Number of trained images after which the training stops. If None, the
+            number of images isn't limited.
+        sampler: IndexSampler | None
+            The sampler of the order in which the images are visited in each
+            epoch. If None, the images are visited in the order of the training
+            data.
+
+        """
+        self.set_neural_net(neural_net)
+        self.set_schedule(schedule)
+        self.set_epochs(epochs)
+        self.set_batch_size(batch_size)
+        self.set_sampler(sampler if sampler is not None else IndexSampler(
+            "sequential"))
+        self.set_validation_share(validation_share)
+        self.set_evaluation_interval(evaluation_interval)
+        self.set_early_stopping(patience, min_improvement)
+        self.set_budgets(time_budget, sample_budget)
+        self.set_history([])
+        self.set_stop_reason("")
+
+    def set_neural_net(self, neural_net: NeuralNetwork) -> None:
+        """
+        Set the neural network that is trained.
+
+        Parameters
+        ----------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+
+        """
+        self.neural_net: NeuralNetwork = neural_net
+
+    def set_schedule(self, schedule: LearningRateSchedule) -> None:
+        """
+        Set the schedule of the learning rate.
+
+        Parameters
+        ----------
+        schedule: LearningRateSchedule
+            The schedule of the learning rate.
+
+        """
+        self.schedule: LearningRateSchedule = schedule
+
+    def set_epochs(self, epochs: int) -> None:
+        """
+        Set the maximum number of passes over the training data.
+
+        Parameters
+        ----------
+        epochs: int
+            Maximum number of passes over the training data.
+
+        Raises
+        ------
+        ValueError
+            If the number of epochs is smaller than 1.
+
+        """
+        if epochs < 1:
+            raise ValueError("The number of epochs has to be at least 1.")
+
+        self.epochs: int = epochs
+
+    def set_batch_size(self, batch_size: int) -> None:
+        """
+        Set the number of images that are run through the neural network at once.
+
+        Parameters
+        ----------
+        batch_size: int
+            Number of images per batch.
+
+        Raises
+        ------
+        ValueError
+            If the batch size is smaller than 1.
+
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size has to be at least 1.")
+
+        self.batch_size: int = batch_size
+
+    def set_sampler(self, sampler: IndexSampler) -> None:
+        """
+        Set the sampler of the order in which the images are visited.
+
+        Parameters
+        ----------
+        sampler: IndexSampler
+            The sampler of the order in which the images are visited in each epoch.
+
+        """
+        self.sampler: IndexSampler = sampler
+
+    def set_validation_share(self, validation_share: float) -> None:
+        """
+        Set the share of the training data that is held out.
+
+        Parameters
+        ----------
+        validation_share: float
+            Share of the training data that is held out for the evaluations.
+
+        Raises
+        ------
+        ValueError
+            If the share isn't in range of (0; 1).
+
+        """
+        if not 0 < validation_share < 1:
+            raise ValueError("The validation share has to be in range of (0; 1).")
+
+        self.validation_share: float = validation_share
+
+    def set_evaluation_interval(self, evaluation_interval: int | None) -> None:
+        """
+        Set the number of trained images between two evaluations.
+
+        Parameters
+        ----------
+        evaluation_interval: int | None
+            Number of trained images between two evaluations. If None, the neural
+            network is only evaluated at the end of each epoch.
+
+        Raises
+        ------
+        ValueError
+            If the interval is smaller than 1.
+
+        """
+        if evaluation_interval is not None and evaluation_interval < 1:
+            raise ValueError("The evaluation interval has to be at least 1.")
+
+        self.evaluation_interval: int | None = evaluation_interval
+
+    def set_early_stopping(self, patience: int | None, min_improvement: float) -> None:
+        """
+        Set the patience and the minimal improvement of the early stopping.
+
+        Parameters
+        ----------
+        patience: int | None
+            Number of evaluations without improvement after which the training
+            stops. If None, the training never stops early.
+        min_improvement: float
+            Increase of the validation accuracy that counts as an improvement.
+
+        Raises
+        ------
+        ValueError
+            If the patience is smaller than 1 or the minimal improvement negative.
+
+        """
+        if (patience is not None and patience < 1) or min_improvement < 0:
+            raise ValueError("The patience has to be at least 1 and the minimal "
+                             "improvement can't be negative.")
+
+        self.patience: int | None = patience
+        self.min_improvement: float = min_improvement
+
+    def set_budgets(self, time_budget: float | None, sample_budget: int | None) -> None:
+        """
+        Set the wall-clock and the sample budget of the training.
+
+        Parameters
+        ----------
+        time_budget: float | None
+            Number of seconds after which the training stops.
+        sample_budget: int | None
+            Number of trained images after which the training stops.
+
+        Raises
+        ------
+        ValueError
+            If a budget isn't positive.
+
+        """
+        if ((time_budget is not None and time_budget <= 0)
+                or (sample_budget is not None and sample_budget <= 0)):
+            raise ValueError("The budgets have to be positive.")
+
+        self.time_budget: float | None = time_budget
+        self.sample_budget: int | None = sample_budget
+
+    def set_history(self, history: list[dict[str, float]]) -> None:
+        """
+        Set the evaluations of the last training.
+
+        Parameters
+        ----------
+        history: list[dict[str, float]]
+            One entry per evaluation.
+
+        """
+        self.history: list[dict[str, float]] = history
+
+    def set_stop_reason(self, stop_reason: str) -> None:
+        """
+        Set why the last training stopped.
+
+        Parameters
+        ----------
+        stop_reason: str
+            'epochs', 'plateau', 'time' or 'samples'.
+
+        """
+        self.stop_reason: str = stop_reason
+
+    def get_neural_net(self) -> NeuralNetwork:
+        """
+        Return the neural network that is trained.
+
+        Returns
+        -------
+        neural_net: NeuralNetwork
+            The neural network that is trained.
+
+        """
+        return self.neural_net
+
+    def get_schedule(self) -> LearningRateSchedule:
+        """
+        Return the schedule of the learning rate.
+
+        Returns
+        -------
+        schedule: LearningRateSchedule
+            The schedule of the learning rate.
+
+        """
+        return self.schedule
+
+    def get_epochs(self) -> int:
+        """
+        Return the maximum number of passes over the training data.
+
+        Returns
+        -------
+        epochs: int
+            Maximum number of passes over the training data.
+
+        """
+        return self.epochs
+
+    def get_batch_size(self) -> int:
+        """
+        Return the number of images that are run through the neural network at once.
+
+        Returns
+        -------
+        batch_size: int
+            Number of images per batch.
+
+        """
+        return self.batch_size
+
+    def get_sampler(self) -> IndexSampler:
+        """
+        Return the sampler of the order in which the images are visited.
+
+        Returns
+        -------
+        sampler: IndexSampler
+            The sampler of the order in which the images are visited in each epoch.
+
+        """
+        return self.sampler
+
+    def get_validation_share(self) -> float:
+        """
+        Return the share of the training data that is held out.
+
+        Returns
+        -------
+        validation_share: float
+            Share of the training data that is held out for the evaluations.
+
+        """
+        return self.validation_share
+
+    def get_evaluation_interval(self) -> int | None:
+        """
+        Return the number of trained images between two evaluations.
+
+        Returns
+        -------
+        evaluation_interval: int | None
+            Number of trained images between two evaluations. None if the neural
+            network is only evaluated at the end of each epoch.
+
+        """
+        return self.evaluation_interval
+
+    def get_patience(self) -> int | None:
+        """
+        Return the number of evaluations without improvement before stopping.
+
+        Returns
+        -------
+        patience: int | None
+            Number of evaluations without improvement after which the training
+            stops. None if the training never stops early.
+
+        """
+        return self.patience
+
+    def get_min_improvement(self) -> float:
+        """
+        Return the increase of the validation accuracy that counts as improvement.
+
+        Returns
+        -------
+        min_improvement: float
+            Increase of the validation accuracy that counts as an improvement.
+
+        """
+        return self.min_improvement
+
+    def get_time_budget(self) -> float | None:
+        """
+        Return the number of seconds after which the training stops.
+
+        Returns
+        -------
+        time_budget: float | None
+            Number of seconds after which the training stops. None if unlimited.
+
+        """
+        return self.time_budget
+
+    def get_sample_budget(self) -> int | None:
+        """
+        Return the number of trained images after which the training stops.
+
+        Returns
+        -------
+        sample_budget: int | None
+            Number of trained images after which the training stops. None if
+            unlimited.
+
+        """
+        return self.sample_budget
+
+    def get_history(self) -> list[dict[str, float]]:
+        """
+        Return the evaluations of the last training.
+
+        Returns
+        -------
+        history: list[dict[str, float]]
+            One entry per evaluation with the epochs done, the trained images, the
+            learning rate, the validation accuracy and the elapsed seconds.
+
+        """
+        return self.history
+
+    def get_stop_reason(self) -> str:
+        """
+        Return why the last training stopped.
+
+        Returns
+        -------
+        stop_reason: str
+            'epochs', 'plateau', 'time' or 'samples'. Empty before the first
+            training.
+
+        """
+        return self.stop_reason
+
+    def split_validation_data(
+            self, training_data: list[Image]
+    ) -> tuple[list[Image], list[Image]]:
+        """
+        Split the training data into the images that are trained and held out.
+
+        Parameters
+        ----------
+        training_data: list[Image]
+            The images that are used for training.
+
+        Returns
+        -------
+        tuple[list[Image], list[Image]]
+            The images that are trained and the last images that are held out.
+
+        Raises
+        ------
+        ValueError
+            If one of the two parts would be empty.
+
+        """
+        # Get the number of images that are trained
+        count: int = len(training_data) - round(
+            len(training_data) * self.get_validation_share())
+
+        if not 0 < count < len(training_data):
+            raise ValueError("The training data is too small to hold out images.")
+
+        return training_data[:count], training_data[count:]
+
+    def evaluate(
+            self, validation_data: list[Image], epoch: float, images: int,
+            learning_rate: float, start: float
+    ) -> float:
+        """
+        Measure the validation accuracy and record it in the history.
+
+        Parameters
+        ----------
+        validation_data: list[Image]
+            The images that are held out.
+        epoch: float
+            Number of epochs done so far.
+        images: int
+            Number of images trained so far.
+        learning_rate: float
+            Learning rate of the last batch.
+        start: float
+            Value of time.perf_counter() at the start of the training.
+
+        Returns
+        -------
+        accuracy: float
+            Share of correctly guessed images of the validation data.
+
+        """
+        # Measure the accuracy on the images that are held out
+        accuracy: float = (self.get_neural_net().test(validation_data)
+                           / len(validation_data))
+
+        self.get_history().append({
+            "epoch": epoch, "images": images, "learning_rate": learning_rate,
+            "accuracy": accuracy, "seconds": time.perf_counter() - start})
+
+        print("Elapsed", images, "images.", "Validation accuracy:", accuracy)
+
+        return accuracy
+
+    def check_budgets(self, start: float, images: int) -> str | None:
+        """
+        Return whether the time or the sample budget is used up.
+
+        Parameters
+        ----------
+        start: float
+            Value of time.perf_counter() at the start of the training.
+        images: int
+            Number of images trained so far.
+
+        Returns
+        -------
+        str | None
+            'time' or 'samples' if that budget is used up, otherwise None.
+
+        """
+        # Get the budgets
+        time_budget: float | None = self.get_time_budget()
+        sample_budget: int | None = self.get_sample_budget()
+
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            return "time"
+        if sample_budget is not None and images >= sample_budget:
+            return "samples"
+
+        return None
+
+    def keep_best(
+            self, accuracy: float, best: tuple[float, list, Optimizer | None, int]
+    ) -> tuple[float, list, Optimizer | None, int]:
+        """
+        Keep copies of the weight matrices and the optimizer if they improved.
+
+        Parameters
+        ----------
+        accuracy: float
+            The validation accuracy of the current weight matrices.
+        best: tuple[float, list, Optimizer | None, int]
+            The best accuracy so far, copies of its weight matrices (empty before
+            the first evaluation), a snapshot of the optimizer at that time and the
+            number of evaluations without improvement since.
+
+        Returns
+        -------
+        tuple[float, list, Optimizer | None, int]
+            The same values after the current evaluation.
+
+        """
+        best_accuracy, best_weight_matrices, best_optimizer, without_improvement = (
+            best)
+
+        if best_weight_matrices and (
+                accuracy <= best_accuracy + self.get_min_improvement()):
+            return (best_accuracy, best_weight_matrices, best_optimizer,
+                    without_improvement + 1)
+
+        # Copy the weight matrices and the state of the optimizer that belongs to
+        # them, so the training can be continued from them
+        neural_net: NeuralNetwork = self.get_neural_net()
+        backend = neural_net.get_backend()
+
+        return (accuracy, [backend.from_lists(weight_matrix)
+                           for weight_matrix in neural_net.get_weight_matrices()],
+                neural_net.get_optimizer().snapshot(backend), 0)
+
+    def train(
+            self, training_data: list[Image], path_to_csv_file: str | None = None
+    ) -> list[list[list[float]]]:
+        """
+        Run the training and keep the weight matrices with the best accuracy.
+
+        Parameters
+        ----------
+        training_data: list[Image]
+            The (60.000) images that are used for training, including the images
+            that are held out.
+        path_to_csv_file: str | None
+            Path to the CSV file in which the best weight matrices (and the state of
+            the optimizer) shall be written to. If None, nothing is written.
+
+        Returns
+        -------
+        list[list[list[float]]]
+            The weight matrices with the best validation accuracy. The neural
+            network is left with these weight matrices and the state its optimizer
+            had at that time.
+
+        Notes
+        -----
+        The learning rate of a batch is the one of the schedule at the position
+        reached after the batch, so the first batch of a warmup isn't trained with
+        a learning rate of zero.
+
+        The budgets are checked after every batch. The time needed for the
+        evaluations counts towards the wall-clock budget.
+
+        """
+        # Get the neural network
+        neural_net: NeuralNetwork = self.get_neural_net()
+
+        # Hold out the images of the evaluations
+        training_images, validation_images = self.split_validation_data(
+            training_data)
+
+        # Get the cached output values of the input layer
+        input_layer_cache: InputLayerCache = neural_net.get_input_layer_cache(
+            training_images, False)
+
+        # Get the interval of the evaluations and the patience
+        evaluation_interval: int = self.get_evaluation_interval() or 0
+        patience: int | None = self.get_patience()
+
+        # Initialize the state of the training
+        self.set_history([])
+        stop_reason: str | None = None
+        best: tuple[float, list, Optimizer | None, int] = (-1.0, [], None, 0)
+        images: int = 0
+        next_evaluation: int = evaluation_interval
+        batch_size: int = self.get_batch_size()
+        start: float = time.perf_counter()
+
+        for epoch in range(self.get_epochs()):
+            # Get the order of the images of the epoch
+            indices: range | array = self.get_sampler().epoch_indices(
+                training_images, epoch)
+
+            for count in range(0, len(indices), batch_size):
+                # Get the learning rate at the end of the batch
+                end: int = min(count + batch_size, len(indices))
+                learning_rate: float = self.get_schedule().learning_rate_at(
+                    epoch + end / len(indices))
+
+                # Train the neural network with the images of the current batch
+                batch_indices: range | array = indices[count:end]
+                neural_net.train_batch(
+                    [training_images[index] for index in batch_indices],
+                    learning_rate, input_layer_cache.get_input_values(batch_indices))
+                images += end - count
+
+                # Check the budgets
+                stop_reason = self.check_budgets(start, images)
+
+                # Evaluate at the intervals, at the end of each epoch and at the end
+                if (stop_reason is None and end < len(indices)
+                        and not (next_evaluation and images >= next_evaluation)):
+                    continue
+
+                while next_evaluation and images >= next_evaluation:
+                    next_evaluation += evaluation_interval
+
+                best = self.keep_best(self.evaluate(
+                    validation_images, epoch + end / len(indices), images,
+                    learning_rate, start), best)
+
+                # Stop if the accuracy doesn't improve anymore
+                if stop_reason is None and patience is not None and best[3] >= patience:
+                    stop_reason = "plateau"
+
+                if stop_reason is not None:
+                    break
+
+            if stop_reason is not None:
+                break
+
+        self.set_stop_reason(stop_reason or "epochs")
+
+        # Continue with the best weight matrices and the state of the optimizer
+        # that belongs to them
+        best_accuracy, best_weight_matrices, best_optimizer, _ = best
+        neural_net.set_weight_matrices(best_weight_matrices, False)
+        if best_optimizer is not None:
+            neural_net.get_optimizer().set_step(best_optimizer.get_step())
+            neural_net.get_optimizer().set_state(best_optimizer.get_state())
+
+        print("Stopped after", images, "images (" + self.get_stop_reason() + ").",
+              "Best validation accuracy:", best_accuracy)
+
+        # Write the best weights into the csv file
+        if path_to_csv_file is not None:
+            NeuralNetwork.write_weights(path_to_csv_file,
+                                        neural_net.get_weight_matrices_as_lists())
+            neural_net.write_optimizer_state(path_to_csv_file)
+
+        return neural_net.get_weight_matrices_as_lists()
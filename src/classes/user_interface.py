@@ -1,7 +1,9 @@
 """File containing the UserInterface class."""
 
 # Import used Python libraries
+import os
 import tkinter
+from collections.abc import Iterator, Sequence
 import PIL
 
 # Import used types
@@ -10,17 +12,28 @@ from PIL import Image as PILImage
 from PIL import ImageDraw
 
 # Import used classes
+from classes.dataset_cache import DatasetCache
 from classes.image import Image
-from classes.neural_network import NeuralNetwork
+from classes.image_dataset import ImageDataset
+from classes.neural_network_interface import NeuralNetworkInterface
 
 # Constants for the images
 PATH_TO_TRAINING_IMAGES: str = "./images/csv/training_data.csv"
 PATH_TO_TESTING_IMAGES: str = "./images/csv/testing_data.csv"
+PATH_TO_IDX_FILES: str = "./images/idx/"
+TRAINING_IDX_FILES: tuple[str, str] = (
+    "train-images.idx3-ubyte", "train-labels.idx1-ubyte")
+TESTING_IDX_FILES: tuple[str, str] = (
+    "t10k-images.idx3-ubyte", "t10k-labels.idx1-ubyte")
+PATH_TO_TRAINING_CACHE: str = "./images/cache/training_data.bin"
+PATH_TO_TESTING_CACHE: str = "./images/cache/testing_data.bin"
 # Path to the weight matrices
 PATH_TO_WEIGHTS: str = "./weight_matrices/altered_weights.csv"
 
 # Used learning rate
 LEARNING_RATE: float = 0.001
+# Number of testing images that are read and tested at once
+TESTING_BLOCK_SIZE: int = 1000
 
 class UserInterface:
     """
@@ -28,7 +41,7 @@ class UserInterface:
 
     Attributes
     ----------
-    neural_net: NeuralNetwork
+    neural_net: NeuralNetworkInterface
         The neural net through which the numbers shall be determined.
     main_window: Tk
         Main window on which all the other elements shall be displayed.
@@ -107,10 +120,14 @@ class UserInterface:
         Place all elements on the main window and show it.
     submit_number
         Submit the drawn number to the neural network.
+    load_images
+        Load the images of IDX files through the binary dataset cache.
     train
         Train the neural network.
     test
         Test the neural network.
+    count_images
+        Pass the blocks of images on and record the size of each block.
     change_buttons
         Disable/Enables all buttons.
     update_status
@@ -118,13 +135,13 @@ class UserInterface:
 
     """
 
-    def __init__(self, neural_net: NeuralNetwork) -> None:
+    def __init__(self, neural_net: NeuralNetworkInterface) -> None:
         """
         Construct one UserInterface object with the given attributes.
 
         Parameters
         ----------
-        neural_net: NeuralNetwork
+        neural_net: NeuralNetworkInterface
             The neural net through which the numbers shall be determined.
 
         """
@@ -160,17 +177,17 @@ class UserInterface:
         self.set_testing_button(tkinter.Button(self.get_main_window(), text="TEST",
                                                command=self.test))
 
-    def set_neural_net(self, neural_net: NeuralNetwork):
+    def set_neural_net(self, neural_net: NeuralNetworkInterface):
         """
         Set the neural network of the user interface.
 
         Parameters
         ----------
-        neural_net: NeuralNetwork
+        neural_net: NeuralNetworkInterface
             The neural net through which the numbers shall be determined.
 
         """
-        self.neural_net: NeuralNetwork = neural_net
+        self.neural_net: NeuralNetworkInterface = neural_net
 
     def set_main_window(self, main_window: Tk) -> None:
         """
@@ -304,13 +321,13 @@ class UserInterface:
         """
         self.testing_button: Button = testing_button
 
-    def get_neural_net(self) -> NeuralNetwork:
+    def get_neural_net(self) -> NeuralNetworkInterface:
         """
         Return the neural network of the user interface.
 
         Returns
         -------
-        neural_net: NeuralNetwork
+        neural_net: NeuralNetworkInterface
             The neural net through which the numbers shall be determined.
 
         """
@@ -513,7 +530,8 @@ class UserInterface:
         image: Image = Image(pixels, None)
 
         # Run the image through the net and get the values at the output layer
-        result: list[float] = self.get_neural_net().detect_one_image(image)[2]
+        result: list[list[float]] = self.get_neural_net().get_backend().to_lists(
+            self.get_neural_net().detect_one_image(image)[2])
 
         # Convert the results into percent values with two digits
         result_as_percent: list[str] = ["Number\t\tPercent"]
@@ -525,14 +543,46 @@ class UserInterface:
         # Place the results
         self.update_status(results_as_string)
 
+    @staticmethod
+    def load_images(
+        idx_files: tuple[str, str], path_to_cache: str
+    ) -> ImageDataset | None:
+        """
+        Load the images of IDX files through the binary dataset cache.
+
+        Parameters
+        ----------
+        idx_files: tuple[str, str]
+            Names of the IDX files of the images and of the labels.
+        path_to_cache: str
+            Path to the cache file, which is written at the first load.
+
+        Returns
+        -------
+        ImageDataset | None
+            The images, None if the IDX files don't exist (then the CSV files are
+            used).
+
+        """
+        # Get the paths to the IDX files
+        path_to_images: str = PATH_TO_IDX_FILES + idx_files[0]
+        path_to_labels: str = PATH_TO_IDX_FILES + idx_files[1]
+
+        if not (os.path.exists(path_to_images) and os.path.exists(path_to_labels)):
+            return None
+
+        return DatasetCache.load(path_to_images, path_to_labels, path_to_cache)
+
     def train(self) -> None:
         """Train the neural network."""
         # Clear the status label and drawing pad
         self.clear_drawing_pad()
 
-        # Get the training images
-        training_images: list[Image] = Image.create_images_from_csv(
-            PATH_TO_TRAINING_IMAGES)
+        # Get the training images, stored compactly as bytes
+        training_images: ImageDataset | None = UserInterface.load_images(
+            TRAINING_IDX_FILES, PATH_TO_TRAINING_CACHE)
+        if training_images is None:
+            training_images = ImageDataset.from_csv(PATH_TO_TRAINING_IMAGES)
 
         # Update the status label to indicate that the net is training
         self.update_status("Currently training...")
@@ -554,11 +604,21 @@ class UserInterface:
         # Clear the status label and drawing pad
         self.clear_drawing_pad()
 
-        # Get the testing images
-        test_images: list[Image] = Image.create_images_from_csv(PATH_TO_TESTING_IMAGES)
+        # Get the testing images of the binary dataset cache
+        test_images: ImageDataset | None = UserInterface.load_images(
+            TESTING_IDX_FILES, PATH_TO_TESTING_CACHE)
+
+        # Test the images in blocks, without the IDX files they're streamed from
+        # the CSV file, so the testing starts while the file is still read
+        if test_images is not None:
+            test_blocks: Iterator[Sequence[Image]] = test_images.batches(
+                TESTING_BLOCK_SIZE)
+        else:
+            test_blocks = Image.iterate_image_batches_from_csv(
+                PATH_TO_TESTING_IMAGES, TESTING_BLOCK_SIZE)
 
-        # Get the number of images to properly present the accuracy
-        number_of_images: int = len(test_images)
+        # Count the images of the blocks to properly present the accuracy
+        block_sizes: list[int] = []
 
         # Update the status label to indicate that the net is testing
         self.update_status("Currently testing...")
@@ -567,7 +627,9 @@ class UserInterface:
         self.change_buttons()
 
         # Test the neural net and get the accuracy
-        accuracy: float = self.get_neural_net().test(test_images) / number_of_images
+        accuracy: float = self.get_neural_net().test(
+            UserInterface.count_images(test_blocks, block_sizes)
+        ) / max(sum(block_sizes), 1)
 
         # Display the accuracy
         self.update_status("Accuracy:\t" + str(accuracy) + "%")
@@ -575,6 +637,30 @@ class UserInterface:
         # Enable all buttons
         self.change_buttons()
 
+    @staticmethod
+    def count_images(
+        blocks: Iterator[Sequence[Image]], block_sizes: list[int]
+    ) -> Iterator[Sequence[Image]]:
+        """
+        Pass the blocks of images on and record the size of each block.
+
+        Parameters
+        ----------
+        blocks: Iterator[Sequence[Image]]
+            The blocks of images, which are only read once.
+        block_sizes: list[int]
+            List to which the size of each block is appended while it is passed on.
+
+        Yields
+        ------
+        Sequence[Image]
+            The blocks of images, unchanged.
+
+        """
+        for block in blocks:
+            block_sizes.append(len(block))
+            yield block
+
     def change_buttons(self) -> None:
         """Disable/Enables all buttons."""
         # Boolean indicating whether to enable or disable all buttons
@@ -0,0 +1,238 @@
+"""File containing the WeightFile class."""
+
+# Import used Python libraries
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+# Import used classes
+from classes.matrix import Matrix
+
+class WeightFile:
+    """
+    A class reading and writing weight matrices in a binary file.
+
+    The file starts with a header of 16 bytes: the magic bytes b'NNWT', the version
+    (uint16), the typecode of the values (b'd' for float64 or b'f' for float32), a
+    zero byte, the number of weight matrices (uint32) and the CRC-32 checksum of
+    everything after the header (uint32). The header is followed by the size
+    (uint64) and the modification time in nanoseconds (int64) of the CSV file the
+    weights were converted from (both 0 without one), the number of rows and
+    columns (uint32 each) of every weight matrix, zero bytes up to the next
+    multiple of 8 and the raw values of all weight matrices, stored row after row.
+    All numbers are little-endian.
+
+    A binary file only replaces its CSV file as long as the stored size and
+    modification time match the CSV file, so a training writing the CSV file
+    makes it outdated.
+
+    Because the values are aligned and stored in the order of a Matrix, the file is
+    mapped into memory and each weight matrix is copied out of the mapping as a
+    whole, without parsing any text.
+
+    Methods
+    -------
+    get_source_info
+        Return the size and modification time of a CSV file.
+    write
+        Write weight matrices into a binary file.
+    read_source
+        Read the information about the CSV file stored in a binary file.
+    read
+        Read the weight matrices of a binary file.
+
+    """
+
+    magic: bytes = b"NNWT"
+    version: int = 2
+    header: struct.Struct = struct.Struct("<4sHcBII")
+    source: struct.Struct = struct.Struct("<Qq")
+    shape: struct.Struct = struct.Struct("<II")
+
+    @staticmethod
+    def get_source_info(path: str) -> tuple[int, int]:
+        """
+        Return the size and modification time of a CSV file.
+
+        Parameters
+        ----------
+        path: str
+            Path to the CSV file.
+
+        Returns
+        -------
+        tuple[int, int]
+            The size in bytes and the modification time in nanoseconds.
+
+        """
+        status: os.stat_result = os.stat(path)
+
+        return status.st_size, status.st_mtime_ns
+
+    @staticmethod
+    def write(
+        path_to_output: str, weight_matrices: list, typecode: str = "d",
+        source: tuple[int, int] = (0, 0)
+    ) -> None:
+        """
+        Write weight matrices into a binary file.
+
+        Parameters
+        ----------
+        path_to_output: str
+            Path to the binary file in which the weight matrices need to be written.
+        weight_matrices: list
+            The weight matrices as nested lists of floats or as Matrix objects.
+        typecode: str
+            'd' to store the values as float64, 'f' to store them as float32.
+        source: tuple[int, int]
+            Size and modification time of the CSV file the weights were read from
+            (see get_source_info), (0, 0) without one.
+
+        Raises
+        ------
+        ValueError
+            If the typecode isn't 'd' or 'f'.
+
+        """
+        if typecode not in ("d", "f"):
+            raise ValueError("The typecode has to be 'd' or 'f'.")
+
+        # Convert the weight matrices into matrices of the typecode
+        matrices: list[Matrix] = [
+            weight_matrix if isinstance(weight_matrix, Matrix)
+            and weight_matrix.get_typecode() == typecode
+            else Matrix.from_lists(weight_matrix.to_lists() if isinstance(
+                weight_matrix, Matrix) else weight_matrix, typecode)
+            for weight_matrix in weight_matrices]
+
+        # Create the information about the source and the shapes, padded to a
+        # multiple of 8 bytes
+        body: bytearray = bytearray(WeightFile.source.pack(*source))
+        for matrix in matrices:
+            body += WeightFile.shape.pack(matrix.get_rows(), matrix.get_columns())
+        body += bytes(-(WeightFile.header.size + len(body)) % 8)
+
+        # Append the values in little-endian byte order
+        for matrix in matrices:
+            if sys.byteorder == "big":
+                values: array = array(typecode, matrix.get_values())
+                values.byteswap()
+                body += values.tobytes()
+            else:
+                body += matrix.get_values().tobytes()
+
+        with open(path_to_output, 'wb') as binary_file:
+            binary_file.write(WeightFile.header.pack(
+                WeightFile.magic, WeightFile.version, typecode.encode(), 0,
+                len(matrices), zlib.crc32(body)))
+            binary_file.write(body)
+
+    @staticmethod
+    def read_source(path_to_binary_file: str) -> tuple[int, int]:
+        """
+        Read the information about the CSV file stored in a binary file.
+
+        Parameters
+        ----------
+        path_to_binary_file: str
+            Path to the binary file.
+
+        Returns
+        -------
+        tuple[int, int]
+            Size and modification time of the CSV file the weights were read from,
+            (0, 0) without one.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a weight file of the current version.
+
+        """
+        with open(path_to_binary_file, 'rb') as binary_file:
+            data: bytes = binary_file.read(
+                WeightFile.header.size + WeightFile.source.size)
+
+        if len(data) < WeightFile.header.size + WeightFile.source.size or (
+                WeightFile.header.unpack_from(data)[:2]
+                != (WeightFile.magic, WeightFile.version)):
+            raise ValueError("The file isn't a weight file of version "
+                             + str(WeightFile.version) + ".")
+
+        return WeightFile.source.unpack_from(data, WeightFile.header.size)
+
+    @staticmethod
+    def read(path_to_binary_file: str, verify: bool = True) -> list[Matrix]:
+        """
+        Read the weight matrices of a binary file.
+
+        Parameters
+        ----------
+        path_to_binary_file: str
+            Path to the binary file that is read.
+        verify: bool
+            Whether the checksum is verified.
+
+        Returns
+        -------
+        list[Matrix]
+            One Matrix (with the typecode of the file) per weight matrix.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a weight file of a known version, is truncated or its
+            checksum doesn't match.
+
+        """
+        with open(path_to_binary_file, 'rb') as binary_file, mmap.mmap(
+                binary_file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            # Read the header
+            if len(mapping) < WeightFile.header.size:
+                raise ValueError("The file is too short to be a weight file.")
+            magic, version, typecode, _, count, checksum = (
+                WeightFile.header.unpack_from(mapping))
+            if (magic != WeightFile.magic or version != WeightFile.version
+                    or typecode not in (b"d", b"f")):
+                raise ValueError("The file isn't a weight file of version "
+                                 + str(WeightFile.version) + ".")
+            typecode = typecode.decode()
+
+            # Check that the shapes are complete before reading them
+            offset: int = WeightFile.header.size + WeightFile.source.size
+            if len(mapping) < offset + count * WeightFile.shape.size:
+                raise ValueError("The size of the file doesn't match its header.")
+
+            # Read the shapes of the weight matrices
+            shapes: list[tuple[int, int]] = [
+                WeightFile.shape.unpack_from(
+                    mapping, offset + i * WeightFile.shape.size)
+                for i in range(count)]
+            offset += count * WeightFile.shape.size
+            offset += -offset % 8
+
+            # Check that the values are complete and unchanged
+            itemsize: int = array(typecode).itemsize
+            if offset + sum(rows * columns for rows, columns in shapes) * itemsize != (
+                    len(mapping)):
+                raise ValueError("The size of the file doesn't match its header.")
+            if verify and zlib.crc32(
+                    memoryview(mapping)[WeightFile.header.size:]) != checksum:
+                raise ValueError("The checksum of the file doesn't match.")
+
+            # Copy each weight matrix out of the mapping at once
+            weight_matrices: list[Matrix] = []
+            for rows, columns in shapes:
+                values: array = array(typecode)
+                values.frombytes(
+                    memoryview(mapping)[offset:offset + rows * columns * itemsize])
+                if sys.byteorder == "big":
+                    values.byteswap()
+                weight_matrices.append(Matrix(rows, columns, values))
+                offset += rows * columns * itemsize
+
+        return weight_matrices
@@ -0,0 +1,46 @@
+"""Shared fixtures of the tests."""
+
+# Import used Python libraries
+import pathlib
+import random
+import struct
+
+import pytest
+
+# Import used classes
+from classes.backend import NumpyBackend
+from classes.image import Image
+
+# Dimensions of the small neural network used by the tests
+DIMENSIONS: list[tuple[int, int]] = [(12, 30), (10, 12)]
+
+# Names of the compute backends that can be tested, NumPy is optional
+BACKENDS: list[str] = ["list", "array", "array32"] + (
+    ["numpy"] if NumpyBackend.is_available() else [])
+
+
+def write_idx_file(
+    path: pathlib.Path, shape: tuple[int, ...], data: bytes, data_type: int = 0x08
+) -> None:
+    """Write an IDX file of the given data type (unsigned bytes by default)."""
+    path.write_bytes(
+        bytes([0, 0, data_type, len(shape)])
+        + struct.pack(">" + "I" * len(shape), *shape) + data)
+
+
+@pytest.fixture(name="images")
+def fixture_images() -> list[Image]:
+    """Return 40 random images with 30 pixels and labels."""
+    generator: random.Random = random.Random(1)
+
+    return [Image([generator.random() for _ in range(30)], generator.randrange(10))
+            for _ in range(40)]
+
+
+@pytest.fixture(name="weight_matrices")
+def fixture_weight_matrices() -> list[list[list[float]]]:
+    """Return random weight matrices of the small neural network."""
+    generator: random.Random = random.Random(2)
+
+    return [[[generator.gauss(0, (1 / columns) ** 0.5) for _ in range(columns)]
+             for _ in range(rows)] for rows, columns in DIMENSIONS]
@@ -0,0 +1,26 @@
+"""Tests of the interface of the compute backends."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes.backend import Backend
+from conftest import BACKENDS
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_implement_the_interface(name: str) -> None:
+    """Every backend implements all methods of the interface."""
+    assert isinstance(Backend.create(name), Backend)
+
+
+def test_incomplete_backend_cannot_be_created() -> None:
+    """A backend missing methods fails when it's created, not when it's used."""
+    class IncompleteBackend(Backend):  # pylint: disable=abstract-method
+        """A backend that implements none of the operations."""
+
+        name: str = "incomplete"
+
+    with pytest.raises(TypeError):
+        # pylint: disable-next=abstract-class-instantiated
+        IncompleteBackend()  # type: ignore[abstract]
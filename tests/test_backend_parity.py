@@ -0,0 +1,83 @@
+"""Tests comparing the NumPy backend with the pure Python list backend."""
+
+# Import used Python libraries
+import contextlib
+import io
+import math
+
+import pytest
+
+# Import used classes
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from conftest import DIMENSIONS
+
+# The NumPy backend is optional
+numpy = pytest.importorskip("numpy")
+
+
+def create_networks(
+    weight_matrices: list[list[list[float]]]
+) -> tuple[NeuralNetwork, NeuralNetwork]:
+    """Return a neural network of each backend with the same weights."""
+    return (NeuralNetwork(DIMENSIONS, weight_matrices, "list"),
+            NeuralNetwork(DIMENSIONS, weight_matrices, "numpy"))
+
+
+def assert_close(list_matrix: list[list[float]], numpy_matrix) -> None:
+    """Assert that a matrix of each backend contains the same values."""
+    assert numpy.allclose(numpy.array(list_matrix), numpy_matrix, rtol=1e-9,
+                          atol=1e-12)
+
+
+def test_forward_pass(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Both backends calculate the same values at each layer."""
+    list_net, numpy_net = create_networks(weight_matrices)
+
+    for list_values, numpy_values in zip(list_net.detect_images(images),
+                                         numpy_net.detect_images(images)):
+        assert_close(list_values, numpy_values)
+
+
+def test_single_image(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Both backends detect one image with the same output values."""
+    list_net, numpy_net = create_networks(weight_matrices)
+
+    list_output: list[list[float]] = list_net.detect_one_image(images[0])[-1]
+    numpy_output = numpy_net.detect_one_image(images[0])[-1]
+
+    for list_row, numpy_row in zip(list_output, numpy_output):
+        assert math.isclose(list_row[0], float(numpy_row[0]), rel_tol=1e-9)
+
+
+def test_test_counts(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Both backends count the same number of correctly detected images."""
+    list_net, numpy_net = create_networks(weight_matrices)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert list_net.test(images) == numpy_net.test(images)
+        assert list_net.test(images, 7) == numpy_net.test(images, 7)
+
+
+@pytest.mark.parametrize("batch_size", [1, 8])
+def test_train_batch(
+    images: list[Image], weight_matrices: list[list[list[float]]], batch_size: int
+) -> None:
+    """One training step changes the weights of both backends in the same way."""
+    list_net, numpy_net = create_networks(weight_matrices)
+
+    list_net.train_batch(images[:batch_size], 0.1)
+    numpy_net.train_batch(images[:batch_size], 0.1)
+
+    # The weights changed and are the same for both backends
+    assert list_net.get_weight_matrices_as_lists() != weight_matrices
+    for list_matrix, numpy_matrix in zip(
+            list_net.get_weight_matrices_as_lists(),
+            numpy_net.get_weight_matrices_as_lists()):
+        assert_close(list_matrix, numpy.array(numpy_matrix))
@@ -0,0 +1,40 @@
+"""Tests of the streaming predictions of a set of images."""
+
+# Import used Python libraries
+import csv
+import pathlib
+
+# Import used classes
+from classes.batch_predictor import BatchPredictor
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from conftest import DIMENSIONS, write_idx_file
+
+
+def test_idx_labels_are_read_from_the_paired_file(
+    tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """The label column is filled from the labels file next to the IDX images."""
+    pixels: bytes = bytes(
+        round(pixel * 255) for image in images for pixel in image.get_pixels())
+    labels: list[int] = [index % 10 for index in range(len(images))]
+    write_idx_file(tmp_path / "test-images.idx3-ubyte", (len(images), 5, 6), pixels)
+    predictor: BatchPredictor = BatchPredictor(
+        NeuralNetwork(DIMENSIONS, weight_matrices, "list"), 16, 1)
+
+    # Without the labels file the labels are unknown
+    predictor.predict(str(tmp_path / "test-images.idx3-ubyte"),
+                      str(tmp_path / "unlabeled.csv"))
+    with open(tmp_path / "unlabeled.csv", 'r', encoding='utf-8') as csv_file:
+        assert [row["label"] for row in csv.DictReader(csv_file)] == [""] * len(
+            images)
+
+    write_idx_file(tmp_path / "test-labels.idx1-ubyte", (len(images),),
+                   bytes(labels))
+    report: dict[str, float] = predictor.predict(
+        str(tmp_path / "test-images.idx3-ubyte"), str(tmp_path / "labeled.csv"))
+
+    assert report["images"] == len(images)
+    with open(tmp_path / "labeled.csv", 'r', encoding='utf-8') as csv_file:
+        assert [int(row["label"]) for row in csv.DictReader(csv_file)] == labels
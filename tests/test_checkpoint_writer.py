@@ -0,0 +1,95 @@
+"""Tests of resuming a training from its checkpoints."""
+
+# Import used Python libraries
+import pathlib
+
+import pytest
+
+# Import used classes
+from classes.checkpoint_writer import CheckpointWriter
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from classes.optimizer import Adam
+from conftest import DIMENSIONS
+
+
+class Interruption(Exception):
+    """The error that stops a training halfway."""
+
+
+def interrupt_training(
+    monkeypatch: pytest.MonkeyPatch, neural_net: NeuralNetwork, images: list[Image],
+    path_to_csv_file: str
+) -> None:
+    """Train until the 13th batch and wait for the last checkpoint."""
+    writers: list[CheckpointWriter] = []
+    initialize_writer = CheckpointWriter.__init__
+
+    def record_writer(writer: CheckpointWriter, *arguments, **options) -> None:
+        initialize_writer(writer, *arguments, **options)
+        writers.append(writer)
+
+    train_batch = neural_net.train_batch
+    batches: list[int] = []
+
+    def stop_training(*arguments, **options) -> None:
+        batches.append(len(batches))
+        if len(batches) == 13:
+            raise Interruption()
+        train_batch(*arguments, **options)
+
+    monkeypatch.setattr(CheckpointWriter, "__init__", record_writer)
+    monkeypatch.setattr(neural_net, "train_batch", stop_training)
+    with pytest.raises(Interruption):
+        neural_net.train(images, 0.1, path_to_csv_file, 4, 2, 3,
+                         checkpoint_images=8)
+    writers[0].close()
+    monkeypatch.undo()
+
+
+def test_resumed_training_matches_uninterrupted_training(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """The weights and the state of Adam are restored from the last checkpoint."""
+    uninterrupted_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Adam())
+    uninterrupted_net.train(images, 0.1, str(tmp_path / "uninterrupted.csv"), 4, 2, 3)
+
+    interrupt_training(
+        monkeypatch, NeuralNetwork(DIMENSIONS, weight_matrices, "list",
+                                   optimizer=Adam()),
+        images, str(tmp_path / "resumed.csv"))
+    position: dict[str, int | str] = CheckpointWriter.read_position(
+        CheckpointWriter.get_position_path(str(tmp_path / "resumed.csv")))
+    assert (position["epoch"], position["index"]) == (1, 8)
+
+    resumed_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Adam())
+    resumed_net.train(images, 0.1, str(tmp_path / "resumed.csv"), 4, 2,
+                      checkpoint_images=8, resume=True)
+
+    assert resumed_net.get_optimizer().get_step() == 20
+    for resumed_matrix, uninterrupted_matrix in zip(
+            resumed_net.get_weight_matrices_as_lists(),
+            uninterrupted_net.get_weight_matrices_as_lists()):
+        for resumed_row, uninterrupted_row in zip(
+                resumed_matrix, uninterrupted_matrix):
+            assert resumed_row == pytest.approx(uninterrupted_row, abs=1e-12)
+
+
+def test_incomplete_checkpoint_is_rejected(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """Weights replaced after the position was written can't be resumed."""
+    interrupt_training(
+        monkeypatch, NeuralNetwork(DIMENSIONS, weight_matrices, "list"), images,
+        str(tmp_path / "weights.csv"))
+
+    # Replace the weights, as if the training stopped while writing a checkpoint
+    NeuralNetwork.write_weights(str(tmp_path / "weights.csv"), weight_matrices)
+
+    with pytest.raises(ValueError):
+        NeuralNetwork(DIMENSIONS, weight_matrices, "list").resume_training(
+            str(tmp_path / "weights.csv"))
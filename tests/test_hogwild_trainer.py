@@ -0,0 +1,26 @@
+"""Tests of the asynchronous training on shared weight matrices."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes.backend import NumpyBackend
+from classes.hogwild_trainer import HogwildTrainer
+from classes.neural_network import NeuralNetwork
+from classes.optimizer import Optimizer
+from conftest import DIMENSIONS
+
+
+@pytest.mark.skipif(not NumpyBackend.is_available(), reason="NumPy isn't installed")
+@pytest.mark.parametrize("optimizer", ["momentum", "nesterov", "adam"])
+def test_stateful_optimizers_are_rejected(
+    weight_matrices: list[list[list[float]]], optimizer: str
+) -> None:
+    """The workers only train with SGD, so other optimizers aren't accepted."""
+    with pytest.raises(ValueError):
+        HogwildTrainer(NeuralNetwork(
+            DIMENSIONS, weight_matrices, "numpy",
+            optimizer=Optimizer.create(optimizer)), 2)
+
+    assert HogwildTrainer(NeuralNetwork(
+        DIMENSIONS, weight_matrices, "numpy"), 2).get_workers() == 2
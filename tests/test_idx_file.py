@@ -0,0 +1,57 @@
+"""Tests of reading IDX files through mmap."""
+
+# Import used Python libraries
+import pathlib
+import struct
+
+import pytest
+
+# Import used classes
+from classes.idx_file import IdxFile
+from conftest import write_idx_file
+
+
+def test_header_of_images_is_parsed(tmp_path: pathlib.Path) -> None:
+    """The rank, the shape and the byte data are taken from the header."""
+    write_idx_file(tmp_path / "images.idx3-ubyte", (3, 2, 2), bytes(range(12)))
+
+    with IdxFile(str(tmp_path / "images.idx3-ubyte")) as idx_file:
+        assert idx_file.get_typecode() == "B"
+        assert idx_file.get_shape() == (3, 2, 2)
+        assert (idx_file.get_count(), idx_file.get_item_size()) == (3, 4)
+        assert idx_file.read(1, 2).tolist() == [4, 5, 6, 7]
+        assert idx_file.get_batch(2, 5, 1) == [[8.0, 9.0, 10.0, 11.0]]
+        with idx_file.view(0, 1) as view:
+            assert view.tolist() == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("data_type, typecode, values", [
+    (0x09, "b", [-1, 2, -3]), (0x0B, "h", [-300, 2, 300]),
+    (0x0C, "i", [-70000, 2, 70000]), (0x0D, "f", [-1.5, 2.0, 0.25]),
+    (0x0E, "d", [-1.5, 2.0, 0.1])])
+def test_data_types_are_converted_from_big_endian(
+    tmp_path: pathlib.Path, data_type: int, typecode: str, values: list[float]
+) -> None:
+    """Every data type is detected and read in the byte order of the machine."""
+    write_idx_file(tmp_path / "values.idx1", (3,),
+                   struct.pack(">" + typecode * 3, *values), data_type)
+
+    with IdxFile(str(tmp_path / "values.idx1")) as idx_file:
+        assert idx_file.get_typecode() == typecode
+        assert (idx_file.get_count(), idx_file.get_item_size()) == (3, 1)
+        assert idx_file.read().tolist() == values
+
+
+@pytest.mark.parametrize("content", [
+    b"", b"\0\0\x08", b"\x01\0\x08\x01" + bytes(4), b"\0\0\x07\x01" + bytes(4),
+    b"\0\0\x08\x03" + struct.pack(">II", 2, 2),
+    b"\0\0\x08\x03" + struct.pack(">III", 2, 2, 2) + bytes(7),
+    b"\0\0\x0B\x01" + struct.pack(">I", 2) + bytes(3)])
+def test_invalid_or_truncated_files_are_rejected(
+    tmp_path: pathlib.Path, content: bytes
+) -> None:
+    """Wrong magic numbers, truncated headers and truncated data raise errors."""
+    (tmp_path / "invalid.idx").write_bytes(content)
+
+    with pytest.raises(ValueError):
+        IdxFile(str(tmp_path / "invalid.idx"))
@@ -0,0 +1,21 @@
+"""Tests of the compact dataset of images."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes.image import Image
+from classes.image_dataset import ImageDataset
+
+
+def test_dataset_is_a_sequence(images: list[Image]) -> None:
+    """Indexing returns views, slicing returns datasets and count still works."""
+    dataset: ImageDataset = ImageDataset.from_images(images, "f")
+
+    assert len(dataset) == dataset.size == len(images)
+    assert dataset.count(dataset[0]) == 0
+    assert [image.get_actual_number() for image in dataset[5:15]] == [
+        image.get_actual_number() for image in images[5:15]]
+    assert len(dataset[::3]) == len(images[::3])
+    assert dataset[-1].get_pixels() == pytest.approx(images[-1].get_pixels())
+    assert dataset[-1].get_actual_number() == images[-1].get_actual_number()
@@ -0,0 +1,102 @@
+"""Tests comparing the in-place weight updates with new weight matrices."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from conftest import BACKENDS, DIMENSIONS
+
+# Tolerance of the comparisons, the float32 backend rounds every value
+TOLERANCES: dict[str, float] = {"list": 1e-12, "array": 1e-12, "array32": 1e-5,
+                                "numpy": 1e-12}
+
+
+def assert_close(matrix_1: list[list[float]], matrix_2: list[list[float]],
+                 tolerance: float) -> None:
+    """Assert that two nested lists contain the same values."""
+    assert len(matrix_1) == len(matrix_2)
+    for row_1, row_2 in zip(matrix_1, matrix_2):
+        assert row_1 == pytest.approx(row_2, rel=tolerance, abs=tolerance)
+
+
+def copy_update(
+    neural_net: NeuralNetwork, batch: list[Image], learning_rate: float
+) -> list[list[list[float]]]:
+    """Return the weights after one step that creates new weight matrices."""
+    backend: Backend = neural_net.get_backend()
+
+    # Calculate the summed changes and average them over the batch
+    values_at_each_layer: list = neural_net.detect_images(batch, True)
+    changes: list = neural_net.calc_weight_changes(
+        values_at_each_layer,
+        neural_net.calc_batch_errors_at_each_layer(batch, values_at_each_layer),
+        learning_rate / len(batch))
+
+    return [backend.to_lists(backend.matrix_addition(weight_matrix, change))
+            for weight_matrix, change in zip(neural_net.get_weight_matrices(),
+                                             changes)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("batch_size", [1, 5])
+def test_train_batch_matches_copy(
+    images: list[Image], weight_matrices: list[list[list[float]]], backend: str,
+    batch_size: int
+) -> None:
+    """train_batch changes the weights like adding new change matrices."""
+    expected: list = copy_update(
+        NeuralNetwork(DIMENSIONS, weight_matrices, backend), images[:batch_size],
+        0.1)
+
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, backend)
+    neural_net.train_batch(images[:batch_size], 0.1)
+
+    for actual_matrix, expected_matrix in zip(
+            neural_net.get_weight_matrices_as_lists(), expected):
+        assert_close(actual_matrix, expected_matrix, TOLERANCES[backend])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_weight_matrices_stay_in_place(
+    images: list[Image], weight_matrices: list[list[list[float]]], backend: str
+) -> None:
+    """Training updates the existing weight matrices instead of replacing them."""
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, backend)
+    before: list = list(neural_net.get_weight_matrices())
+
+    neural_net.train_batch(images[:3], 0.1)
+
+    assert all(matrix is old_matrix for matrix, old_matrix in zip(
+        neural_net.get_weight_matrices(), before))
+    assert neural_net.get_weight_matrices_as_lists() != weight_matrices
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_kernels(backend: str) -> None:
+    """The in-place kernels match the kernels creating new matrices."""
+    kernels: Backend = Backend.create(backend)
+    matrix: list[list[float]] = [[0.5, -1.0, 2.0], [1.5, 0.25, -0.75]]
+    matrix_1: list[list[float]] = [[1.0, 2.0], [-0.5, 3.0]]
+    matrix_2: list[list[float]] = [[0.5, 1.0], [2.0, -1.0], [0.0, 4.0]]
+    tolerance: float = TOLERANCES[backend]
+
+    # Multiplication with the inverted first matrix
+    assert_close(kernels.to_lists(kernels.transposed_matrix_multiplication(
+        kernels.from_lists(matrix), kernels.from_lists(matrix_1))),
+        kernels.to_lists(kernels.matrix_multiplication(
+            kernels.invert(kernels.from_lists(matrix)),
+            kernels.from_lists(matrix_1))), tolerance)
+
+    # Adding the product with the inverted second matrix in place
+    expected: list[list[float]] = kernels.to_lists(kernels.matrix_addition(
+        kernels.from_lists(matrix), kernels.matrix_multiplication(
+            kernels.from_lists(matrix_1),
+            kernels.invert(kernels.from_lists(matrix_2)))))
+    in_place = kernels.from_lists(matrix)
+    kernels.add_matrix_product_in_place(
+        in_place, kernels.from_lists(matrix_1), kernels.from_lists(matrix_2),
+        kernels.create_update_buffer(in_place))
+    assert_close(kernels.to_lists(in_place), expected, tolerance)
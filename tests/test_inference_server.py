@@ -0,0 +1,79 @@
+"""Tests of the micro-batching HTTP server on localhost."""
+
+# Import used Python libraries
+import asyncio
+import json
+
+# Import used classes
+from classes.image import Image
+from classes.inference_server import InferenceServer, MAX_BODY_SIZE
+from classes.neural_network import NeuralNetwork
+from conftest import DIMENSIONS
+
+
+async def send_request(port: int, request: bytes) -> tuple[int, dict]:
+    """Send one raw HTTP request and return the status and the JSON body."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response: bytes = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, body = response.split(b"\r\n\r\n", 1)
+
+    return int(head.split()[1]), json.loads(body)
+
+
+def create_post(body: bytes, content_type: str = "application/json") -> bytes:
+    """Create a prediction request, which closes the connection."""
+    return (b"POST /predict HTTP/1.1\r\nContent-Type: " + content_type.encode()
+            + b"\r\nContent-Length: " + str(len(body)).encode()
+            + b"\r\nConnection: close\r\n\r\n" + body)
+
+
+async def run_requests(
+    server: InferenceServer, images: list[Image]
+) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]], tuple[int, dict]]:
+    """Send concurrent predictions, invalid requests and read the statistics."""
+    listening_server: asyncio.Server = await server.start()
+    port: int = server.get_address()[1]
+
+    try:
+        predictions: list[tuple[int, dict]] = await asyncio.gather(*[
+            send_request(port, create_post(json.dumps(
+                {"pixels": image.get_pixels()}).encode()))
+            for image in images[:20]])
+        errors: list[tuple[int, dict]] = [
+            await send_request(port, create_post(b"{\"pixels\": [0.5, ")),
+            await send_request(port, create_post(b"{\"pixels\": [0.5, 0.5]}")),
+            await send_request(port, b"POST /predict HTTP/1.1\r\nContent-Length: "
+                               + str(MAX_BODY_SIZE + 1).encode() + b"\r\n\r\n")]
+        stats: tuple[int, dict] = await send_request(
+            port, b"GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n")
+    finally:
+        listening_server.close()
+        await listening_server.wait_closed()
+        if server.batcher is not None:
+            server.batcher.cancel()
+
+    return predictions, errors, stats
+
+
+def test_concurrent_requests_are_batched(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Concurrent requests share a forward pass, invalid ones are answered."""
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, "list")
+    server: InferenceServer = InferenceServer(neural_net, "127.0.0.1", 0, 32, 0.5)
+
+    predictions, errors, stats = asyncio.run(run_requests(server, images))
+    labels, probabilities = neural_net.predict_batch(images[:20])
+
+    assert predictions == [
+        (200, {"prediction": label, "probabilities": values})
+        for label, values in zip(labels, probabilities)]
+    assert [status for status, _ in errors] == [400, 400, 413]
+    assert stats[0] == 200
+    assert (stats[1]["requests"], stats[1]["batches"], stats[1]["errors"]) == (
+        20, 1, 2)
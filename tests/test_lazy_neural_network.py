@@ -0,0 +1,59 @@
+"""Tests of the neural network that reads its weights on first use."""
+
+# Import used Python libraries
+import pathlib
+import pickle
+
+import pytest
+
+# Import used classes
+from classes.image import Image
+from classes.lazy_neural_network import LazyNeuralNetwork
+from classes.neural_network import NeuralNetwork
+from conftest import DIMENSIONS
+
+
+def test_weights_are_read_on_first_use(
+    tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """The weights are read by the first detection, not by the constructor."""
+    NeuralNetwork.write_weights(str(tmp_path / "weights.csv"), weight_matrices)
+    lazy_net: LazyNeuralNetwork = LazyNeuralNetwork(
+        DIMENSIONS, str(tmp_path / "weights.csv"), "list")
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, "list")
+
+    assert not lazy_net.is_loaded()
+    assert lazy_net.detect_one_image(images[0]) == neural_net.detect_one_image(
+        images[0])
+    assert lazy_net.is_loaded()
+    assert lazy_net.backend_name == lazy_net.get_backend().name == "list"
+
+    # Other attributes are looked up on the loaded neural network
+    assert lazy_net.get_weight_version() == neural_net.get_weight_version()
+
+
+def test_unloaded_network_can_be_pickled(tmp_path: pathlib.Path) -> None:
+    """Unpickling and half-initialized objects don't look up attributes endlessly."""
+    lazy_net: LazyNeuralNetwork = LazyNeuralNetwork(
+        DIMENSIONS, str(tmp_path / "missing.csv"))
+
+    assert not pickle.loads(pickle.dumps(lazy_net)).is_loaded()
+    with pytest.raises(AttributeError):
+        getattr(object.__new__(LazyNeuralNetwork), "detect_images")
+
+
+def test_images_can_be_tested_in_blocks(
+    tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """A sequence, a stream and blocks of the images count the same images."""
+    NeuralNetwork.write_weights(str(tmp_path / "weights.csv"), weight_matrices)
+    lazy_net: LazyNeuralNetwork = LazyNeuralNetwork(
+        DIMENSIONS, str(tmp_path / "weights.csv"), "list")
+    blocks: list[list[Image]] = [images[:15], images[15:]]
+
+    correct_images: int = lazy_net.test(images, 7)
+    assert lazy_net.test(iter(images), 7) == correct_images
+    assert lazy_net.test(blocks) == correct_images
+    assert lazy_net.test(iter(blocks)) == correct_images
@@ -0,0 +1,108 @@
+"""Tests of the Matrix type and of the array backends."""
+
+# Import used Python libraries
+import contextlib
+import io
+
+import pytest
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+from classes.matrix import Matrix
+from classes.neural_network import NeuralNetwork
+from conftest import DIMENSIONS
+
+# Tolerance of each array backend, the float32 backend rounds every value
+TOLERANCES: dict[str, float] = {"array": 1e-12, "array32": 1e-6}
+
+# Matrices the kernels are applied to
+MATRIX_1: list[list[float]] = [[0.5, -1.0, 2.0], [1.5, 0.25, -0.75]]
+MATRIX_2: list[list[float]] = [[1.0, -2.0], [0.5, 3.0], [-0.25, 0.125]]
+MATRIX_3: list[list[float]] = [[0.75, 0.5, -1.25], [2.0, -0.5, 0.0625]]
+
+
+def assert_close(matrix_1: list[list[float]], matrix_2: list[list[float]],
+                 tolerance: float) -> None:
+    """Assert that two nested lists contain the same values."""
+    assert len(matrix_1) == len(matrix_2)
+    for row_1, row_2 in zip(matrix_1, matrix_2):
+        assert row_1 == pytest.approx(row_2, rel=tolerance, abs=tolerance)
+
+
+@pytest.mark.parametrize("typecode", ["d", "f"])
+def test_matrix_round_trip(typecode: str) -> None:
+    """A matrix keeps the shape and the values of the nested list."""
+    matrix: Matrix = Matrix.from_lists(MATRIX_1, typecode)
+
+    assert (matrix.get_rows(), matrix.get_columns()) == (2, 3)
+    assert matrix.get_typecode() == typecode
+    assert matrix.to_lists() == MATRIX_1
+    assert list(matrix.get_row(1)) == MATRIX_1[1]
+    assert list(matrix.get_column(2)) == [2.0, -0.75]
+    assert Matrix.zeros(2, 3, typecode).to_lists() == [[0.0] * 3] * 2
+
+
+@pytest.mark.parametrize("backend", ["array", "array32"])
+@pytest.mark.parametrize("kernel, arguments", [
+    ("matrix_multiplication", (MATRIX_1, MATRIX_2)),
+    ("invert", (MATRIX_1,)),
+    ("matrix_addition", (MATRIX_1, MATRIX_3)),
+    ("matrix_subtraction", (MATRIX_1, MATRIX_3)),
+    ("transposed_matrix_multiplication", (MATRIX_1, MATRIX_3)),
+    ("sigmoid", (MATRIX_1,)),
+    ("sigmoid_derivative", (MATRIX_3,)),
+    ("relu", (MATRIX_1,)),
+    ("relu_derivative", (MATRIX_1,)),
+    ("softmax", (MATRIX_1,)),
+    ("error_gradient", (MATRIX_1, MATRIX_3, 0.1)),
+])
+def test_kernel_parity(backend: str, kernel: str, arguments: tuple) -> None:
+    """Each kernel of an array backend calculates the values of the list backend."""
+    list_backend: Backend = Backend.create("list")
+    array_backend: Backend = Backend.create(backend)
+
+    expected = getattr(list_backend, kernel)(*[
+        list_backend.from_lists(argument) if isinstance(argument, list) else argument
+        for argument in arguments])
+    actual = getattr(array_backend, kernel)(*[
+        array_backend.from_lists(argument) if isinstance(argument, list) else argument
+        for argument in arguments])
+
+    assert isinstance(actual, Matrix)
+    assert_close(array_backend.to_lists(actual), list_backend.to_lists(expected),
+                 TOLERANCES[backend])
+
+
+@pytest.mark.parametrize("backend", ["array", "array32"])
+def test_conversions(backend: str) -> None:
+    """The array backends create the same columns, labels and maxima."""
+    list_backend: Backend = Backend.create("list")
+    array_backend: Backend = Backend.create(backend)
+
+    assert array_backend.to_lists(array_backend.column_matrix(MATRIX_1)) == (
+        list_backend.to_lists(list_backend.column_matrix(MATRIX_1)))
+    assert array_backend.to_lists(array_backend.one_hot([2, 0], 3)) == (
+        list_backend.one_hot([2, 0], 3))
+    assert array_backend.argmax(array_backend.from_lists(MATRIX_1)) == (
+        list_backend.argmax(MATRIX_1))
+
+
+@pytest.mark.parametrize("backend", ["array", "array32"])
+def test_network_parity(
+    images: list[Image], weight_matrices: list[list[list[float]]], backend: str
+) -> None:
+    """A neural network of an array backend detects and trains like the list one."""
+    list_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, "list")
+    array_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, backend)
+
+    assert_close(array_net.get_backend().to_lists(array_net.detect_images(images)[-1]),
+                 list_net.detect_images(images)[-1], TOLERANCES[backend])
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert array_net.test(images) == list_net.test(images)
+
+    list_net.train_batch(images[:4], 0.1)
+    array_net.train_batch(images[:4], 0.1)
+    for array_matrix, list_matrix in zip(array_net.get_weight_matrices_as_lists(),
+                                         list_net.get_weight_matrices_as_lists()):
+        assert_close(array_matrix, list_matrix, TOLERANCES[backend])
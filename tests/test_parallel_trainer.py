@@ -0,0 +1,62 @@
+"""Tests of the data-parallel training against the single-process training."""
+
+# Import used Python libraries
+import contextlib
+import io
+import pathlib
+
+import pytest
+
+# Import used classes
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from classes.optimizer import Optimizer
+from classes.parallel_trainer import ParallelTrainer
+from conftest import DIMENSIONS
+
+
+@pytest.mark.parametrize("optimizer", ["sgd", "momentum", "nesterov", "adam"])
+def test_parallel_training_uses_the_optimizer(
+    images: list[Image], weight_matrices: list[list[list[float]]], optimizer: str
+) -> None:
+    """The averaged gradients of the workers are applied by the optimizer."""
+    serial_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Optimizer.create(optimizer))
+    parallel_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Optimizer.create(optimizer))
+    trainer: ParallelTrainer = ParallelTrainer(parallel_net, 2)
+
+    with trainer.create_pool(
+        ParallelTrainer.initialize_worker,
+        (DIMENSIONS, "list", parallel_net.get_activations())
+    ) as pool:
+        for start in range(0, len(images), 10):
+            serial_net.train_batch(images[start:start + 10], 0.1)
+            trainer.train_batch(pool, images[start:start + 10], 0.1)
+
+    assert parallel_net.get_optimizer().get_step() == 4
+    for serial_matrix, parallel_matrix in zip(
+            serial_net.get_weight_matrices_as_lists(),
+            parallel_net.get_weight_matrices_as_lists()):
+        for serial_row, parallel_row in zip(serial_matrix, parallel_matrix):
+            assert parallel_row == pytest.approx(serial_row, abs=1e-12)
+
+
+def test_parallel_training_writes_the_optimizer_state(
+    tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """The optimizer state is written next to the weights, so training can resume."""
+    neural_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Optimizer.create("adam"))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ParallelTrainer(neural_net, 2).train(
+            images, 0.1, str(tmp_path / "weights.csv"), 10)
+
+    resumed_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, NeuralNetwork.create_weights_from_csv(
+            str(tmp_path / "weights.csv")),
+        "list", optimizer=Optimizer.create("adam"))
+    assert resumed_net.read_optimizer_state(str(tmp_path / "weights.csv"))
+    assert resumed_net.get_optimizer().get_step() == 4
@@ -0,0 +1,83 @@
+"""Tests of the cache of the predictions of the neural network."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes import prediction_cache as prediction_cache_module
+from classes.backend import ListBackend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from classes.prediction_cache import PredictionCache
+from conftest import DIMENSIONS
+
+
+def test_least_recently_used_result_is_evicted() -> None:
+    """A full cache evicts the result that wasn't looked up the longest."""
+    cache: PredictionCache = PredictionCache(2)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+
+    assert cache.get(("a",)) == 1
+    cache.put(("c",), 3)
+
+    assert cache.get(("b",)) is None
+    assert (cache.get(("a",)), cache.get(("c",))) == (1, 3)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_expired_result_is_discarded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Results older than the time to live count as misses."""
+    now: list[float] = [100.0]
+    monkeypatch.setattr(prediction_cache_module.time, "monotonic", lambda: now[0])
+    cache: PredictionCache = PredictionCache(10, 5.0)
+    cache.put(("a",), 1)
+
+    now[0] += 4.0
+    assert cache.get(("a",)) == 1
+    now[0] += 2.0
+    assert cache.get(("a",)) is None
+    assert cache.get_stats()["expirations"] == 1
+    assert cache.get_stats()["size"] == 0
+
+
+def test_keys_depend_on_the_quantized_pixels_and_the_version() -> None:
+    """Pixels rounding to the same bytes share a key, new weights don't."""
+    backend: ListBackend = ListBackend()
+
+    assert PredictionCache.create_key(backend, [0.5, 1.0], 0, "predict") == (
+        PredictionCache.create_key(backend, [0.5001, 1.0], 0, "predict"))
+    assert PredictionCache.create_key(backend, [0.5, 1.0], 0, "predict") != (
+        PredictionCache.create_key(backend, [0.5, 1.0], 1, "predict"))
+
+
+def test_hits_bypass_the_forward_pass(
+    monkeypatch: pytest.MonkeyPatch, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """Cached images aren't run through the network until the weights change."""
+    neural_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", prediction_cache=PredictionCache())
+    expected: tuple[list[int], list[list[float]]] = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list").predict_batch(images)
+
+    # Count the images that are run through the network
+    predicted_images: list[int] = []
+    predict_input_values = neural_net.predict_input_values
+
+    def count_images(input_values: list[list[float]]):
+        predicted_images.append(len(input_values[0]))
+        return predict_input_values(input_values)
+
+    monkeypatch.setattr(neural_net, "predict_input_values", count_images)
+
+    assert neural_net.predict_batch(images[:30]) == (
+        expected[0][:30], expected[1][:30])
+    assert neural_net.predict_batch(images) == expected
+    assert predicted_images == [30, 10]
+
+    # Training changes the weight version, so the results are calculated again
+    neural_net.train_batch(images[:4], 0.1)
+    neural_net.predict_batch(images[:5])
+
+    assert predicted_images == [30, 10, 5]
@@ -0,0 +1,86 @@
+"""Tests of the int8 quantization of the weight matrices."""
+
+# Import used Python libraries
+import pathlib
+
+import pytest
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from classes.quantized_neural_network import QuantizedNeuralNetwork
+from conftest import BACKENDS, DIMENSIONS
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_quantize_round_trip(
+    weight_matrices: list[list[list[float]]], backend: str
+) -> None:
+    """Dequantized weights differ by at most half a step of their row."""
+    kernels: Backend = Backend.create(backend)
+
+    for weight_matrix in weight_matrices:
+        quantized_matrix, scales = kernels.quantize_rows(
+            kernels.from_lists(weight_matrix))
+        quantized_rows: list[list[float]] = kernels.to_lists(quantized_matrix)
+        scale_rows: list[list[float]] = kernels.to_lists(scales)
+
+        for row, quantized_row, (scale,) in zip(weight_matrix, quantized_rows,
+                                                scale_rows):
+            # The largest absolute value of the row is mapped to 127
+            assert scale == pytest.approx(max(abs(value) for value in row) / 127,
+                                          rel=1e-6)
+            assert max(abs(value) for value in quantized_row) == 127
+            assert all(value == int(value) for value in quantized_row)
+
+            # Rounding to the next step leaves an error of at most half a step
+            for value, quantized_value in zip(row, quantized_row):
+                assert abs(value - quantized_value * scale) <= scale / 2 * (1 + 1e-6)
+
+
+def test_zero_row_keeps_scale() -> None:
+    """A row of zeros gets the scale 1 instead of dividing by zero."""
+    kernels: Backend = Backend.create("list")
+
+    quantized_matrix, scales = kernels.quantize_rows([[0.0, 0.0], [0.5, -1.0]])
+
+    assert quantized_matrix == [[0, 0], [64, -127]]
+    assert scales[0] == [1.0]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_quantized_outputs(
+    images: list[Image], weight_matrices: list[list[list[float]]], backend: str
+) -> None:
+    """The quantized network outputs about the values of the float network."""
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, backend)
+    quantized_net: QuantizedNeuralNetwork = QuantizedNeuralNetwork.quantize(
+        neural_net)
+
+    expected: list[list[float]] = neural_net.get_backend().to_lists(
+        neural_net.detect_images(images)[-1])
+    actual: list[list[float]] = quantized_net.get_backend().to_lists(
+        quantized_net.detect_images(images)[-1])
+
+    for actual_row, expected_row in zip(actual, expected):
+        assert actual_row == pytest.approx(expected_row, abs=0.01)
+
+
+def test_csv_round_trip(
+    tmp_path: pathlib.Path, images: list[Image],
+    weight_matrices: list[list[list[float]]]
+) -> None:
+    """A quantized network read from its CSV file outputs the same values."""
+    quantized_net: QuantizedNeuralNetwork = QuantizedNeuralNetwork.quantize(
+        NeuralNetwork(DIMENSIONS, weight_matrices, "list"))
+    path: str = str(tmp_path / "quantized_weights.csv")
+
+    quantized_net.write_weights(path)
+    read_net: QuantizedNeuralNetwork = QuantizedNeuralNetwork.create_from_csv(
+        path, DIMENSIONS, "list")
+
+    assert read_net.get_quantized_weight_matrices() == (
+        quantized_net.get_quantized_weight_matrices())
+    assert read_net.detect_images(images)[-1] == (
+        quantized_net.detect_images(images)[-1])
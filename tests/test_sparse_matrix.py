@@ -0,0 +1,92 @@
+"""Tests of the magnitude pruning and the CSR inference of the first layer."""
+
+# Import used Python libraries
+import pytest
+
+# Import used classes
+from classes.backend import Backend
+from classes.image import Image
+from classes.neural_network import NeuralNetwork
+from classes.sparse_matrix import SparseMatrix
+from conftest import BACKENDS, DIMENSIONS
+
+# Matrix that is pruned
+MATRIX: list[list[float]] = [[0.5, -0.05, 0.0, 2.0], [-1.5, 0.2, -0.01, 0.3]]
+
+
+def assert_close(matrix_1: list[list[float]], matrix_2: list[list[float]],
+                 tolerance: float = 1e-12) -> None:
+    """Assert that two nested lists contain the same values."""
+    assert len(matrix_1) == len(matrix_2)
+    for row_1, row_2 in zip(matrix_1, matrix_2):
+        assert row_1 == pytest.approx(row_2, rel=tolerance, abs=tolerance)
+
+
+def test_prune_threshold() -> None:
+    """Pruning with a threshold keeps the weights of at least that magnitude."""
+    sparse_matrix: SparseMatrix = SparseMatrix.prune(MATRIX, threshold=0.2)
+
+    assert list(sparse_matrix.get_values()) == [0.5, 2.0, -1.5, 0.2, 0.3]
+    assert list(sparse_matrix.get_column_indices()) == [0, 3, 0, 1, 3]
+    assert list(sparse_matrix.get_row_pointers()) == [0, 2, 5]
+    assert sparse_matrix.to_lists() == [[0.5, 0.0, 0.0, 2.0],
+                                        [-1.5, 0.2, 0.0, 0.3]]
+    assert sparse_matrix.get_sparsity() == pytest.approx(3 / 8)
+
+
+def test_prune_top_k() -> None:
+    """Pruning with top_k keeps the largest weights of each row, but no zeros."""
+    sparse_matrix: SparseMatrix = SparseMatrix.prune(MATRIX, top_k=3)
+
+    assert sparse_matrix.to_lists() == [[0.5, -0.05, 0.0, 2.0],
+                                        [-1.5, 0.2, 0.0, 0.3]]
+    with pytest.raises(ValueError):
+        SparseMatrix.prune(MATRIX)
+    with pytest.raises(ValueError):
+        SparseMatrix.prune(MATRIX, threshold=0.1, top_k=1)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_sparse_multiplication(backend: str) -> None:
+    """The CSR multiplication equals the dense multiplication of the pruned matrix."""
+    kernels: Backend = Backend.create(backend)
+    sparse_matrix: SparseMatrix = SparseMatrix.prune(MATRIX, threshold=0.2)
+    columns: list[list[float]] = [[1.0, 0.5], [-2.0, 0.25], [3.0, -1.0], [0.5, 2.0]]
+
+    assert_close(
+        kernels.to_lists(kernels.sparse_matrix_multiplication(
+            sparse_matrix, kernels.from_lists(columns))),
+        kernels.to_lists(kernels.matrix_multiplication(
+            kernels.from_lists(sparse_matrix.to_lists()),
+            kernels.from_lists(columns))), 1e-6 if backend == "array32" else 1e-12)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_sparse_inference(
+    images: list[Image], weight_matrices: list[list[list[float]]], backend: str
+) -> None:
+    """A pruned network infers the values of a dense network with pruned weights."""
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, backend)
+    neural_net.prune_first_layer(top_k=10)
+    sparse_values: list = neural_net.detect_images(images)[-1]
+
+    # The dense weight matrix contains the pruned weights
+    dense_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, neural_net.get_weight_matrices_as_lists(), backend)
+    assert dense_net.get_sparse_first_layer() is None
+
+    assert_close(neural_net.get_backend().to_lists(sparse_values),
+                 dense_net.get_backend().to_lists(dense_net.detect_images(images)[-1]),
+                 1e-6 if backend == "array32" else 1e-12)
+
+
+def test_training_discards_sparse_layer(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Training changes the dense weights, so the CSR weights aren't used anymore."""
+    neural_net: NeuralNetwork = NeuralNetwork(DIMENSIONS, weight_matrices, "list")
+    neural_net.prune_first_layer(threshold=0.1)
+
+    neural_net.train_batch(images[:2], 0.1)
+
+    assert neural_net.get_sparse_first_layer() is None
@@ -0,0 +1,160 @@
+"""Tests of the learning rate schedules and of the stops of the training."""
+
+# Import used Python libraries
+import contextlib
+import io
+import math
+
+import pytest
+
+# Import used classes
+from classes.image import Image
+from classes.learning_rate_schedule import (
+    ConstantSchedule, CosineSchedule, LearningRateSchedule, StepSchedule)
+from classes.neural_network import NeuralNetwork
+from classes.optimizer import Adam
+from classes.training_controller import TrainingController
+from conftest import DIMENSIONS
+
+
+def test_constant_schedule() -> None:
+    """The constant schedule only changes during the warmup."""
+    schedule: LearningRateSchedule = ConstantSchedule(0.1, warmup_epochs=2)
+
+    assert schedule.learning_rate_at(0.5) == pytest.approx(0.025)
+    assert schedule.learning_rate_at(1.0) == pytest.approx(0.05)
+    assert schedule.learning_rate_at(2.0) == pytest.approx(0.1)
+    assert schedule.learning_rate_at(10.0) == pytest.approx(0.1)
+
+
+def test_step_schedule() -> None:
+    """The step schedule decays by the factor after every step."""
+    schedule: LearningRateSchedule = StepSchedule(0.1, 2, 0.5)
+
+    assert [schedule.learning_rate_at(epoch) for epoch in (0, 1.9, 2, 3.5, 4)] == (
+        pytest.approx([0.1, 0.1, 0.05, 0.05, 0.025]))
+    with pytest.raises(ValueError):
+        StepSchedule(0.1, 0, 0.5)
+    with pytest.raises(ValueError):
+        StepSchedule(0.1, 1, 1.5)
+
+
+def test_cosine_schedule() -> None:
+    """The cosine schedule falls to the minimum and stays there."""
+    schedule: LearningRateSchedule = CosineSchedule(0.1, 4, 0.1)
+
+    assert schedule.learning_rate_at(0) == pytest.approx(0.1)
+    assert schedule.learning_rate_at(2) == pytest.approx(0.1 * (0.1 + 0.9 * 0.5))
+    assert schedule.learning_rate_at(1) == pytest.approx(
+        0.1 * (0.1 + 0.9 * (1 + math.cos(math.pi / 4)) / 2))
+    assert schedule.learning_rate_at(4) == pytest.approx(0.01)
+    assert schedule.learning_rate_at(8) == pytest.approx(0.01)
+
+
+def test_create_schedule() -> None:
+    """Schedules are created by their names."""
+    assert isinstance(LearningRateSchedule.create("constant", 0.1, 3),
+                      ConstantSchedule)
+    assert isinstance(LearningRateSchedule.create("step", 0.1, 3), StepSchedule)
+    assert isinstance(LearningRateSchedule.create("cosine", 0.1, 3), CosineSchedule)
+    with pytest.raises(ValueError):
+        LearningRateSchedule.create("linear", 0.1, 3)
+
+
+def run_training(
+    images: list[Image], weight_matrices: list[list[list[float]]],
+    learning_rate: float, **arguments
+) -> TrainingController:
+    """Train a small neural network with a controller and return the controller."""
+    controller: TrainingController = TrainingController(
+        NeuralNetwork(DIMENSIONS, weight_matrices, "list"),
+        ConstantSchedule(learning_rate), **arguments)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        controller.train(images)
+
+    return controller
+
+
+def test_stop_after_epochs(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """Without budgets and patience the training runs all epochs."""
+    controller: TrainingController = run_training(
+        images, weight_matrices, 0.1, epochs=2, batch_size=4, patience=None)
+
+    assert controller.get_stop_reason() == "epochs"
+    assert [entry["epoch"] for entry in controller.get_history()] == [1.0, 2.0]
+    assert controller.get_history()[-1]["images"] == 72
+
+
+def test_stop_on_plateau(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """The training stops when the accuracy doesn't improve for patience evaluations."""
+    controller: TrainingController = run_training(
+        images, weight_matrices, 0.1, epochs=10, evaluation_interval=9, patience=2,
+        min_improvement=1.0)
+
+    assert controller.get_stop_reason() == "plateau"
+    assert len(controller.get_history()) == 3
+
+
+def test_stop_on_sample_budget(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """The training stops once the number of trained images reaches the budget."""
+    controller: TrainingController = run_training(
+        images, weight_matrices, 0.1, epochs=10, batch_size=2, sample_budget=10)
+
+    assert controller.get_stop_reason() == "samples"
+    assert controller.get_history()[-1]["images"] == 10
+
+
+def test_stop_on_time_budget(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """The training stops once the wall-clock budget is used up."""
+    controller: TrainingController = run_training(
+        images, weight_matrices, 0.1, epochs=10, time_budget=1e-9)
+
+    assert controller.get_stop_reason() == "time"
+    assert controller.get_history()[-1]["images"] == 1
+
+
+def test_best_weights_are_kept(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """The neural network ends with the weights of the best evaluation."""
+    controller: TrainingController = TrainingController(
+        NeuralNetwork(DIMENSIONS, weight_matrices, "list"), ConstantSchedule(0.5),
+        epochs=3, evaluation_interval=6, patience=None)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        best_weight_matrices: list = controller.train(images)
+        best_accuracy: float = max(entry["accuracy"]
+                                   for entry in controller.get_history())
+        validation_images: list[Image] = controller.split_validation_data(images)[1]
+
+        assert controller.get_neural_net().get_weight_matrices_as_lists() == (
+            best_weight_matrices)
+        assert controller.get_neural_net().test(validation_images) == round(
+            best_accuracy * len(validation_images))
+
+
+def test_best_optimizer_state_is_kept(
+    images: list[Image], weight_matrices: list[list[list[float]]]
+) -> None:
+    """The optimizer is left with its state at the best evaluation."""
+    neural_net: NeuralNetwork = NeuralNetwork(
+        DIMENSIONS, weight_matrices, "list", optimizer=Adam())
+    controller: TrainingController = TrainingController(
+        neural_net, ConstantSchedule(0.05), epochs=4, batch_size=3,
+        evaluation_interval=6, patience=None)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        controller.train(images)
+
+    best_entry: dict[str, float] = max(controller.get_history(),
+                                       key=lambda entry: entry["accuracy"])
+    assert neural_net.get_optimizer().get_step() == best_entry["images"] // 3
@@ -0,0 +1,55 @@
+"""Tests of the binary weight file."""
+
+# Import used Python libraries
+import pathlib
+
+import pytest
+
+# Import used classes
+from classes.matrix import Matrix
+from classes.neural_network import NeuralNetwork
+from classes.weight_file import WeightFile
+
+
+def test_binary_file_round_trip(
+    tmp_path: pathlib.Path, weight_matrices: list[list[list[float]]]
+) -> None:
+    """The binary file stores the float64 weights exactly."""
+    WeightFile.write(str(tmp_path / "weights.bin"), weight_matrices)
+
+    assert [matrix.to_lists() for matrix in WeightFile.read(
+        str(tmp_path / "weights.bin"))] == weight_matrices
+
+
+def test_truncated_file_is_rejected(
+    tmp_path: pathlib.Path, weight_matrices: list[list[list[float]]]
+) -> None:
+    """Every truncated file raises a ValueError, not a struct.error."""
+    WeightFile.write(str(tmp_path / "weights.bin"), weight_matrices)
+    data: bytes = (tmp_path / "weights.bin").read_bytes()
+
+    for size in (0, 10, WeightFile.header.size, WeightFile.header.size + 20,
+                 len(data) - 1):
+        (tmp_path / "truncated.bin").write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            WeightFile.read(str(tmp_path / "truncated.bin"))
+
+
+def test_outdated_binary_file_is_ignored(
+    tmp_path: pathlib.Path, weight_matrices: list[list[list[float]]]
+) -> None:
+    """The binary file is only read while the CSV file is unchanged."""
+    path_to_csv_file: str = str(tmp_path / "weights.csv")
+    NeuralNetwork.write_weights(path_to_csv_file, weight_matrices)
+    NeuralNetwork.convert_weights_to_binary(
+        path_to_csv_file, str(tmp_path / "weights.bin"))
+
+    assert isinstance(NeuralNetwork.create_weights(path_to_csv_file)[0], Matrix)
+
+    # Rewriting the CSV file (even within the same second) outdates the binary file
+    changed_matrices: list[list[list[float]]] = [
+        [[value + 1 for value in row] for row in weight_matrix]
+        for weight_matrix in weight_matrices]
+    NeuralNetwork.write_weights(path_to_csv_file, changed_matrices)
+
+    assert NeuralNetwork.create_weights(path_to_csv_file) == changed_matrices